@@ -11,7 +11,11 @@ namespace detail
 void export_Action(pybind11::module& m)
     {
     pybind11::class_<Action, Autotuned, std::shared_ptr<Action>>(m, "Action")
-        .def(pybind11::init<std::shared_ptr<SystemDefinition>>());
+        .def(pybind11::init<std::shared_ptr<SystemDefinition>>())
+        .def("getProfileTime", &Action::getProfileTime)
+        .def("getProfileCalls", &Action::getProfileCalls)
+        .def("resetProfile", &Action::resetProfile)
+        .def("isProfiled", &Action::isProfiled);
     }
     } // end namespace detail
 
@@ -12,6 +12,7 @@
 #include <vector>
 
 #include "Autotuned.h"
+#include "Profiler.h"
 #include "SharedSignal.h"
 #include "SystemDefinition.h"
 
@@ -25,6 +26,11 @@ namespace hoomd
     and interact with these autotuners, Action provides a pybind11 interface to get and set
     autotuner parameters for all child classes. Derived classes must add all autotuners to
     m_autotuners for the base class API to be effective.
+
+    Action also holds a profile counter that accumulates the time spent in the action when
+    profiling is enabled in the ExecutionConfiguration. System times the top level calls to
+    Tuners, Updaters, Analyzers, and the Integrator. Each Compute subclass times the work done in
+    its compute() method. Subclasses that do no timed work override isProfiled() to return false.
 */
 class Action : public Autotuned
     {
@@ -34,7 +40,40 @@ class Action : public Autotuned
         {
         }
 
+    /// Get the total time spent in this action since the last profile reset [s]
+    double getProfileTime() const
+        {
+        return m_profile.getSeconds();
+        }
+
+    /// Get the number of times this action executed since the last profile reset
+    uint64_t getProfileCalls() const
+        {
+        return m_profile.calls;
+        }
+
+    /// Reset the profile counter
+    void resetProfile()
+        {
+        m_profile.reset();
+        }
+
+    /// Get the profile counter
+    hoomd::detail::ProfileCounter& getProfileCounter()
+        {
+        return m_profile;
+        }
+
+    /// Return true when this action records its time in the profile counter
+    virtual bool isProfiled() const
+        {
+        return true;
+        }
+
     protected:
+    /// Time spent in this action when profiling is enabled
+    hoomd::detail::ProfileCounter m_profile;
+
     /// The system definition this action is associated with.
     const std::shared_ptr<SystemDefinition> m_sysdef;
 
@@ -11,6 +11,9 @@
 
 #include <pybind11/numpy.h>
 
+#include <algorithm>
+#include <numeric>
+
 #ifdef ENABLE_HIP
 #include "BondedGroupData.cuh"
 #include "CachedAllocator.h"
@@ -62,9 +65,9 @@ BondedGroupData<group_size, Group, name, has_type_mapping>::BondedGroupData(
 
     // connect to particle sort signal
     m_pdata->getParticleSortSignal()
-        .template connect<BondedGroupData<group_size, Group, name, has_type_mapping>,
-                          &BondedGroupData<group_size, Group, name, has_type_mapping>::setDirty>(
-            this);
+        .template connect<
+            BondedGroupData<group_size, Group, name, has_type_mapping>,
+            &BondedGroupData<group_size, Group, name, has_type_mapping>::slotParticleSort>(this);
 #ifdef ENABLE_MPI
     if (m_pdata->getDomainDecomposition())
         {
@@ -104,9 +107,9 @@ BondedGroupData<group_size, Group, name, has_type_mapping>::BondedGroupData(
 
     // connect to particle sort signal
     m_pdata->getParticleSortSignal()
-        .template connect<BondedGroupData<group_size, Group, name, has_type_mapping>,
-                          &BondedGroupData<group_size, Group, name, has_type_mapping>::setDirty>(
-            this);
+        .template connect<
+            BondedGroupData<group_size, Group, name, has_type_mapping>,
+            &BondedGroupData<group_size, Group, name, has_type_mapping>::slotParticleSort>(this);
 
     // initialize from snapshot
     initializeFromSnapshot(snapshot);
@@ -128,9 +131,9 @@ template<unsigned int group_size, typename Group, const char* name, bool has_typ
 BondedGroupData<group_size, Group, name, has_type_mapping>::~BondedGroupData()
     {
     m_pdata->getParticleSortSignal()
-        .template disconnect<BondedGroupData<group_size, Group, name, has_type_mapping>,
-                             &BondedGroupData<group_size, Group, name, has_type_mapping>::setDirty>(
-            this);
+        .template disconnect<
+            BondedGroupData<group_size, Group, name, has_type_mapping>,
+            &BondedGroupData<group_size, Group, name, has_type_mapping>::slotParticleSort>(this);
 #ifdef ENABLE_MPI
     m_pdata->getSingleParticleMoveSignal()
         .template disconnect<
@@ -673,6 +676,111 @@ void BondedGroupData<group_size, Group, name, has_type_mapping>::removeBondedGro
     notifyGroupReorder();
     }
 
+/*! Reorder the local groups by the current particle index of their first member so that loops
+    over the groups access the particle data in nearly sequential order. Ghost groups are sorted
+    separately and remain at the end of the table.
+
+    When the groups are already in order, the table is left unchanged. When only a tail of the table
+    is out of order (e.g. after groups are appended during migration), only the tail is sorted and
+    then merged with the ordered head.
+*/
+template<unsigned int group_size, typename Group, const char* name, bool has_type_mapping>
+void BondedGroupData<group_size, Group, name, has_type_mapping>::sortGroups()
+    {
+    const unsigned int n_total = m_n_groups + m_n_ghost;
+    if (n_total < 2)
+        return;
+
+    // sort key: the particle index of the first member
+    std::vector<unsigned int> key(n_total);
+        {
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(),
+                                         access_location::host,
+                                         access_mode::read);
+        ArrayHandle<members_t> h_groups(m_groups, access_location::host, access_mode::read);
+        for (unsigned int group_idx = 0; group_idx < n_total; group_idx++)
+            {
+            key[group_idx] = h_rtag.data[h_groups.data[group_idx].tag[0]];
+            }
+        }
+
+    std::vector<unsigned int> order(n_total);
+    std::iota(order.begin(), order.end(), 0);
+    auto compare = [&key](unsigned int a, unsigned int b)
+    {
+        return key[a] < key[b];
+    };
+
+    bool reordered = false;
+    const unsigned int range_begin[2] = {0, m_n_groups};
+    const unsigned int range_end[2] = {m_n_groups, n_total};
+    for (unsigned int range = 0; range < 2; range++)
+        {
+        auto first = order.begin() + range_begin[range];
+        auto last = order.begin() + range_end[range];
+        auto tail = std::is_sorted_until(first, last, compare);
+        if (tail == last)
+            continue;
+
+        std::stable_sort(tail, last, compare);
+        std::inplace_merge(first, tail, last, compare);
+        reordered = true;
+        }
+
+    if (!reordered)
+        return;
+
+        {
+        ArrayHandle<members_t> h_groups(m_groups, access_location::host, access_mode::read);
+        ArrayHandle<members_t> h_groups_alt(getAltMembersArray(),
+                                            access_location::host,
+                                            access_mode::overwrite);
+        ArrayHandle<typeval_t> h_typeval(m_group_typeval, access_location::host, access_mode::read);
+        ArrayHandle<typeval_t> h_typeval_alt(getAltTypeValArray(),
+                                             access_location::host,
+                                             access_mode::overwrite);
+        ArrayHandle<unsigned int> h_tag(m_group_tag, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag_alt(getAltTags(),
+                                            access_location::host,
+                                            access_mode::overwrite);
+        ArrayHandle<unsigned int> h_rtag(m_group_rtag,
+                                         access_location::host,
+                                         access_mode::readwrite);
+
+        for (unsigned int group_idx = 0; group_idx < n_total; group_idx++)
+            {
+            unsigned int old_idx = order[group_idx];
+            h_groups_alt.data[group_idx] = h_groups.data[old_idx];
+            h_typeval_alt.data[group_idx] = h_typeval.data[old_idx];
+            unsigned int tag = h_tag.data[old_idx];
+            h_tag_alt.data[group_idx] = tag;
+            h_rtag.data[tag] = group_idx;
+            }
+        }
+    swapMemberArrays();
+    swapTypeArrays();
+    swapTagArrays();
+
+#ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+            {
+            ArrayHandle<ranks_t> h_ranks(m_group_ranks, access_location::host, access_mode::read);
+            ArrayHandle<ranks_t> h_ranks_alt(getAltRanksArray(),
+                                             access_location::host,
+                                             access_mode::overwrite);
+            for (unsigned int group_idx = 0; group_idx < n_total; group_idx++)
+                {
+                h_ranks_alt.data[group_idx] = h_ranks.data[order[group_idx]];
+                }
+            }
+        swapRankArrays();
+        }
+#endif
+
+    notifyGroupReorder();
+    }
+
 /*! \param name Type name
  */
 template<unsigned int group_size, typename Group, const char* name, bool has_type_mapping>
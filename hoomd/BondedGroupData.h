@@ -627,6 +627,22 @@ class BondedGroupData
         m_groups_dirty = true;
         }
 
+    /// Sort the groups by the particle index of their first member
+    void sortGroups();
+
+    /// Update the groups after the particles have been sorted
+    void slotParticleSort()
+        {
+        m_groups_dirty = true;
+
+        // The GPU code paths access the groups by particle index through the GPU table and do not
+        // benefit from sorted groups.
+        if (!m_exec_conf->isCUDAEnabled())
+            {
+            sortGroups();
+            }
+        }
+
 #ifdef ENABLE_MPI
     //! Helper function to transfer bonded groups connected to a single particle
     /*! \param tag Tag of particle that moves between domains
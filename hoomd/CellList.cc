@@ -183,6 +183,8 @@ void CellList::compute(uint64_t timestep)
     // only update if we need to
     if (shouldCompute(timestep) || force)
         {
+        detail::ScopedProfile profile(m_exec_conf, m_profile);
+
         bool overflowed = false;
         do
             {
@@ -199,6 +201,51 @@ void CellList::compute(uint64_t timestep)
         }
     }
 
+/*! An in-place permutation of the local particles leaves every particle in the same cell.
+    Remap the particle indices stored in the cell list instead of recomputing it. Any other sort
+    recomputes the cell list on the next call to compute().
+*/
+void CellList::slotParticlesSorted()
+    {
+    // a sorted cell list orders the members of each cell by index
+    if (!m_pdata->isSortPermutation() || m_params_changed || m_particles_sorted
+        || m_sort_cell_list)
+        {
+        m_particles_sorted = true;
+        return;
+        }
+
+    // charge and type flags do not change
+    const bool flag_index = m_compute_xyzf && !m_flag_charge && !m_flag_type;
+    if (!flag_index && !m_compute_idx)
+        return;
+
+    const std::vector<unsigned int>& rorder = m_pdata->getSortReverseOrder();
+    const unsigned int N = m_pdata->getN();
+
+    ArrayHandle<unsigned int> h_cell_size(m_cell_size, access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_xyzf(m_xyzf, access_location::host, access_mode::readwrite);
+    ArrayHandle<unsigned int> h_cell_idx(m_idx, access_location::host, access_mode::readwrite);
+
+    for (unsigned int bin = 0; bin < m_cell_indexer.getNumElements(); bin++)
+        {
+        const unsigned int size = std::min(h_cell_size.data[bin], m_Nmax);
+        for (unsigned int offset = 0; offset < size; offset++)
+            {
+            const unsigned int k = m_cell_list_indexer(offset, bin);
+            // ghost particles keep their indices
+            if (flag_index)
+                {
+                const unsigned int idx = __scalar_as_int(h_xyzf.data[k].w);
+                if (idx < N)
+                    h_xyzf.data[k].w = __int_as_scalar(rorder[idx]);
+                }
+            if (m_compute_idx && h_cell_idx.data[k] < N)
+                h_cell_idx.data[k] = rorder[h_cell_idx.data[k]];
+            }
+        }
+    }
+
 void CellList::initializeAll()
     {
     initializeWidth();
@@ -405,13 +452,28 @@ void CellList::computeCellList()
     {
     // acquire the particle data
     ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
-    ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(),
-                                       access_location::host,
-                                       access_mode::read);
-    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
-    ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                     access_location::host,
-                                     access_mode::read);
+    // only request the optional per-particle arrays that the flags use
+    std::unique_ptr<ArrayHandle<Scalar4>> h_orientation;
+    if (m_compute_orientation)
+        {
+        h_orientation.reset(new ArrayHandle<Scalar4>(m_pdata->getOrientationArray(),
+                                                     access_location::host,
+                                                     access_mode::read));
+        }
+    std::unique_ptr<ArrayHandle<Scalar>> h_charge;
+    if (m_flag_charge)
+        {
+        h_charge.reset(new ArrayHandle<Scalar>(m_pdata->getCharges(),
+                                               access_location::host,
+                                               access_mode::read));
+        }
+    std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+    if (m_compute_type_body && m_pdata->isAllocated(pdata_array::body))
+        {
+        h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                   access_location::host,
+                                                   access_mode::read));
+        }
     const BoxDim& box = m_pdata->getBox();
 
     // access the cell list data arrays
@@ -495,7 +557,7 @@ void CellList::computeCellList()
         // setup the flag value to store
         Scalar flag;
         if (m_flag_charge)
-            flag = h_charge.data[n];
+            flag = h_charge->data[n];
         else if (m_flag_type)
             flag = h_pos.data[n].w;
         else
@@ -515,12 +577,13 @@ void CellList::computeCellList()
             if (m_compute_type_body)
                 {
                 h_type_body.data[cli(offset, bin)]
-                    = make_uint2(__scalar_as_int(h_pos.data[n].w), h_body.data[n]);
+                    = make_uint2(__scalar_as_int(h_pos.data[n].w),
+                                 h_body ? h_body->data[n] : NO_BODY);
                 }
 
             if (m_compute_orientation)
                 {
-                h_cell_orientation.data[cli(offset, bin)] = h_orientation.data[n];
+                h_cell_orientation.data[cli(offset, bin)] = h_orientation->data[n];
                 }
 
             if (m_compute_idx)
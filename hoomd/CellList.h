@@ -175,10 +175,7 @@ class PYBIND11_EXPORT CellList : public Compute
         }
 
     //! Notification of a particle resort
-    void slotParticlesSorted()
-        {
-        m_particles_sorted = true;
-        }
+    void slotParticlesSorted();
 
     //! Notification of a box size change
     void slotBoxChanged()
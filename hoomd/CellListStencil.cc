@@ -55,6 +55,8 @@ void CellListStencil::compute(uint64_t timestep)
     if (!shouldCompute(timestep))
         return;
 
+    detail::ScopedProfile profile(m_exec_conf, m_profile);
+
     // sanity check that rstencil is correctly sized
     assert(m_rstencil.size() >= m_pdata->getNTypes());
 
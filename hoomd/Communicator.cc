@@ -1229,10 +1229,35 @@ Communicator::Communicator(std::shared_ptr<SystemDefinition> sysdef,
         m_forward_ghosts_reverse[dir].swap(forward_ghosts_reverse);
         m_num_forward_ghosts_reverse[dir] = 0;
         m_num_recv_forward_ghosts_reverse[dir] = 0;
+
+        TAG_ALLOCATION(m_copy_ghosts[dir]);
+        TAG_ALLOCATION(m_copy_ghosts_reverse[dir]);
+        TAG_ALLOCATION(m_plan_reverse_copybuf[dir]);
+        TAG_ALLOCATION(m_forward_ghosts_reverse[dir]);
         }
 
+    // name the communication buffers for memory accounting
+    TAG_ALLOCATION(m_pos_copybuf);
+    TAG_ALLOCATION(m_charge_copybuf);
+    TAG_ALLOCATION(m_diameter_copybuf);
+    TAG_ALLOCATION(m_body_copybuf);
+    TAG_ALLOCATION(m_image_copybuf);
+    TAG_ALLOCATION(m_velocity_copybuf);
+    TAG_ALLOCATION(m_orientation_copybuf);
+    TAG_ALLOCATION(m_plan_copybuf);
+    TAG_ALLOCATION(m_tag_copybuf);
+    TAG_ALLOCATION(m_netforce_copybuf);
+    TAG_ALLOCATION(m_nettorque_copybuf);
+    TAG_ALLOCATION(m_netvirial_copybuf);
+    TAG_ALLOCATION(m_netvirial_recvbuf);
+    TAG_ALLOCATION(m_plan);
+    TAG_ALLOCATION(m_plan_reverse);
+    TAG_ALLOCATION(m_tag_reverse);
+    TAG_ALLOCATION(m_netforce_reverse_copybuf);
+    TAG_ALLOCATION(m_netforce_reverse_recvbuf);
+
     // connect to particle sort signal
-    m_pdata->getParticleSortSignal().connect<Communicator, &Communicator::forceMigrate>(this);
+    m_pdata->getParticleSortSignal().connect<Communicator, &Communicator::slotParticleSort>(this);
 
     // connect to particle sort signal
     m_pdata->getGhostParticlesRemovedSignal()
@@ -1344,7 +1369,8 @@ Communicator::Communicator(std::shared_ptr<SystemDefinition> sysdef,
 Communicator::~Communicator()
     {
     m_exec_conf->msg->notice(5) << "Destroying Communicator" << std::endl;
-    m_pdata->getParticleSortSignal().disconnect<Communicator, &Communicator::forceMigrate>(this);
+    m_pdata->getParticleSortSignal().disconnect<Communicator, &Communicator::slotParticleSort>(
+        this);
     m_pdata->getGhostParticlesRemovedSignal()
         .disconnect<Communicator, &Communicator::slotGhostParticlesRemoved>(this);
 
@@ -1519,8 +1545,11 @@ void Communicator::communicate(uint64_t timestep)
     if (!m_force_migrate && !m_compute_callbacks.empty() && m_has_ghost_particles)
         {
         // do an obligatory update before determining whether to migrate
-        beginUpdateGhosts(timestep);
-        finishUpdateGhosts(timestep);
+            {
+            detail::ScopedProfile profile(m_exec_conf, m_profile_update_ghosts);
+            beginUpdateGhosts(timestep);
+            finishUpdateGhosts(timestep);
+            }
 
         // call subscribers after ghost update, but before distance check
         m_compute_callbacks.emit(timestep);
@@ -1543,6 +1572,7 @@ void Communicator::communicate(uint64_t timestep)
     // Update ghosts if we are not migrating
     if (!migrate && m_compute_callbacks.empty())
         {
+        detail::ScopedProfile profile(m_exec_conf, m_profile_update_ghosts);
         beginUpdateGhosts(timestep);
 
         finishUpdateGhosts(timestep);
@@ -1554,10 +1584,16 @@ void Communicator::communicate(uint64_t timestep)
         m_force_migrate = false;
 
         // If so, migrate atoms
-        migrateParticles();
+            {
+            detail::ScopedProfile profile(m_exec_conf, m_profile_migrate);
+            migrateParticles();
+            }
 
         // Construct ghost send lists, exchange ghost atom data
-        exchangeGhosts();
+            {
+            detail::ScopedProfile profile(m_exec_conf, m_profile_exchange_ghosts);
+            exchangeGhosts();
+            }
 
         // update particle data now that ghosts are available
         m_compute_callbacks.emit(timestep);
@@ -1833,11 +1869,17 @@ void Communicator::exchangeGhosts()
         ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(),
                                    access_location::host,
                                    access_mode::read);
-        ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                         access_location::host,
-                                         access_mode::read);
         ArrayHandle<unsigned int> h_plan(m_plan, access_location::host, access_mode::readwrite);
 
+        // without the body array, all particles are free particles
+        std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+        if (m_pdata->isAllocated(pdata_array::body))
+            {
+            h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                       access_location::host,
+                                                       access_mode::read));
+            }
+
         for (unsigned int idx = 0; idx < m_pdata->getN(); idx++)
             {
             Scalar4 postype = h_pos.data[idx];
@@ -1847,7 +1889,7 @@ void Communicator::exchangeGhosts()
             const unsigned int type = __scalar_as_int(postype.w);
             Scalar ghost_width = h_r_ghost.data[type];
 
-            if (h_body.data[idx] < MIN_FLOPPY)
+            if (h_body && h_body->data[idx] < MIN_FLOPPY)
                 {
                 ghost_width = std::max(ghost_width, h_r_ghost_body.data[type]);
                 }
@@ -1958,27 +2000,38 @@ void Communicator::exchangeGhosts()
             ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(),
                                        access_location::host,
                                        access_mode::read);
-            ArrayHandle<Scalar> h_charge(m_pdata->getCharges(),
-                                         access_location::host,
-                                         access_mode::read);
-            ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(),
-                                           access_location::host,
-                                           access_mode::read);
-            ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                             access_location::host,
-                                             access_mode::read);
             ArrayHandle<int3> h_image(m_pdata->getImages(),
                                       access_location::host,
                                       access_mode::read);
             ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(),
                                        access_location::host,
                                        access_mode::read);
-            ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(),
-                                               access_location::host,
-                                               access_mode::read);
             ArrayHandle<unsigned int> h_tag(m_pdata->getTags(),
                                             access_location::host,
                                             access_mode::read);
+
+            // access the optional fields only when requested, so that unused fields stay
+            // unallocated
+            std::unique_ptr<ArrayHandle<Scalar>> h_charge;
+            std::unique_ptr<ArrayHandle<Scalar>> h_diameter;
+            std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+            std::unique_ptr<ArrayHandle<Scalar4>> h_orientation;
+            if (flags[comm_flag::charge])
+                h_charge.reset(new ArrayHandle<Scalar>(m_pdata->getCharges(),
+                                                       access_location::host,
+                                                       access_mode::read));
+            if (flags[comm_flag::diameter])
+                h_diameter.reset(new ArrayHandle<Scalar>(m_pdata->getDiameters(),
+                                                         access_location::host,
+                                                         access_mode::read));
+            if (flags[comm_flag::body])
+                h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                           access_location::host,
+                                                           access_mode::read));
+            if (flags[comm_flag::orientation])
+                h_orientation.reset(new ArrayHandle<Scalar4>(m_pdata->getOrientationArray(),
+                                                             access_location::host,
+                                                             access_mode::read));
             ArrayHandle<unsigned int> h_plan(m_plan, access_location::host, access_mode::readwrite);
 
             ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir],
@@ -2017,18 +2070,18 @@ void Communicator::exchangeGhosts()
                     if (flags[comm_flag::position])
                         h_pos_copybuf.data[m_num_copy_ghosts[dir]] = h_pos.data[idx];
                     if (flags[comm_flag::charge])
-                        h_charge_copybuf.data[m_num_copy_ghosts[dir]] = h_charge.data[idx];
+                        h_charge_copybuf.data[m_num_copy_ghosts[dir]] = h_charge->data[idx];
                     if (flags[comm_flag::diameter])
-                        h_diameter_copybuf.data[m_num_copy_ghosts[dir]] = h_diameter.data[idx];
+                        h_diameter_copybuf.data[m_num_copy_ghosts[dir]] = h_diameter->data[idx];
                     if (flags[comm_flag::body])
-                        h_body_copybuf.data[m_num_copy_ghosts[dir]] = h_body.data[idx];
+                        h_body_copybuf.data[m_num_copy_ghosts[dir]] = h_body->data[idx];
                     if (flags[comm_flag::image])
                         h_image_copybuf.data[m_num_copy_ghosts[dir]] = h_image.data[idx];
                     if (flags[comm_flag::velocity])
                         h_velocity_copybuf.data[m_num_copy_ghosts[dir]] = h_vel.data[idx];
                     if (flags[comm_flag::orientation])
                         h_orientation_copybuf.data[m_num_copy_ghosts[dir]]
-                            = h_orientation.data[idx];
+                            = h_orientation->data[idx];
                     h_plan_copybuf.data[m_num_copy_ghosts[dir]] = h_plan.data[idx];
 
                     h_copy_ghosts.data[m_num_copy_ghosts[dir]] = h_tag.data[idx];
@@ -2112,28 +2165,39 @@ void Communicator::exchangeGhosts()
             ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(),
                                        access_location::host,
                                        access_mode::readwrite);
-            ArrayHandle<Scalar> h_charge(m_pdata->getCharges(),
-                                         access_location::host,
-                                         access_mode::readwrite);
-            ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(),
-                                           access_location::host,
-                                           access_mode::readwrite);
-            ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                             access_location::host,
-                                             access_mode::readwrite);
             ArrayHandle<int3> h_image(m_pdata->getImages(),
                                       access_location::host,
                                       access_mode::readwrite);
             ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(),
                                        access_location::host,
                                        access_mode::readwrite);
-            ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(),
-                                               access_location::host,
-                                               access_mode::readwrite);
             ArrayHandle<unsigned int> h_tag(m_pdata->getTags(),
                                             access_location::host,
                                             access_mode::readwrite);
 
+            // access the optional fields only when requested, so that unused fields stay
+            // unallocated
+            std::unique_ptr<ArrayHandle<Scalar>> h_charge;
+            std::unique_ptr<ArrayHandle<Scalar>> h_diameter;
+            std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+            std::unique_ptr<ArrayHandle<Scalar4>> h_orientation;
+            if (flags[comm_flag::charge])
+                h_charge.reset(new ArrayHandle<Scalar>(m_pdata->getCharges(),
+                                                       access_location::host,
+                                                       access_mode::readwrite));
+            if (flags[comm_flag::diameter])
+                h_diameter.reset(new ArrayHandle<Scalar>(m_pdata->getDiameters(),
+                                                         access_location::host,
+                                                         access_mode::readwrite));
+            if (flags[comm_flag::body])
+                h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                           access_location::host,
+                                                           access_mode::readwrite));
+            if (flags[comm_flag::orientation])
+                h_orientation.reset(new ArrayHandle<Scalar4>(m_pdata->getOrientationArray(),
+                                                             access_location::host,
+                                                             access_mode::readwrite));
+
             // Clear out the mpi variables for new statuses and requests
             m_reqs.clear();
             m_stats.clear();
@@ -2202,7 +2266,7 @@ void Communicator::exchangeGhosts()
                           m_mpi_comm,
                           &req);
                 m_reqs.push_back(req);
-                MPI_Irecv(h_charge.data + start_idx,
+                MPI_Irecv(h_charge->data + start_idx,
                           int(m_num_recv_ghosts[dir] * sizeof(Scalar)),
                           MPI_BYTE,
                           recv_neighbor,
@@ -2222,7 +2286,7 @@ void Communicator::exchangeGhosts()
                           m_mpi_comm,
                           &req);
                 m_reqs.push_back(req);
-                MPI_Irecv(h_diameter.data + start_idx,
+                MPI_Irecv(h_diameter->data + start_idx,
                           int(m_num_recv_ghosts[dir] * sizeof(Scalar)),
                           MPI_BYTE,
                           recv_neighbor,
@@ -2262,7 +2326,7 @@ void Communicator::exchangeGhosts()
                           m_mpi_comm,
                           &req);
                 m_reqs.push_back(req);
-                MPI_Irecv(h_orientation.data + start_idx,
+                MPI_Irecv(h_orientation->data + start_idx,
                           int(m_num_recv_ghosts[dir] * sizeof(Scalar4)),
                           MPI_BYTE,
                           recv_neighbor,
@@ -2282,7 +2346,7 @@ void Communicator::exchangeGhosts()
                           m_mpi_comm,
                           &req);
                 m_reqs.push_back(req);
-                MPI_Irecv(h_body.data + start_idx,
+                MPI_Irecv(h_body->data + start_idx,
                           int(m_num_recv_ghosts[dir] * sizeof(unsigned int)),
                           MPI_BYTE,
                           recv_neighbor,
@@ -3409,6 +3473,9 @@ void export_Communicator(pybind11::module& m)
         .def(pybind11::init<std::shared_ptr<SystemDefinition>,
                             std::shared_ptr<DomainDecomposition>>())
         .def("addMeshDefinition", &Communicator::addMeshDefinition)
+        .def("getProfileTimes", &Communicator::getProfileTimes)
+        .def("getProfileCalls", &Communicator::getProfileCalls)
+        .def("resetProfile", &Communicator::resetProfile)
         .def_property_readonly("domain_decomposition", &Communicator::getDomainDecomposition);
     }
     } // end namespace detail
@@ -18,8 +18,10 @@
 #include "MeshDefinition.h"
 #include "MeshGroupData.h"
 #include "ParticleData.h"
+#include "Profiler.h"
 
 #include <hoomd/extern/nano-signal-slot/nano_signal_slot.hpp>
+#include <map>
 #include <memory>
 
 #ifndef __HIPCC__
@@ -303,6 +305,16 @@ class PYBIND11_EXPORT Communicator
             m_force_migrate = true;
         }
 
+    //! Force particle migration after a particle sort
+    /*! An in-place permutation of the local particles keeps the ghost layer intact, and the ghost
+        copy lists store tags, so there is nothing to migrate.
+    */
+    void slotParticleSort()
+        {
+        if (!m_pdata->isSortPermutation())
+            forceMigrate();
+        }
+
     /*! Exchange positions of ghost particles
      * Using the previously constructed ghost exchange lists, ghost positions are updated on the
      * neighboring processors.
@@ -388,7 +400,40 @@ class PYBIND11_EXPORT Communicator
 
     void addMeshDefinition(std::shared_ptr<MeshDefinition> meshdef);
 
+    /// Get the time spent in each communication substep since the last profile reset [s]
+    std::map<std::string, double> getProfileTimes() const
+        {
+        return {{"migrate", m_profile_migrate.getSeconds()},
+                {"exchange_ghosts", m_profile_exchange_ghosts.getSeconds()},
+                {"update_ghosts", m_profile_update_ghosts.getSeconds()}};
+        }
+
+    /// Get the number of times each communication substep executed since the last profile reset
+    std::map<std::string, uint64_t> getProfileCalls() const
+        {
+        return {{"migrate", m_profile_migrate.calls},
+                {"exchange_ghosts", m_profile_exchange_ghosts.calls},
+                {"update_ghosts", m_profile_update_ghosts.calls}};
+        }
+
+    /// Reset the profile counters
+    void resetProfile()
+        {
+        m_profile_migrate.reset();
+        m_profile_exchange_ghosts.reset();
+        m_profile_update_ghosts.reset();
+        }
+
     protected:
+    /// Time spent migrating particles when profiling is enabled
+    detail::ProfileCounter m_profile_migrate;
+
+    /// Time spent exchanging ghost particles when profiling is enabled
+    detail::ProfileCounter m_profile_exchange_ghosts;
+
+    /// Time spent updating ghost particles when profiling is enabled
+    detail::ProfileCounter m_profile_update_ghosts;
+
     //! Helper class to perform the communication tasks related to bonded groups
     template<class group_data> class GroupCommunicator
         {
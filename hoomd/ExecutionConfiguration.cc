@@ -722,6 +722,9 @@ void export_ExecutionConfiguration(pybind11::module& m)
         .def("getNumThreads", &ExecutionConfiguration::getNumThreads)
         .def("setMemoryTracing", &ExecutionConfiguration::setMemoryTracing)
         .def("memoryTracingEnabled", &ExecutionConfiguration::memoryTracingEnabled)
+        .def("setProfiling", &ExecutionConfiguration::setProfiling)
+        .def("profilingEnabled", &ExecutionConfiguration::profilingEnabled)
+        .def("getMemoryTracker", &ExecutionConfiguration::getMemoryTracker)
         .def_static("getCapableDevices", &ExecutionConfiguration::getCapableDevices)
         .def_static("getScanMessages", &ExecutionConfiguration::getScanMessages)
         .def("getActiveDevices", &ExecutionConfiguration::getActiveDevices);
@@ -30,6 +30,7 @@
 #include <tbb/task_arena.h>
 #endif
 
+#include "MemoryTracker.h"
 #include "Messenger.h"
 
 /*! \file ExecutionConfiguration.h
@@ -305,6 +306,24 @@ class PYBIND11_EXPORT ExecutionConfiguration
         return m_memory_tracing;
         }
 
+    /// Get the accounting of the memory held by GlobalArray allocations
+    std::shared_ptr<MemoryTracker> getMemoryTracker() const
+        {
+        return m_memory_tracker;
+        }
+
+    /// Enable or disable the collection of per-operation timing data
+    void setProfiling(bool enable)
+        {
+        m_profiling = enable;
+        }
+
+    /// Test if per-operation timing data is being collected
+    bool profilingEnabled() const
+        {
+        return m_profiling;
+        }
+
     //! Returns true if we are in a multi-GPU block
     bool inMultiGPUBlock() const
         {
@@ -411,6 +430,12 @@ class PYBIND11_EXPORT ExecutionConfiguration
     void setupStats();
 
     bool m_memory_tracing = false;
+
+    /// Set to true to collect per-operation timing data
+    bool m_profiling = false;
+
+    /// Accounting of the memory held by GlobalArray allocations
+    std::shared_ptr<MemoryTracker> m_memory_tracker = std::make_shared<MemoryTracker>();
     };
 
 #if defined(ENABLE_HIP)
@@ -515,6 +515,7 @@ void ForceCompute::compute(uint64_t timestep)
     // flags do not match
     if (m_particles_sorted || shouldCompute(timestep) || m_pdata->getFlags() != m_computed_flags)
         {
+        detail::ScopedProfile profile(m_exec_conf, m_profile);
         computeForces(timestep);
         }
 
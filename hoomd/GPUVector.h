@@ -433,9 +433,9 @@ template<class T> class GlobalVector : public GPUVectorBase<T, GlobalArray<T>>
         }
 
     //! Set the tag
-    void setTag(const std::string& tag)
+    void setTag(const std::string& tag, const std::string& component = std::string())
         {
-        static_cast<GlobalArray<T>&>(*this).setTag(tag);
+        static_cast<GlobalArray<T>&>(*this).setTag(tag, component);
         }
 
     //! Get the underlying raw pointer
@@ -4,8 +4,26 @@
 #include "GSDDequeWriter.h"
 #include "hoomd/GSDDumpWriter.h"
 
+#include <algorithm>
+
 namespace hoomd
     {
+namespace
+    {
+/// Number of bytes reserved by a vector
+template<class T> size_t getVectorBytes(const std::vector<T>& v)
+    {
+    return v.capacity() * sizeof(T);
+    }
+
+/// Number of bytes reserved by a bonded group snapshot
+template<class Snapshot> size_t getGroupSnapshotBytes(const Snapshot& snapshot)
+    {
+    return getVectorBytes(snapshot.type_id) + getVectorBytes(snapshot.val)
+           + getVectorBytes(snapshot.groups);
+    }
+    } // end anonymous namespace
+
 GSDDequeWriter::GSDDequeWriter(std::shared_ptr<SystemDefinition> sysdef,
                                std::shared_ptr<Trigger> trigger,
                                const std::string& fname,
@@ -47,15 +65,24 @@ GSDDequeWriter::GSDDequeWriter(std::shared_ptr<SystemDefinition> sysdef,
         }
     }
 
+GSDDequeWriter::~GSDDequeWriter()
+    {
+    setQueueBytes(0);
+    }
+
 void GSDDequeWriter::analyze(uint64_t timestep)
     {
+    // the log data is a Python object
+    pybind11::gil_scoped_acquire acquire;
     m_frame_queue.emplace_front();
     populateLocalFrame(m_frame_queue.front(), timestep);
     m_log_queue.push_front(getLogData());
+
+    setQueueBytes(m_queue_bytes + getFrameBytes(m_frame_queue.front()));
+
     if (m_queue_size != -1 && m_frame_queue.size() > static_cast<size_t>(m_queue_size))
         {
-        m_frame_queue.pop_back();
-        m_log_queue.pop_back();
+        popFrame();
         }
     }
 
@@ -67,6 +94,39 @@ void GSDDequeWriter::dump()
         }
     m_frame_queue.clear();
     m_log_queue.clear();
+
+    setQueueBytes(0);
+    }
+
+void GSDDequeWriter::popFrame()
+    {
+    setQueueBytes(m_queue_bytes - std::min(getFrameBytes(m_frame_queue.back()), m_queue_bytes));
+
+    m_frame_queue.pop_back();
+    m_log_queue.pop_back();
+    }
+
+void GSDDequeWriter::setQueueBytes(size_t bytes)
+    {
+    auto tracker = m_exec_conf->getMemoryTracker();
+    tracker->remove("hoomd::GSDDequeWriter", "m_frame_queue", m_queue_bytes);
+    tracker->add("hoomd::GSDDequeWriter", "m_frame_queue", bytes);
+    m_queue_bytes = bytes;
+    }
+
+size_t GSDDequeWriter::getFrameBytes(const GSDFrame& frame)
+    {
+    const auto& particles = frame.particle_data;
+    return getVectorBytes(frame.particle_tags) + getVectorBytes(particles.pos)
+           + getVectorBytes(particles.vel) + getVectorBytes(particles.accel)
+           + getVectorBytes(particles.type) + getVectorBytes(particles.mass)
+           + getVectorBytes(particles.charge) + getVectorBytes(particles.diameter)
+           + getVectorBytes(particles.image) + getVectorBytes(particles.body)
+           + getVectorBytes(particles.orientation) + getVectorBytes(particles.angmom)
+           + getVectorBytes(particles.inertia) + getGroupSnapshotBytes(frame.bond_data)
+           + getGroupSnapshotBytes(frame.angle_data) + getGroupSnapshotBytes(frame.dihedral_data)
+           + getGroupSnapshotBytes(frame.improper_data)
+           + getGroupSnapshotBytes(frame.constraint_data) + getGroupSnapshotBytes(frame.pair_data);
     }
 
 int GSDDequeWriter::getMaxQueueSize() const
@@ -88,8 +148,7 @@ void GSDDequeWriter::setMaxQueueSize(int new_max_size)
         }
     while (static_cast<size_t>(m_queue_size) < m_frame_queue.size())
         {
-        m_frame_queue.pop_back();
-        m_log_queue.pop_back();
+        popFrame();
         }
     }
 
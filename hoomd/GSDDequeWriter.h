@@ -27,7 +27,7 @@ class PYBIND11_EXPORT GSDDequeWriter : public GSDDumpWriter
                    std::string mode,
                    bool write_on_init,
                    uint64_t timestep);
-    ~GSDDequeWriter() = default;
+    ~GSDDequeWriter();
 
     void analyze(uint64_t timestep) override;
 
@@ -42,6 +42,18 @@ class PYBIND11_EXPORT GSDDequeWriter : public GSDDumpWriter
     int m_queue_size;
     std::deque<GSDDumpWriter::GSDFrame> m_frame_queue;
     std::deque<pybind11::dict> m_log_queue;
+
+    /// Bytes held by the frames in m_frame_queue, as reported to the MemoryTracker
+    size_t m_queue_bytes = 0;
+
+    /// Remove the frame at the back of the queue
+    void popFrame();
+
+    /// Report the bytes held by the queued frames to the MemoryTracker
+    void setQueueBytes(size_t bytes);
+
+    /// Estimate the number of bytes held by a frame
+    static size_t getFrameBytes(const GSDFrame& frame);
     };
 
 namespace detail
@@ -355,6 +355,9 @@ void GSDDumpWriter::analyze(uint64_t timestep)
     Analyzer::analyze(timestep);
     int retval;
 
+    // the log data is a Python object
+    pybind11::gil_scoped_acquire acquire;
+
     // truncate the file if requested
     if (m_truncate)
         {
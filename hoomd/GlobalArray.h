@@ -40,18 +40,39 @@
 #include <sstream>
 #include <string>
 #include <type_traits>
+#include <typeinfo>
 #include <unistd.h>
 #include <vector>
 
-#define TAG_ALLOCATION(array)              \
-        {                                  \
-        array.setTag(std::string(#array)); \
+/// Tag an array with its variable name and the class that owns it
+/*! Use in member functions only. The owning class is accounted as the component in the
+    MemoryTracker.
+*/
+#define TAG_ALLOCATION(array)                                                     \
+        {                                                                         \
+        array.setTag(std::string(#array), hoomd::detail::getComponentName(this)); \
         }
 
 namespace hoomd
     {
 namespace detail
     {
+/// Get the demangled name of the static type of a class
+/*! The argument is only used to deduce the class, TAG_ALLOCATION passes `this`.
+ */
+template<class Owner> std::string getComponentName(const Owner*)
+    {
+    const std::string type_name = typeid(Owner).name();
+    int status;
+    char* realname = abi::__cxa_demangle(type_name.c_str(), 0, 0, &status);
+    if (status)
+        return type_name;
+
+    std::string result(realname);
+    free(realname);
+    return result;
+    }
+
 #ifdef __GNUC__
 #define GCC_VERSION (__GNUC__ * 10000 + __GNUC_MINOR__ * 100 + __GNUC_PATCHLEVEL__)
 /* Test for GCC < 5.0 */
@@ -237,7 +258,10 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         {
 #ifndef ALWAYS_USE_MANAGED_MEMORY
         if (!(m_is_managed))
+            {
+            track();
             return;
+            }
 #endif
 
         assert(this->m_exec_conf);
@@ -251,10 +275,14 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
 
         if (m_num_elements > 0)
             allocate();
+        track();
         }
 
     //! Destructor
-    virtual ~GlobalArray() { }
+    virtual ~GlobalArray()
+        {
+        untrack();
+        }
 
     //! Copy constructor
     GlobalArray(const GlobalArray& from) noexcept
@@ -263,8 +291,8 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
           m_fallback(from.m_fallback),
 #endif
           m_num_elements(from.m_num_elements), m_pitch(from.m_pitch), m_height(from.m_height),
-          m_acquired(false), m_tag(from.m_tag), m_align_bytes(from.m_align_bytes),
-          m_is_managed(false)
+          m_acquired(false), m_tag(from.m_tag), m_component(from.m_component),
+          m_align_bytes(from.m_align_bytes), m_is_managed(false)
         {
         if (from.m_data.get())
             {
@@ -285,11 +313,14 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
 
             std::copy(from.m_data.get(), from.m_data.get() + from.m_num_elements, m_data.get());
             }
+
+        track();
         }
 
     //! = operator
     GlobalArray& operator=(const GlobalArray& rhs) noexcept
         {
+        untrack();
         m_exec_conf = rhs.m_exec_conf;
 #ifndef ALWAYS_USE_MANAGED_MEMORY
         m_fallback = rhs.m_fallback;
@@ -303,6 +334,7 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
             m_acquired = false;
             m_align_bytes = rhs.m_align_bytes;
             m_tag = rhs.m_tag;
+            m_component = rhs.m_component;
 
             if (rhs.m_data.get())
                 {
@@ -329,6 +361,7 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
                 }
             }
 
+        track();
         return *this;
         }
 
@@ -341,12 +374,16 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
           m_data(std::move(other.m_data)), m_num_elements(std::move(other.m_num_elements)),
           m_pitch(std::move(other.m_pitch)), m_height(std::move(other.m_height)),
           m_acquired(std::move(other.m_acquired)), m_tag(std::move(other.m_tag)),
-          m_align_bytes(std::move(other.m_align_bytes)), m_is_managed(std::move(other.m_is_managed))
+          m_component(std::move(other.m_component)), m_align_bytes(std::move(other.m_align_bytes)),
+          m_is_managed(std::move(other.m_is_managed))
 #ifdef ENABLE_HIP
           ,
           m_event(std::move(other.m_event))
 #endif
         {
+        // the accounted bytes move with the allocation
+        m_tracked_bytes = other.m_tracked_bytes;
+        other.m_tracked_bytes = 0;
         }
 
     //! Move assignment operator
@@ -355,6 +392,7 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         // call base clas method
         if (&other != this)
             {
+            untrack();
             m_exec_conf = std::move(other.m_exec_conf);
 #ifndef ALWAYS_USE_MANAGED_MEMORY
             m_fallback = std::move(other.m_fallback);
@@ -365,11 +403,14 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
             m_height = std::move(other.m_height);
             m_acquired = std::move(other.m_acquired);
             m_tag = std::move(other.m_tag);
+            m_component = std::move(other.m_component);
             m_align_bytes = std::move(other.m_align_bytes);
             m_is_managed = std::move(other.m_is_managed);
 #ifdef ENABLE_HIP
             m_event = std::move(other.m_event);
 #endif
+            m_tracked_bytes = other.m_tracked_bytes;
+            other.m_tracked_bytes = 0;
             }
 
         return *this;
@@ -399,7 +440,10 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         {
 #ifndef ALWAYS_USE_MANAGED_MEMORY
         if (!m_is_managed)
+            {
+            track();
             return;
+            }
 #endif
 
         // make m_pitch the next multiple of 16 larger or equal to the given width
@@ -417,6 +461,7 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
 
         if (m_num_elements > 0)
             allocate();
+        track();
         }
 
     //! Swap the pointers of two GlobalArrays
@@ -433,6 +478,8 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         std::swap(m_pitch, from.m_pitch);
         std::swap(m_height, from.m_height);
         std::swap(m_tag, from.m_tag);
+        std::swap(m_component, from.m_component);
+        std::swap(m_tracked_bytes, from.m_tracked_bytes);
         std::swap(m_align_bytes, from.m_align_bytes);
         std::swap(m_is_managed, from.m_is_managed);
 #ifdef ENABLE_HIP
@@ -526,6 +573,7 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         if (!this->m_exec_conf || !m_is_managed)
             {
             m_fallback.resize(num_elements);
+            track();
             this->outputRepresentation();
             return;
             }
@@ -566,6 +614,7 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         m_pitch = m_num_elements;
         m_height = 1;
 
+        track();
         outputRepresentation();
         }
 
@@ -578,6 +627,7 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         if (!m_is_managed)
             {
             m_fallback.resize(width, height);
+            track();
             outputRepresentation();
             return;
             }
@@ -625,16 +675,23 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
 
         m_height = height;
         m_pitch = pitch;
+        track();
         outputRepresentation();
         }
 
     //! Set an optional tag for memory profiling
-    /*! tag The name of this allocation
+    /*! \param tag The name of this allocation
+        \param component The name of the class that owns this allocation
      */
-    inline void setTag(const std::string& tag)
+    inline void setTag(const std::string& tag, const std::string& component = std::string())
         {
+        // move the accounted bytes to the new name
+        untrack();
+
         // update the tag
         m_tag = tag;
+        m_component = component;
+        track();
 
         // set tag on deleter so it can be displayed upon free
         if (!isNull() && m_data)
@@ -740,7 +797,10 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
 
     mutable bool m_acquired; //!< Tracks if the array is already acquired
 
-    std::string m_tag; //!< Name tag of this buffer (optional)
+    std::string m_tag;       //!< Name tag of this buffer (optional)
+    std::string m_component; //!< Name of the class that owns this buffer (optional)
+
+    size_t m_tracked_bytes = 0; //!< Bytes reported to the MemoryTracker
 
     size_t m_align_bytes; //!< Size of alignment in bytes
     bool m_is_managed;    //!< Whether or not this array is stored using managed memory.
@@ -750,6 +810,29 @@ template<class T> class GlobalArray : public GPUArrayBase<T, GlobalArray<T>>
         m_event; //! CUDA event for synchronization
 #endif
 
+    //! Report the bytes held by this array to the MemoryTracker
+    void track()
+        {
+        size_t bytes = isNull() ? 0 : getNumElements() * sizeof(T);
+        if (bytes == m_tracked_bytes)
+            return;
+
+        untrack();
+        if (bytes > 0 && this->m_exec_conf)
+            {
+            this->m_exec_conf->getMemoryTracker()->add(m_component, m_tag, bytes);
+            m_tracked_bytes = bytes;
+            }
+        }
+
+    //! Remove the bytes held by this array from the MemoryTracker
+    void untrack()
+        {
+        if (m_tracked_bytes > 0 && this->m_exec_conf)
+            this->m_exec_conf->getMemoryTracker()->remove(m_component, m_tag, m_tracked_bytes);
+        m_tracked_bytes = 0;
+        }
+
     //! Allocate the managed array and construct the items
     void allocate()
         {
@@ -170,23 +170,37 @@ void Integrator::computeNetForce(uint64_t timestep)
         force->compute(timestep);
         }
 
+    // Sum the torques only when a force applies them or when the net torque array is already in
+    // use. Otherwise, leave the optional net torque array unallocated.
+    bool sum_torque = m_pdata->isAllocated(pdata_array::net_torque);
+    for (const auto& force : m_forces)
+        sum_torque = sum_torque || force->isAnisotropic();
+    for (const auto& constraint_force : m_constraint_forces)
+        sum_torque = sum_torque || constraint_force->isAnisotropic();
+
     Scalar external_virial[6];
     Scalar external_energy;
         {
         // access the net force and virial arrays
         const GlobalArray<Scalar4>& net_force = m_pdata->getNetForce();
         const GlobalArray<Scalar>& net_virial = m_pdata->getNetVirial();
-        const GlobalArray<Scalar4>& net_torque = m_pdata->getNetTorqueArray();
         ArrayHandle<Scalar4> h_net_force(net_force, access_location::host, access_mode::overwrite);
         ArrayHandle<Scalar> h_net_virial(net_virial, access_location::host, access_mode::overwrite);
-        ArrayHandle<Scalar4> h_net_torque(net_torque,
-                                          access_location::host,
-                                          access_mode::overwrite);
 
         // start by zeroing the net force and virial arrays
         memset((void*)h_net_force.data, 0, sizeof(Scalar4) * net_force.getNumElements());
         memset((void*)h_net_virial.data, 0, sizeof(Scalar) * net_virial.getNumElements());
-        memset((void*)h_net_torque.data, 0, sizeof(Scalar4) * net_torque.getNumElements());
+
+        std::unique_ptr<ArrayHandle<Scalar4>> h_net_torque;
+        if (sum_torque)
+            {
+            const GlobalArray<Scalar4>& net_torque = m_pdata->getNetTorqueArray();
+            h_net_torque.reset(new ArrayHandle<Scalar4>(net_torque,
+                                                        access_location::host,
+                                                        access_mode::overwrite));
+            memset((void*)h_net_torque->data, 0, sizeof(Scalar4) * net_torque.getNumElements());
+            }
+        Scalar4* net_torque_data = h_net_torque ? h_net_torque->data : nullptr;
 
         for (unsigned int i = 0; i < 6; ++i)
             external_virial[i] = Scalar(0.0);
@@ -200,7 +214,6 @@ void Integrator::computeNetForce(uint64_t timestep)
 
         assert(nparticles <= net_force.getNumElements());
         assert(6 * nparticles <= net_virial.getNumElements());
-        assert(nparticles <= net_torque.getNumElements());
 
         for (const auto& force : m_forces)
             {
@@ -224,10 +237,13 @@ void Integrator::computeNetForce(uint64_t timestep)
                 h_net_force.data[j].z += h_force.data[j].z;
                 h_net_force.data[j].w += h_force.data[j].w;
 
-                h_net_torque.data[j].x += h_torque.data[j].x;
-                h_net_torque.data[j].y += h_torque.data[j].y;
-                h_net_torque.data[j].z += h_torque.data[j].z;
-                h_net_torque.data[j].w += h_torque.data[j].w;
+                if (net_torque_data)
+                    {
+                    net_torque_data[j].x += h_torque.data[j].x;
+                    net_torque_data[j].y += h_torque.data[j].y;
+                    net_torque_data[j].z += h_torque.data[j].z;
+                    net_torque_data[j].w += h_torque.data[j].w;
+                    }
 
                 for (unsigned int k = 0; k < 6; k++)
                     {
@@ -275,14 +291,19 @@ void Integrator::computeNetForce(uint64_t timestep)
         // access the net force and virial arrays
         const GlobalArray<Scalar4>& net_force = m_pdata->getNetForce();
         const GlobalArray<Scalar>& net_virial = m_pdata->getNetVirial();
-        const GlobalArray<Scalar4>& net_torque = m_pdata->getNetTorqueArray();
         ArrayHandle<Scalar4> h_net_force(net_force, access_location::host, access_mode::readwrite);
         ArrayHandle<Scalar> h_net_virial(net_virial, access_location::host, access_mode::readwrite);
-        ArrayHandle<Scalar4> h_net_torque(net_torque,
-                                          access_location::host,
-                                          access_mode::readwrite);
         size_t net_virial_pitch = net_virial.getPitch();
 
+        std::unique_ptr<ArrayHandle<Scalar4>> h_net_torque;
+        if (sum_torque)
+            {
+            h_net_torque.reset(new ArrayHandle<Scalar4>(m_pdata->getNetTorqueArray(),
+                                                        access_location::host,
+                                                        access_mode::readwrite));
+            }
+        Scalar4* net_torque_data = h_net_torque ? h_net_torque->data : nullptr;
+
         // now, add up the net forces
         unsigned int nparticles = m_pdata->getN();
         assert(nparticles <= net_force.getNumElements());
@@ -308,10 +329,13 @@ void Integrator::computeNetForce(uint64_t timestep)
                 h_net_force.data[j].z += h_force.data[j].z;
                 h_net_force.data[j].w += h_force.data[j].w;
 
-                h_net_torque.data[j].x += h_torque.data[j].x;
-                h_net_torque.data[j].y += h_torque.data[j].y;
-                h_net_torque.data[j].z += h_torque.data[j].z;
-                h_net_torque.data[j].w += h_torque.data[j].w;
+                if (net_torque_data)
+                    {
+                    net_torque_data[j].x += h_torque.data[j].x;
+                    net_torque_data[j].y += h_torque.data[j].y;
+                    net_torque_data[j].z += h_torque.data[j].z;
+                    net_torque_data[j].w += h_torque.data[j].w;
+                    }
 
                 for (unsigned int k = 0; k < 6; k++)
                     {
@@ -0,0 +1,126 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+/*! \file MemoryTracker.cc
+    \brief Defines the MemoryTracker class
+*/
+
+#include "MemoryTracker.h"
+
+#include <pybind11/stl.h>
+
+#include <algorithm>
+
+namespace hoomd
+    {
+namespace
+    {
+/// Replace empty names with the name GlobalArray uses for untagged arrays
+std::string nameOrAnonymous(const std::string& name)
+    {
+    return name.empty() ? std::string("anonymous") : name;
+    }
+
+/// Add bytes to a Usage and update the peak
+void addBytes(MemoryTracker::Usage& usage, size_t bytes)
+    {
+    usage.current += bytes;
+    usage.peak = std::max(usage.peak, usage.current);
+    }
+
+/// Remove bytes from a Usage
+void removeBytes(MemoryTracker::Usage& usage, size_t bytes)
+    {
+    usage.current -= std::min(usage.current, bytes);
+    }
+    } // end anonymous namespace
+
+void MemoryTracker::add(const std::string& component, const std::string& tag, size_t bytes)
+    {
+    const std::string component_name = nameOrAnonymous(component);
+    std::lock_guard<std::mutex> lock(m_mutex);
+
+    addBytes(m_total, bytes);
+    addBytes(m_components[component_name], bytes);
+    addBytes(m_allocations[std::make_pair(component_name, nameOrAnonymous(tag))], bytes);
+    }
+
+void MemoryTracker::remove(const std::string& component, const std::string& tag, size_t bytes)
+    {
+    const std::string component_name = nameOrAnonymous(component);
+    std::lock_guard<std::mutex> lock(m_mutex);
+
+    removeBytes(m_total, bytes);
+    removeBytes(m_components[component_name], bytes);
+    removeBytes(m_allocations[std::make_pair(component_name, nameOrAnonymous(tag))], bytes);
+    }
+
+MemoryTracker::Usage MemoryTracker::getTotal() const
+    {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    return m_total;
+    }
+
+std::map<std::string, MemoryTracker::Usage> MemoryTracker::getComponents() const
+    {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    return m_components;
+    }
+
+std::vector<std::tuple<std::string, std::string, size_t, size_t>>
+MemoryTracker::getAllocations() const
+    {
+    std::lock_guard<std::mutex> lock(m_mutex);
+
+    std::vector<std::tuple<std::string, std::string, size_t, size_t>> result;
+    result.reserve(m_allocations.size());
+    for (const auto& allocation : m_allocations)
+        {
+        result.push_back(std::make_tuple(allocation.first.first,
+                                         allocation.first.second,
+                                         allocation.second.current,
+                                         allocation.second.peak));
+        }
+    return result;
+    }
+
+void MemoryTracker::resetPeak()
+    {
+    std::lock_guard<std::mutex> lock(m_mutex);
+
+    m_total.peak = m_total.current;
+    for (auto& component : m_components)
+        component.second.peak = component.second.current;
+    for (auto& allocation : m_allocations)
+        allocation.second.peak = allocation.second.current;
+    }
+
+namespace detail
+    {
+void export_MemoryTracker(pybind11::module& m)
+    {
+    pybind11::class_<MemoryTracker, std::shared_ptr<MemoryTracker>>(m, "MemoryTracker")
+        .def("getTotal",
+             [](const MemoryTracker& tracker)
+             {
+                 auto total = tracker.getTotal();
+                 return std::make_pair(total.current, total.peak);
+             })
+        .def("getComponents",
+             [](const MemoryTracker& tracker)
+             {
+                 std::map<std::string, std::pair<size_t, size_t>> result;
+                 for (const auto& component : tracker.getComponents())
+                     {
+                     result[component.first]
+                         = std::make_pair(component.second.current, component.second.peak);
+                     }
+                 return result;
+             })
+        .def("getAllocations", &MemoryTracker::getAllocations)
+        .def("resetPeak", &MemoryTracker::resetPeak);
+    }
+
+    } // end namespace detail
+
+    } // end namespace hoomd
@@ -0,0 +1,95 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#pragma once
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#include <pybind11/pybind11.h>
+
+#include <map>
+#include <mutex>
+#include <string>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+/*! \file MemoryTracker.h
+    \brief Declares the MemoryTracker class
+*/
+
+namespace hoomd
+    {
+/// Account for the memory held by GlobalArray allocations.
+/*! Every GlobalArray reports the bytes it holds to the MemoryTracker of its execution
+    configuration. Allocations are identified by the owning component (the class that tagged the
+    array with TAG_ALLOCATION) and the tag (the name of the member variable). MemoryTracker keeps
+    the current and the peak number of bytes for each allocation, for each component, and in total.
+
+    Arrays that were never tagged are accounted under the name "anonymous".
+
+    MemoryTracker is thread safe.
+*/
+class PYBIND11_EXPORT MemoryTracker
+    {
+    public:
+    /// Current and peak number of bytes
+    struct Usage
+        {
+        /// Bytes currently allocated
+        size_t current = 0;
+
+        /// Largest value of current since construction or the last call to resetPeak()
+        size_t peak = 0;
+        };
+
+    /// Record an allocation
+    /*! \param component Name of the owning component
+        \param tag Name of the allocation
+        \param bytes Number of bytes allocated
+    */
+    void add(const std::string& component, const std::string& tag, size_t bytes);
+
+    /// Record a deallocation
+    /*! \param component Name of the owning component
+        \param tag Name of the allocation
+        \param bytes Number of bytes freed
+    */
+    void remove(const std::string& component, const std::string& tag, size_t bytes);
+
+    /// Get the memory usage summed over all allocations
+    Usage getTotal() const;
+
+    /// Get the memory usage of each component
+    std::map<std::string, Usage> getComponents() const;
+
+    /// Get the memory usage of each allocation as (component, tag, current, peak) tuples
+    std::vector<std::tuple<std::string, std::string, size_t, size_t>> getAllocations() const;
+
+    /// Set the peak values to the current values
+    void resetPeak();
+
+    private:
+    /// Protect concurrent access to the accounting data
+    mutable std::mutex m_mutex;
+
+    /// Usage summed over all allocations
+    Usage m_total;
+
+    /// Usage of each component
+    std::map<std::string, Usage> m_components;
+
+    /// Usage of each allocation, indexed by (component, tag)
+    std::map<std::pair<std::string, std::string>, Usage> m_allocations;
+    };
+
+namespace detail
+    {
+/// Export MemoryTracker to python
+void export_MemoryTracker(pybind11::module& m);
+
+    } // end namespace detail
+
+    } // end namespace hoomd
@@ -39,7 +39,8 @@ MeshGroupData<group_size, Group, name, snap>::MeshGroupData(std::shared_ptr<Part
     // connect to particle sort signal
     this->m_pdata->getParticleSortSignal()
         .template connect<BondedGroupData<group_size, Group, name, true>,
-                          &BondedGroupData<group_size, Group, name, true>::setDirty>(this);
+                          &BondedGroupData<group_size, Group, name, true>::slotParticleSort>(
+            this);
 
 #ifdef ENABLE_MPI
     if (this->m_pdata->getDomainDecomposition())
@@ -73,7 +74,8 @@ MeshGroupData<group_size, Group, name, snap>::MeshGroupData(std::shared_ptr<Part
     // connect to particle sort signal
     this->m_pdata->getParticleSortSignal()
         .template connect<BondedGroupData<group_size, Group, name, true>,
-                          &BondedGroupData<group_size, Group, name, true>::setDirty>(this);
+                          &BondedGroupData<group_size, Group, name, true>::slotParticleSort>(
+            this);
 
     // initialize from snapshot
     initializeFromSnapshot(snapshot);
@@ -95,7 +97,8 @@ MeshGroupData<group_size, Group, name, snap>::~MeshGroupData()
     {
     this->m_pdata->getParticleSortSignal()
         .template disconnect<BondedGroupData<group_size, Group, name, true>,
-                             &BondedGroupData<group_size, Group, name, true>::setDirty>(this);
+                             &BondedGroupData<group_size, Group, name, true>::slotParticleSort>(
+            this);
 #ifdef ENABLE_MPI
     this->m_pdata->getSingleParticleMoveSignal()
         .template disconnect<BondedGroupData<group_size, Group, name, true>,
@@ -56,6 +56,66 @@ class mpi_io : public std::streambuf
     };
 #endif
 
+//! Stream buffer that holds the GIL while it writes to a Python stream
+/*! System::run releases the GIL, so messages printed during a run must acquire it before they touch
+    the Python stream object. gil_pythonbuf forwards all output to a pybind11 pythonbuf with the GIL
+    held.
+*/
+class gil_pythonbuf : public std::streambuf
+    {
+    public:
+    //! Constructor
+    /*! \param pyostream Python object with write() and flush() methods
+        \pre The caller holds the GIL
+    */
+    explicit gil_pythonbuf(pybind11::object pyostream)
+        : m_buf(new pybind11::detail::pythonbuf(pyostream))
+        {
+        }
+
+    virtual ~gil_pythonbuf()
+        {
+        if (Py_IsInitialized())
+            {
+            pybind11::gil_scoped_acquire acquire;
+            m_buf.reset();
+            }
+        else
+            {
+            // The Python stream no longer exists, it is not safe to flush or release it
+            m_buf.release();
+            }
+        }
+
+    protected:
+    //! Write a character
+    virtual int_type overflow(int_type c)
+        {
+        if (traits_type::eq_int_type(c, traits_type::eof()))
+            return traits_type::not_eof(c);
+
+        pybind11::gil_scoped_acquire acquire;
+        return m_buf->sputc(traits_type::to_char_type(c));
+        }
+
+    //! Write a sequence of characters
+    virtual std::streamsize xsputn(const char_type* s, std::streamsize n)
+        {
+        pybind11::gil_scoped_acquire acquire;
+        return m_buf->sputn(s, n);
+        }
+
+    //! Flush the output to Python
+    virtual int sync()
+        {
+        pybind11::gil_scoped_acquire acquire;
+        return m_buf->pubsync();
+        }
+
+    private:
+    std::unique_ptr<pybind11::detail::pythonbuf> m_buf; //!< The wrapped Python stream buffer
+    };
+
     } // end namespace detail
 
 /*! \post Warning and error streams are set to cerr
@@ -342,8 +402,8 @@ void Messenger::openFile(const std::string& fname)
    displayed in the notebook properly. It is also useful if the user decides to remap sys.stdout to
    something.
 
-    The iostream writes acquire the GIL, so they are safe to call from methods that have released
-   the GIL.
+    The streams acquire the GIL when they write, so they are safe to use from methods that have
+   released the GIL (such as System::run). openPython() itself must be called with the GIL held.
 */
 void Messenger::openPython()
     {
@@ -354,8 +414,8 @@ void Messenger::openPython()
     m_pystdout = m_sys.attr("stdout");
     m_pystderr = m_sys.attr("stderr");
 
-    m_streambuf_out = std::shared_ptr<std::streambuf>(new pybind11::detail::pythonbuf(m_pystdout));
-    m_streambuf_err = std::shared_ptr<std::streambuf>(new pybind11::detail::pythonbuf(m_pystderr));
+    m_streambuf_out = std::shared_ptr<std::streambuf>(new detail::gil_pythonbuf(m_pystdout));
+    m_streambuf_err = std::shared_ptr<std::streambuf>(new detail::gil_pythonbuf(m_pystderr));
 
     // now update the error, warning, and notice streams
     m_file_out = std::shared_ptr<std::ostream>(new std::ostream(m_streambuf_out.get()));
@@ -376,6 +436,9 @@ void Messenger::reopenPythonIfNeeded()
     // and python is initialized
     if (m_python_open && Py_IsInitialized())
         {
+        // System::run releases the GIL, take it back before accessing sys
+        pybind11::gil_scoped_acquire acquire;
+
         // flush and reopen the streams if sys.stdout or sys.stderr change
         pybind11::object new_pystdout = m_sys.attr("stdout");
         pybind11::object new_pystderr = m_sys.attr("stderr");
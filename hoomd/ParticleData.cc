@@ -47,6 +47,20 @@ std::string getDefaultTypeName(unsigned int id)
     return result;
     }
 
+//! Allocate an array with N elements and fill it with the given value
+template<class T>
+static void allocateFilled(GlobalArray<T>& array,
+                           unsigned int N,
+                           const T& value,
+                           std::shared_ptr<const ExecutionConfiguration> exec_conf)
+    {
+    GlobalArray<T> new_array(N, exec_conf);
+    array.swap(new_array);
+
+    ArrayHandle<T> h_array(array, access_location::host, access_mode::overwrite);
+    std::fill(h_array.data, h_array.data + N, value);
+    }
+
     } // end namespace detail
 
 ////////////////////////////////////////////////////////////////////////////
@@ -290,6 +304,28 @@ void ParticleData::notifyParticleSort()
     m_sort_signal.emit();
     }
 
+/*! \param order Old index of the particle at each new index, for the local particles
+
+    Call this method instead of notifyParticleSort() after permuting the local particles in place.
+    The caller must keep the ghost particles at the same indices and update the reverse-lookup tags
+    of the local particles. Subscribers to the sort signal that cache particle indices can remap
+    them with getSortOrder() and getSortReverseOrder().
+*/
+void ParticleData::notifyParticlePermute(const std::vector<unsigned int>& order)
+    {
+    const unsigned int N = getN();
+    assert(order.size() >= N);
+
+    m_sort_order.assign(order.begin(), order.begin() + N);
+    m_sort_reverse_order.resize(N);
+    for (unsigned int i = 0; i < N; i++)
+        m_sort_reverse_order[m_sort_order[i]] = i;
+
+    m_sort_permutation = true;
+    notifyParticleSort();
+    m_sort_permutation = false;
+    }
+
 /*! This function is called any time the ghost particles are removed
  *
  * The rationale is that a subscriber (i.e. the Communicator) can perform clean-up for ghost
@@ -382,16 +418,6 @@ void ParticleData::allocate(unsigned int N)
     m_accel.swap(accel);
     TAG_ALLOCATION(m_accel);
 
-    // charge
-    GlobalArray<Scalar> charge(N, m_exec_conf);
-    m_charge.swap(charge);
-    TAG_ALLOCATION(m_charge);
-
-    // diameter
-    GlobalArray<Scalar> diameter(N, m_exec_conf);
-    m_diameter.swap(diameter);
-    TAG_ALLOCATION(m_diameter);
-
     // image
     GlobalArray<int3> image(N, m_exec_conf);
     m_image.swap(image);
@@ -402,50 +428,42 @@ void ParticleData::allocate(unsigned int N)
     m_tag.swap(tag);
     TAG_ALLOCATION(m_tag);
 
-    // body ID
-    GlobalArray<unsigned int> body(N, m_exec_conf);
-    m_body.swap(body);
-    TAG_ALLOCATION(m_body);
-
     GlobalArray<Scalar4> net_force(N, m_exec_conf);
     m_net_force.swap(net_force);
     TAG_ALLOCATION(m_net_force);
     GlobalArray<Scalar> net_virial(N, 6, m_exec_conf);
     m_net_virial.swap(net_virial);
     TAG_ALLOCATION(m_net_virial);
-    GlobalArray<Scalar4> net_torque(N, m_exec_conf);
-    m_net_torque.swap(net_torque);
-    TAG_ALLOCATION(m_net_torque);
 
         {
         ArrayHandle<Scalar4> h_net_force(m_net_force,
                                          access_location::host,
                                          access_mode::overwrite);
-        ArrayHandle<Scalar4> h_net_torque(m_net_torque,
-                                          access_location::host,
-                                          access_mode::overwrite);
         ArrayHandle<Scalar> h_net_virial(m_net_virial,
                                          access_location::host,
                                          access_mode::overwrite);
         memset(h_net_force.data, 0, sizeof(Scalar4) * m_net_force.getNumElements());
-        memset(h_net_torque.data, 0, sizeof(Scalar4) * m_net_torque.getNumElements());
         memset(h_net_virial.data, 0, sizeof(Scalar) * m_net_virial.getNumElements());
         }
 
-    GlobalArray<Scalar4> orientation(N, m_exec_conf);
-    m_orientation.swap(orientation);
-    TAG_ALLOCATION(m_orientation);
-    GlobalArray<Scalar4> angmom(N, m_exec_conf);
-    m_angmom.swap(angmom);
-    TAG_ALLOCATION(m_angmom);
-    GlobalArray<Scalar3> inertia(N, m_exec_conf);
-    m_inertia.swap(inertia);
-    TAG_ALLOCATION(m_inertia);
-
     GlobalArray<unsigned int> comm_flags(N, m_exec_conf);
     m_comm_flags.swap(comm_flags);
     TAG_ALLOCATION(m_comm_flags);
 
+    m_arrays_allocated = true;
+
+    // The CPU allocates the optional arrays on first use. The GPU code paths access all of them.
+    if (m_exec_conf->isCUDAEnabled())
+        {
+        allocateOptionalArray(pdata_array::charge);
+        allocateOptionalArray(pdata_array::diameter);
+        allocateOptionalArray(pdata_array::body);
+        allocateOptionalArray(pdata_array::orientation);
+        allocateOptionalArray(pdata_array::angmom);
+        allocateOptionalArray(pdata_array::inertia);
+        allocateOptionalArray(pdata_array::net_torque);
+        }
+
 #if defined(ENABLE_HIP) && defined(__HIP_PLATFORM_NVCC__)
     if (m_exec_conf->isCUDAEnabled() && m_exec_conf->allConcurrentManagedAccess())
         {
@@ -499,12 +517,11 @@ void ParticleData::allocate(unsigned int N)
 #endif
 
     // allocate alternate particle data arrays (for swapping in-out)
-    allocateAlternateArrays(N);
+    if (m_alternate_arrays)
+        allocateAlternateArrays(N);
 
     // notify observers
     m_max_particle_num_signal.emit();
-
-    m_arrays_allocated = true;
     }
 
 /*! \param N Number of particles to allocate memory for
@@ -529,14 +546,20 @@ void ParticleData::allocateAlternateArrays(unsigned int N)
     TAG_ALLOCATION(m_accel_alt);
 
     // charge
-    GlobalArray<Scalar> charge_alt(N, m_exec_conf);
-    m_charge_alt.swap(charge_alt);
-    TAG_ALLOCATION(m_charge_alt);
+    if (!m_charge.isNull())
+        {
+        GlobalArray<Scalar> charge_alt(N, m_exec_conf);
+        m_charge_alt.swap(charge_alt);
+        TAG_ALLOCATION(m_charge_alt);
+        }
 
     // diameter
-    GlobalArray<Scalar> diameter_alt(N, m_exec_conf);
-    m_diameter_alt.swap(diameter_alt);
-    TAG_ALLOCATION(m_diameter_alt);
+    if (!m_diameter.isNull())
+        {
+        GlobalArray<Scalar> diameter_alt(N, m_exec_conf);
+        m_diameter_alt.swap(diameter_alt);
+        TAG_ALLOCATION(m_diameter_alt);
+        }
 
     // image
     GlobalArray<int3> image_alt(N, m_exec_conf);
@@ -549,24 +572,36 @@ void ParticleData::allocateAlternateArrays(unsigned int N)
     TAG_ALLOCATION(m_tag_alt);
 
     // body ID
-    GlobalArray<unsigned int> body_alt(N, m_exec_conf);
-    m_body_alt.swap(body_alt);
-    TAG_ALLOCATION(m_body_alt);
+    if (!m_body.isNull())
+        {
+        GlobalArray<unsigned int> body_alt(N, m_exec_conf);
+        m_body_alt.swap(body_alt);
+        TAG_ALLOCATION(m_body_alt);
+        }
 
     // orientation
-    GlobalArray<Scalar4> orientation_alt(N, m_exec_conf);
-    m_orientation_alt.swap(orientation_alt);
-    TAG_ALLOCATION(m_orientation_alt);
+    if (!m_orientation.isNull())
+        {
+        GlobalArray<Scalar4> orientation_alt(N, m_exec_conf);
+        m_orientation_alt.swap(orientation_alt);
+        TAG_ALLOCATION(m_orientation_alt);
+        }
 
     // angular momentum
-    GlobalArray<Scalar4> angmom_alt(N, m_exec_conf);
-    m_angmom_alt.swap(angmom_alt);
-    TAG_ALLOCATION(m_angmom_alt);
+    if (!m_angmom.isNull())
+        {
+        GlobalArray<Scalar4> angmom_alt(N, m_exec_conf);
+        m_angmom_alt.swap(angmom_alt);
+        TAG_ALLOCATION(m_angmom_alt);
+        }
 
     // moments of inertia
-    GlobalArray<Scalar3> inertia_alt(N, m_exec_conf);
-    m_inertia_alt.swap(inertia_alt);
-    TAG_ALLOCATION(m_inertia_alt);
+    if (!m_inertia.isNull())
+        {
+        GlobalArray<Scalar3> inertia_alt(N, m_exec_conf);
+        m_inertia_alt.swap(inertia_alt);
+        TAG_ALLOCATION(m_inertia_alt);
+        }
 
     // Net force
     GlobalArray<Scalar4> net_force_alt(N, m_exec_conf);
@@ -579,22 +614,20 @@ void ParticleData::allocateAlternateArrays(unsigned int N)
     TAG_ALLOCATION(m_net_virial_alt);
 
     // Net torque
-    GlobalArray<Scalar4> net_torque_alt(N, m_exec_conf);
-    m_net_torque_alt.swap(net_torque_alt);
-    TAG_ALLOCATION(m_net_torque_alt);
+    if (!m_net_torque.isNull())
+        {
+        detail::allocateFilled(m_net_torque_alt, N, make_scalar4(0, 0, 0, 0), m_exec_conf);
+        TAG_ALLOCATION(m_net_torque_alt);
+        }
 
         {
         ArrayHandle<Scalar4> h_net_force_alt(m_net_force_alt,
                                              access_location::host,
                                              access_mode::overwrite);
-        ArrayHandle<Scalar4> h_net_torque_alt(m_net_torque_alt,
-                                              access_location::host,
-                                              access_mode::overwrite);
         ArrayHandle<Scalar> h_net_virial_alt(m_net_virial_alt,
                                              access_location::host,
                                              access_mode::overwrite);
         memset(h_net_force_alt.data, 0, sizeof(Scalar4) * m_net_force_alt.getNumElements());
-        memset(h_net_torque_alt.data, 0, sizeof(Scalar4) * m_net_torque_alt.getNumElements());
         memset(h_net_virial_alt.data, 0, sizeof(Scalar) * m_net_virial_alt.getNumElements());
         }
 
@@ -648,6 +681,180 @@ void ParticleData::allocateAlternateArrays(unsigned int N)
 #endif
     }
 
+/*! \param array Optional array to allocate
+
+    Allocates \a array (and its alternate array, when the alternate arrays are allocated) with
+    the current maximum number of particles and fills it with the default value. Does nothing
+    when the array is already allocated.
+*/
+void ParticleData::allocateOptionalArray(pdata_array::Enum array) const
+    {
+    if (!m_arrays_allocated || isAllocated(array))
+        return;
+
+    const unsigned int N = m_max_nparticles;
+    const bool alternate = hasAlternateArrays();
+    switch (array)
+        {
+    case pdata_array::charge:
+        detail::allocateFilled(m_charge, N, Scalar(0.0), m_exec_conf);
+        TAG_ALLOCATION(m_charge);
+        if (alternate)
+            {
+            detail::allocateFilled(m_charge_alt, N, Scalar(0.0), m_exec_conf);
+            TAG_ALLOCATION(m_charge_alt);
+            }
+        break;
+    case pdata_array::diameter:
+        detail::allocateFilled(m_diameter, N, Scalar(1.0), m_exec_conf);
+        TAG_ALLOCATION(m_diameter);
+        if (alternate)
+            {
+            detail::allocateFilled(m_diameter_alt, N, Scalar(1.0), m_exec_conf);
+            TAG_ALLOCATION(m_diameter_alt);
+            }
+        break;
+    case pdata_array::body:
+        detail::allocateFilled(m_body, N, (unsigned int)NO_BODY, m_exec_conf);
+        TAG_ALLOCATION(m_body);
+        if (alternate)
+            {
+            detail::allocateFilled(m_body_alt, N, (unsigned int)NO_BODY, m_exec_conf);
+            TAG_ALLOCATION(m_body_alt);
+            }
+        break;
+    case pdata_array::orientation:
+        detail::allocateFilled(m_orientation, N, make_scalar4(1, 0, 0, 0), m_exec_conf);
+        TAG_ALLOCATION(m_orientation);
+        if (alternate)
+            {
+            detail::allocateFilled(m_orientation_alt, N, make_scalar4(1, 0, 0, 0), m_exec_conf);
+            TAG_ALLOCATION(m_orientation_alt);
+            }
+        break;
+    case pdata_array::angmom:
+        detail::allocateFilled(m_angmom, N, make_scalar4(0, 0, 0, 0), m_exec_conf);
+        TAG_ALLOCATION(m_angmom);
+        if (alternate)
+            {
+            detail::allocateFilled(m_angmom_alt, N, make_scalar4(0, 0, 0, 0), m_exec_conf);
+            TAG_ALLOCATION(m_angmom_alt);
+            }
+        break;
+    case pdata_array::inertia:
+        detail::allocateFilled(m_inertia, N, make_scalar3(0, 0, 0), m_exec_conf);
+        TAG_ALLOCATION(m_inertia);
+        if (alternate)
+            {
+            detail::allocateFilled(m_inertia_alt, N, make_scalar3(0, 0, 0), m_exec_conf);
+            TAG_ALLOCATION(m_inertia_alt);
+            }
+        break;
+    case pdata_array::net_torque:
+        detail::allocateFilled(m_net_torque, N, make_scalar4(0, 0, 0, 0), m_exec_conf);
+        TAG_ALLOCATION(m_net_torque);
+        if (alternate)
+            {
+            detail::allocateFilled(m_net_torque_alt, N, make_scalar4(0, 0, 0, 0), m_exec_conf);
+            TAG_ALLOCATION(m_net_torque_alt);
+            }
+        break;
+        }
+
+    m_exec_conf->msg->notice(7) << "Allocated optional particle data array " << array << std::endl;
+    }
+
+/*! \param array Optional array to check
+    \returns true when \a array is allocated
+*/
+bool ParticleData::isAllocated(pdata_array::Enum array) const
+    {
+    switch (array)
+        {
+    case pdata_array::charge:
+        return !m_charge.isNull();
+    case pdata_array::diameter:
+        return !m_diameter.isNull();
+    case pdata_array::body:
+        return !m_body.isNull();
+    case pdata_array::orientation:
+        return !m_orientation.isNull();
+    case pdata_array::angmom:
+        return !m_angmom.isNull();
+    case pdata_array::inertia:
+        return !m_inertia.isNull();
+    case pdata_array::net_torque:
+        return !m_net_torque.isNull();
+        }
+    return false;
+    }
+
+/*! Allocate each optional array for which the given particle value differs from the default.
+ */
+void ParticleData::allocateOptionalArrays(Scalar charge,
+                                          Scalar diameter,
+                                          unsigned int body,
+                                          const Scalar4& orientation,
+                                          const Scalar4& angmom,
+                                          const Scalar3& inertia,
+                                          const Scalar4& net_torque)
+    {
+    if (charge != Scalar(0.0))
+        allocateOptionalArray(pdata_array::charge);
+    if (diameter != Scalar(1.0))
+        allocateOptionalArray(pdata_array::diameter);
+    if (body != NO_BODY)
+        allocateOptionalArray(pdata_array::body);
+    if (orientation != make_scalar4(1, 0, 0, 0))
+        allocateOptionalArray(pdata_array::orientation);
+    if (angmom != make_scalar4(0, 0, 0, 0))
+        allocateOptionalArray(pdata_array::angmom);
+    if (inertia != make_scalar3(0, 0, 0))
+        allocateOptionalArray(pdata_array::inertia);
+    if (net_torque != make_scalar4(0, 0, 0, 0))
+        allocateOptionalArray(pdata_array::net_torque);
+    }
+
+/*! \param alternate_arrays Set to false to free the alternate per-particle arrays
+
+    Without the alternate arrays, removeParticles() compacts the particle data in place, and
+    SFCPackTuner permutes the particle data in place. This saves one copy of every per-particle
+    array at the cost of slower sorts. The GPU code paths require the alternate arrays.
+*/
+void ParticleData::setAlternateArrays(bool alternate_arrays)
+    {
+    if (!alternate_arrays && m_exec_conf->isCUDAEnabled())
+        {
+        throw std::runtime_error("The GPU requires the alternate particle data arrays.");
+        }
+
+    m_alternate_arrays = alternate_arrays;
+    if (!m_arrays_allocated)
+        return;
+
+    if (m_alternate_arrays && !hasAlternateArrays())
+        {
+        allocateAlternateArrays(m_max_nparticles);
+        }
+    else if (!m_alternate_arrays && hasAlternateArrays())
+        {
+        m_pos_alt = GlobalArray<Scalar4>();
+        m_vel_alt = GlobalArray<Scalar4>();
+        m_accel_alt = GlobalArray<Scalar3>();
+        m_charge_alt = GlobalArray<Scalar>();
+        m_diameter_alt = GlobalArray<Scalar>();
+        m_image_alt = GlobalArray<int3>();
+        m_tag_alt = GlobalArray<unsigned int>();
+        m_body_alt = GlobalArray<unsigned int>();
+        m_orientation_alt = GlobalArray<Scalar4>();
+        m_angmom_alt = GlobalArray<Scalar4>();
+        m_inertia_alt = GlobalArray<Scalar3>();
+        m_net_force_alt = GlobalArray<Scalar4>();
+        m_net_virial_alt = GlobalArray<Scalar>();
+        m_net_torque_alt = GlobalArray<Scalar4>();
+        }
+    }
+
 //! Set global number of particles
 /*! \param nglobal Global number of particles
  */
@@ -741,33 +948,43 @@ void ParticleData::reallocate(unsigned int max_n)
     m_pos.resize(max_n);
     m_vel.resize(max_n);
     m_accel.resize(max_n);
-    m_charge.resize(max_n);
-    m_diameter.resize(max_n);
     m_image.resize(max_n);
     m_tag.resize(max_n);
-    m_body.resize(max_n);
 
     m_net_force.resize(max_n);
     m_net_virial.resize(max_n, 6);
-    m_net_torque.resize(max_n);
         {
         ArrayHandle<Scalar4> h_net_force(m_net_force,
                                          access_location::host,
                                          access_mode::readwrite);
-        ArrayHandle<Scalar4> h_net_torque(m_net_torque,
-                                          access_location::host,
-                                          access_mode::readwrite);
         ArrayHandle<Scalar> h_net_virial(m_net_virial,
                                          access_location::host,
                                          access_mode::readwrite);
         memset(h_net_force.data, 0, sizeof(Scalar4) * m_net_force.getNumElements());
-        memset(h_net_torque.data, 0, sizeof(Scalar4) * m_net_torque.getNumElements());
         memset(h_net_virial.data, 0, sizeof(Scalar) * m_net_virial.getNumElements());
         }
 
-    m_orientation.resize(max_n);
-    m_angmom.resize(max_n);
-    m_inertia.resize(max_n);
+    // resize only the optional arrays that are in use
+    if (!m_charge.isNull())
+        m_charge.resize(max_n);
+    if (!m_diameter.isNull())
+        m_diameter.resize(max_n);
+    if (!m_body.isNull())
+        m_body.resize(max_n);
+    if (!m_orientation.isNull())
+        m_orientation.resize(max_n);
+    if (!m_angmom.isNull())
+        m_angmom.resize(max_n);
+    if (!m_inertia.isNull())
+        m_inertia.resize(max_n);
+    if (!m_net_torque.isNull())
+        {
+        m_net_torque.resize(max_n);
+        ArrayHandle<Scalar4> h_net_torque(m_net_torque,
+                                          access_location::host,
+                                          access_mode::readwrite);
+        memset(h_net_torque.data, 0, sizeof(Scalar4) * m_net_torque.getNumElements());
+        }
 
     m_comm_flags.resize(max_n);
 
@@ -826,34 +1043,44 @@ void ParticleData::reallocate(unsigned int max_n)
         m_pos_alt.resize(max_n);
         m_vel_alt.resize(max_n);
         m_accel_alt.resize(max_n);
-        m_charge_alt.resize(max_n);
-        m_diameter_alt.resize(max_n);
         m_image_alt.resize(max_n);
         m_tag_alt.resize(max_n);
-        m_body_alt.resize(max_n);
-        m_orientation_alt.resize(max_n);
-        m_angmom_alt.resize(max_n);
-        m_inertia_alt.resize(max_n);
 
         m_net_force_alt.resize(max_n);
-        m_net_torque_alt.resize(max_n);
         m_net_virial_alt.resize(max_n, 6);
 
             {
             ArrayHandle<Scalar4> h_net_force_alt(m_net_force_alt,
                                                  access_location::host,
                                                  access_mode::overwrite);
-            ArrayHandle<Scalar4> h_net_torque_alt(m_net_torque_alt,
-                                                  access_location::host,
-                                                  access_mode::overwrite);
             ArrayHandle<Scalar> h_net_virial_alt(m_net_virial_alt,
                                                  access_location::host,
                                                  access_mode::overwrite);
             memset(h_net_force_alt.data, 0, sizeof(Scalar4) * m_net_force_alt.getNumElements());
-            memset(h_net_torque_alt.data, 0, sizeof(Scalar4) * m_net_torque_alt.getNumElements());
             memset(h_net_virial_alt.data, 0, sizeof(Scalar) * m_net_virial_alt.getNumElements());
             }
 
+        if (!m_charge_alt.isNull())
+            m_charge_alt.resize(max_n);
+        if (!m_diameter_alt.isNull())
+            m_diameter_alt.resize(max_n);
+        if (!m_body_alt.isNull())
+            m_body_alt.resize(max_n);
+        if (!m_orientation_alt.isNull())
+            m_orientation_alt.resize(max_n);
+        if (!m_angmom_alt.isNull())
+            m_angmom_alt.resize(max_n);
+        if (!m_inertia_alt.isNull())
+            m_inertia_alt.resize(max_n);
+        if (!m_net_torque_alt.isNull())
+            {
+            m_net_torque_alt.resize(max_n);
+            ArrayHandle<Scalar4> h_net_torque_alt(m_net_torque_alt,
+                                                  access_location::host,
+                                                  access_mode::overwrite);
+            memset(h_net_torque_alt.data, 0, sizeof(Scalar4) * m_net_torque_alt.getNumElements());
+            }
+
 #if defined(ENABLE_HIP) && defined(__HIP_PLATFORM_NVCC__)
         if (m_exec_conf->isCUDAEnabled() && m_exec_conf->allConcurrentManagedAccess())
             {
@@ -1231,6 +1458,18 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
         // resize particle data
         resize(m_nparticles);
 
+        // allocate the optional arrays that the local particles use
+        for (unsigned int idx = 0; idx < m_nparticles; idx++)
+            {
+            allocateOptionalArrays(charge[idx],
+                                   diameter[idx],
+                                   body[idx],
+                                   orientation[idx],
+                                   angmom[idx],
+                                   inertia[idx],
+                                   make_scalar4(0, 0, 0, 0));
+            }
+
         // Load particle data
         ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::overwrite);
         ArrayHandle<Scalar4> h_vel(m_vel, access_location::host, access_mode::overwrite);
@@ -1256,15 +1495,23 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
                 = make_scalar4(pos[idx].x, pos[idx].y, pos[idx].z, __int_as_scalar(type[idx]));
             h_vel.data[idx] = make_scalar4(vel[idx].x, vel[idx].y, vel[idx].z, mass[idx]);
             h_accel.data[idx] = accel[idx];
-            h_charge.data[idx] = charge[idx];
-            h_diameter.data[idx] = diameter[idx];
             h_image.data[idx] = image[idx];
             h_tag.data[idx] = tag[idx];
             h_rtag.data[tag[idx]] = idx;
-            h_body.data[idx] = body[idx];
-            h_orientation.data[idx] = orientation[idx];
-            h_angmom.data[idx] = angmom[idx];
-            h_inertia.data[idx] = inertia[idx];
+
+            // optional arrays that are not allocated hold the default values
+            if (h_charge.data)
+                h_charge.data[idx] = charge[idx];
+            if (h_diameter.data)
+                h_diameter.data[idx] = diameter[idx];
+            if (h_body.data)
+                h_body.data[idx] = body[idx];
+            if (h_orientation.data)
+                h_orientation.data[idx] = orientation[idx];
+            if (h_angmom.data)
+                h_angmom.data[idx] = angmom[idx];
+            if (h_inertia.data)
+                h_inertia.data[idx] = inertia[idx];
 
             h_comm_flag.data[idx] = 0; // initialize with zero
             }
@@ -1281,6 +1528,23 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
         // allocate particle data such that we can accommodate the particles
         resize(snapshot.size);
 
+        // allocate the optional arrays that the particles use
+        for (unsigned int snap_idx = 0; snap_idx < snapshot.size; snap_idx++)
+            {
+            if (ignore_bodies && snapshot.body[snap_idx] != NO_BODY)
+                {
+                continue;
+                }
+
+            allocateOptionalArrays(snapshot.charge[snap_idx],
+                                   snapshot.diameter[snap_idx],
+                                   snapshot.body[snap_idx],
+                                   quat_to_scalar4(snapshot.orientation[snap_idx]),
+                                   quat_to_scalar4(snapshot.angmom[snap_idx]),
+                                   vec_to_scalar3(snapshot.inertia[snap_idx]),
+                                   make_scalar4(0, 0, 0, 0));
+            }
+
         ArrayHandle<Scalar4> h_pos(m_pos, access_location::host, access_mode::overwrite);
         ArrayHandle<Scalar4> h_vel(m_vel, access_location::host, access_mode::overwrite);
         ArrayHandle<Scalar3> h_accel(m_accel, access_location::host, access_mode::overwrite);
@@ -1315,15 +1579,23 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
                                                snapshot.vel[snap_idx].z,
                                                snapshot.mass[snap_idx]);
             h_accel.data[nglobal] = vec_to_scalar3(snapshot.accel[snap_idx]);
-            h_charge.data[nglobal] = snapshot.charge[snap_idx];
-            h_diameter.data[nglobal] = snapshot.diameter[snap_idx];
             h_image.data[nglobal] = snapshot.image[snap_idx];
             h_tag.data[nglobal] = nglobal;
             h_rtag.data[nglobal] = nglobal;
-            h_body.data[nglobal] = snapshot.body[snap_idx];
-            h_orientation.data[nglobal] = quat_to_scalar4(snapshot.orientation[snap_idx]);
-            h_angmom.data[nglobal] = quat_to_scalar4(snapshot.angmom[snap_idx]);
-            h_inertia.data[nglobal] = vec_to_scalar3(snapshot.inertia[snap_idx]);
+
+            // optional arrays that are not allocated hold the default values
+            if (h_charge.data)
+                h_charge.data[nglobal] = snapshot.charge[snap_idx];
+            if (h_diameter.data)
+                h_diameter.data[nglobal] = snapshot.diameter[snap_idx];
+            if (h_body.data)
+                h_body.data[nglobal] = snapshot.body[snap_idx];
+            if (h_orientation.data)
+                h_orientation.data[nglobal] = quat_to_scalar4(snapshot.orientation[snap_idx]);
+            if (h_angmom.data)
+                h_angmom.data[nglobal] = quat_to_scalar4(snapshot.angmom[snap_idx]);
+            if (h_inertia.data)
+                h_inertia.data[nglobal] = vec_to_scalar3(snapshot.inertia[snap_idx]);
             nglobal++;
             }
 
@@ -1428,16 +1700,17 @@ template<class Real> void ParticleData::takeSnapshot(SnapshotParticleData<Real>&
             accel[idx] = h_accel.data[idx];
             type[idx] = __scalar_as_int(h_pos.data[idx].w);
             mass[idx] = h_vel.data[idx].w;
-            charge[idx] = h_charge.data[idx];
-            diameter[idx] = h_diameter.data[idx];
+            charge[idx] = h_charge.data ? h_charge.data[idx] : Scalar(0.0);
+            diameter[idx] = h_diameter.data ? h_diameter.data[idx] : Scalar(1.0);
             image[idx] = h_image.data[idx];
             image[idx].x -= m_o_image.x;
             image[idx].y -= m_o_image.y;
             image[idx].z -= m_o_image.z;
-            body[idx] = h_body.data[idx];
-            orientation[idx] = h_orientation.data[idx];
-            angmom[idx] = h_angmom.data[idx];
-            inertia[idx] = h_inertia.data[idx];
+            body[idx] = h_body.data ? h_body.data[idx] : NO_BODY;
+            orientation[idx]
+                = h_orientation.data ? h_orientation.data[idx] : make_scalar4(1, 0, 0, 0);
+            angmom[idx] = h_angmom.data ? h_angmom.data[idx] : make_scalar4(0, 0, 0, 0);
+            inertia[idx] = h_inertia.data ? h_inertia.data[idx] : make_scalar3(0, 0, 0);
 
             // insert reverse lookup global tag -> idx
             rtag_map.insert(std::pair<unsigned int, unsigned int>(h_tag.data[idx], idx));
@@ -1592,16 +1865,20 @@ template<class Real> void ParticleData::takeSnapshot(SnapshotParticleData<Real>&
             snapshot.accel[snap_id] = vec3<Real>(h_accel.data[idx]);
             snapshot.type[snap_id] = __scalar_as_int(h_pos.data[idx].w);
             snapshot.mass[snap_id] = Real(h_vel.data[idx].w);
-            snapshot.charge[snap_id] = Real(h_charge.data[idx]);
-            snapshot.diameter[snap_id] = Real(h_diameter.data[idx]);
+            // optional arrays that are not allocated hold the default values
+            snapshot.charge[snap_id] = h_charge.data ? Real(h_charge.data[idx]) : Real(0.0);
+            snapshot.diameter[snap_id] = h_diameter.data ? Real(h_diameter.data[idx]) : Real(1.0);
             snapshot.image[snap_id] = h_image.data[idx];
             snapshot.image[snap_id].x -= m_o_image.x;
             snapshot.image[snap_id].y -= m_o_image.y;
             snapshot.image[snap_id].z -= m_o_image.z;
-            snapshot.body[snap_id] = h_body.data[idx];
-            snapshot.orientation[snap_id] = quat<Real>(h_orientation.data[idx]);
-            snapshot.angmom[snap_id] = quat<Real>(h_angmom.data[idx]);
-            snapshot.inertia[snap_id] = vec3<Real>(h_inertia.data[idx]);
+            snapshot.body[snap_id] = h_body.data ? h_body.data[idx] : NO_BODY;
+            snapshot.orientation[snap_id]
+                = h_orientation.data ? quat<Real>(h_orientation.data[idx]) : quat<Real>();
+            snapshot.angmom[snap_id] = h_angmom.data ? quat<Real>(h_angmom.data[idx])
+                                                     : quat<Real>(Real(0), vec3<Real>());
+            snapshot.inertia[snap_id]
+                = h_inertia.data ? vec3<Real>(h_inertia.data[idx]) : vec3<Real>();
 
             // make sure the position stored in the snapshot is within the boundaries
             Scalar3 tmp = vec_to_scalar3(snapshot.pos[snap_id]);
@@ -1823,7 +2100,8 @@ Scalar ParticleData::getCharge(unsigned int tag) const
     if (found)
         {
         ArrayHandle<Scalar> h_charge(m_charge, access_location::host, access_mode::read);
-        result = h_charge.data[idx];
+        if (h_charge.data)
+            result = h_charge.data[idx];
         }
 #ifdef ENABLE_MPI
     if (m_decomposition)
@@ -1865,11 +2143,12 @@ Scalar ParticleData::getDiameter(unsigned int tag) const
     {
     unsigned int idx = getRTag(tag);
     bool found = (idx < getN());
-    Scalar result = 0.0;
+    Scalar result = 1.0;
     if (found)
         {
         ArrayHandle<Scalar> h_diameter(m_diameter, access_location::host, access_mode::read);
-        result = h_diameter.data[idx];
+        if (h_diameter.data)
+            result = h_diameter.data[idx];
         }
 #ifdef ENABLE_MPI
     if (m_decomposition)
@@ -1888,11 +2167,12 @@ unsigned int ParticleData::getBody(unsigned int tag) const
     {
     unsigned int idx = getRTag(tag);
     bool found = (idx < getN());
-    unsigned int result = 0;
+    unsigned int result = NO_BODY;
     if (found)
         {
         ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::read);
-        result = h_body.data[idx];
+        if (h_body.data)
+            result = h_body.data[idx];
         }
 #ifdef ENABLE_MPI
     if (m_decomposition)
@@ -1934,11 +2214,12 @@ Scalar4 ParticleData::getOrientation(unsigned int tag) const
     {
     unsigned int idx = getRTag(tag);
     bool found = (idx < getN());
-    Scalar4 result = make_scalar4(0.0, 0.0, 0.0, 0.0);
+    Scalar4 result = make_scalar4(1.0, 0.0, 0.0, 0.0);
     if (found)
         {
         ArrayHandle<Scalar4> h_orientation(m_orientation, access_location::host, access_mode::read);
-        result = h_orientation.data[idx];
+        if (h_orientation.data)
+            result = h_orientation.data[idx];
         }
 #ifdef ENABLE_MPI
     if (m_decomposition)
@@ -1964,7 +2245,8 @@ Scalar4 ParticleData::getAngularMomentum(unsigned int tag) const
     if (found)
         {
         ArrayHandle<Scalar4> h_angmom(m_angmom, access_location::host, access_mode::read);
-        result = h_angmom.data[idx];
+        if (h_angmom.data)
+            result = h_angmom.data[idx];
         }
 #ifdef ENABLE_MPI
     if (m_decomposition)
@@ -1990,7 +2272,8 @@ Scalar3 ParticleData::getMomentsOfInertia(unsigned int tag) const
     if (found)
         {
         ArrayHandle<Scalar3> h_inertia(m_inertia, access_location::host, access_mode::read);
-        result = h_inertia.data[idx];
+        if (h_inertia.data)
+            result = h_inertia.data[idx];
         }
 #ifdef ENABLE_MPI
     if (m_decomposition)
@@ -2041,7 +2324,8 @@ Scalar4 ParticleData::getNetTorque(unsigned int tag) const
     if (found)
         {
         ArrayHandle<Scalar4> h_net_torque(m_net_torque, access_location::host, access_mode::read);
-        result = h_net_torque.data[idx];
+        if (h_net_torque.data)
+            result = h_net_torque.data[idx];
         }
 #ifdef ENABLE_MPI
     if (m_decomposition)
@@ -2276,7 +2560,7 @@ void ParticleData::setCharge(unsigned int tag, Scalar charge)
 #endif
     if (found)
         {
-        ArrayHandle<Scalar> h_charge(m_charge, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_charge(getCharges(), access_location::host, access_mode::readwrite);
         h_charge.data[idx] = charge;
         }
     }
@@ -2312,7 +2596,9 @@ void ParticleData::setDiameter(unsigned int tag, Scalar diameter)
 #endif
     if (found)
         {
-        ArrayHandle<Scalar> h_diameter(m_diameter, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_diameter(getDiameters(),
+                                       access_location::host,
+                                       access_mode::readwrite);
         h_diameter.data[idx] = diameter;
         }
     }
@@ -2330,7 +2616,9 @@ void ParticleData::setBody(unsigned int tag, int body)
 #endif
     if (found)
         {
-        ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_body(getBodies(),
+                                         access_location::host,
+                                         access_mode::readwrite);
         h_body.data[idx] = body;
         }
     }
@@ -2369,7 +2657,7 @@ void ParticleData::setOrientation(unsigned int tag, const Scalar4& orientation)
 #endif
     if (found)
         {
-        ArrayHandle<Scalar4> h_orientation(m_orientation,
+        ArrayHandle<Scalar4> h_orientation(getOrientationArray(),
                                            access_location::host,
                                            access_mode::readwrite);
         h_orientation.data[idx] = orientation;
@@ -2389,7 +2677,9 @@ void ParticleData::setAngularMomentum(unsigned int tag, const Scalar4& angmom)
 #endif
     if (found)
         {
-        ArrayHandle<Scalar4> h_angmom(m_angmom, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_angmom(getAngularMomentumArray(),
+                                      access_location::host,
+                                      access_mode::readwrite);
         h_angmom.data[idx] = angmom;
         }
     }
@@ -2407,7 +2697,9 @@ void ParticleData::setMomentsOfInertia(unsigned int tag, const Scalar3& inertia)
 #endif
     if (found)
         {
-        ArrayHandle<Scalar3> h_inertia(m_inertia, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar3> h_inertia(getMomentsOfInertiaArray(),
+                                       access_location::host,
+                                       access_mode::readwrite);
         h_inertia.data[idx] = inertia;
         }
     }
@@ -2490,21 +2782,13 @@ unsigned int ParticleData::addParticle(unsigned int type)
         ArrayHandle<Scalar3> h_accel(getAccelerations(),
                                      access_location::host,
                                      access_mode::readwrite);
-        ArrayHandle<Scalar> h_charge(getCharges(), access_location::host, access_mode::readwrite);
-        ArrayHandle<Scalar> h_diameter(getDiameters(),
-                                       access_location::host,
-                                       access_mode::readwrite);
+        ArrayHandle<Scalar> h_charge(m_charge, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_diameter(m_diameter, access_location::host, access_mode::readwrite);
         ArrayHandle<int3> h_image(getImages(), access_location::host, access_mode::readwrite);
-        ArrayHandle<Scalar4> h_angmom(getAngularMomentumArray(),
-                                      access_location::host,
-                                      access_mode::readwrite);
-        ArrayHandle<Scalar3> h_inertia(getMomentsOfInertiaArray(),
-                                       access_location::host,
-                                       access_mode::readwrite);
-        ArrayHandle<unsigned int> h_body(getBodies(),
-                                         access_location::host,
-                                         access_mode::readwrite);
-        ArrayHandle<Scalar4> h_orientation(getOrientationArray(),
+        ArrayHandle<Scalar4> h_angmom(m_angmom, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar3> h_inertia(m_inertia, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_orientation(m_orientation,
                                            access_location::host,
                                            access_mode::readwrite);
         ArrayHandle<unsigned int> h_tag(getTags(), access_location::host, access_mode::readwrite);
@@ -2518,14 +2802,22 @@ unsigned int ParticleData::addParticle(unsigned int type)
         h_pos.data[idx] = make_scalar4(0, 0, 0, __int_as_scalar(type));
         h_vel.data[idx] = make_scalar4(0, 0, 0, 1.0);
         h_accel.data[idx] = make_scalar3(0, 0, 0);
-        h_charge.data[idx] = 0.0;
-        h_diameter.data[idx] = 1.0;
         h_image.data[idx] = make_int3(0, 0, 0);
-        h_angmom.data[idx] = make_scalar4(0, 0, 0, 0);
-        h_inertia.data[idx] = make_scalar3(0, 0, 0);
-        h_body.data[idx] = NO_BODY;
-        h_orientation.data[idx] = make_scalar4(1.0, 0.0, 0.0, 0.0);
         h_tag.data[idx] = tag;
+
+        // optional arrays that are not allocated already hold the default values
+        if (h_charge.data)
+            h_charge.data[idx] = 0.0;
+        if (h_diameter.data)
+            h_diameter.data[idx] = 1.0;
+        if (h_angmom.data)
+            h_angmom.data[idx] = make_scalar4(0, 0, 0, 0);
+        if (h_inertia.data)
+            h_inertia.data[idx] = make_scalar3(0, 0, 0);
+        if (h_body.data)
+            h_body.data[idx] = NO_BODY;
+        if (h_orientation.data)
+            h_orientation.data[idx] = make_scalar4(1.0, 0.0, 0.0, 0.0);
         h_comm_flag.data[idx] = 0;
         }
 
@@ -2607,17 +2899,15 @@ void ParticleData::removeParticle(unsigned int tag)
             ArrayHandle<Scalar3> h_accel(getAccelerations(),
                                          access_location::host,
                                          access_mode::readwrite);
-            ArrayHandle<Scalar> h_charge(getCharges(),
+            ArrayHandle<Scalar> h_charge(m_charge,
                                          access_location::host,
                                          access_mode::readwrite);
-            ArrayHandle<Scalar> h_diameter(getDiameters(),
+            ArrayHandle<Scalar> h_diameter(m_diameter,
                                            access_location::host,
                                            access_mode::readwrite);
             ArrayHandle<int3> h_image(getImages(), access_location::host, access_mode::readwrite);
-            ArrayHandle<unsigned int> h_body(getBodies(),
-                                             access_location::host,
-                                             access_mode::readwrite);
-            ArrayHandle<Scalar4> h_orientation(getOrientationArray(),
+            ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::readwrite);
+            ArrayHandle<Scalar4> h_orientation(m_orientation,
                                                access_location::host,
                                                access_mode::readwrite);
             ArrayHandle<unsigned int> h_tag(getTags(),
@@ -2633,12 +2923,16 @@ void ParticleData::removeParticle(unsigned int tag)
             h_pos.data[idx] = h_pos.data[size - 1];
             h_vel.data[idx] = h_vel.data[size - 1];
             h_accel.data[idx] = h_accel.data[size - 1];
-            h_charge.data[idx] = h_charge.data[size - 1];
-            h_diameter.data[idx] = h_diameter.data[size - 1];
             h_image.data[idx] = h_image.data[size - 1];
-            h_body.data[idx] = h_body.data[size - 1];
-            h_orientation.data[idx] = h_orientation.data[size - 1];
             h_tag.data[idx] = h_tag.data[size - 1];
+            if (h_charge.data)
+                h_charge.data[idx] = h_charge.data[size - 1];
+            if (h_diameter.data)
+                h_diameter.data[idx] = h_diameter.data[size - 1];
+            if (h_body.data)
+                h_body.data[idx] = h_body.data[size - 1];
+            if (h_orientation.data)
+                h_orientation.data[idx] = h_orientation.data[size - 1];
             h_comm_flag.data[idx] = h_comm_flag.data[size - 1];
 
             unsigned int last_tag = h_tag.data[size - 1];
@@ -2774,6 +3068,8 @@ void export_ParticleData(pybind11::module& m)
         .def("setGlobalBoxL", &ParticleData::setGlobalBoxL)
         .def("setGlobalBox", setGlobalBox_overload)
         .def("getN", &ParticleData::getN)
+        .def("setAlternateArrays", &ParticleData::setAlternateArrays)
+        .def("hasAlternateArrays", &ParticleData::hasAlternateArrays)
         .def("getNGhosts", &ParticleData::getNGhosts)
         .def("getNGlobal", &ParticleData::getNGlobal)
         .def("getNTypes", &ParticleData::getNTypes)
@@ -2930,6 +3226,9 @@ void ParticleData::removeParticles(std::vector<detail::pdata_element>& out,
     unsigned int old_nparticles = getN();
     unsigned int new_nparticles = m_nparticles - num_remove_ptls;
 
+    // without alternate arrays, compact the remaining particles in place
+    const bool in_place = !hasAlternateArrays();
+
     // resize output buffers
     out.resize(num_remove_ptls);
     comm_flags.resize(num_remove_ptls);
@@ -2944,27 +3243,20 @@ void ParticleData::removeParticles(std::vector<detail::pdata_element>& out,
         ArrayHandle<Scalar3> h_accel(getAccelerations(),
                                      access_location::host,
                                      access_mode::readwrite);
-        ArrayHandle<Scalar> h_charge(getCharges(), access_location::host, access_mode::readwrite);
-        ArrayHandle<Scalar> h_diameter(getDiameters(),
-                                       access_location::host,
-                                       access_mode::readwrite);
+        // the optional arrays that are not allocated give null pointers
+        ArrayHandle<Scalar> h_charge(m_charge, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_diameter(m_diameter, access_location::host, access_mode::readwrite);
         ArrayHandle<int3> h_image(getImages(), access_location::host, access_mode::readwrite);
-        ArrayHandle<unsigned int> h_body(getBodies(),
-                                         access_location::host,
-                                         access_mode::readwrite);
-        ArrayHandle<Scalar4> h_orientation(getOrientationArray(),
+        ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_orientation(m_orientation,
                                            access_location::host,
                                            access_mode::readwrite);
-        ArrayHandle<Scalar4> h_angmom(getAngularMomentumArray(),
-                                      access_location::host,
-                                      access_mode::readwrite);
-        ArrayHandle<Scalar3> h_inertia(getMomentsOfInertiaArray(),
-                                       access_location::host,
-                                       access_mode::readwrite);
+        ArrayHandle<Scalar4> h_angmom(m_angmom, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar3> h_inertia(m_inertia, access_location::host, access_mode::readwrite);
         ArrayHandle<Scalar4> h_net_force(getNetForce(),
                                          access_location::host,
                                          access_mode::readwrite);
-        ArrayHandle<Scalar4> h_net_torque(getNetTorqueArray(),
+        ArrayHandle<Scalar4> h_net_torque(m_net_torque,
                                           access_location::host,
                                           access_mode::readwrite);
         ArrayHandle<Scalar> h_net_virial(getNetVirial(),
@@ -3016,6 +3308,22 @@ void ParticleData::removeParticles(std::vector<detail::pdata_element>& out,
                                             access_location::host,
                                             access_mode::overwrite);
 
+        // kept particles go to the alternate arrays, or in place to index n <= i
+        Scalar4* pos_out = in_place ? h_pos.data : h_pos_alt.data;
+        Scalar4* vel_out = in_place ? h_vel.data : h_vel_alt.data;
+        Scalar3* accel_out = in_place ? h_accel.data : h_accel_alt.data;
+        Scalar* charge_out = in_place ? h_charge.data : h_charge_alt.data;
+        Scalar* diameter_out = in_place ? h_diameter.data : h_diameter_alt.data;
+        int3* image_out = in_place ? h_image.data : h_image_alt.data;
+        unsigned int* body_out = in_place ? h_body.data : h_body_alt.data;
+        Scalar4* orientation_out = in_place ? h_orientation.data : h_orientation_alt.data;
+        Scalar4* angmom_out = in_place ? h_angmom.data : h_angmom_alt.data;
+        Scalar3* inertia_out = in_place ? h_inertia.data : h_inertia_alt.data;
+        Scalar4* net_force_out = in_place ? h_net_force.data : h_net_force_alt.data;
+        Scalar4* net_torque_out = in_place ? h_net_torque.data : h_net_torque_alt.data;
+        Scalar* net_virial_out = in_place ? h_net_virial.data : h_net_virial_alt.data;
+        unsigned int* tag_out = in_place ? h_tag.data : h_tag_alt.data;
+
         unsigned int n = 0;
         unsigned int m = 0;
         unsigned int net_virial_pitch = (unsigned int)m_net_virial.getPitch();
@@ -3024,23 +3332,30 @@ void ParticleData::removeParticles(std::vector<detail::pdata_element>& out,
             unsigned int tag = h_tag.data[i];
             if (h_rtag.data[tag] != NOT_LOCAL)
                 {
-                // copy over to alternate pdata arrays
-                h_pos_alt.data[n] = h_pos.data[i];
-                h_vel_alt.data[n] = h_vel.data[i];
-                h_accel_alt.data[n] = h_accel.data[i];
-                h_charge_alt.data[n] = h_charge.data[i];
-                h_diameter_alt.data[n] = h_diameter.data[i];
-                h_image_alt.data[n] = h_image.data[i];
-                h_body_alt.data[n] = h_body.data[i];
-                h_orientation_alt.data[n] = h_orientation.data[i];
-                h_angmom_alt.data[n] = h_angmom.data[i];
-                h_inertia_alt.data[n] = h_inertia.data[i];
-                h_net_force_alt.data[n] = h_net_force.data[i];
-                h_net_torque_alt.data[n] = h_net_torque.data[i];
+                // copy over to the output pdata arrays
+                pos_out[n] = h_pos.data[i];
+                vel_out[n] = h_vel.data[i];
+                accel_out[n] = h_accel.data[i];
+                image_out[n] = h_image.data[i];
+                net_force_out[n] = h_net_force.data[i];
+                if (charge_out)
+                    charge_out[n] = h_charge.data[i];
+                if (diameter_out)
+                    diameter_out[n] = h_diameter.data[i];
+                if (body_out)
+                    body_out[n] = h_body.data[i];
+                if (orientation_out)
+                    orientation_out[n] = h_orientation.data[i];
+                if (angmom_out)
+                    angmom_out[n] = h_angmom.data[i];
+                if (inertia_out)
+                    inertia_out[n] = h_inertia.data[i];
+                if (net_torque_out)
+                    net_torque_out[n] = h_net_torque.data[i];
                 for (unsigned int j = 0; j < 6; ++j)
-                    h_net_virial_alt.data[net_virial_pitch * j + n]
+                    net_virial_out[net_virial_pitch * j + n]
                         = h_net_virial.data[net_virial_pitch * j + i];
-                h_tag_alt.data[n] = h_tag.data[i];
+                tag_out[n] = h_tag.data[i];
                 ++n;
                 }
             else
@@ -3050,15 +3365,17 @@ void ParticleData::removeParticles(std::vector<detail::pdata_element>& out,
                 p.pos = h_pos.data[i];
                 p.vel = h_vel.data[i];
                 p.accel = h_accel.data[i];
-                p.charge = h_charge.data[i];
-                p.diameter = h_diameter.data[i];
+                p.charge = h_charge.data ? h_charge.data[i] : Scalar(0.0);
+                p.diameter = h_diameter.data ? h_diameter.data[i] : Scalar(1.0);
                 p.image = h_image.data[i];
-                p.body = h_body.data[i];
-                p.orientation = h_orientation.data[i];
-                p.angmom = h_angmom.data[i];
-                p.inertia = h_inertia.data[i];
+                p.body = h_body.data ? h_body.data[i] : NO_BODY;
+                p.orientation
+                    = h_orientation.data ? h_orientation.data[i] : make_scalar4(1, 0, 0, 0);
+                p.angmom = h_angmom.data ? h_angmom.data[i] : make_scalar4(0, 0, 0, 0);
+                p.inertia = h_inertia.data ? h_inertia.data[i] : make_scalar3(0, 0, 0);
                 p.net_force = h_net_force.data[i];
-                p.net_torque = h_net_torque.data[i];
+                p.net_torque
+                    = h_net_torque.data ? h_net_torque.data[i] : make_scalar4(0, 0, 0, 0);
                 for (unsigned int j = 0; j < 6; ++j)
                     p.net_virial[j] = h_net_virial.data[net_virial_pitch * j + i];
                 p.tag = h_tag.data[i];
@@ -3077,20 +3394,23 @@ void ParticleData::removeParticles(std::vector<detail::pdata_element>& out,
         }
 
     // swap particle data arrays
-    swapPositions();
-    swapVelocities();
-    swapAccelerations();
-    swapCharges();
-    swapDiameters();
-    swapImages();
-    swapBodies();
-    swapOrientations();
-    swapAngularMomenta();
-    swapMomentsOfInertia();
-    swapNetForce();
-    swapNetTorque();
-    swapNetVirial();
-    swapTags();
+    if (!in_place)
+        {
+        swapPositions();
+        swapVelocities();
+        swapAccelerations();
+        swapCharges();
+        swapDiameters();
+        swapImages();
+        swapBodies();
+        swapOrientations();
+        swapAngularMomenta();
+        swapMomentsOfInertia();
+        swapNetForce();
+        swapNetTorque();
+        swapNetVirial();
+        swapTags();
+        }
 
         {
         ArrayHandle<unsigned int> h_rtag(getRTags(), access_location::host, access_mode::readwrite);
@@ -3121,6 +3441,18 @@ void ParticleData::addParticles(const std::vector<detail::pdata_element>& in)
     // resize particle data using amortized O(1) array resizing
     resize(new_nparticles);
 
+    // allocate the optional arrays that the new particles use
+    for (const auto& p : in)
+        {
+        allocateOptionalArrays(p.charge,
+                               p.diameter,
+                               p.body,
+                               p.orientation,
+                               p.angmom,
+                               p.inertia,
+                               p.net_torque);
+        }
+
         {
         // access particle data arrays
         ArrayHandle<Scalar4> h_pos(getPositions(), access_location::host, access_mode::readwrite);
@@ -3128,27 +3460,20 @@ void ParticleData::addParticles(const std::vector<detail::pdata_element>& in)
         ArrayHandle<Scalar3> h_accel(getAccelerations(),
                                      access_location::host,
                                      access_mode::readwrite);
-        ArrayHandle<Scalar> h_charge(getCharges(), access_location::host, access_mode::readwrite);
-        ArrayHandle<Scalar> h_diameter(getDiameters(),
-                                       access_location::host,
-                                       access_mode::readwrite);
+        // the optional arrays that are not allocated give null pointers
+        ArrayHandle<Scalar> h_charge(m_charge, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_diameter(m_diameter, access_location::host, access_mode::readwrite);
         ArrayHandle<int3> h_image(getImages(), access_location::host, access_mode::readwrite);
-        ArrayHandle<unsigned int> h_body(getBodies(),
-                                         access_location::host,
-                                         access_mode::readwrite);
-        ArrayHandle<Scalar4> h_orientation(getOrientationArray(),
+        ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_orientation(m_orientation,
                                            access_location::host,
                                            access_mode::readwrite);
-        ArrayHandle<Scalar4> h_angmom(getAngularMomentumArray(),
-                                      access_location::host,
-                                      access_mode::readwrite);
-        ArrayHandle<Scalar3> h_inertia(getMomentsOfInertiaArray(),
-                                       access_location::host,
-                                       access_mode::readwrite);
+        ArrayHandle<Scalar4> h_angmom(m_angmom, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar3> h_inertia(m_inertia, access_location::host, access_mode::readwrite);
         ArrayHandle<Scalar4> h_net_force(getNetForce(),
                                          access_location::host,
                                          access_mode::readwrite);
-        ArrayHandle<Scalar4> h_net_torque(getNetTorqueArray(),
+        ArrayHandle<Scalar4> h_net_torque(m_net_torque,
                                           access_location::host,
                                           access_mode::readwrite);
         ArrayHandle<Scalar> h_net_virial(getNetVirial(),
@@ -3170,15 +3495,22 @@ void ParticleData::addParticles(const std::vector<detail::pdata_element>& in)
             h_pos.data[n] = p.pos;
             h_vel.data[n] = p.vel;
             h_accel.data[n] = p.accel;
-            h_charge.data[n] = p.charge;
-            h_diameter.data[n] = p.diameter;
             h_image.data[n] = p.image;
-            h_body.data[n] = p.body;
-            h_orientation.data[n] = p.orientation;
-            h_angmom.data[n] = p.angmom;
-            h_inertia.data[n] = p.inertia;
             h_net_force.data[n] = p.net_force;
-            h_net_torque.data[n] = p.net_torque;
+            if (h_charge.data)
+                h_charge.data[n] = p.charge;
+            if (h_diameter.data)
+                h_diameter.data[n] = p.diameter;
+            if (h_body.data)
+                h_body.data[n] = p.body;
+            if (h_orientation.data)
+                h_orientation.data[n] = p.orientation;
+            if (h_angmom.data)
+                h_angmom.data[n] = p.angmom;
+            if (h_inertia.data)
+                h_inertia.data[n] = p.inertia;
+            if (h_net_torque.data)
+                h_net_torque.data[n] = p.net_torque;
             for (unsigned int j = 0; j < 6; ++j)
                 h_net_virial.data[net_virial_pitch * j + n] = p.net_virial[j];
             h_tag.data[n] = p.tag;
@@ -83,6 +83,22 @@ struct pdata_flag
 //! valid
 typedef std::bitset<32> PDataFlags;
 
+//! List of optional per-particle arrays that ParticleData allocates on first use
+struct pdata_array
+    {
+    //! The enum
+    enum Enum
+        {
+        charge = 0,  //!< Particle charges (default 0)
+        diameter,    //!< Particle diameters (default 1)
+        body,        //!< Rigid body ids (default NO_BODY)
+        orientation, //!< Orientation quaternions (default (1, 0, 0, 0))
+        angmom,      //!< Angular momentum quaternions (default 0)
+        inertia,     //!< Principal moments of inertia (default 0)
+        net_torque   //!< Net torque (default 0)
+        };
+    };
+
 //! Defines a simple structure to deal with complex numbers
 /*! This structure is useful to deal with complex numbers for such situations
     as Fourier transforms. Note that we do not need any to define any operations and the
@@ -323,6 +339,12 @@ struct pdata_element
     changes the order must call notifyParticleSort(). Any class interested in being notified
     can subscribe to the signal by calling connectParticleSort().
 
+    A class that permutes only the local particles in place, keeping the ghost particles where
+    they are, may call notifyParticlePermute() instead. It emits the same sort signal, but while
+    the signal runs, isSortPermutation() returns true and getSortOrder() / getSortReverseOrder()
+    give the permutation. Subscribers that cache particle indices can remap them instead of
+    rebuilding. Subscribers that ignore the permutation handle it like any other sort.
+
     Some fields in ParticleData are not computed and assigned by default because they require
    additional processing time. PDataFlags is a bitset that lists which flags (enumerated in
    pdata_flag) are enable/disabled. Computes should call getFlags() and compute the requested
@@ -568,10 +590,18 @@ class PYBIND11_EXPORT ParticleData
     Scalar getMaxDiameter() const
         {
         Scalar maxdiam = 0;
-        ArrayHandle<Scalar> h_diameter(getDiameters(), access_location::host, access_mode::read);
-        for (unsigned int i = 0; i < m_nparticles; i++)
-            if (h_diameter.data[i] > maxdiam)
-                maxdiam = h_diameter.data[i];
+        if (!isAllocated(pdata_array::diameter))
+            {
+            // all particles have the default diameter
+            maxdiam = m_nparticles > 0 ? Scalar(1.0) : Scalar(0.0);
+            }
+        else
+            {
+            ArrayHandle<Scalar> h_diameter(m_diameter, access_location::host, access_mode::read);
+            for (unsigned int i = 0; i < m_nparticles; i++)
+                if (h_diameter.data[i] > maxdiam)
+                    maxdiam = h_diameter.data[i];
+            }
 #ifdef ENABLE_MPI
         if (m_decomposition)
             {
@@ -591,8 +621,8 @@ class PYBIND11_EXPORT ParticleData
     bool hasBodies() const
         {
         unsigned int has_bodies = 0;
-        ArrayHandle<unsigned int> h_body(getBodies(), access_location::host, access_mode::read);
-        for (unsigned int i = 0; i < getN(); ++i)
+        ArrayHandle<unsigned int> h_body(m_body, access_location::host, access_mode::read);
+        for (unsigned int i = 0; h_body.data && i < getN(); ++i)
             {
             if (h_body.data[i] != NO_BODY)
                 {
@@ -633,14 +663,22 @@ class PYBIND11_EXPORT ParticleData
         }
 
     //! Return charges
+    /*! Allocates the array on first access, see isAllocated().
+     */
     const GlobalArray<Scalar>& getCharges() const
         {
+        if (m_charge.isNull())
+            allocateOptionalArray(pdata_array::charge);
         return m_charge;
         }
 
     //! Return diameters
+    /*! Allocates the array on first access, see isAllocated().
+     */
     const GlobalArray<Scalar>& getDiameters() const
         {
+        if (m_diameter.isNull())
+            allocateOptionalArray(pdata_array::diameter);
         return m_diameter;
         }
 
@@ -663,8 +701,12 @@ class PYBIND11_EXPORT ParticleData
         }
 
     //! Return body ids
+    /*! Allocates the array on first access, see isAllocated().
+     */
     const GlobalArray<unsigned int>& getBodies() const
         {
+        if (m_body.isNull())
+            allocateOptionalArray(pdata_array::body);
         return m_body;
         }
 
@@ -857,6 +899,27 @@ class PYBIND11_EXPORT ParticleData
         m_inertia.swap(m_inertia_alt);
         }
 
+    //! Set whether to allocate the alternate per-particle arrays
+    void setAlternateArrays(bool alternate_arrays);
+
+    //! Check whether the alternate per-particle arrays are allocated
+    /*! When false, the getAlt*() arrays are null and callers must permute the particle data in
+        place.
+    */
+    bool hasAlternateArrays() const
+        {
+        return !m_pos_alt.isNull();
+        }
+
+    //! Check whether an optional per-particle array is allocated
+    /*! On the CPU, ParticleData allocates the optional arrays (see pdata_array) only when they
+        are first accessed or when particles with non-default values are added. Until then, the
+        particles have the default values. Code that only needs an optional array when it holds
+        non-default values should check isAllocated() before calling the accessor, which
+        allocates the array. On the GPU, all optional arrays are always allocated.
+    */
+    bool isAllocated(pdata_array::Enum array) const;
+
     //! Connects a function to be called every time the particles are rearranged in memory
     Nano::Signal<void()>& getParticleSortSignal()
         {
@@ -866,6 +929,31 @@ class PYBIND11_EXPORT ParticleData
     //! Notify listeners that the particles have been rearranged in memory
     void notifyParticleSort();
 
+    //! Notify listeners that the local particles have been permuted in place
+    void notifyParticlePermute(const std::vector<unsigned int>& order);
+
+    //! Check if the current sort signal reports an in-place permutation of the local particles
+    bool isSortPermutation() const
+        {
+        return m_sort_permutation;
+        }
+
+    //! Get the old index of the local particle at each new index
+    /*! Only valid while isSortPermutation() is true.
+     */
+    const std::vector<unsigned int>& getSortOrder() const
+        {
+        return m_sort_order;
+        }
+
+    //! Get the new index of the local particle at each old index
+    /*! Only valid while isSortPermutation() is true.
+     */
+    const std::vector<unsigned int>& getSortReverseOrder() const
+        {
+        return m_sort_reverse_order;
+        }
+
     //! Connects a function to be called every time the box size is changed
     Nano::Signal<void()>& getBoxChangeSignal()
         {
@@ -940,26 +1028,42 @@ class PYBIND11_EXPORT ParticleData
         }
 
     //! Get the net torque array
+    /*! Allocates the array on first access, see isAllocated().
+     */
     const GlobalArray<Scalar4>& getNetTorqueArray() const
         {
+        if (m_net_torque.isNull())
+            allocateOptionalArray(pdata_array::net_torque);
         return m_net_torque;
         }
 
     //! Get the orientation array
+    /*! Allocates the array on first access, see isAllocated().
+     */
     const GlobalArray<Scalar4>& getOrientationArray() const
         {
+        if (m_orientation.isNull())
+            allocateOptionalArray(pdata_array::orientation);
         return m_orientation;
         }
 
     //! Get the angular momentum array
+    /*! Allocates the array on first access, see isAllocated().
+     */
     const GlobalArray<Scalar4>& getAngularMomentumArray() const
         {
+        if (m_angmom.isNull())
+            allocateOptionalArray(pdata_array::angmom);
         return m_angmom;
         }
 
     //! Get the angular momentum array
+    /*! Allocates the array on first access, see isAllocated().
+     */
     const GlobalArray<Scalar3>& getMomentsOfInertiaArray() const
         {
+        if (m_inertia.isNull())
+            allocateOptionalArray(pdata_array::inertia);
         return m_inertia;
         }
 
@@ -1285,6 +1389,9 @@ class PYBIND11_EXPORT ParticleData
 
     Nano::Signal<void()>
         m_sort_signal; //!< Signal that is triggered when particles are sorted in memory
+    bool m_sort_permutation = false;                //!< True while emitting an in-place permutation
+    std::vector<unsigned int> m_sort_order;         //!< Old index of each permuted local particle
+    std::vector<unsigned int> m_sort_reverse_order; //!< New index of each permuted local particle
     Nano::Signal<void()> m_boxchange_signal; //!< Signal that is triggered when the box size changes
     Nano::Signal<void()> m_max_particle_num_signal; //!< Signal that is triggered when the maximum
                                                     //!< particle number changes
@@ -1308,16 +1415,16 @@ class PYBIND11_EXPORT ParticleData
     GlobalArray<Scalar4> m_pos;        //!< particle positions and types
     GlobalArray<Scalar4> m_vel;        //!< particle velocities and masses
     GlobalArray<Scalar3> m_accel;      //!< particle accelerations
-    GlobalArray<Scalar> m_charge;      //!< particle charges
-    GlobalArray<Scalar> m_diameter;    //!< particle diameters
-    GlobalArray<int3> m_image;         //!< particle images
-    GlobalArray<unsigned int> m_tag;   //!< particle tags
-    GlobalVector<unsigned int> m_rtag; //!< reverse lookup tags
-    GlobalArray<unsigned int> m_body;  //!< rigid body ids
-    GlobalArray<Scalar4>
+    mutable GlobalArray<Scalar> m_charge;     //!< particle charges
+    mutable GlobalArray<Scalar> m_diameter;   //!< particle diameters
+    GlobalArray<int3> m_image;                //!< particle images
+    GlobalArray<unsigned int> m_tag;          //!< particle tags
+    GlobalVector<unsigned int> m_rtag;        //!< reverse lookup tags
+    mutable GlobalArray<unsigned int> m_body; //!< rigid body ids
+    mutable GlobalArray<Scalar4>
         m_orientation; //!< Orientation quaternion for each particle (ignored if not anisotropic)
-    GlobalArray<Scalar4> m_angmom;          //!< Angular momementum quaternion for each particle
-    GlobalArray<Scalar3> m_inertia;         //!< Principal moments of inertia for each particle
+    mutable GlobalArray<Scalar4> m_angmom;  //!< Angular momementum quaternion for each particle
+    mutable GlobalArray<Scalar3> m_inertia; //!< Principal moments of inertia for each particle
     GlobalArray<unsigned int> m_comm_flags; //!< Array of communication flags
 
     std::stack<unsigned int> m_recycled_tags; //!< Global tags of removed particles
@@ -1338,23 +1445,23 @@ class PYBIND11_EXPORT ParticleData
     GlobalArray<Scalar4> m_pos_alt;         //!< particle positions and type (swap-in)
     GlobalArray<Scalar4> m_vel_alt;         //!< particle velocities and masses (swap-in)
     GlobalArray<Scalar3> m_accel_alt;       //!< particle accelerations (swap-in)
-    GlobalArray<Scalar> m_charge_alt;       //!< particle charges (swap-in)
-    GlobalArray<Scalar> m_diameter_alt;     //!< particle diameters (swap-in)
-    GlobalArray<int3> m_image_alt;          //!< particle images (swap-in)
-    GlobalArray<unsigned int> m_tag_alt;    //!< particle tags (swap-in)
-    GlobalArray<unsigned int> m_body_alt;   //!< rigid body ids (swap-in)
-    GlobalArray<Scalar4> m_orientation_alt; //!< orientations (swap-in)
-    GlobalArray<Scalar4> m_angmom_alt;      //!< angular momenta (swap-in)
-    GlobalArray<Scalar3>
+    mutable GlobalArray<Scalar> m_charge_alt;       //!< particle charges (swap-in)
+    mutable GlobalArray<Scalar> m_diameter_alt;     //!< particle diameters (swap-in)
+    GlobalArray<int3> m_image_alt;                  //!< particle images (swap-in)
+    GlobalArray<unsigned int> m_tag_alt;            //!< particle tags (swap-in)
+    mutable GlobalArray<unsigned int> m_body_alt;   //!< rigid body ids (swap-in)
+    mutable GlobalArray<Scalar4> m_orientation_alt; //!< orientations (swap-in)
+    mutable GlobalArray<Scalar4> m_angmom_alt;      //!< angular momenta (swap-in)
+    mutable GlobalArray<Scalar3>
         m_inertia_alt; //!< Principal moments of inertia for each particle (swap-in)
-    GlobalArray<Scalar4> m_net_force_alt;  //!< Net force (swap-in)
-    GlobalArray<Scalar> m_net_virial_alt;  //!< Net virial (swap-in)
-    GlobalArray<Scalar4> m_net_torque_alt; //!< Net torque (swap-in)
+    GlobalArray<Scalar4> m_net_force_alt;          //!< Net force (swap-in)
+    GlobalArray<Scalar> m_net_virial_alt;          //!< Net virial (swap-in)
+    mutable GlobalArray<Scalar4> m_net_torque_alt; //!< Net torque (swap-in)
 
-    GlobalArray<Scalar4> m_net_force;  //!< Net force calculated for each particle
-    GlobalArray<Scalar> m_net_virial;  //!< Net virial calculated for each particle (2D GPU array of
-                                       //!< dimensions 6*number of particles)
-    GlobalArray<Scalar4> m_net_torque; //!< Net torque calculated for each particle
+    GlobalArray<Scalar4> m_net_force; //!< Net force calculated for each particle
+    GlobalArray<Scalar> m_net_virial; //!< Net virial calculated for each particle (2D GPU array of
+                                      //!< dimensions 6*number of particles)
+    mutable GlobalArray<Scalar4> m_net_torque; //!< Net torque calculated for each particle
 
     Scalar m_external_virial[6]; //!< External potential contribution to the virial
     Scalar m_external_energy;    //!< External potential energy
@@ -1365,7 +1472,8 @@ class PYBIND11_EXPORT ParticleData
     Scalar3 m_origin; //!< Tracks the position of the origin of the coordinate system
     int3 m_o_image;   //!< Tracks the origin image
 
-    bool m_arrays_allocated; //!< True if arrays have been initialized
+    bool m_arrays_allocated;        //!< True if arrays have been initialized
+    bool m_alternate_arrays = true; //!< True to allocate the alternate (swap-in) arrays
 
 #ifdef ENABLE_HIP
     GPUPartition m_gpu_partition; //!< The partition of the local number of particles across GPUs
@@ -1378,6 +1486,18 @@ class PYBIND11_EXPORT ParticleData
     //! Helper function to allocate alternate particle data
     void allocateAlternateArrays(unsigned int N);
 
+    //! Helper function to allocate an optional array and fill it with the default value
+    void allocateOptionalArray(pdata_array::Enum array) const;
+
+    //! Helper function to allocate the optional arrays needed to store a particle's values
+    void allocateOptionalArrays(Scalar charge,
+                                Scalar diameter,
+                                unsigned int body,
+                                const Scalar4& orientation,
+                                const Scalar4& angmom,
+                                const Scalar3& inertia,
+                                const Scalar4& net_torque);
+
     //! Helper function for amortized array resizing
     void resize(unsigned int new_nparticles);
 
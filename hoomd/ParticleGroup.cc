@@ -260,18 +260,24 @@ void ParticleGroup::updateMemberTags(bool force_update)
     m_n_central_and_free_global = 0;
 
     ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
-    ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                     access_location::host,
-                                     access_mode::read);
+    // the body array is only allocated once a rigid body has been defined
+    std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+    if (m_pdata->isAllocated(pdata_array::body))
+        {
+        h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                   access_location::host,
+                                                   access_mode::read));
+        }
+    const unsigned int* body = h_body ? h_body->data : nullptr;
     ArrayHandle<unsigned int> h_is_member_tag(m_is_member_tag,
                                               access_location::host,
                                               access_mode::read);
     for (unsigned int i = 0; i < m_pdata->getN(); i++)
         {
         unsigned int tag = h_tag.data[i];
-        unsigned int body = h_body.data[i];
+        unsigned int body_i = body ? body[i] : NO_BODY;
 
-        if (h_is_member_tag.data[tag] && (body == tag || body > MIN_FLOPPY))
+        if (h_is_member_tag.data[tag] && (body_i == tag || body_i > MIN_FLOPPY))
             {
             m_n_central_and_free_global++;
             }
@@ -0,0 +1,96 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#pragma once
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "ExecutionConfiguration.h"
+
+#include <chrono>
+#include <memory>
+
+/*! \file Profiler.h
+    \brief Declares lightweight timers used to profile operations
+*/
+
+namespace hoomd
+    {
+namespace detail
+    {
+/// Accumulated wall clock time spent in a region of code.
+struct ProfileCounter
+    {
+    /// Total time spent in the region [ns]
+    int64_t time = 0;
+
+    /// Number of times the region executed
+    uint64_t calls = 0;
+
+    /// Clear the counter
+    void reset()
+        {
+        time = 0;
+        calls = 0;
+        }
+
+    /// Get the total time in seconds
+    double getSeconds() const
+        {
+        return double(time) * 1e-9;
+        }
+    };
+
+/// Time the enclosing scope and add the result to a ProfileCounter.
+/*! ScopedProfile does nothing unless profiling is enabled in the ExecutionConfiguration, so it is
+    safe to place in performance critical code paths. When profiling on the GPU, the destructor
+    synchronizes the device so that the time includes all kernels launched in the scope.
+
+    Nested scopes measure inclusive time. For example, the time recorded for a force compute
+    includes the time spent building its neighbor list.
+*/
+class ScopedProfile
+    {
+    public:
+    ScopedProfile(const std::shared_ptr<const ExecutionConfiguration>& exec_conf,
+                  ProfileCounter& counter)
+        : m_exec_conf(exec_conf), m_counter(counter), m_enabled(exec_conf->profilingEnabled())
+        {
+        if (m_enabled)
+            m_start = std::chrono::steady_clock::now();
+        }
+
+    ~ScopedProfile()
+        {
+        if (!m_enabled)
+            return;
+
+#ifdef ENABLE_HIP
+        if (m_exec_conf->isCUDAEnabled())
+            hipDeviceSynchronize();
+#endif
+
+        auto elapsed = std::chrono::steady_clock::now() - m_start;
+        m_counter.time += std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count();
+        m_counter.calls++;
+        }
+
+    private:
+    /// The execution configuration
+    const std::shared_ptr<const ExecutionConfiguration>& m_exec_conf;
+
+    /// Counter to add to
+    ProfileCounter& m_counter;
+
+    /// Set to true when profiling is enabled at construction
+    const bool m_enabled;
+
+    /// Start time of the scope
+    std::chrono::steady_clock::time_point m_start;
+    };
+
+    } // end namespace detail
+
+    } // end namespace hoomd
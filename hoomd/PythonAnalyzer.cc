@@ -19,6 +19,7 @@ PythonAnalyzer::PythonAnalyzer(std::shared_ptr<SystemDefinition> sysdef,
 void PythonAnalyzer::analyze(uint64_t timestep)
     {
     Analyzer::analyze(timestep);
+    pybind11::gil_scoped_acquire acquire;
     m_analyzer.attr("act")(timestep);
     }
 
@@ -19,6 +19,7 @@ PythonTuner::PythonTuner(std::shared_ptr<SystemDefinition> sysdef,
 void PythonTuner::update(uint64_t timestep)
     {
     Updater::update(timestep);
+    pybind11::gil_scoped_acquire acquire;
     m_tuner.attr("act")(timestep);
     }
 
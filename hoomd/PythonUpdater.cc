@@ -19,6 +19,7 @@ PythonUpdater::PythonUpdater(std::shared_ptr<SystemDefinition> sysdef,
 void PythonUpdater::update(uint64_t timestep)
     {
     Updater::update(timestep);
+    pybind11::gil_scoped_acquire acquire;
     m_updater.attr("act")(timestep);
     }
 
@@ -83,6 +83,12 @@ void SFCPackTuner::update(uint64_t timestep)
     Updater::update(timestep);
     m_exec_conf->msg->notice(6) << "SFCPackTuner: particle sort" << std::endl;
 
+    if (m_in_place && !m_exec_conf->isCUDAEnabled())
+        {
+        permuteInPlace();
+        return;
+        }
+
 #ifdef ENABLE_MPI
     if (m_sysdef->isDomainDecomposed())
         {
@@ -116,10 +122,34 @@ void SFCPackTuner::update(uint64_t timestep)
 #endif
     }
 
+/*! Sort the local particles without migrating particles or removing ghosts. The ghost particles
+    keep their indices, and subscribers to the sort signal receive the permutation so that they
+    can remap cached particle indices.
+*/
+void SFCPackTuner::permuteInPlace()
+    {
+    if (m_sysdef->getNDimensions() == 2)
+        getSortedOrder2D();
+    else
+        getSortedOrder3D();
+
+    // applySortOrder() only reads and writes the local particles and their reverse-lookup tags
+    applySortOrder();
+
+    m_pdata->notifyParticlePermute(m_sort_order);
+    }
+
 void SFCPackTuner::applySortOrder()
     {
     assert(m_pdata);
     assert(m_sort_order.size() >= m_pdata->getN());
+
+    // without the alternate arrays, also avoid the temporary copies below
+    if (!m_pdata->hasAlternateArrays())
+        {
+        applySortOrderInPlace();
+        return;
+        }
     ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(),
                                access_location::host,
                                access_mode::readwrite);
@@ -129,22 +159,7 @@ void SFCPackTuner::applySortOrder()
     ArrayHandle<Scalar3> h_accel(m_pdata->getAccelerations(),
                                  access_location::host,
                                  access_mode::readwrite);
-    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(),
-                                 access_location::host,
-                                 access_mode::readwrite);
-    ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(),
-                                   access_location::host,
-                                   access_mode::readwrite);
     ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::readwrite);
-    ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                     access_location::host,
-                                     access_mode::readwrite);
-    ArrayHandle<Scalar4> h_angmom(m_pdata->getAngularMomentumArray(),
-                                  access_location::host,
-                                  access_mode::readwrite);
-    ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(),
-                                   access_location::host,
-                                   access_mode::readwrite);
     ArrayHandle<unsigned int> h_tag(m_pdata->getTags(),
                                     access_location::host,
                                     access_mode::readwrite);
@@ -175,30 +190,54 @@ void SFCPackTuner::applySortOrder()
         h_accel.data[i] = scal3_tmp[i];
 
     Scalar* scal_tmp = new Scalar[m_pdata->getN()];
-    // sort charge
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        scal_tmp[i] = h_charge.data[m_sort_order[i]];
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        h_charge.data[i] = scal_tmp[i];
+    // sort charge, skipping the optional arrays that are not allocated
+    if (m_pdata->isAllocated(pdata_array::charge))
+        {
+        ArrayHandle<Scalar> h_charge(m_pdata->getCharges(),
+                                     access_location::host,
+                                     access_mode::readwrite);
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            scal_tmp[i] = h_charge.data[m_sort_order[i]];
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            h_charge.data[i] = scal_tmp[i];
+        }
 
     // sort diameter
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        scal_tmp[i] = h_diameter.data[m_sort_order[i]];
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        h_diameter.data[i] = scal_tmp[i];
+    if (m_pdata->isAllocated(pdata_array::diameter))
+        {
+        ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(),
+                                       access_location::host,
+                                       access_mode::readwrite);
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            scal_tmp[i] = h_diameter.data[m_sort_order[i]];
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            h_diameter.data[i] = scal_tmp[i];
+        }
 
     // sort angular momentum
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        scal4_tmp[i] = h_angmom.data[m_sort_order[i]];
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        h_angmom.data[i] = scal4_tmp[i];
+    if (m_pdata->isAllocated(pdata_array::angmom))
+        {
+        ArrayHandle<Scalar4> h_angmom(m_pdata->getAngularMomentumArray(),
+                                      access_location::host,
+                                      access_mode::readwrite);
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            scal4_tmp[i] = h_angmom.data[m_sort_order[i]];
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            h_angmom.data[i] = scal4_tmp[i];
+        }
 
     // sort moment of inertia
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        scal3_tmp[i] = h_inertia.data[m_sort_order[i]];
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+    if (m_pdata->isAllocated(pdata_array::inertia))
         {
-        h_inertia.data[i] = scal3_tmp[i];
+        ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(),
+                                       access_location::host,
+                                       access_mode::readwrite);
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            scal3_tmp[i] = h_inertia.data[m_sort_order[i]];
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            {
+            h_inertia.data[i] = scal3_tmp[i];
+            }
         }
 
         // in case anyone access it from frame to frame, sort the net virial
@@ -229,6 +268,7 @@ void SFCPackTuner::applySortOrder()
             h_net_force.data[i] = scal4_tmp[i];
         }
 
+    if (m_pdata->isAllocated(pdata_array::net_torque))
         {
         ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(),
                                           access_location::host,
@@ -240,6 +280,7 @@ void SFCPackTuner::applySortOrder()
             h_net_torque.data[i] = scal4_tmp[i];
         }
 
+    if (m_pdata->isAllocated(pdata_array::orientation))
         {
         ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(),
                                            access_location::host,
@@ -260,10 +301,16 @@ void SFCPackTuner::applySortOrder()
 
     // sort body
     unsigned int* uint_tmp = new unsigned int[m_pdata->getN()];
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        uint_tmp[i] = h_body.data[m_sort_order[i]];
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        h_body.data[i] = uint_tmp[i];
+    if (m_pdata->isAllocated(pdata_array::body))
+        {
+        ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
+                                         access_location::host,
+                                         access_mode::readwrite);
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            uint_tmp[i] = h_body.data[m_sort_order[i]];
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            h_body.data[i] = uint_tmp[i];
+        }
 
     // sort global tag
     for (unsigned int i = 0; i < m_pdata->getN(); i++)
@@ -284,6 +331,153 @@ void SFCPackTuner::applySortOrder()
     delete[] int3_tmp;
     }
 
+namespace detail
+    {
+//! Permute an array in place by following the cycles of a permutation
+/*! \param data Array to permute
+    \param order Old index of the element at each new index
+    \param N Number of elements
+    \param visited Scratch space, resized to \a N
+
+    After the call, data[i] holds the element that was at data[order[i]]. Each element is moved
+    once, and the only temporary storage is one element and one bit per element.
+*/
+template<class T>
+static void applyPermutation(T* data,
+                             const std::vector<unsigned int>& order,
+                             unsigned int N,
+                             std::vector<bool>& visited)
+    {
+    visited.assign(N, false);
+    for (unsigned int start = 0; start < N; start++)
+        {
+        if (visited[start])
+            continue;
+
+        // rotate the elements of the cycle that contains start
+        T first = data[start];
+        unsigned int i = start;
+        visited[i] = true;
+        while (order[i] != start)
+            {
+            data[i] = data[order[i]];
+            i = order[i];
+            visited[i] = true;
+            }
+        data[i] = first;
+        }
+    }
+
+    } // end namespace detail
+
+/*! Apply the sort order without allocating temporary copies of the particle data.
+ */
+void SFCPackTuner::applySortOrderInPlace()
+    {
+    const unsigned int N = m_pdata->getN();
+    std::vector<bool> visited;
+
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(),
+                                   access_location::host,
+                                   access_mode::readwrite);
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(),
+                                   access_location::host,
+                                   access_mode::readwrite);
+        ArrayHandle<Scalar3> h_accel(m_pdata->getAccelerations(),
+                                     access_location::host,
+                                     access_mode::readwrite);
+        ArrayHandle<int3> h_image(m_pdata->getImages(),
+                                  access_location::host,
+                                  access_mode::readwrite);
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(),
+                                        access_location::host,
+                                        access_mode::readwrite);
+
+        detail::applyPermutation(h_pos.data, m_sort_order, N, visited);
+        detail::applyPermutation(h_vel.data, m_sort_order, N, visited);
+        detail::applyPermutation(h_accel.data, m_sort_order, N, visited);
+        detail::applyPermutation(h_image.data, m_sort_order, N, visited);
+        detail::applyPermutation(h_tag.data, m_sort_order, N, visited);
+
+        // rebuild global rtag
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(),
+                                         access_location::host,
+                                         access_mode::readwrite);
+        for (unsigned int i = 0; i < N; i++)
+            h_rtag.data[h_tag.data[i]] = i;
+        }
+
+    // skip the optional arrays that are not allocated
+    if (m_pdata->isAllocated(pdata_array::charge))
+        {
+        ArrayHandle<Scalar> h_charge(m_pdata->getCharges(),
+                                     access_location::host,
+                                     access_mode::readwrite);
+        detail::applyPermutation(h_charge.data, m_sort_order, N, visited);
+        }
+    if (m_pdata->isAllocated(pdata_array::diameter))
+        {
+        ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(),
+                                       access_location::host,
+                                       access_mode::readwrite);
+        detail::applyPermutation(h_diameter.data, m_sort_order, N, visited);
+        }
+    if (m_pdata->isAllocated(pdata_array::body))
+        {
+        ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
+                                         access_location::host,
+                                         access_mode::readwrite);
+        detail::applyPermutation(h_body.data, m_sort_order, N, visited);
+        }
+    if (m_pdata->isAllocated(pdata_array::angmom))
+        {
+        ArrayHandle<Scalar4> h_angmom(m_pdata->getAngularMomentumArray(),
+                                      access_location::host,
+                                      access_mode::readwrite);
+        detail::applyPermutation(h_angmom.data, m_sort_order, N, visited);
+        }
+    if (m_pdata->isAllocated(pdata_array::inertia))
+        {
+        ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(),
+                                       access_location::host,
+                                       access_mode::readwrite);
+        detail::applyPermutation(h_inertia.data, m_sort_order, N, visited);
+        }
+    if (m_pdata->isAllocated(pdata_array::orientation))
+        {
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(),
+                                           access_location::host,
+                                           access_mode::readwrite);
+        detail::applyPermutation(h_orientation.data, m_sort_order, N, visited);
+        }
+    if (m_pdata->isAllocated(pdata_array::net_torque))
+        {
+        ArrayHandle<Scalar4> h_net_torque(m_pdata->getNetTorqueArray(),
+                                          access_location::host,
+                                          access_mode::readwrite);
+        detail::applyPermutation(h_net_torque.data, m_sort_order, N, visited);
+        }
+
+        // in case anyone access it from frame to frame, sort the net force and virial
+        {
+        ArrayHandle<Scalar4> h_net_force(m_pdata->getNetForce(),
+                                         access_location::host,
+                                         access_mode::readwrite);
+        ArrayHandle<Scalar> h_net_virial(m_pdata->getNetVirial(),
+                                         access_location::host,
+                                         access_mode::readwrite);
+        size_t virial_pitch = m_pdata->getNetVirial().getPitch();
+
+        detail::applyPermutation(h_net_force.data, m_sort_order, N, visited);
+        for (unsigned int j = 0; j < 6; j++)
+            detail::applyPermutation(h_net_virial.data + j * virial_pitch,
+                                     m_sort_order,
+                                     N,
+                                     visited);
+        }
+    }
+
 namespace detail
     {
 //! x walking table for the hilbert curve
@@ -689,7 +883,8 @@ void export_SFCPackTuner(pybind11::module& m)
     {
     pybind11::class_<SFCPackTuner, Tuner, std::shared_ptr<SFCPackTuner>>(m, "SFCPackTuner")
         .def(pybind11::init<std::shared_ptr<SystemDefinition>, std::shared_ptr<Trigger>>())
-        .def_property("grid", &SFCPackTuner::getGrid, &SFCPackTuner::setGridPython);
+        .def_property("grid", &SFCPackTuner::getGrid, &SFCPackTuner::setGridPython)
+        .def_property("in_place", &SFCPackTuner::getInPlace, &SFCPackTuner::setInPlace);
     }
 
     } // end namespace detail
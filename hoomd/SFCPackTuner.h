@@ -38,6 +38,14 @@ namespace hoomd
    set to reasonable defaults, which is as high as it can possibly go without consuming a
    significant amount of memory. The grid dimension can be changed by calling setGrid().
 
+    In-place mode:<br>
+    By default, update() migrates particles, removes the ghost particles, sorts, and notifies all
+    subscribers with ParticleData::notifyParticleSort(), which forces neighbor list rebuilds and
+    a new ghost exchange. With setInPlace(true), update() permutes only the local particles,
+    keeps the ghost particles, and calls ParticleData::notifyParticlePermute(). Subscribers that
+    cache particle indices (such as the neighbor list and the cell list) remap them instead of
+    rebuilding. The GPU implementation always uses the default mode.
+
     Implementation details:<br>
     The rearranging is done by computing bins for the particles, and then ordering the particles
    based on the order in which those bins appear along a hilbert curve. It is very efficient, even
@@ -80,10 +88,23 @@ class PYBIND11_EXPORT SFCPackTuner : public Tuner
         return m_grid;
         }
 
+    //! Set whether to permute the local particles in place without removing ghosts
+    void setInPlace(bool in_place)
+        {
+        m_in_place = in_place;
+        }
+
+    //! Get whether to permute the local particles in place without removing ghosts
+    bool getInPlace()
+        {
+        return m_in_place;
+        }
+
     protected:
     unsigned int m_grid;                      //!< Grid dimension to use
     unsigned int m_last_grid;                 //!< The last value of MMax
     unsigned int m_last_dim;                  //!< Check the last dimension we ran at
+    bool m_in_place = false;                  //!< Permute the local particles in place
     GPUArray<unsigned int> m_traversal_order; //!< Generated traversal order of bins
 
     //! Helper function that actually performs the sort
@@ -94,6 +115,12 @@ class PYBIND11_EXPORT SFCPackTuner : public Tuner
     //! Apply the sorted order to the particle data
     virtual void applySortOrder();
 
+    //! Apply the sorted order to the particle data without temporary copies
+    void applySortOrderInPlace();
+
+    //! Sort the local particles in place and notify subscribers of the permutation
+    void permuteInPlace();
+
     //! Helper function to generate traversal order
     static void generateTraversalOrder(int i,
                                        int j,
@@ -79,6 +79,11 @@ void System::setCommunicator(std::shared_ptr<Communicator> comm)
 
 void System::run(uint64_t nsteps, bool write_at_start)
     {
+    // Release the GIL so that other Python threads progress during the run. Operations that call
+    // Python code (custom actions, custom forces, Python triggers, variants, and loggers) acquire
+    // the GIL when needed.
+    pybind11::gil_scoped_release release;
+
     m_start_tstep = m_cur_tstep;
     m_end_tstep = m_cur_tstep + nsteps;
 
@@ -86,6 +91,7 @@ void System::run(uint64_t nsteps, bool write_at_start)
     m_initial_time = m_clk.getTime();
     m_last_walltime = 0.0;
     m_last_TPS = 0.0;
+    int64_t last_signal_check = m_initial_time;
 
     resetStats();
 
@@ -123,7 +129,10 @@ void System::run(uint64_t nsteps, bool write_at_start)
         for (auto& analyzer : m_analyzers)
             {
             if ((*analyzer->getTrigger())(m_cur_tstep))
+                {
+                detail::ScopedProfile profile(m_exec_conf, analyzer->getProfileCounter());
                 analyzer->analyze(m_cur_tstep);
+                }
             }
         }
 
@@ -133,7 +142,10 @@ void System::run(uint64_t nsteps, bool write_at_start)
         for (auto& tuner : m_tuners)
             {
             if ((*tuner->getTrigger())(m_cur_tstep))
+                {
+                detail::ScopedProfile profile(m_exec_conf, tuner->getProfileCounter());
                 tuner->update(m_cur_tstep);
+                }
             }
 
         // execute updaters
@@ -141,6 +153,7 @@ void System::run(uint64_t nsteps, bool write_at_start)
             {
             if ((*updater->getTrigger())(m_cur_tstep))
                 {
+                detail::ScopedProfile profile(m_exec_conf, updater->getProfileCounter());
                 updater->update(m_cur_tstep);
                 m_update_group_dof_next_step |= updater->mayChangeDegreesOfFreedom(m_cur_tstep);
                 }
@@ -159,7 +172,10 @@ void System::run(uint64_t nsteps, bool write_at_start)
 
         // execute the integrator
         if (m_integrator)
+            {
+            detail::ScopedProfile profile(m_exec_conf, m_integrator->getProfileCounter());
             m_integrator->update(m_cur_tstep);
+            }
 
         m_cur_tstep++;
 
@@ -167,15 +183,26 @@ void System::run(uint64_t nsteps, bool write_at_start)
         for (auto& analyzer : m_analyzers)
             {
             if ((*analyzer->getTrigger())(m_cur_tstep))
+                {
+                detail::ScopedProfile profile(m_exec_conf, analyzer->getProfileCounter());
                 analyzer->analyze(m_cur_tstep);
+                }
             }
 
         updateTPS();
 
-        // propagate Python exceptions related to signals
-        if (PyErr_CheckSignals() != 0)
+        // propagate Python exceptions related to signals, checking periodically so that other
+        // Python threads do not contend for the GIL on every step
+        const int64_t now = m_clk.getTime();
+        if (now - last_signal_check > SIGNAL_CHECK_INTERVAL)
             {
-            throw pybind11::error_already_set();
+            last_signal_check = now;
+
+            pybind11::gil_scoped_acquire acquire;
+            if (PyErr_CheckSignals() != 0)
+                {
+                throw pybind11::error_already_set();
+                }
             }
         }
     }
@@ -237,6 +237,9 @@ class PYBIND11_EXPORT System
     /// Update the TPS average
     void updateTPS();
 
+    /// Minimum time between checks for Python signals during a run [ns]
+    static constexpr int64_t SIGNAL_CHECK_INTERVAL = 100000000;
+
     std::shared_ptr<const ExecutionConfiguration>
         m_exec_conf; //!< Stored shared ptr to the execution configuration
 
@@ -36,11 +36,18 @@ On import, `hoomd` installs a ``SIGTERM`` signal handler that calls `sys.exit`
 so that open gsd files have a chance to flush write buffers
 (`hoomd.write.GSD.flush`) when a user's process is terminated. Use
 `signal.signal` to adjust this behavior as needed.
+
+.. rubric:: Lazy imports
+
+``import hoomd`` imports only the modules needed to construct a `Simulation`.
+`hoomd` imports the remaining subpackages, such as `hoomd.md`, `hoomd.hpmc`,
+and `hoomd.write`, and their extension modules the first time you access them.
 """
 import sys
 import pathlib
 import os
 import signal
+import importlib
 
 if ((pathlib.Path(__file__).parent / 'CMakeLists.txt').exists()
         and 'SPHINX' not in os.environ):
@@ -58,6 +65,32 @@ outside the hoomd source directory, execute `python3 -m pytest --pyargs hoomd`.
           file=sys.stderr)
 
 from hoomd import version
+
+# Subpackages and modules that are not needed to construct a Simulation. Import
+# these on first access (PEP 562) to reduce the time needed to import hoomd.
+_lazy_modules = {'mesh', 'profiler', 'update', 'wall', 'write'}
+if version.md_built:
+    _lazy_modules.add('md')
+if version.hpmc_built:
+    _lazy_modules.add('hpmc')
+# if version.metal_built:
+#     _lazy_modules.add('metal')
+# if version.mpcd_built:
+#     _lazy_modules.add('mpcd')
+
+
+def __getattr__(name):
+    """Import lazily loaded subpackages on first access."""
+    if name in _lazy_modules:
+        return importlib.import_module(f'hoomd.{name}')
+    raise AttributeError(f"module 'hoomd' has no attribute '{name}'")
+
+
+def __dir__():
+    """List the module attributes including the lazily loaded subpackages."""
+    return sorted(set(globals()) | _lazy_modules)
+
+
 from hoomd import trigger
 from hoomd import variant
 from hoomd.box import Box, box_like
@@ -65,24 +98,12 @@ from hoomd import data
 from hoomd import filter
 from hoomd import device
 from hoomd import error
-from hoomd import mesh
-from hoomd import update
 from hoomd import communicator
 from hoomd import util
-from hoomd import write
-from hoomd import wall
 from hoomd import _hoomd
 from hoomd import tune
 from hoomd import logging
 from hoomd import custom
-if version.md_built:
-    from hoomd import md
-if version.hpmc_built:
-    from hoomd import hpmc
-# if version.metal_built:
-#     from hoomd import metal
-# if version.mpcd_built:
-#     from hoomd import mpcd
 
 from hoomd.simulation import Simulation
 from hoomd.state import State
@@ -94,7 +115,10 @@ _default_excepthook = sys.excepthook
 
 def _hoomd_sys_excepthook(type, value, traceback):
     """Override Python's excepthook to abort MPI runs."""
-    write.gsd._flush_open_gsd_writers()
+    # Open GSD writers exist only when hoomd.write has been imported.
+    gsd = sys.modules.get('hoomd.write.gsd')
+    if gsd is not None:
+        gsd._flush_open_gsd_writers()
     _default_excepthook(type, value, traceback)
     sys.stderr.flush()
     _hoomd.abort_mpi(communicator._current_communicator.cpp_mpi_conf, 1)
@@ -555,6 +555,25 @@ def operation_pickling_check(instance, sim):
     pickling_check(instance)
 
 
+def cpu_threads_check(snapshot, run, seed=None):
+    """Test that results do not depend on the number of CPU threads.
+
+    Call ``run`` with simulations on 1 and 4 CPU threads, both initialized
+    from ``snapshot``. ``run`` returns a list of arrays to compare. Threads
+    sum contributions in a different order, so the comparison has a tolerance.
+    """
+    results = []
+    for num_cpu_threads in (1, 4):
+        sim = Simulation(
+            device=hoomd.device.CPU(num_cpu_threads=num_cpu_threads),
+            seed=seed)
+        sim.create_state_from_snapshot(snapshot)
+        results.append(run(sim))
+
+    for result_1, result_n in zip(*results):
+        numpy.testing.assert_allclose(result_1, result_n, rtol=1e-4, atol=1e-5)
+
+
 def autotuned_kernel_parameter_check(instance, activate, all_optional=False):
     """Check that an AutotunedObject behaves as expected."""
     instance.tune_kernel_parameters()
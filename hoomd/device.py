@@ -40,6 +40,7 @@ See Also:
 import contextlib
 import hoomd
 from hoomd import _hoomd
+from hoomd.logging import log, Loggable
 
 
 class NoticeFile:
@@ -96,7 +97,7 @@ class NoticeFile:
         pass
 
 
-class Device:
+class Device(metaclass=Loggable):
     """Base class device object.
 
     Provides methods and properties common to `CPU` and `GPU`, including those
@@ -104,6 +105,17 @@ class Device:
     status messages HOOMD-blue prints (`notice_level`) and a method for user
     provided status messages (`notice`).
 
+    .. rubric:: Memory accounting
+
+    `Device` accounts for the memory held by the per-particle arrays, neighbor
+    lists, cell lists, communication buffers, and other internal arrays of the
+    simulations that use it, as well as the frames buffered by
+    `hoomd.write.Burst`. Log `memory_allocated`, `peak_memory_allocated`,
+    `memory_components`, and `memory_component_bytes` with
+    `hoomd.logging.Logger` or call `memory_report` to find out which component
+    holds the memory. In MPI simulations, these values are those of the local
+    rank.
+
     Warning:
         `Device` cannot be used directly. Instantate a `CPU` or `GPU` object.
 
@@ -258,6 +270,72 @@ class Device:
         """
         self._cpp_msg.notice(level, str(message) + "\n")
 
+    @log(category='scalar')
+    def memory_allocated(self):
+        """int: Bytes currently held by the accounted allocations \
+        :math:`[\\mathrm{bytes}]`."""
+        return self._cpp_exec_conf.getMemoryTracker().getTotal()[0]
+
+    @log(category='scalar')
+    def peak_memory_allocated(self):
+        """int: Largest value of `memory_allocated` since the device was \
+        created :math:`[\\mathrm{bytes}]`."""
+        return self._cpp_exec_conf.getMemoryTracker().getTotal()[1]
+
+    @log(category='strings', default=False)
+    def memory_components(self):
+        """list[str]: Names of the classes that hold accounted allocations.
+
+        Allocations that were never named are listed under ``anonymous``.
+        """
+        return list(self._cpp_exec_conf.getMemoryTracker().getComponents())
+
+    @log(category='sequence', default=False)
+    def memory_component_bytes(self):
+        """list[int]: Bytes currently held by each component \
+        :math:`[\\mathrm{bytes}]`.
+
+        The order of `memory_component_bytes` matches `memory_components`.
+        """
+        components = self._cpp_exec_conf.getMemoryTracker().getComponents()
+        return [current for current, _ in components.values()]
+
+    def memory_report(self):
+        """Format the memory accounting as a table.
+
+        Returns:
+            str: A table with the current and peak memory held by each
+            allocation sorted by the current memory, followed by the totals.
+
+        .. rubric:: Example:
+
+        .. code-block:: python
+
+            print(device.memory_report())
+        """
+        tracker = self._cpp_exec_conf.getMemoryTracker()
+        rows = sorted(tracker.getAllocations(),
+                      key=lambda row: (row[2], row[3]),
+                      reverse=True)
+        width_component = max([len(row[0]) for row in rows]
+                              + [len('Component')])
+        width_tag = max([len(row[1]) for row in rows] + [len('Allocation')])
+
+        def format_row(component, tag, current, peak):
+            return (f'{component:<{width_component}}  {tag:<{width_tag}}  '
+                    f'{current / 2**20:14.3f}  {peak / 2**20:14.3f}')
+
+        header = (f'{"Component":<{width_component}}  '
+                  f'{"Allocation":<{width_tag}}  '
+                  f'{"Current (MiB)":>14}  {"Peak (MiB)":>14}')
+        separator = '-' * len(header)
+
+        lines = [header, separator]
+        lines.extend(format_row(*row) for row in rows)
+        lines.append(separator)
+        lines.append(format_row('Total', '', *tracker.getTotal()))
+        return '\n'.join(lines)
+
 
 def _create_messenger(mpi_config, notice_level, message_filename):
     msg = _hoomd.Messenger(mpi_config)
@@ -11,6 +11,14 @@
 #include "IntegratorHPMCMono.h"
 #include "hoomd/RNGIdentifiers.h"
 
+#include <functional>
+
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/enumerable_thread_specific.h>
+#include <tbb/parallel_for.h>
+#endif
+
 /*! \file ComputeFreeVolume.h
     \brief Defines the template class for an approximate free volume integration
     \note This header cannot be compiled by nvcc
@@ -111,6 +119,8 @@ template<class Shape> void ComputeFreeVolume<Shape>::compute(uint64_t timestep)
     if (!shouldCompute(timestep))
         return;
 
+    hoomd::detail::ScopedProfile profile(this->m_exec_conf, this->m_profile);
+
     // update ghost layers
     m_mc->communicate(false);
 
@@ -122,7 +132,6 @@ template<class Shape> void ComputeFreeVolume<Shape>::compute(uint64_t timestep)
 template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t timestep)
     {
     unsigned int overlap_count = 0;
-    unsigned int err_count = 0;
     unsigned int ndim = this->m_sysdef->getNDimensions();
 
     this->m_exec_conf->msg->notice(5) << "HPMC computing free volume " << timestep << std::endl;
@@ -131,7 +140,7 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
     const hoomd::detail::AABBTree& aabb_tree = this->m_mc->buildAABBTree();
 
     // update the image list
-    std::vector<vec3<Scalar>> image_list = this->m_mc->updateImageList();
+    const std::vector<vec3<Scalar>>& image_list = this->m_mc->updateImageList();
 
     uint16_t seed = m_sysdef->getSeed();
 
@@ -164,8 +173,9 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
         n_sample /= this->m_exec_conf->getNRanks();
 #endif
 
-        for (unsigned int i = 0; i < n_sample; i++)
-            {
+        // test whether sample i overlaps any particle
+        auto test_sample = [&](unsigned int i)
+        {
             // select a random particle coordinate in the box
             hoomd::RandomGenerator rng_i(
                 hoomd::Seed(hoomd::RNGIdentifier::ComputeFreeVolume, timestep, seed),
@@ -188,6 +198,7 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
                 }
 
             // check for overlaps with particles in the system state
+            unsigned int err_count = 0;
             bool overlap = false;
             hoomd::detail::AABB aabb_i_local = shape_i.getAABB(vec3<Scalar>(0, 0, 0));
 
@@ -251,11 +262,36 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
                     break;
                 } // end loop over images
 
-            if (overlap)
+            return overlap;
+        };
+
+#ifdef ENABLE_TBB
+        // count overlaps separately in each thread
+        tbb::enumerable_thread_specific<unsigned int> thread_overlap_count(0);
+        m_exec_conf->getTaskArena()->execute(
+            [&]
+            {
+                tbb::parallel_for(tbb::blocked_range<unsigned int>(0, n_sample),
+                                  [&](const tbb::blocked_range<unsigned int>& r)
+                                  {
+                                      unsigned int& count = thread_overlap_count.local();
+                                      for (unsigned int i = r.begin(); i != r.end(); ++i)
+                                          {
+                                          if (test_sample(i))
+                                              count++;
+                                          }
+                                  });
+            });
+        overlap_count = thread_overlap_count.combine(std::plus<unsigned int>());
+#else
+        for (unsigned int i = 0; i < n_sample; i++)
+            {
+            if (test_sample(i))
                 {
                 overlap_count++;
                 }
             } // end loop through all particles
+#endif // ENABLE_TBB
 
         } // end lexical scope
 
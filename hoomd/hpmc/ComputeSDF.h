@@ -15,6 +15,12 @@
 #include "hoomd/HOOMDMPI.h"
 #endif
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/enumerable_thread_specific.h>
+#include <tbb/parallel_for.h>
+#endif
+
 /*! \file ComputeSDF.h
     \brief Defines the template class for an sdf compute
     \note This header cannot be compiled by nvcc
@@ -226,6 +232,8 @@ template<class Shape> void ComputeSDF<Shape>::compute(uint64_t timestep)
     if (!shouldCompute(timestep))
         return;
 
+    hoomd::detail::ScopedProfile profile(this->m_exec_conf, this->m_profile);
+
     // kludge to update the max diameter dynamically if it changes
     Scalar max_diam = this->getMaxInteractionDiameter();
     if (max_diam != m_last_max_diam)
@@ -383,10 +391,13 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramBinarySearch(uint64_
     const std::vector<param_type, hoomd::detail::managed_allocator<param_type>>& params
         = m_mc->getParams();
 
-    // loop through N particles
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        {
-        size_t min_bin = m_hist_compression.size();
+    const unsigned int N = m_pdata->getN();
+    const size_t n_bins = m_hist_compression.size();
+
+    // count the first overlap of particle i
+    auto count_particle = [&](unsigned int i, std::vector<double>& hist_compression)
+    {
+        size_t min_bin = n_bins;
         // read in the current position and orientation
         Scalar4 postype_i = h_postype.data[i];
         Scalar4 orientation_i = h_orientation.data[i];
@@ -451,12 +462,38 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramBinarySearch(uint64_
                     }
                 } // end loop over AABB nodes
             }     // end loop over images
-        if (min_bin < m_hist_compression.size())
+        if (min_bin < n_bins)
             {
-            m_hist_compression[min_bin]++;
+            hist_compression[min_bin]++;
             }
-        } // end loop over all particles
-    }     // end countHistogramBinarySearch()
+    };
+
+#ifdef ENABLE_TBB
+    // accumulate separate histograms in each thread
+    tbb::enumerable_thread_specific<std::vector<double>> thread_hist_compression(n_bins, 0.0);
+    m_exec_conf->getTaskArena()->execute(
+        [&]
+        {
+            tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+                              [&](const tbb::blocked_range<unsigned int>& r)
+                              {
+                                  for (unsigned int i = r.begin(); i != r.end(); ++i)
+                                      count_particle(i, thread_hist_compression.local());
+                              });
+        });
+
+    for (const auto& hist_compression : thread_hist_compression)
+        {
+        for (size_t bin = 0; bin < n_bins; bin++)
+            {
+            m_hist_compression[bin] += hist_compression[bin];
+            }
+        }
+#else
+    for (unsigned int i = 0; i < N; i++)
+        count_particle(i, m_hist_compression);
+#endif // ENABLE_TBB
+    } // end countHistogramBinarySearch()
 
 template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_t timestep)
     {
@@ -483,6 +520,11 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
                                    access_mode::read);
     ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
     const auto& params = m_mc->getParams();
+    const std::shared_ptr<PatchEnergy> patch = m_mc->getPatchEnergy();
+    const ShortReal min_core_diameter = m_mc->getMinCoreDiameter();
+
+    const unsigned int N = m_pdata->getN();
+    const size_t n_bins = m_hist_compression.size();
 
     // loop through N particles
     // At the top of this loop, we initialize min_bin to the size of the sdf histogram
@@ -491,10 +533,12 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
     // up to the minimum bin that we've already found for particle i.
     // Then we add to m_hist_compression[min_bin] the negative Mayer-function corresponding to the
     // type of overlap corresponding to particle i's first overlap.
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        {
-        size_t min_bin_compression = m_hist_compression.size();
-        size_t min_bin_expansion = m_hist_expansion.size();
+    auto count_particle = [&](unsigned int i,
+                              std::vector<double>& hist_compression,
+                              std::vector<double>& hist_expansion)
+    {
+        size_t min_bin_compression = n_bins;
+        size_t min_bin_expansion = n_bins;
         double hist_weight_ptl_i_compression = 2.0;
         double hist_weight_ptl_i_expansion = 2.0;
 
@@ -508,15 +552,15 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
         // construct the AABB around the particle's circumsphere
         // pad with enough extra width so that when scaled by xmax, found particles might touch
         ShortReal r_cut_patch = 0;
-        if (m_mc->getPatchEnergy())
+        if (patch)
             {
             r_cut_patch
-                = static_cast<ShortReal>(m_mc->getPatchEnergy()->getRCut()
-                                         + 0.5 * m_mc->getPatchEnergy()->getAdditiveCutoff(typ_i));
+                = static_cast<ShortReal>(patch->getRCut()
+                                         + 0.5 * patch->getAdditiveCutoff(typ_i));
             }
         const ShortReal R_query
             = std::max(shape_i.getCircumsphereDiameter() / ShortReal(2.0),
-                       r_cut_patch - m_mc->getMinCoreDiameter() / (ShortReal)2.0);
+                       r_cut_patch - min_core_diameter / (ShortReal)2.0);
         hoomd::detail::AABB aabb_i_local(vec3<Scalar>(0, 0, 0), R_query + extra_width);
 
         const size_t n_images = image_list.size();
@@ -555,9 +599,9 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
                             const vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
 
                             double u_ij_0 = 0.0; // energy of pair interaction in unperturbed state
-                            if (m_mc->getPatchEnergy())
+                            if (patch)
                                 {
-                                u_ij_0 = m_mc->getPatchEnergy()->energy(
+                                u_ij_0 = patch->energy(
                                     r_ij,
                                     typ_i,
                                     quat<float>(shape_i.orientation),
@@ -594,13 +638,13 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
 
                                 // if no hard overlap, check for a soft overlap if we have
                                 // patches
-                                if (!hard_overlap && m_mc->getPatchEnergy())
+                                if (!hard_overlap && patch)
                                     {
                                     // compute the energy at this size of the perturbation and
                                     // compare to the energy in the unperturbed state
                                     const vec3<Scalar> r_ij_scaled
                                         = r_ij * (Scalar(1.0) - scale_factor);
-                                    double u_ij_new = m_mc->getPatchEnergy()->energy(
+                                    double u_ij_new = patch->energy(
                                         r_ij_scaled,
                                         typ_i,
                                         quat<float>(shape_i.orientation),
@@ -619,7 +663,7 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
                                         hist_weight_ptl_i_compression
                                             = 1.0 - fast::exp(-(u_ij_new - u_ij_0));
                                         }
-                                    } // end if (!hard_overlap && m_mc->getPatchEnergy())
+                                    } // end if (!hard_overlap && patch)
                                 }     // end loop over bins for compression
 
                             // do expansions
@@ -646,13 +690,13 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
                                     } // end if (hard_overlap)
 
                                 // if no hard overlap, check for a soft overlap if necessary
-                                if (!hard_overlap && m_mc->getPatchEnergy())
+                                if (!hard_overlap && patch)
                                     {
                                     // compute the energy at this size of the perturbation and
                                     // compare to the energy in the unperturbed state
                                     const vec3<Scalar> r_ij_scaled
                                         = r_ij * (Scalar(1.0) - scale_factor);
-                                    double u_ij_new = m_mc->getPatchEnergy()->energy(
+                                    double u_ij_new = patch->energy(
                                         r_ij_scaled,
                                         typ_i,
                                         quat<float>(shape_i.orientation),
@@ -671,7 +715,7 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
                                         hist_weight_ptl_i_expansion
                                             = 1.0 - fast::exp(-(u_ij_new - u_ij_0));
                                         }
-                                    } // end if (!hard_overlap && m_mc->getPatchEnergy())
+                                    } // end if (!hard_overlap && patch)
                                 }     // end loop over histogram bins for expansions
                             }
                         }
@@ -683,16 +727,54 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
                     }
                 } // end loop over AABB nodes
             }     // end loop over images
-        if (min_bin_compression < m_hist_compression.size() && hist_weight_ptl_i_compression <= 1.0)
+        if (min_bin_compression < n_bins && hist_weight_ptl_i_compression <= 1.0)
+            {
+            hist_compression[min_bin_compression] += hist_weight_ptl_i_compression;
+            }
+        if (min_bin_expansion < n_bins && hist_weight_ptl_i_expansion <= 1.0)
+            {
+            hist_expansion[min_bin_expansion] += hist_weight_ptl_i_expansion;
+            }
+    };
+
+#ifdef ENABLE_TBB
+    // accumulate separate histograms in each thread
+    tbb::enumerable_thread_specific<std::vector<double>> thread_hist_compression(n_bins, 0.0);
+    tbb::enumerable_thread_specific<std::vector<double>> thread_hist_expansion(n_bins, 0.0);
+    m_exec_conf->getTaskArena()->execute(
+        [&]
+        {
+            tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+                              [&](const tbb::blocked_range<unsigned int>& r)
+                              {
+                                  std::vector<double>& hist_compression
+                                      = thread_hist_compression.local();
+                                  std::vector<double>& hist_expansion
+                                      = thread_hist_expansion.local();
+                                  for (unsigned int i = r.begin(); i != r.end(); ++i)
+                                      count_particle(i, hist_compression, hist_expansion);
+                              });
+        });
+
+    for (const auto& hist_compression : thread_hist_compression)
+        {
+        for (size_t bin = 0; bin < n_bins; bin++)
             {
-            m_hist_compression[min_bin_compression] += hist_weight_ptl_i_compression;
+            m_hist_compression[bin] += hist_compression[bin];
             }
-        if (min_bin_expansion < m_hist_expansion.size() && hist_weight_ptl_i_expansion <= 1.0)
+        }
+    for (const auto& hist_expansion : thread_hist_expansion)
+        {
+        for (size_t bin = 0; bin < n_bins; bin++)
             {
-            m_hist_expansion[min_bin_expansion] += hist_weight_ptl_i_expansion;
+            m_hist_expansion[bin] += hist_expansion[bin];
             }
-        } // end loop over all particles
-    }     // end countHistogramLinearSearch()
+        }
+#else
+    for (unsigned int i = 0; i < N; i++)
+        count_particle(i, m_hist_compression, m_hist_expansion);
+#endif // ENABLE_TBB
+    } // end countHistogramLinearSearch()
 
 /*! \param r_ij Vector pointing from particle i to j (already wrapped into the box)
     \param orientation_i Orientation of the particle i
@@ -48,6 +48,12 @@ class ExternalField : public Compute
         {
         return 0;
         }
+
+    /// External fields evaluate energies inside the HPMC integrator and are not timed separately
+    virtual bool isProfiled() const
+        {
+        return false;
+        }
     };
 //! Compute that accepts or rejects moves according to some external field
 /*! **Overview** <br>
@@ -122,6 +122,19 @@ bool IntegratorHPMC::checkParticleOrientations()
     \returns false if resize results in overlaps
 */
 bool IntegratorHPMC::attemptBoxResize(uint64_t timestep, const BoxDim& new_box)
+    {
+    scaleBox(new_box);
+
+    // check overlaps
+    return !this->countOverlaps(true);
+    }
+
+/*! \param new_box new box dimensions
+
+    Scale the particle positions and the origin from the current box to \a new_box without checking
+    for overlaps.
+*/
+void IntegratorHPMC::scaleBox(const BoxDim& new_box)
     {
     unsigned int N = m_pdata->getN();
 
@@ -161,9 +174,6 @@ bool IntegratorHPMC::attemptBoxResize(uint64_t timestep, const BoxDim& new_box)
 
     // we have moved particles, communicate those changes
     this->communicate(false);
-
-    // check overlaps
-    return !this->countOverlaps(true);
     }
 
 /*! \param mode 0 -> Absolute count, 1 -> relative to the start of the run, 2 -> relative to the
@@ -180,9 +180,24 @@ class PatchEnergy : public Autotuned
         }
 #endif
 
+    //! Get the signal that is emitted when the parameters change
+    Nano::Signal<void()>& getParamChangeSignal()
+        {
+        return m_param_change_signal;
+        }
+
     protected:
     std::shared_ptr<SystemDefinition> m_sysdef; // HOOMD's system definition
-    };                                          // end class PatchEnergy
+
+    //! Signal that is emitted when the parameters change
+    Nano::Signal<void()> m_param_change_signal;
+
+    //! Notify subscribers that the parameters changed
+    void notifyParamChange()
+        {
+        m_param_change_signal.emit();
+        }
+    }; // end class PatchEnergy
 
 //! Integrator that implements the HPMC approach
 /*! **Overview** <br>
@@ -403,6 +418,21 @@ class PYBIND11_EXPORT IntegratorHPMC : public Integrator
     //! Method to scale the box
     virtual bool attemptBoxResize(uint64_t timestep, const BoxDim& new_box);
 
+    //! Scale the box and the particle positions without checking for overlaps
+    void scaleBox(const BoxDim& new_box);
+
+    //! Test whether scaling the box would create overlaps without moving the particles
+    /*! \param new_box Trial box
+        \param overlaps Set to true when scaling the particles into \a new_box creates overlaps
+        \returns false when the test is not available and the caller must use attemptBoxResize()
+
+        The base class does not implement the test.
+    */
+    virtual bool testBoxResize(const BoxDim& new_box, bool& overlaps)
+        {
+        return false;
+        }
+
     ExternalField* getExternalField()
         {
         return m_external_base;
@@ -115,6 +115,68 @@ class UpdateOrder
         std::vector<unsigned int> m_update_order; //!< Update order
     };
 
+//! Linear map that scales vectors from one box to another
+/*! BoxScaling maps separation vectors the same way that IntegratorHPMC::scaleBox() maps particle
+    positions: r' = M r, where M takes the lattice vectors of the old box to those of the new box.
+
+    \ingroup hpmc_data_structs
+*/
+class BoxScaling
+    {
+    public:
+        //! Constructor
+        /*! \param old_box Box to map from
+            \param new_box Box to map to
+        */
+        BoxScaling(const BoxDim& old_box, const BoxDim& new_box)
+            {
+            const vec3<Scalar> zero = map(old_box, new_box, vec3<Scalar>(0,0,0));
+            const vec3<Scalar> zero_inv = map(new_box, old_box, vec3<Scalar>(0,0,0));
+            for (unsigned int k = 0; k < 3; k++)
+                {
+                vec3<Scalar> e(0,0,0);
+                if (k == 0) e.x = 1;
+                if (k == 1) e.y = 1;
+                if (k == 2) e.z = 1;
+                m_col[k] = map(old_box, new_box, e) - zero;
+                m_col_inv[k] = map(new_box, old_box, e) - zero_inv;
+                }
+            }
+
+        //! Scale a separation vector
+        vec3<Scalar> operator()(const vec3<Scalar>& r) const
+            {
+            return r.x * m_col[0] + r.y * m_col[1] + r.z * m_col[2];
+            }
+
+        //! Get a lower bound on |M r| / |r|
+        /*! The smallest singular value of M is 1/|M^-1|_2 and |X|_2 <= sqrt(|X|_1 |X|_inf).
+        */
+        Scalar getMinStretch() const
+            {
+            Scalar norm_1(0.0);
+            vec3<Scalar> row_sum(0,0,0);
+            for (unsigned int k = 0; k < 3; k++)
+                {
+                const vec3<Scalar>& c = m_col_inv[k];
+                norm_1 = std::max(norm_1, fabs(c.x) + fabs(c.y) + fabs(c.z));
+                row_sum += vec3<Scalar>(fabs(c.x), fabs(c.y), fabs(c.z));
+                }
+            Scalar norm_inf = std::max(row_sum.x, std::max(row_sum.y, row_sum.z));
+            return Scalar(1.0) / sqrt(norm_1 * norm_inf);
+            }
+
+    private:
+        vec3<Scalar> m_col[3];     //!< Columns of M
+        vec3<Scalar> m_col_inv[3]; //!< Columns of M^-1
+
+        //! Map a point from the fractional coordinates of one box to another
+        static vec3<Scalar> map(const BoxDim& from, const BoxDim& to, const vec3<Scalar>& r)
+            {
+            return vec3<Scalar>(to.makeCoordinates(from.makeFraction(vec_to_scalar3(r))));
+            }
+    };
+
 }; // end namespace detail
 
 //! HPMC on systems of mono-disperse shapes
@@ -142,6 +204,8 @@ class IntegratorHPMCMono : public IntegratorHPMC
                 free(m_aabbs);
             m_pdata->getBoxChangeSignal().template disconnect<IntegratorHPMCMono<Shape>, &IntegratorHPMCMono<Shape>::slotBoxChanged>(this);
             m_pdata->getParticleSortSignal().template disconnect<IntegratorHPMCMono<Shape>, &IntegratorHPMCMono<Shape>::slotSorted>(this);
+            if (m_patch)
+                m_patch->getParamChangeSignal().template disconnect<IntegratorHPMCMono<Shape>, &IntegratorHPMCMono<Shape>::slotPatchParamChanged>(this);
             }
 
         virtual void resetStats();
@@ -220,6 +284,9 @@ class IntegratorHPMCMono : public IntegratorHPMC
         //! Method to scale the box
         virtual bool attemptBoxResize(uint64_t timestep, const BoxDim& new_box);
 
+        //! Test whether scaling the box would create overlaps without moving the particles
+        virtual bool testBoxResize(const BoxDim& new_box, bool& overlaps);
+
         /*
          * Common HPMC API
          */
@@ -333,6 +400,9 @@ class IntegratorHPMCMono : public IntegratorHPMC
             // base class method
             IntegratorHPMC::prepRun(timestep);
 
+            // local snapshots may change positions, diameters, or charges between runs without a signal
+            m_patch_energy_valid = false;
+
             m_hasOrientation = false;
             quat<Scalar> q(make_scalar4(1,0,0,0));
             for (unsigned int i=0; i < m_pdata->getNTypes(); i++)
@@ -381,6 +451,20 @@ class IntegratorHPMCMono : public IntegratorHPMC
          */
         virtual float computePatchEnergy(uint64_t timestep);
 
+        //! Set the patch energy
+        virtual void setPatchEnergy(std::shared_ptr<PatchEnergy> patch)
+            {
+            if (m_patch)
+                m_patch->getParamChangeSignal().template disconnect<IntegratorHPMCMono<Shape>, &IntegratorHPMCMono<Shape>::slotPatchParamChanged>(this);
+            IntegratorHPMC::setPatchEnergy(patch);
+            if (m_patch)
+                m_patch->getParamChangeSignal().template connect<IntegratorHPMCMono<Shape>, &IntegratorHPMCMono<Shape>::slotPatchParamChanged>(this);
+            m_patch_energy_valid = false;
+            }
+
+        //! Maximum number of sweeps to accumulate into the patch energy before summing all pairs
+        static constexpr unsigned int PATCH_ENERGY_RECOMPUTE_PERIOD = 100;
+
         //! Build the AABB tree (if needed)
         const hoomd::detail::AABBTree& buildAABBTree();
 
@@ -394,7 +478,12 @@ class IntegratorHPMCMono : public IntegratorHPMC
             return m_image_hkl;
             }
 
-        void invalidateAABBTree(){ m_aabb_tree_invalid = true; }
+        //! Notify the integrator that particles have moved outside of update()
+        void invalidateAABBTree()
+            {
+            m_aabb_tree_invalid = true;
+            m_patch_energy_valid = false;
+            }
 
         std::vector<std::string> getTypeShapeMapping(const std::vector<param_type, hoomd::detail::managed_allocator<param_type> > &params) const
             {
@@ -426,6 +515,7 @@ class IntegratorHPMCMono : public IntegratorHPMC
         std::vector<vec3<Scalar> > m_image_list;             //!< List of potentially interacting simulation box images
         std::vector<int3> m_image_hkl;               //!< List of potentially interacting simulation box images (integer shifts)
         unsigned int m_image_list_rebuilds;                  //!< Number of times the image list has been rebuilt
+        Scalar m_image_list_range;                           //!< Separation covered by the image list
         bool m_image_list_warning_issued;                    //!< True if the image list warning has been issued
         bool m_hkl_max_warning_issued;                       //!< True if the image list size warning has been issued
         bool m_hasOrientation;                               //!< true if there are any orientable particles in the system
@@ -440,6 +530,39 @@ class IntegratorHPMCMono : public IntegratorHPMC
 
         Index2D m_overlap_idx;                      //!!< Indexer for interaction matrix
 
+        /* Box resize overlap check related data members */
+
+        //! Pair of particles that may overlap after a box resize
+        struct BoxResizePair
+            {
+            unsigned int i;   //!< Index of the first particle
+            unsigned int j;   //!< Index of the second particle
+            vec3<Scalar> r;   //!< Separation (j - image of i) when the pair list was built
+            };
+
+        std::vector<BoxResizePair> m_box_pairs;      //!< Candidate pairs for box resize trials
+        std::vector<vec3<Scalar> > m_box_pairs_pos;  //!< Particle positions when the pair list was built
+        std::vector<vec3<Scalar> > m_box_pairs_dr;   //!< Displacements since the pair list was built
+        BoxDim m_box_pairs_box;                      //!< Box that m_box_pairs refers to
+        Scalar m_box_pairs_r_cut;                    //!< All pairs closer than this are in m_box_pairs
+        bool m_box_pairs_valid;                      //!< True when m_box_pairs has been built
+
+        //! Find all pairs closer than r_cut for use in box resize trials
+        void buildBoxResizePairs(Scalar r_cut);
+
+        /* Running patch energy related data members */
+
+        // update() adds the energy difference of every accepted trial move to m_patch_energy_total,
+        // which computePatchEnergy() returns instead of summing over all pairs. Operations that
+        // change the configuration or the patch parameters outside of update() invalidate the total
+        // through the box change, particle sort, and patch parameter change signals, or by calling
+        // invalidateAABBTree(). computePatchEnergy() also sums over all pairs at the start of every
+        // run and at least every PATCH_ENERGY_RECOMPUTE_PERIOD sweeps to bound round off drift.
+
+        double m_patch_energy_total;                        //!< Patch energy of the current configuration
+        bool m_patch_energy_valid;                          //!< True when m_patch_energy_total is up to date
+        unsigned int m_patch_energy_sweeps;                 //!< Sweeps accumulated since the last full sum
+
         /* Depletants related data members */
 
         GlobalVector<Scalar> m_fugacity;            //!< Average depletant number density in free volume, per type
@@ -473,12 +596,23 @@ class IntegratorHPMCMono : public IntegratorHPMC
             // anything that changes the box (i.e. NPT, box_resize) is also moving the particles,
             // so use it as a sign to rebuild the AABB tree
             m_aabb_tree_invalid = true;
+            m_patch_energy_valid = false;
             }
 
         //! callback so that the particle sort signal can invalidate the AABB tree
+        /*! Snapshots, type changes, and particle insertions and removals also emit the sort signal,
+            so it invalidates the running patch energy total as well.
+        */
         virtual void slotSorted()
             {
             m_aabb_tree_invalid = true;
+            m_patch_energy_valid = false;
+            }
+
+        //! callback so that changes to the patch parameters invalidate the running patch energy total
+        void slotPatchParamChanged()
+            {
+            m_patch_energy_valid = false;
             }
     };
 
@@ -490,6 +624,11 @@ IntegratorHPMCMono<Shape>::IntegratorHPMCMono(std::shared_ptr<SystemDefinition>
               m_image_list_valid(false),
               m_hasOrientation(true),
               m_extra_image_width(0.0),
+              m_box_pairs_r_cut(0.0),
+              m_box_pairs_valid(false),
+              m_patch_energy_total(0.0),
+              m_patch_energy_valid(false),
+              m_patch_energy_sweeps(0),
               m_fugacity(m_exec_conf),
               m_ntrial(m_exec_conf)
     {
@@ -513,6 +652,7 @@ IntegratorHPMCMono<Shape>::IntegratorHPMCMono(std::shared_ptr<SystemDefinition>
     m_pdata->getParticleSortSignal().template connect<IntegratorHPMCMono<Shape>, &IntegratorHPMCMono<Shape>::slotSorted>(this);
 
     m_image_list_rebuilds = 0;
+    m_image_list_range = 0;
     m_image_list_warning_issued = false;
     m_hkl_max_warning_issued = false;
 
@@ -910,6 +1050,9 @@ void IntegratorHPMCMono<Shape>::update(uint64_t timestep)
                     } // end loop over images
                 } // end if (m_patch)
 
+            // deltaU of the patch interaction alone
+            double patch_energy_diff = patch_field_energy_diff;
+
             // Add external energetic contribution if there are no overlaps
             if (m_external && !overlap)
                 {
@@ -950,6 +1093,10 @@ void IntegratorHPMCMono<Shape>::update(uint64_t timestep)
                 // update position of particle
                 h_postype.data[i] = make_scalar4(pos_i.x,pos_i.y,pos_i.z,postype_i.w);
 
+                // deltaU = U_old - U_new
+                if (m_patch_energy_valid)
+                    m_patch_energy_total -= patch_energy_diff;
+
                 if (shape_i.hasOrientation())
                     {
                     h_orientation.data[i] = quat_to_scalar4(shape_i.orientation);
@@ -983,6 +1130,9 @@ void IntegratorHPMCMono<Shape>::update(uint64_t timestep)
             }
         }
 
+    if (m_patch_energy_valid)
+        m_patch_energy_sweeps++;
+
     // perform the grid shift
     #ifdef ENABLE_MPI
     if (m_sysdef->isDomainDecomposed())
@@ -1162,103 +1312,112 @@ float IntegratorHPMCMono<Shape>::computePatchEnergy(uint64_t timestep)
         throw std::runtime_error("computePatchEnergy must be called after run().");
         }
 
+    // use the running total when only trial moves have changed the configuration since the last sum
+    if (m_patch_energy_valid && m_patch_energy_sweeps < PATCH_ENERGY_RECOMPUTE_PERIOD)
+        {
+        return float(m_patch_energy_total);
+        }
+
     // build an up to date AABB tree
     buildAABBTree();
     // update the image list
     updateImageList();
 
-    // access particle data and system box
-    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
-    ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
-    ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(), access_location::host, access_mode::read);
-    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
-    ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
-
-    // access parameters and interaction matrix
-    ArrayHandle<unsigned int> h_overlaps(m_overlaps, access_location::host, access_mode::read);
-
-    // Loop over all particles
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+    // Use lexical scope block to make sure ArrayHandles get cleaned up
         {
-        // read in the current position and orientation
-        Scalar4 postype_i = h_postype.data[i];
-        Scalar4 orientation_i = h_orientation.data[i];
-        unsigned int typ_i = __scalar_as_int(postype_i.w);
-        Shape shape_i(quat<Scalar>(orientation_i), m_params[typ_i]);
-        vec3<Scalar> pos_i = vec3<Scalar>(postype_i);
+        // access particle data and system box
+        ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
 
-        Scalar d_i = h_diameter.data[i];
-        Scalar charge_i = h_charge.data[i];
+        // access parameters and interaction matrix
+        ArrayHandle<unsigned int> h_overlaps(m_overlaps, access_location::host, access_mode::read);
 
-        // the cut-off
-        ShortReal r_cut = ShortReal(m_patch->getRCut() + 0.5*m_patch->getAdditiveCutoff(typ_i));
+        // Loop over all particles
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            {
+            // read in the current position and orientation
+            Scalar4 postype_i = h_postype.data[i];
+            Scalar4 orientation_i = h_orientation.data[i];
+            unsigned int typ_i = __scalar_as_int(postype_i.w);
+            Shape shape_i(quat<Scalar>(orientation_i), m_params[typ_i]);
+            vec3<Scalar> pos_i = vec3<Scalar>(postype_i);
 
-        // subtract minimum AABB extent from search radius
-        ShortReal R_query = std::max(shape_i.getCircumsphereDiameter()/ShortReal(2.0),
-            r_cut-getMinCoreDiameter()/(ShortReal)2.0);
-        hoomd::detail::AABB aabb_i_local = hoomd::detail::AABB(vec3<Scalar>(0,0,0),R_query);
+            Scalar d_i = h_diameter.data[i];
+            Scalar charge_i = h_charge.data[i];
 
-        const unsigned int n_images = (unsigned int)m_image_list.size();
-        for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
-            {
-            vec3<Scalar> pos_i_image = pos_i + m_image_list[cur_image];
-            hoomd::detail::AABB aabb = aabb_i_local;
-            aabb.translate(pos_i_image);
+            // the cut-off
+            ShortReal r_cut = ShortReal(m_patch->getRCut() + 0.5*m_patch->getAdditiveCutoff(typ_i));
 
-            // stackless search
-            for (unsigned int cur_node_idx = 0; cur_node_idx < m_aabb_tree.getNumNodes(); cur_node_idx++)
+            // subtract minimum AABB extent from search radius
+            ShortReal R_query = std::max(shape_i.getCircumsphereDiameter()/ShortReal(2.0),
+                r_cut-getMinCoreDiameter()/(ShortReal)2.0);
+            hoomd::detail::AABB aabb_i_local = hoomd::detail::AABB(vec3<Scalar>(0,0,0),R_query);
+
+            const unsigned int n_images = (unsigned int)m_image_list.size();
+            for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
                 {
-                if (detail::overlap(m_aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                vec3<Scalar> pos_i_image = pos_i + m_image_list[cur_image];
+                hoomd::detail::AABB aabb = aabb_i_local;
+                aabb.translate(pos_i_image);
+
+                // stackless search
+                for (unsigned int cur_node_idx = 0; cur_node_idx < m_aabb_tree.getNumNodes(); cur_node_idx++)
                     {
-                    if (m_aabb_tree.isNodeLeaf(cur_node_idx))
+                    if (detail::overlap(m_aabb_tree.getNodeAABB(cur_node_idx), aabb))
                         {
-                        for (unsigned int cur_p = 0; cur_p < m_aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
+                        if (m_aabb_tree.isNodeLeaf(cur_node_idx))
                             {
-                            // read in its position and orientation
-                            unsigned int j = m_aabb_tree.getNodeParticle(cur_node_idx, cur_p);
+                            for (unsigned int cur_p = 0; cur_p < m_aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
+                                {
+                                // read in its position and orientation
+                                unsigned int j = m_aabb_tree.getNodeParticle(cur_node_idx, cur_p);
 
-                            // skip i==j in the 0 image
-                            if (cur_image == 0 && i == j)
-                                continue;
+                                // skip i==j in the 0 image
+                                if (cur_image == 0 && i == j)
+                                    continue;
 
-                            Scalar4 postype_j = h_postype.data[j];
-                            Scalar4 orientation_j = h_orientation.data[j];
-                            Scalar d_j = h_diameter.data[j];
-                            Scalar charge_j = h_charge.data[j];
+                                Scalar4 postype_j = h_postype.data[j];
+                                Scalar4 orientation_j = h_orientation.data[j];
+                                Scalar d_j = h_diameter.data[j];
+                                Scalar charge_j = h_charge.data[j];
 
-                            // put particles in coordinate system of particle i
-                            vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
+                                // put particles in coordinate system of particle i
+                                vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
 
-                            unsigned int typ_j = __scalar_as_int(postype_j.w);
-                            Shape shape_j(quat<Scalar>(orientation_j), m_params[typ_j]);
+                                unsigned int typ_j = __scalar_as_int(postype_j.w);
+                                Shape shape_j(quat<Scalar>(orientation_j), m_params[typ_j]);
 
-                            // count unique pairs within range
-                            Scalar rcut_ij = r_cut + 0.5*m_patch->getAdditiveCutoff(typ_j);
+                                // count unique pairs within range
+                                Scalar rcut_ij = r_cut + 0.5*m_patch->getAdditiveCutoff(typ_j);
 
-                            if (h_tag.data[i] <= h_tag.data[j] && dot(r_ij,r_ij) <= rcut_ij*rcut_ij)
-                                {
-                                energy += m_patch->energy(r_ij,
-                                       typ_i,
-                                       quat<float>(orientation_i),
-                                       float(d_i),
-                                       float(charge_i),
-                                       typ_j,
-                                       quat<float>(orientation_j),
-                                       float(d_j),
-                                       float(charge_j));
+                                if (h_tag.data[i] <= h_tag.data[j] && dot(r_ij,r_ij) <= rcut_ij*rcut_ij)
+                                    {
+                                    energy += m_patch->energy(r_ij,
+                                           typ_i,
+                                           quat<float>(orientation_i),
+                                           float(d_i),
+                                           float(charge_i),
+                                           typ_j,
+                                           quat<float>(orientation_j),
+                                           float(d_j),
+                                           float(charge_j));
+                                    }
                                 }
                             }
                         }
-                    }
-                else
-                    {
-                    // skip ahead
-                    cur_node_idx += m_aabb_tree.getNodeSkip(cur_node_idx);
-                    }
+                    else
+                        {
+                        // skip ahead
+                        cur_node_idx += m_aabb_tree.getNodeSkip(cur_node_idx);
+                        }
 
-                } // end loop over AABB nodes
-            } // end loop over images
-        } // end loop over particles
+                    } // end loop over AABB nodes
+                } // end loop over images
+            } // end loop over particles
+        } // end lexical scope
 
     #ifdef ENABLE_MPI
     if (this->m_pdata->getDomainDecomposition())
@@ -1267,10 +1426,17 @@ float IntegratorHPMCMono<Shape>::computePatchEnergy(uint64_t timestep)
         }
     #endif
 
+    // start a new running total
+    m_patch_energy_total = energy;
+    m_patch_energy_sweeps = 0;
+    m_patch_energy_valid = true;
+    #ifdef ENABLE_MPI
+    m_patch_energy_valid = !this->m_pdata->getDomainDecomposition();
+    #endif
+
     return float(energy);
     }
 
-
 template <class Shape>
 Scalar IntegratorHPMCMono<Shape>::getMaxCoreDiameter()
     {
@@ -1464,6 +1630,7 @@ inline const std::vector<vec3<Scalar> >& IntegratorHPMCMono<Shape>::updateImageL
     range += m_extra_image_width;
 
     m_exec_conf->msg->notice(6) << "Image list: range = " << range << std::endl;
+    m_image_list_range = range;
 
     // initialize loop
     // start in the middle and add image boxes going out, one index at a time until no more
@@ -2643,6 +2810,187 @@ bool IntegratorHPMCMono<Shape>::attemptBoxResize(uint64_t timestep, const BoxDim
     return result;
     }
 
+/*! \param new_box Trial box
+    \param overlaps Set to true when scaling the particles into \a new_box creates overlaps
+    \returns false when the test is not available and the caller must use attemptBoxResize()
+
+    Box resize trials only need to check pairs that are close enough to overlap after scaling.
+    testBoxResize() keeps a list of all pairs closer than m_box_pairs_r_cut together with their
+    separation vectors and the particle positions at the time the list was built. When the box
+    changes, the list is scaled along with it. No pair of particles can move closer than
+    r_cut - 2 dr_max (r_cut scaled by the smallest stretch of the box map) where dr_max is the
+    largest displacement since the list was built, so the list remains complete while that distance
+    exceeds the largest circumsphere diameter. The list is rebuilt lazily when particle moves
+    exhaust the margin.
+
+    The check uses the same overlap tests as countOverlaps() and does not modify the particle data.
+    It is not available with implicit depletants or domain decomposition.
+*/
+template<class Shape>
+bool IntegratorHPMCMono<Shape>::testBoxResize(const BoxDim& new_box, bool& overlaps)
+    {
+    overlaps = false;
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        return false;
+    #endif
+
+    for (unsigned int ptype = 0; ptype < this->m_pdata->getNTypes(); ++ptype)
+        {
+        if (getDepletantFugacity(ptype) != 0.0)
+            return false;
+        }
+
+    const BoxDim box = m_pdata->getGlobalBox();
+    const unsigned int N = m_pdata->getN();
+    const Scalar d_max = getMaxCoreDiameter();
+    const Scalar stretch = detail::BoxScaling(box, new_box).getMinStretch();
+
+    // cover a margin of 25% of the diameter, limited to the range of the image list
+    updateImageList();
+    const Scalar r_cut = std::min(Scalar(1.25) * d_max, m_image_list_range);
+    if (stretch * r_cut <= d_max)
+        return false;
+
+    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+
+    // scale the pair list to the current box
+    if (m_box_pairs_valid && !(m_box_pairs_box == box))
+        {
+        const detail::BoxScaling scale(m_box_pairs_box, box);
+        for (auto& pair : m_box_pairs)
+            pair.r = scale(pair.r);
+        for (auto& pos : m_box_pairs_pos)
+            pos = vec3<Scalar>(box.makeCoordinates(m_box_pairs_box.makeFraction(vec_to_scalar3(pos))));
+        m_box_pairs_r_cut *= scale.getMinStretch();
+        m_box_pairs_box = box;
+        }
+
+    // find the largest displacement since the pair list was built
+    Scalar dr_max_sq(0.0);
+    bool valid = m_box_pairs_valid && m_box_pairs_pos.size() == N;
+    if (valid)
+        {
+        m_box_pairs_dr.resize(N);
+        for (unsigned int i = 0; i < N; i++)
+            {
+            vec3<Scalar> dr = vec3<Scalar>(h_postype.data[i]) - m_box_pairs_pos[i];
+            dr = vec3<Scalar>(box.minImage(vec_to_scalar3(dr)));
+            m_box_pairs_dr[i] = dr;
+            dr_max_sq = std::max(dr_max_sq, dot(dr, dr));
+            }
+        valid = stretch * (m_box_pairs_r_cut - Scalar(2.0) * sqrt(dr_max_sq)) > d_max;
+        }
+
+    if (!valid)
+        {
+        buildBoxResizePairs(r_cut);
+        m_box_pairs_dr.assign(N, vec3<Scalar>(0,0,0));
+        }
+
+    // check the candidate pairs in the scaled box
+    ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_overlaps(m_overlaps, access_location::host, access_mode::read);
+    const detail::BoxScaling scale(box, new_box);
+    unsigned int err_count = 0;
+
+    for (const auto& pair : m_box_pairs)
+        {
+        const unsigned int i = pair.i;
+        const unsigned int j = pair.j;
+        Scalar4 postype_i = h_postype.data[i];
+        Scalar4 postype_j = h_postype.data[j];
+        unsigned int typ_i = __scalar_as_int(postype_i.w);
+        unsigned int typ_j = __scalar_as_int(postype_j.w);
+
+        if (!h_overlaps.data[m_overlap_idx(typ_i,typ_j)])
+            continue;
+
+        vec3<Scalar> r_ij = scale(pair.r + m_box_pairs_dr[j] - m_box_pairs_dr[i]);
+        Shape shape_i(quat<Scalar>(h_orientation.data[i]), m_params[typ_i]);
+        Shape shape_j(quat<Scalar>(h_orientation.data[j]), m_params[typ_j]);
+
+        if (check_circumsphere_overlap(r_ij, shape_i, shape_j)
+            && test_overlap(r_ij, shape_i, shape_j, err_count)
+            && test_overlap(-r_ij, shape_j, shape_i, err_count))
+            {
+            overlaps = true;
+            break;
+            }
+        }
+
+    return true;
+    }
+
+/*! \param r_cut Largest separation to include in the list
+
+    Find all pairs of particles (including periodic images) with centers closer than \a r_cut using
+    the AABB tree.
+*/
+template<class Shape>
+void IntegratorHPMCMono<Shape>::buildBoxResizePairs(Scalar r_cut)
+    {
+    m_exec_conf->msg->notice(8) << "IntegratorHPMCMono: building box resize pair list" << std::endl;
+
+    // build an up to date AABB tree
+    buildAABBTree();
+    // update the image list
+    updateImageList();
+
+    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+    const unsigned int N = m_pdata->getN();
+    const Scalar r_cut_sq = r_cut * r_cut;
+
+    m_box_pairs.clear();
+    m_box_pairs_pos.resize(N);
+
+    for (unsigned int i = 0; i < N; i++)
+        {
+        vec3<Scalar> pos_i = vec3<Scalar>(h_postype.data[i]);
+        m_box_pairs_pos[i] = pos_i;
+
+        const unsigned int n_images = (unsigned int)m_image_list.size();
+        for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
+            {
+            vec3<Scalar> pos_i_image = pos_i + m_image_list[cur_image];
+            hoomd::detail::AABB aabb(pos_i_image, r_cut);
+
+            // stackless search
+            for (unsigned int cur_node_idx = 0; cur_node_idx < m_aabb_tree.getNumNodes(); cur_node_idx++)
+                {
+                if (detail::overlap(m_aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                    {
+                    if (m_aabb_tree.isNodeLeaf(cur_node_idx))
+                        {
+                        for (unsigned int cur_p = 0; cur_p < m_aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
+                            {
+                            unsigned int j = m_aabb_tree.getNodeParticle(cur_node_idx, cur_p);
+
+                            // store each pair once, skipping i==j in the 0 image
+                            if (j < i || (cur_image == 0 && i == j))
+                                continue;
+
+                            vec3<Scalar> r_ij = vec3<Scalar>(h_postype.data[j]) - pos_i_image;
+                            if (dot(r_ij, r_ij) < r_cut_sq)
+                                m_box_pairs.push_back(BoxResizePair{i, j, r_ij});
+                            }
+                        }
+                    }
+                else
+                    {
+                    // skip ahead
+                    cur_node_idx += m_aabb_tree.getNodeSkip(cur_node_idx);
+                    }
+                } // end loop over AABB nodes
+            } // end loop over images
+        } // end loop over particles
+
+    m_box_pairs_box = m_pdata->getGlobalBox();
+    m_box_pairs_r_cut = r_cut;
+    m_box_pairs_valid = true;
+    }
+
 namespace detail {
 
 //! Export the IntegratorHPMCMono class to python
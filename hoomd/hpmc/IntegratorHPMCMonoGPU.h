@@ -1968,6 +1968,9 @@ template<class Shape> void IntegratorHPMCMonoGPU<Shape>::update(uint64_t timeste
     // all particle have been moved, the aabb tree is now invalid
     this->m_aabb_tree_invalid = true;
 
+    // the GPU kernels do not accumulate the running patch energy total
+    this->m_patch_energy_valid = false;
+
     // set current MPS value
     hpmc_counters_t run_counters = this->getCounters(1);
     double cur_time = double(this->m_clock.getTime()) / Scalar(1e9);
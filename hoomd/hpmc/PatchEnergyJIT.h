@@ -65,6 +65,7 @@ class PYBIND11_EXPORT PatchEnergyJIT : public hpmc::PatchEnergy
     void setRCut(Scalar r_cut)
         {
         m_r_cut_isotropic = r_cut;
+        notifyParamChange();
         }
 
     //! Get the maximum r_ij radius beyond which energies are always 0
@@ -102,6 +103,8 @@ class PYBIND11_EXPORT PatchEnergyJIT : public hpmc::PatchEnergy
     static pybind11::object getParamArray(pybind11::object self)
         {
         auto self_cpp = self.cast<PatchEnergyJIT*>();
+        // the caller may modify the parameters through the returned view
+        self_cpp->notifyParamChange();
         return pybind11::array(self_cpp->m_param_array.size(),
                                self_cpp->m_factory->getAlphaArray(),
                                self);
@@ -91,6 +91,7 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
             {
             m_type[pid][i] = pybind11::cast<unsigned int>(typeids[i]);
             }
+        notifyParamChange();
         }
 
     //! Get per-type typeid of constituent particles as a python list
@@ -118,6 +119,7 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
             m_position[pid][i] = pos;
             }
         buildOBBTree(pid);
+        notifyParamChange();
         }
 
     //! Get per-type positions of the constituent particles as a python list of 3-tuples
@@ -151,6 +153,7 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
             quat<float> ort(s, vec3<float>(x, y, z));
             m_orientation[pid][i] = ort;
             }
+        notifyParamChange();
         }
 
     //! Get per-type orientations of the constituent particles as a python list of 4-tuples
@@ -179,6 +182,7 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
             {
             m_diameter[pid][i] = diameter[i].cast<float>();
             }
+        notifyParamChange();
         }
 
     //! Get per-type diameters of the constituent particles as a python list
@@ -203,6 +207,7 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
             {
             m_charge[pid][i] = charge[i].cast<float>();
             }
+        notifyParamChange();
         }
 
     //! Get per-type charges of the constituent particles as python list
@@ -253,6 +258,7 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
         // return cutoff for constituent particle potentials
         m_r_cut_constituent = r_cut;
         // buildOBBTree();  // TODO: investigate if this is needed here
+        notifyParamChange();
         }
 
     //! Get the cut-off for constituent particles
@@ -268,6 +274,7 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
         // return cutoff for constituent particle potentials
         m_r_cut_isotropic = r_cut;
         // buildOBBTree();  // TODO: investigate if this is needed here
+        notifyParamChange();
         }
 
     //! Get the maximum geometric extent, which is added to the cutoff, per type
@@ -308,6 +315,8 @@ class PatchEnergyJITUnion : public PatchEnergyJIT
     static pybind11::object getParamArrayConstituent(pybind11::object self)
         {
         auto self_cpp = self.cast<PatchEnergyJITUnion*>();
+        // the caller may modify the parameters through the returned view
+        self_cpp->notifyParamChange();
         unsigned int array_size = (unsigned int)self_cpp->m_param_array_constituent.size();
         return pybind11::array(array_size,
                                self_cpp->m_factory_constituent->getAlphaUnionArray(),
@@ -218,6 +218,10 @@ inline bool UpdaterBoxMC::remove_overshear()
     \returns bool True if box resize was accepted
 
     If box is excessively sheared, subtract lattice vectors to make box more cubic.
+
+    When there is no patch energy or external field, IntegratorHPMC::testBoxResize() may check
+    the trial box for overlaps without moving the particles. The particles are then scaled only when
+    the trial is accepted.
 */
 inline bool UpdaterBoxMC::box_resize_trial(Scalar Lx,
                                            Scalar Ly,
@@ -229,6 +233,32 @@ inline bool UpdaterBoxMC::box_resize_trial(Scalar Lx,
                                            double delta_beta_H,
                                            hoomd::RandomGenerator& rng)
     {
+    BoxDim curBox = m_pdata->getGlobalBox();
+    BoxDim newBox = curBox;
+
+    newBox.setL(make_scalar3(Lx, Ly, Lz));
+    newBox.setTiltFactors(xy, xz, yz);
+
+    // Without energy terms that depend on the particle positions, the integrator may be able to
+    // check the trial box for overlaps before moving any particles
+    bool overlaps = false;
+    if (!m_mc->getPatchEnergy() && !m_mc->getExternalField()
+        && m_mc->testBoxResize(newBox, overlaps))
+        {
+        if (overlaps)
+            {
+            return false;
+            }
+
+        double p = hoomd::detail::generate_canonical<double>(rng);
+        if (p < exp(-delta_beta_H))
+            {
+            m_mc->scaleBox(newBox);
+            return true;
+            }
+        return false;
+        }
+
     // Make a backup copy of position data
     unsigned int N_backup = m_pdata->getN();
         {
@@ -241,7 +271,6 @@ inline bool UpdaterBoxMC::box_resize_trial(Scalar Lx,
         memcpy(h_pos_backup.data, h_pos.data, sizeof(Scalar4) * N_backup);
         }
 
-    BoxDim curBox = m_pdata->getGlobalBox();
     double delta_U_pair = 0;
 
     if (m_mc->getPatchEnergy())
@@ -251,11 +280,6 @@ inline bool UpdaterBoxMC::box_resize_trial(Scalar Lx,
         }
 
     // Attempt box resize and check for overlaps
-    BoxDim newBox = m_pdata->getGlobalBox();
-
-    newBox.setL(make_scalar3(Lx, Ly, Lz));
-    newBox.setTiltFactors(xy, xz, yz);
-
     Scalar3 old_origin = m_pdata->getOrigin();
     bool allowed = m_mc->attemptBoxResize(timestep, newBox);
     Scalar3 new_origin = m_pdata->getOrigin();
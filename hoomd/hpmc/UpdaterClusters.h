@@ -12,6 +12,8 @@
 #include "hoomd/RandomNumbers.h"
 #include "hoomd/RNGIdentifiers.h"
 
+#include <atomic>
+#include <functional>
 #include <set>
 #include <list>
 
@@ -20,17 +22,10 @@
 #include "IntegratorHPMCMono.h"
 
 #ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
 #include <tbb/concurrent_unordered_map.h>
 #include <tbb/concurrent_unordered_set.h>
-#include <tbb/concurrent_vector.h>
 #include <tbb/parallel_for.h>
-#include <tbb/task.h>
-#include <atomic>
-
-#if TBB_VERSION_MAJOR < 2021
-#define ENABLE_TBB_TASK
-#endif
-
 #endif
 
 namespace hoomd {
@@ -40,232 +35,133 @@ namespace hpmc
 
 namespace detail
 {
-
-#ifdef ENABLE_TBB_TASK
-//! Wrapper around std::atomic_flag to allow use in a std::vector
-class my_atomic_flag
+//! Hash function for particle index pairs
+struct PairHash
     {
-    public:
-        //! Default constructor
-        my_atomic_flag()
-            {
-            f.clear();
-            }
-
-        //! Copy constructor
-        /*! \note this constructor doesn't really copy the value of its argument,
-            it just reset's the flag to zero
-         */
-        my_atomic_flag(const my_atomic_flag& other)
-            {
-            f.clear();
-            }
-
-        //! Assignment operator (non-atomic)
-        /*! \note this assignment operator doesn't really copy the value of its argument,
-            it just reset's the flag to zero
-         */
-        my_atomic_flag& operator =( const my_atomic_flag& other)
-            {
-            f.clear();
-            return *this;
-            }
-
-        //! Sets flag and returns old value
-        bool test_and_set()
-            {
-            return f.test_and_set();
-            }
-
-    private:
-        std::atomic_flag f;
+    size_t operator()(const std::pair<unsigned int, unsigned int>& p) const
+        {
+        return std::hash<uint64_t>()((uint64_t(p.first) << 32) | uint64_t(p.second));
+        }
     };
-#endif
 
-// Graph class represents a undirected graph
-// using adjacency list representation
-class Graph
+//! Disjoint set forest to find the connected components of an undirected graph
+/*! Edges may be added concurrently from multiple threads. The implementation is lock-free:
+    find() compresses paths by halving with compare-and-swap, and unite() links the root with the
+    larger index below the root with the smaller index. Because parent indices only ever decrease,
+    no cycles can form and the root of every set is its smallest member once all edges are added.
+
+    connectedComponents() must not be called concurrently with unite().
+*/
+class UnionFind
     {
     public:
-        Graph()
+        UnionFind()
             {
             }
 
-        inline Graph(unsigned int V);   // Constructor
+        inline UnionFind(unsigned int V);   // Constructor
 
+        //! Reset to V disjoint singletons
         inline void resize(unsigned int V);
 
-        inline void addEdge(unsigned int v, unsigned int w);
+        //! Find the root of the set containing v
+        inline unsigned int find(unsigned int v);
 
-        #ifdef ENABLE_TBB_TASK
-        inline void connectedComponents(std::vector<tbb::concurrent_vector<unsigned int> >& cc);
-        #else
-        inline void connectedComponents(std::vector<std::vector<unsigned int> >& cc);
-        #endif
+        //! Merge the sets containing v and w
+        inline void unite(unsigned int v, unsigned int w);
 
-        #ifdef ENABLE_TBB_TASK
-        void setTaskArena(std::shared_ptr<tbb::task_arena> task_arena)
+        //! Add an (undirected) edge between v and w
+        void addEdge(unsigned int v, unsigned int w)
             {
-            m_task_arena = task_arena;
+            unite(v, w);
             }
-        #endif
-
-    private:
-        #ifndef ENABLE_TBB_TASK
-        std::multimap<unsigned int,unsigned int> adj;
-        #else
-        tbb::concurrent_unordered_multimap<unsigned int, unsigned int> adj;
-        #endif
-
-        #ifndef ENABLE_TBB_TASK
-        std::vector<unsigned int> visited;
-        #else
-        std::vector<my_atomic_flag> visited;
-        #endif
-
-        #ifdef ENABLE_TBB_TASK
-        /// The TBB task arena
-        std::shared_ptr<tbb::task_arena> m_task_arena;
-        #endif
-
-        #ifndef ENABLE_TBB_TASK
-        // A function used by DFS
-        inline void DFSUtil(unsigned int v, std::vector<unsigned int>& visited, std::vector<unsigned int>& cur_cc);
-        #endif
-
-        #ifdef ENABLE_TBB_TASK
-        class DFSTask : public tbb::task
-            {
-            public:
-                DFSTask(unsigned int _root, std::vector<my_atomic_flag>& _visited,
-                    tbb::concurrent_vector<unsigned int>& _cc,
-                    const tbb::concurrent_unordered_multimap<unsigned int, unsigned int>& _adj)
-                    : root(_root), visited(_visited), cc(_cc), adj(_adj)
-                    { }
-
-                tbb::task* execute()
-                    {
-                    cc.push_back(root);
-
-                    unsigned int count = 0;
-                    tbb::task_list list;
-
-                    auto begin = adj.equal_range(root).first;
-                    auto end = adj.equal_range(root).second;
-
-                    for (auto it = begin; it != end; ++it)
-                        {
-                        unsigned int neighbor = it->second;
-                        if (!visited[neighbor].test_and_set())
-                            {
-                            if (count++ == 0)
-                                {
-                                root = neighbor; // for task recycling
-                                continue;
-                                }
-                            list.push_back(*new(allocate_child()) DFSTask(neighbor, visited, cc, adj));
-                            }
-                        }
-
-                    if (count)
-                        {
-                        set_ref_count(count);
-                        spawn(list);
 
-                        recycle_as_safe_continuation();
-                        }
-
-                    return NULL;
-                    }
-
-            private:
-                unsigned int root;
-                std::vector<my_atomic_flag> & visited;
-                tbb::concurrent_vector<unsigned int>& cc;
-                const tbb::concurrent_unordered_multimap<unsigned int, unsigned int>& adj;
-            };
-        #endif // ENABLE_TBB_TASK
+        //! Gather the connected components
+        /*! Components are ordered by their smallest member, and the members of each component are
+            in ascending order.
+        */
+        inline void connectedComponents(std::vector<std::vector<unsigned int> >& cc);
 
+    private:
+        std::vector< std::atomic<unsigned int> > m_parent; //!< Parent of each node in the forest
+        std::vector<unsigned int> m_label;                 //!< Temporary component labels
     };
 
-// Gather connected components in an undirected graph
-#ifdef ENABLE_TBB_TASK
-void Graph::connectedComponents(std::vector<tbb::concurrent_vector<unsigned int> >& cc)
-#else
-void Graph::connectedComponents(std::vector<std::vector<unsigned int> >& cc)
-#endif
+UnionFind::UnionFind(unsigned int V)
+    {
+    resize(V);
+    }
+
+void UnionFind::resize(unsigned int V)
     {
-    #ifdef ENABLE_TBB_TASK
-    this->m_task_arena->execute([&]{
-    for (unsigned int v = 0; v < visited.size(); ++v)
+    if (m_parent.size() != V)
         {
-        if (! visited[v].test_and_set())
-            {
-            tbb::concurrent_vector<unsigned int> component;
-            DFSTask& a = *new(tbb::task::allocate_root()) DFSTask(v, visited, component, adj);
-            tbb::task::spawn_root_and_wait(a);
-            cc.push_back(component);
-            }
+        // std::atomic is not movable, so reallocate instead of resizing
+        std::vector< std::atomic<unsigned int> >(V).swap(m_parent);
         }
-    }); // end task arena execute()
-    #else
-    std::fill(visited.begin(), visited.end(), 0);
 
-    // Depth first search
-    for (unsigned int v=0; v<visited.size(); v++)
+    for (unsigned int v = 0; v < V; ++v)
         {
-        if (visited[v] == false)
-            {
-            std::vector<unsigned int> cur_cc;
-            DFSUtil(v, visited, cur_cc);
-            cc.push_back(cur_cc);
-            }
+        m_parent[v].store(v, std::memory_order_relaxed);
         }
-    #endif
     }
 
-#ifndef ENABLE_TBB_TASK
-void Graph::DFSUtil(unsigned int v, std::vector<unsigned int>& visited, std::vector<unsigned int>& cur_cc)
+unsigned int UnionFind::find(unsigned int v)
     {
-    visited[v] = 1;
-    cur_cc.push_back(v);
-
-    // Recur for all the vertices
-    // adjacent to this vertex
-    auto begin = adj.equal_range(v).first;
-    auto end = adj.equal_range(v).second;
-    for(auto i = begin; i != end; ++i)
+    while (true)
         {
-        if(!visited[i->second])
-            DFSUtil(i->second, visited, cur_cc);
+        unsigned int parent = m_parent[v].load(std::memory_order_acquire);
+        if (parent == v)
+            return v;
+
+        unsigned int grandparent = m_parent[parent].load(std::memory_order_acquire);
+
+        // path halving, it is harmless if another thread updated the parent in the meantime
+        if (grandparent != parent)
+            m_parent[v].compare_exchange_weak(parent, grandparent, std::memory_order_acq_rel);
+
+        v = grandparent;
         }
     }
-#endif
-Graph::Graph(unsigned int V)
-    {
-    #ifndef ENABLE_TBB_TASK
-    visited.resize(V, 0);
-    #else
-    visited.resize(V);
-    #endif
-    }
 
-void Graph::resize(unsigned int V)
+void UnionFind::unite(unsigned int v, unsigned int w)
     {
-    #ifndef ENABLE_TBB_TASK
-    visited.resize(V, 0);
-    #else
-    visited.clear();
-    visited.resize(V);
-    #endif
+    while (true)
+        {
+        v = find(v);
+        w = find(w);
+
+        if (v == w)
+            return;
 
-    adj.clear();
+        // link the larger root below the smaller one
+        if (v < w)
+            std::swap(v, w);
+
+        // succeeds only if v is still a root
+        unsigned int expected = v;
+        if (m_parent[v].compare_exchange_strong(expected, w, std::memory_order_acq_rel))
+            return;
+        }
     }
 
-// method to add a directed edge
-void Graph::addEdge(unsigned int v, unsigned int w)
+void UnionFind::connectedComponents(std::vector<std::vector<unsigned int> >& cc)
     {
-    adj.insert(std::make_pair(v,w));
+    unsigned int V = (unsigned int) m_parent.size();
+    m_label.resize(V);
+
+    for (unsigned int v = 0; v < V; ++v)
+        {
+        // the root is the smallest member of the component, and has already been labeled
+        unsigned int root = find(v);
+        if (root == v)
+            {
+            m_label[v] = (unsigned int) cc.size();
+            cc.push_back(std::vector<unsigned int>());
+            }
+
+        cc[m_label[root]].push_back(v);
+        }
     }
 } // end namespace detail
 
@@ -365,13 +261,9 @@ class UpdaterClusters : public Updater
 
         unsigned int m_instance=0;                  //!< Unique ID for RNG seeding
 
-        #ifdef ENABLE_TBB_TASK
-        std::vector<tbb::concurrent_vector<unsigned int> > m_clusters; //!< Cluster components
-        #else
         std::vector<std::vector<unsigned int> > m_clusters; //!< Cluster components
-        #endif
 
-        detail::Graph m_G; //!< The graph
+        detail::UnionFind m_G; //!< The graph
 
         hoomd::detail::AABBTree m_aabb_tree_old;              //!< Locality lookup for old configuration
 
@@ -379,14 +271,14 @@ class UpdaterClusters : public Updater
         GlobalVector<Scalar4> m_orientation_backup;    //!< Old local orientations
         GlobalVector<int3> m_image_backup;             //!< Old local images
 
-        #ifndef ENABLE_TBB_TASK
+        #ifndef ENABLE_TBB
         std::set<std::pair<unsigned int, unsigned int> > m_overlap;   //!< A local vector of particle pairs due to overlap
         std::map<std::pair<unsigned int, unsigned int>,float > m_energy_old_old;    //!< Energy of interaction old-old
         std::map<std::pair<unsigned int, unsigned int>,float > m_energy_new_old;    //!< Energy of interaction old-old
         #else
-        tbb::concurrent_unordered_set<std::pair<unsigned int, unsigned int> > m_overlap;
-        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float > m_energy_old_old;
-        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float > m_energy_new_old;
+        tbb::concurrent_unordered_set<std::pair<unsigned int, unsigned int>, detail::PairHash > m_overlap;
+        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float, detail::PairHash > m_energy_old_old;
+        tbb::concurrent_unordered_map<std::pair<unsigned int, unsigned int>,float, detail::PairHash > m_energy_new_old;
         #endif
 
         hpmc_clusters_counters_t m_count_total;                 //!< Total count since initialization
@@ -426,10 +318,6 @@ UpdaterClusters<Shape>::UpdaterClusters(std::shared_ptr<SystemDefinition> sysdef
     {
     m_exec_conf->msg->notice(5) << "Constructing UpdaterClusters" << std::endl;
 
-    #ifdef ENABLE_TBB_TASK
-    m_G.setTaskArena(sysdef->getParticleData()->getExecConf()->getTaskArena());
-    #endif
-
     // initialize stats
     resetStats();
 
@@ -494,7 +382,7 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
         }
     img_i = box.getImage(pos_i_transf);
 
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
     this->m_exec_conf->getTaskArena()->execute([&]{
     tbb::parallel_for(tbb::blocked_range<unsigned int>(0, this->m_pdata->getNTypes()),
         [=, &shape_i](const tbb::blocked_range<unsigned int>& x) {
@@ -507,7 +395,7 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
             {
             continue;
             }
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
         tbb::parallel_for(tbb::blocked_range<unsigned int>(type_a, this->m_pdata->getNTypes()),
             [=, &shape_i](const tbb::blocked_range<unsigned int>& w) {
         for (unsigned int type_b = w.begin(); type_b != w.end(); ++type_b)
@@ -655,7 +543,7 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
                 }
 
             // for every depletant
-            #ifdef ENABLE_TBB_TASK
+            #ifdef ENABLE_TBB
             tbb::parallel_for(tbb::blocked_range<unsigned int>(0, (unsigned int)n),
                 [=, &shape_i,
                     &pos_j, &orientation_j, &type_j, &V_all,
@@ -1051,15 +939,15 @@ inline void UpdaterClusters<Shape>::checkDepletantOverlap(unsigned int i, vec3<S
                         }
                     } // end loop over intersections
                 } // end loop over depletants
-            #ifdef ENABLE_TBB_TASK
+            #ifdef ENABLE_TBB
                 });
             #endif
             } // end loop over type_b
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
             });
         #endif
         } // end loop over type_a
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
         });
     }); // end task arena execute()
     #endif
@@ -1194,7 +1082,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
     if (patch)
         {
         // test old configuration against itself
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
         this->m_exec_conf->getTaskArena()->execute([&]{
         tbb::parallel_for((unsigned int)0,this->m_pdata->getN(), [&](unsigned int i)
         #else
@@ -1287,14 +1175,14 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
                 } // end loop over images
 
             } // end loop over old configuration
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
             );
         }); // end task arena execute()
         #endif
         }
 
     // loop over new configuration
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
     this->m_exec_conf->getTaskArena()->execute([&]{
     tbb::parallel_for((unsigned int)0,nptl, [&](unsigned int i)
     #else
@@ -1452,7 +1340,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
                 } // end loop over images
             } // end if patch
         } // end loop over local particles
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
         );
     }); // end task arena execute()
     #endif
@@ -1476,7 +1364,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
         return;
 
     // test old configuration against itself
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
     this->m_exec_conf->getTaskArena()->execute([&]{
     tbb::parallel_for((unsigned int)0,this->m_pdata->getN(), [&](unsigned int i) {
     #else
@@ -1494,7 +1382,7 @@ void UpdaterClusters<Shape>::findInteractions(uint64_t timestep, const quat<Scal
             h_overlaps.data, h_fugacity.data,
             timestep, q, pivot, line);
         }
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
         });
     }); // end task arena execute()
     #endif
@@ -1629,7 +1517,7 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
     // resize the number of graph nodes in place
     m_G.resize(this->m_pdata->getN());
 
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
     this->m_exec_conf->getTaskArena()->execute([&]{
     tbb::parallel_for(m_overlap.range(), [&] (decltype(m_overlap.range()) r)
     #else
@@ -1646,7 +1534,7 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
             m_G.addEdge(i,j);
             }
         }
-    #ifdef ENABLE_TBB_TASK
+    #ifdef ENABLE_TBB
         );
     }); // end task arena execute()
     #endif
@@ -1654,8 +1542,8 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
     if (m_mc->getPatchEnergy())
         {
         // sum up interaction energies
-        #ifdef ENABLE_TBB_TASK
-        tbb::concurrent_unordered_map< std::pair<unsigned int, unsigned int>, float> delta_U;
+        #ifdef ENABLE_TBB
+        tbb::concurrent_unordered_map< std::pair<unsigned int, unsigned int>, float, detail::PairHash> delta_U;
         #else
         std::map< std::pair<unsigned int, unsigned int>, float> delta_U;
         #endif
@@ -1694,7 +1582,7 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
             delta_U[p] = delU;
             }
 
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
         this->m_exec_conf->getTaskArena()->execute([&]{
         tbb::parallel_for(delta_U.range(), [&] (decltype(delta_U.range()) r)
         #else
@@ -1719,7 +1607,7 @@ void UpdaterClusters<Shape>::update(uint64_t timestep)
                     }
                 }
             }
-        #ifdef ENABLE_TBB_TASK
+        #ifdef ENABLE_TBB
             );
         }); // end task arena execute()
         #endif
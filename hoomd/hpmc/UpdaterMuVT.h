@@ -5,6 +5,7 @@
 #define __UPDATER_MUVT_H__
 
 #include "hoomd/HOOMDMPI.h"
+#include "hoomd/Index1D.h"
 #include "hoomd/Updater.h"
 #include "hoomd/Variant.h"
 #include "hoomd/VectorMath.h"
@@ -147,6 +148,24 @@ template<class Shape> class UpdaterMuVT : public Updater
         return m_n_trial;
         }
 
+    //! Set the width of the cavity grid cells
+    /*! \param width Cell width, or 0 to insert particles uniformly in the box
+     */
+    void setCavityCellWidth(Scalar width)
+        {
+        if (width < Scalar(0.0))
+            {
+            throw std::domain_error("cavity_cell_width must be non-negative.");
+            }
+        m_cavity_width = width;
+        }
+
+    //! Get the width of the cavity grid cells
+    Scalar getCavityCellWidth()
+        {
+        return m_cavity_width;
+        }
+
     //! Get the current counter values
     hpmc_muvt_counters_t getCounters(unsigned int mode = 0);
 
@@ -179,6 +198,38 @@ template<class Shape> class UpdaterMuVT : public Updater
 
     unsigned int m_n_trial;
 
+    Scalar m_cavity_width;                    //!< Width of the cavity grid cells (0 disables)
+    Index3D m_cavity_indexer;                 //!< Indexes the cells of the cavity grid
+    std::vector<unsigned int> m_cavity_count; //!< Number of particles in the stencil of each cell
+    std::vector<unsigned int> m_cavity_empty; //!< List of cells with an empty stencil
+
+    /*! Bin the particles into the cavity grid
+     * \returns false if the box is too small for a grid with at least three cells along each box
+     *          vector, in which case particles are inserted uniformly in the box
+     *
+     * A cell is empty when no particle center lies in the cell or any of its nearest neighbors.
+     */
+    bool updateCavityGrid();
+
+    //! Get the index of the cavity grid cell containing a position
+    unsigned int getCavityCell(const vec3<Scalar>& pos);
+
+    //! Get the total volume of the empty cavity grid cells
+    Scalar getCavityVolume();
+
+    /*! Get the volume of the empty cavity grid cells without one particle
+     * \param pos Position of the particle to remove
+     * \param V (return value) Volume of the empty cells once the particle is removed
+     * \returns true if the particle is inside an empty cell once it is removed
+     */
+    bool getCavityVolumeWithout(const vec3<Scalar>& pos, Scalar& V);
+
+    //! Draw a position uniformly from the empty cavity grid cells
+    vec3<Scalar> generateCavityPosition(hoomd::RandomGenerator& rng);
+
+    //! Call f(cell) for every cell in the stencil of nearest neighbors around a cavity grid cell
+    template<class F> void forEachCavityNeighbor(unsigned int cell, const F& f);
+
     /*! Check for overlaps of a fictitious particle
      * \param timestep Current time step
      * \param type Type of particle to test
@@ -334,7 +385,8 @@ UpdaterMuVT<Shape>::UpdaterMuVT(std::shared_ptr<SystemDefinition> sysdef,
                                 std::shared_ptr<IntegratorHPMCMono<Shape>> mc,
                                 unsigned int npartition)
     : Updater(sysdef, trigger), m_mc(mc), m_npartition(npartition), m_gibbs(false),
-      m_max_vol_rescale(0.1), m_volume_move_probability(0.5), m_gibbs_other(0), m_n_trial(1)
+      m_max_vol_rescale(0.1), m_volume_move_probability(0.5), m_gibbs_other(0), m_n_trial(1),
+      m_cavity_width(0.0)
     {
     m_fugacity.resize(m_pdata->getNTypes(), std::shared_ptr<Variant>(new VariantConstant(0.0)));
     m_type_map.resize(m_pdata->getNTypes());
@@ -862,6 +914,150 @@ bool UpdaterMuVT<Shape>::boxResizeAndScale(uint64_t timestep,
     return !overlap;
     }
 
+template<class Shape>
+template<class F>
+void UpdaterMuVT<Shape>::forEachCavityNeighbor(unsigned int cell, const F& f)
+    {
+    uint3 c = m_cavity_indexer.getTriple(cell);
+    int w = (int)m_cavity_indexer.getW();
+    int h = (int)m_cavity_indexer.getH();
+    int d = (int)m_cavity_indexer.getD();
+    int range_z = m_sysdef->getNDimensions() == 2 ? 0 : 1;
+
+    for (int k = -range_z; k <= range_z; ++k)
+        {
+        for (int j = -1; j <= 1; ++j)
+            {
+            for (int i = -1; i <= 1; ++i)
+                {
+                f(m_cavity_indexer(((int)c.x + i + w) % w,
+                                   ((int)c.y + j + h) % h,
+                                   ((int)c.z + k + d) % d));
+                }
+            }
+        }
+    }
+
+template<class Shape> bool UpdaterMuVT<Shape>::updateCavityGrid()
+    {
+    const BoxDim box = m_pdata->getGlobalBox();
+    Scalar3 L = box.getNearestPlaneDistance();
+    bool twod = m_sysdef->getNDimensions() == 2;
+
+    // the stencil of a cell must not contain the same cell twice
+    Scalar3 n = L / m_cavity_width;
+    if (n.x < Scalar(3.0) || n.y < Scalar(3.0) || (!twod && n.z < Scalar(3.0)))
+        {
+        return false;
+        }
+
+    m_cavity_indexer = Index3D((unsigned int)n.x, (unsigned int)n.y, twod ? 1 : (unsigned int)n.z);
+    m_cavity_count.assign(m_cavity_indexer.getNumElements(), 0);
+
+        {
+        ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(),
+                                       access_location::host,
+                                       access_mode::read);
+
+        for (unsigned int i = 0; i < m_pdata->getN(); ++i)
+            {
+            unsigned int cell = getCavityCell(vec3<Scalar>(h_postype.data[i]));
+            forEachCavityNeighbor(cell, [&](unsigned int neigh) { m_cavity_count[neigh]++; });
+            }
+        }
+
+#ifdef ENABLE_MPI
+    if (m_sysdef->isDomainDecomposed())
+        {
+        MPI_Allreduce(MPI_IN_PLACE,
+                      m_cavity_count.data(),
+                      (int)m_cavity_count.size(),
+                      MPI_UNSIGNED,
+                      MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        }
+#endif
+
+    m_cavity_empty.clear();
+    for (unsigned int cell = 0; cell < m_cavity_count.size(); ++cell)
+        {
+        if (m_cavity_count[cell] == 0)
+            {
+            m_cavity_empty.push_back(cell);
+            }
+        }
+
+    return true;
+    }
+
+template<class Shape> unsigned int UpdaterMuVT<Shape>::getCavityCell(const vec3<Scalar>& pos)
+    {
+    Scalar3 f = m_pdata->getGlobalBox().makeFraction(vec_to_scalar3(pos));
+
+    int w = (int)m_cavity_indexer.getW();
+    int h = (int)m_cavity_indexer.getH();
+    int d = (int)m_cavity_indexer.getD();
+
+    // wrap particles that are numerically on the upper boundary back into the grid
+    int i = (int)floor(f.x * Scalar(w)) % w;
+    int j = (int)floor(f.y * Scalar(h)) % h;
+    int k = (int)floor(f.z * Scalar(d)) % d;
+
+    return m_cavity_indexer((i + w) % w, (j + h) % h, (k + d) % d);
+    }
+
+template<class Shape> Scalar UpdaterMuVT<Shape>::getCavityVolume()
+    {
+    return m_pdata->getGlobalBox().getVolume() * Scalar(m_cavity_empty.size())
+           / Scalar(m_cavity_indexer.getNumElements());
+    }
+
+template<class Shape>
+bool UpdaterMuVT<Shape>::getCavityVolumeWithout(const vec3<Scalar>& pos, Scalar& V)
+    {
+    unsigned int cell = getCavityCell(pos);
+
+    // cells that only contain the particle in their stencil become empty
+    unsigned int n_empty = (unsigned int)m_cavity_empty.size();
+    forEachCavityNeighbor(cell,
+                          [&](unsigned int neigh)
+                          {
+                              if (m_cavity_count[neigh] == 1)
+                                  n_empty++;
+                          });
+
+    V = m_pdata->getGlobalBox().getVolume() * Scalar(n_empty)
+        / Scalar(m_cavity_indexer.getNumElements());
+
+    return m_cavity_count[cell] == 1;
+    }
+
+template<class Shape>
+vec3<Scalar> UpdaterMuVT<Shape>::generateCavityPosition(hoomd::RandomGenerator& rng)
+    {
+    unsigned int cell = m_cavity_empty[hoomd::UniformIntDistribution(
+        (unsigned int)(m_cavity_empty.size() - 1))(rng)];
+    uint3 c = m_cavity_indexer.getTriple(cell);
+
+    // uniform position inside the cell
+    Scalar3 f;
+    f.x = (Scalar(c.x) + hoomd::detail::generate_canonical<Scalar>(rng))
+          / Scalar(m_cavity_indexer.getW());
+    f.y = (Scalar(c.y) + hoomd::detail::generate_canonical<Scalar>(rng))
+          / Scalar(m_cavity_indexer.getH());
+    if (m_sysdef->getNDimensions() == 2)
+        {
+        f.z = Scalar(0.5);
+        }
+    else
+        {
+        f.z = (Scalar(c.z) + hoomd::detail::generate_canonical<Scalar>(rng))
+              / Scalar(m_cavity_indexer.getD());
+        }
+
+    return vec3<Scalar>(m_pdata->getGlobalBox().makeCoordinates(f));
+    }
+
 template<class Shape> void UpdaterMuVT<Shape>::update(uint64_t timestep)
     {
     Updater::update(timestep);
@@ -979,6 +1175,9 @@ template<class Shape> void UpdaterMuVT<Shape>::update(uint64_t timestep)
             }
 #endif
 
+        // restrict insertions to the empty cells of the cavity grid
+        bool cavity_bias = m_cavity_width > Scalar(0.0) && updateCavityGrid();
+
         // whether we insert or remove a particle
         bool insert = m_gibbs ? mod : hoomd::UniformIntDistribution(1)(rng);
 
@@ -1050,19 +1249,36 @@ template<class Shape> void UpdaterMuVT<Shape>::update(uint64_t timestep)
                     = m_mc->getParams();
                 const typename Shape::param_type& param = params[type];
 
-                // Propose a random position uniformly in the box
-                Scalar3 f;
-                f.x = hoomd::detail::generate_canonical<Scalar>(rng);
-                f.y = hoomd::detail::generate_canonical<Scalar>(rng);
-                if (m_sysdef->getNDimensions() == 2)
+                vec3<Scalar> pos_test;
+                bool no_cavity = false;
+                if (cavity_bias)
                     {
-                    f.z = Scalar(0.5);
+                    // Propose a random position uniformly in the empty cells, the acceptance
+                    // criterion uses the volume of the empty cells in place of the box volume
+                    no_cavity = m_cavity_empty.empty();
+                    if (!no_cavity)
+                        {
+                        pos_test = generateCavityPosition(rng);
+                        V = getCavityVolume();
+                        }
                     }
-                else
+
+                if (!cavity_bias || no_cavity)
                     {
-                    f.z = hoomd::detail::generate_canonical<Scalar>(rng);
+                    // Propose a random position uniformly in the box
+                    Scalar3 f;
+                    f.x = hoomd::detail::generate_canonical<Scalar>(rng);
+                    f.y = hoomd::detail::generate_canonical<Scalar>(rng);
+                    if (m_sysdef->getNDimensions() == 2)
+                        {
+                        f.z = Scalar(0.5);
+                        }
+                    else
+                        {
+                        f.z = hoomd::detail::generate_canonical<Scalar>(rng);
+                        }
+                    pos_test = vec3<Scalar>(m_pdata->getGlobalBox().makeCoordinates(f));
                     }
-                vec3<Scalar> pos_test = vec3<Scalar>(m_pdata->getGlobalBox().makeCoordinates(f));
 
                 Shape shape_test(quat<Scalar>(), param);
                 if (shape_test.hasOrientation())
@@ -1103,6 +1319,12 @@ template<class Shape> void UpdaterMuVT<Shape>::update(uint64_t timestep)
                     lnboltzmann += lnb;
                     }
 
+                if (no_cavity)
+                    {
+                    // there is no volume to insert into
+                    nonzero = 0;
+                    }
+
 #ifdef ENABLE_MPI
                 if (m_gibbs && is_root)
                     {
@@ -1266,7 +1488,20 @@ template<class Shape> void UpdaterMuVT<Shape>::update(uint64_t timestep)
 
             // acceptance probability
             unsigned int nonzero = 1;
-            if (nptl_type)
+            if (nptl_type && cavity_bias)
+                {
+                // the reverse insertion can only place the particle in an empty cell
+                vec3<Scalar> pos(m_pdata->getPosition(tag) + m_pdata->getOrigin());
+                if (getCavityVolumeWithout(pos, V))
+                    {
+                    lnboltzmann += log((Scalar)nptl_type / V);
+                    }
+                else
+                    {
+                    nonzero = 0;
+                    }
+                }
+            else if (nptl_type)
                 {
                 lnboltzmann += log((Scalar)nptl_type / V);
                 }
@@ -3096,6 +3331,9 @@ template<class Shape> void export_UpdaterMuVT(pybind11::module& m, const std::st
                       &UpdaterMuVT<Shape>::getTransferTypes,
                       &UpdaterMuVT<Shape>::setTransferTypes)
         .def_property("ntrial", &UpdaterMuVT<Shape>::getNTrial, &UpdaterMuVT<Shape>::setNTrial)
+        .def_property("cavity_cell_width",
+                      &UpdaterMuVT<Shape>::getCavityCellWidth,
+                      &UpdaterMuVT<Shape>::setCavityCellWidth)
         .def_property_readonly("N", &UpdaterMuVT<Shape>::getN)
         .def("getCounters", &UpdaterMuVT<Shape>::getCounters);
     }
@@ -99,6 +99,14 @@ class CPPPotentialBase(AutotunedObject):
 
         Returns `None` when the patch object and integrator are not
         attached.
+
+        Note:
+            On the CPU, the integrator adds the energy change of each accepted
+            trial move to a running total. `energy` returns the running total
+            until another operation changes the system or the potential
+            parameters (including `param_array`), and sums over all pairs at
+            least every 100 sweeps. Changes made through a local snapshot
+            during a run take effect in `energy` at the next full sum.
         """
         integrator = self._simulation.operations.integrator
         timestep = self._simulation.timestep
@@ -252,6 +252,35 @@ def test_disk_compression(betaP, box_move, simulation_factory,
     assert sim.state.box != initial_box
 
 
+@pytest.mark.parametrize("box_move", box_moves_attrs)
+def test_polyhedron_compression(box_move, simulation_factory,
+                                lattice_snapshot_factory):
+    """Test that BoxMC rejects trials that create overlaps."""
+    snap = lattice_snapshot_factory(dimensions=3, n=5, a=1.05)
+
+    boxmc = hoomd.hpmc.update.BoxMC(betaP=1000, trigger=1)
+    params = dict(box_move['params'])
+    delta = params['delta']
+    if isinstance(delta, tuple):
+        params['delta'] = tuple(10 * d for d in delta)
+    else:
+        params['delta'] = 10 * delta
+    setattr(boxmc, box_move['move'], params)
+
+    sim = simulation_factory(snap)
+    sim.operations.updaters.append(boxmc)
+    mc = hoomd.hpmc.integrate.ConvexPolyhedron(default_d=0.02, default_a=0.02)
+    mc.shape['A'] = dict(vertices=[(-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5),
+                                   (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5),
+                                   (0.5, -0.5, -0.5), (0.5, -0.5, 0.5),
+                                   (0.5, 0.5, -0.5), (0.5, 0.5, 0.5)])
+    sim.operations.integrator = mc
+
+    sim.run(50)
+
+    assert mc.overlaps == 0
+
+
 @pytest.mark.parametrize("box_move", box_moves_attrs)
 def test_counters(box_move, simulation_factory, lattice_snapshot_factory,
                   counter_attrs):
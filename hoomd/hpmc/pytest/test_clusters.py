@@ -5,7 +5,8 @@
 
 import hoomd
 from hoomd.conftest import (operation_pickling_check, logging_check,
-                            autotuned_kernel_parameter_check)
+                            autotuned_kernel_parameter_check,
+                            cpu_threads_check)
 from hoomd.logging import LoggerCategories
 import pytest
 import hoomd.hpmc.pytest.conftest
@@ -159,6 +160,44 @@ def test_pivot_moves(device, simulation_factory, lattice_snapshot_factory):
     assert avg > 0
 
 
+@pytest.mark.serial
+@pytest.mark.cpu
+@pytest.mark.skipif(not hoomd.version.tbb_enabled, reason='TBB is not enabled')
+@pytest.mark.parametrize("shape", ['sphere', 'polyhedron'])
+def test_cpu_threads(device, shape, lattice_snapshot_factory):
+    """Test that Clusters moves do not depend on the number of CPU threads."""
+    snapshot = lattice_snapshot_factory(particle_types=['A'],
+                                        dimensions=3,
+                                        a=1.2,
+                                        n=6,
+                                        r=0.05)
+    cube = [(-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5),
+            (-0.5, 0.5, 0.5), (0.5, -0.5, -0.5), (0.5, -0.5, 0.5),
+            (0.5, 0.5, -0.5), (0.5, 0.5, 0.5)]
+
+    def run(sim):
+        if shape == 'sphere':
+            mc = hoomd.hpmc.integrate.Sphere(default_d=0.1)
+            mc.shape['A'] = dict(diameter=1.0)
+        else:
+            mc = hoomd.hpmc.integrate.ConvexPolyhedron(default_d=0.1,
+                                                       default_a=0.1)
+            mc.shape['A'] = dict(vertices=cube)
+        sim.operations.integrator = mc
+
+        cl = hoomd.hpmc.update.Clusters(trigger=hoomd.trigger.Periodic(1),
+                                        pivot_move_probability=0.5)
+        sim.operations.updaters.append(cl)
+
+        sim.run(10)
+
+        assert cl.avg_cluster_size > 0
+        assert mc.overlaps == 0
+        return [sim.state.get_snapshot().particles.position]
+
+    cpu_threads_check(snapshot, run, seed=3)
+
+
 def test_pickling(simulation_factory, two_particle_snapshot_factory):
     """Test that Cluster objects are picklable."""
     sim = simulation_factory(two_particle_snapshot_factory())
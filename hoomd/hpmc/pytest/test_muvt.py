@@ -15,6 +15,9 @@ valid_constructor_args = [
          max_volume_rescale=0.2,
          volume_move_probability=0.5),
     dict(trigger=hoomd.trigger.After(100), transfer_types=['A', 'B']),
+    dict(trigger=hoomd.trigger.Periodic(1),
+         transfer_types=['A'],
+         cavity_cell_width=0.5),
 ]
 
 valid_attrs = [('trigger', hoomd.trigger.Periodic(10000)),
@@ -22,7 +25,8 @@ valid_attrs = [('trigger', hoomd.trigger.Periodic(10000)),
                ('trigger', hoomd.trigger.Before(12345)),
                ('volume_move_probability', 0.2), ('max_volume_rescale', 0.42),
                ('transfer_types', ['A']), ('transfer_types', ['B']),
-               ('transfer_types', ['A', 'B'])]
+               ('transfer_types', ['A', 'B']), ('cavity_cell_width', 0.5),
+               ('cavity_cell_width', 0.0)]
 
 
 @pytest.mark.serial
@@ -159,3 +163,36 @@ def test_insertion_removal(device, simulation_factory,
 
     # make a wild guess: there be B particles
     assert (muvt.N['B'] > 0)
+
+
+@pytest.mark.serial
+def test_cavity_bias(device, simulation_factory, lattice_snapshot_factory):
+    """Test that cavity-biased insertion samples the ideal gas distribution."""
+    sim = simulation_factory(
+        lattice_snapshot_factory(particle_types=['A'],
+                                 dimensions=3,
+                                 a=2,
+                                 n=5,
+                                 r=0.1))
+
+    mc = hoomd.hpmc.integrate.Sphere(default_d=0.1)
+    mc.shape['A'] = dict(diameter=0.0)
+    sim.operations.integrator = mc
+
+    muvt = hoomd.hpmc.update.MuVT(trigger=hoomd.trigger.Periodic(1),
+                                  transfer_types=['A'],
+                                  cavity_cell_width=1.0)
+    muvt.fugacity['A'] = 0.05
+    sim.operations.updaters.append(muvt)
+
+    sim.run(1000)
+
+    N = []
+    for i in range(300):
+        sim.run(10)
+        N.append(muvt.N['A'])
+
+    # the ideal gas has <N> = z V, which is 50 in this box
+    assert sum(muvt.insert_moves) > 0
+    assert sum(muvt.remove_moves) > 0
+    assert sum(N) / len(N) == pytest.approx(50, abs=8)
@@ -367,3 +367,73 @@ def test_cpp_potential_sticky_spheres(device, simulation_factory,
             dist = np.linalg.norm(snap.particles.position[0]
                                   - snap.particles.position[1])
             assert dist > max_r_interact
+
+
+@pytest.mark.validate
+@pytest.mark.skipif(llvm_disabled, reason='LLVM not enabled')
+def test_running_energy(device, simulation_factory, lattice_snapshot_factory):
+    """Test that the energy logged during a run matches a full sum."""
+    lennard_jones = """
+                     float rsq = dot(r_ij, r_ij);
+                     float rsqinv = 1.0f / rsq;
+                     float r6inv = rsqinv*rsqinv*rsqinv;
+                     return 4.0f*r6inv*(r6inv-1.0f);
+                     """
+
+    patch = hoomd.hpmc.pair.user.CPPPotential(r_cut=2.5,
+                                              code=lennard_jones,
+                                              param_array=[])
+    mc = hoomd.hpmc.integrate.Sphere(default_d=0.1)
+    mc.shape['A'] = dict(diameter=0.9)
+    mc.pair_potential = patch
+
+    sim = simulation_factory(lattice_snapshot_factory(n=5, a=1.2))
+    sim.operations.integrator = mc
+
+    class RecordEnergy(hoomd.custom.Action):
+
+        def __init__(self):
+            self.energies = []
+
+        def act(self, timestep):
+            self.energies.append(patch.energy)
+
+    record = RecordEnergy()
+    writer = hoomd.write.CustomWriter(action=record, trigger=1)
+    sim.operations.writers.append(writer)
+    sim.run(20)
+
+    # run(0) starts a new running total from a full sum
+    sim.operations.writers.remove(writer)
+    sim.run(0)
+    assert len(record.energies) == 20
+    assert record.energies[0] != record.energies[-1]
+    assert np.isclose(record.energies[-1], patch.energy, rtol=1e-4)
+
+
+@pytest.mark.validate
+@pytest.mark.skipif(llvm_disabled, reason='LLVM not enabled')
+def test_running_energy_param_array(device, simulation_factory,
+                                    lattice_snapshot_factory):
+    """Test that param_array changes invalidate the running energy."""
+    scaled_lennard_jones = """
+                     float rsq = dot(r_ij, r_ij);
+                     float rsqinv = 1.0f / rsq;
+                     float r6inv = rsqinv*rsqinv*rsqinv;
+                     return param_array[0]*4.0f*r6inv*(r6inv-1.0f);
+                     """
+
+    patch = hoomd.hpmc.pair.user.CPPPotential(r_cut=2.5,
+                                              code=scaled_lennard_jones,
+                                              param_array=[1.0])
+    mc = hoomd.hpmc.integrate.Sphere(default_d=0.1)
+    mc.shape['A'] = dict(diameter=0.9)
+    mc.pair_potential = patch
+
+    sim = simulation_factory(lattice_snapshot_factory(n=5, a=1.2))
+    sim.operations.integrator = mc
+    sim.run(10)
+
+    energy = patch.energy
+    patch.param_array[0] = 2.0
+    assert np.isclose(patch.energy, 2 * energy, rtol=1e-4)
@@ -379,10 +379,32 @@ class MuVT(Updater):
           ensemble)
         move_ratio (float): (if set) Set the ratio between volume and
           exchange/transfer moves (applies to Gibbs ensemble)
+        cavity_cell_width (float): Width of the cavity grid cells
+          :math:`[\mathrm{length}]`. Set to 0 to insert particles uniformly
+          in the box.
 
     The muVT (or grand-canonical) ensemble simulates a system at constant
     fugacity.
 
+    .. rubric:: Cavity-biased insertion
+
+    At liquid densities, nearly all insertions at uniformly random positions
+    overlap with existing particles. Set ``cavity_cell_width`` to a positive
+    value to restrict insertions to cavities. `MuVT` divides the box into a
+    grid of cells with a width of at least ``cavity_cell_width`` and considers
+    a cell empty when neither the cell nor any of its nearest neighbor cells
+    contain a particle center. Insertions choose a uniformly random position in
+    a uniformly random empty cell. The acceptance criteria for insertion and
+    removal moves replace the box volume :math:`V` with the volume of the empty
+    cells :math:`V_\mathrm{cav}`, and removal moves are rejected when the
+    removed particle would not be inside an empty cell. This samples the same
+    ensemble as uniform insertion.
+
+    Choose ``cavity_cell_width`` so that a cell with an empty neighborhood has
+    a reasonable chance of fitting a particle, such as half of the particle
+    diameter. When the box is smaller than three cells along any box vector,
+    `MuVT` inserts particles uniformly in the box.
+
     Gibbs ensemble simulations are also supported, where particles and volume
     are swapped between two or more boxes.  Every box correspond to one MPI
     partition, and can therefore run on multiple ranks. Use the
@@ -409,6 +431,8 @@ class MuVT(Updater):
           (applies to Gibbs ensemble)
         ntrial (float): (**default**: 1) Number of configurational bias attempts
           to swap depletants
+        cavity_cell_width (float): Width of the cavity grid cells
+          :math:`[\mathrm{length}]`.
         fugacity (`TypeParameter` [ ``particle type``, `float`]):
             Particle fugacity
             :math:`[\mathrm{volume}^{-1}]` (**default:** 0).
@@ -419,7 +443,8 @@ class MuVT(Updater):
                  ngibbs=1,
                  max_volume_rescale=0.1,
                  volume_move_probability=0.5,
-                 trigger=1):
+                 trigger=1,
+                 cavity_cell_width=0.0):
         super().__init__(trigger)
 
         self.ngibbs = int(ngibbs)
@@ -429,6 +454,7 @@ class MuVT(Updater):
             transfer_types=list(transfer_types),
             max_volume_rescale=float(max_volume_rescale),
             volume_move_probability=float(volume_move_probability),
+            cavity_cell_width=float(cavity_cell_width),
             **_default_dict)
         self._param_dict.update(param_dict)
 
@@ -480,10 +480,10 @@ void AnisoPotentialPair<aniso_evaluator>::computeForces(uint64_t timestep)
     bool third_law = m_nlist->getStorageMode() == NeighborList::half;
 
     // access the neighbor list, particle data, and system box
-    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(),
+    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(m_r_cut_nlist),
                                         access_location::host,
                                         access_mode::read);
-    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(),
+    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(m_r_cut_nlist),
                                       access_location::host,
                                       access_mode::read);
     ArrayHandle<size_t> h_head_list(m_nlist->getHeadList(),
@@ -100,10 +100,10 @@ template<class evaluator> void AnisoPotentialPairGPU<evaluator>::computeForces(u
         }
 
     // access the neighbor list
-    ArrayHandle<unsigned int> d_n_neigh(this->m_nlist->getNNeighArray(),
+    ArrayHandle<unsigned int> d_n_neigh(this->m_nlist->getNNeighArray(this->m_r_cut_nlist),
                                         access_location::device,
                                         access_mode::read);
-    ArrayHandle<unsigned int> d_nlist(this->m_nlist->getNListArray(),
+    ArrayHandle<unsigned int> d_nlist(this->m_nlist->getNListArray(this->m_r_cut_nlist),
                                       access_location::device,
                                       access_mode::read);
     ArrayHandle<size_t> d_head_list(this->m_nlist->getHeadList(),
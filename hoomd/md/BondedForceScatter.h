@@ -0,0 +1,195 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#ifndef __BONDED_FORCE_SCATTER_H__
+#define __BONDED_FORCE_SCATTER_H__
+
+#include "hoomd/ExecutionConfiguration.h"
+#include "hoomd/HOOMDMath.h"
+
+#include <algorithm>
+#include <memory>
+#include <vector>
+
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#endif
+
+/*! \file BondedForceScatter.h
+    \brief Defines a helper that evaluates bonded group forces on multiple CPU threads
+*/
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+namespace hoomd
+    {
+namespace md
+    {
+namespace detail
+    {
+//! Evaluate the forces of bonded groups in parallel with per-thread output buffers
+/*! Bonded force computes loop over groups and add each group's force, energy, and virial to all
+    of its members. Two groups that share a particle write to the same output element, so the
+    loop cannot be split across threads without separate outputs.
+
+    compute() divides the groups into one contiguous block per CPU thread. The first block adds
+    directly to the output arrays and every other block adds to its own buffer. After all blocks
+    finish, the buffers are summed into the output in block order. The result depends on the
+    number of threads, but not on the order in which the threads execute the blocks. With one
+    thread (or few groups), compute() evaluates the groups serially in the output arrays.
+
+    Bonded computes keep one BondedForceScatter as a member so that the buffers are reused
+    between time steps. Other computes that scatter forces to neighboring particles, such as
+    PotentialTersoff, use computeRange() with one item per particle.
+*/
+class BondedForceScatter
+    {
+    public:
+    //! Minimum number of groups per block
+    static constexpr unsigned int min_groups_per_block = 256;
+
+    //! Evaluate all groups
+    /*! \param exec_conf Execution configuration
+        \param n_groups Number of groups
+        \param n_particles Number of elements in the force array to accumulate
+        \param force Force array (zeroed by the caller)
+        \param virial Virial array (zeroed by the caller)
+        \param virial_pitch Pitch of the virial array
+        \param compute_group Callable compute_group(i, force, virial, virial_pitch) that adds the
+               contributions of group i to the given arrays
+
+        compute_group must be safe to call concurrently for different groups. The force and
+        virial arrays that it receives have at least \a n_particles elements per component.
+    */
+    template<class Func>
+    void compute(std::shared_ptr<const ExecutionConfiguration> exec_conf,
+                 unsigned int n_groups,
+                 unsigned int n_particles,
+                 Scalar4* force,
+                 Scalar* virial,
+                 size_t virial_pitch,
+                 const Func& compute_group)
+        {
+        computeRange(exec_conf,
+                     n_groups,
+                     n_particles,
+                     force,
+                     virial,
+                     virial_pitch,
+                     [&](unsigned int begin,
+                         unsigned int end,
+                         Scalar4* block_force,
+                         Scalar* block_virial,
+                         size_t block_virial_pitch)
+                     {
+                         for (unsigned int i = begin; i < end; i++)
+                             compute_group(i, block_force, block_virial, block_virial_pitch);
+                     });
+        }
+
+    //! Evaluate all items in contiguous ranges
+    /*! \param exec_conf Execution configuration
+        \param n_items Number of items
+        \param n_particles Number of elements in the force array to accumulate
+        \param force Force array (zeroed by the caller)
+        \param virial Virial array (zeroed by the caller)
+        \param virial_pitch Pitch of the virial array
+        \param compute_range Callable compute_range(begin, end, force, virial, virial_pitch) that
+               adds the contributions of items begin to end - 1 to the given arrays
+
+        compute_range is called once per block, so it can set up scratch space that it reuses for
+        all items in the range.
+    */
+    template<class Func>
+    void computeRange(std::shared_ptr<const ExecutionConfiguration> exec_conf,
+                      unsigned int n_items,
+                      unsigned int n_particles,
+                      Scalar4* force,
+                      Scalar* virial,
+                      size_t virial_pitch,
+                      const Func& compute_range)
+        {
+        unsigned int n_blocks = 1;
+#ifdef ENABLE_TBB
+        n_blocks = std::max(1u,
+                            std::min(exec_conf->getNumThreads(), n_items / min_groups_per_block));
+#endif
+
+        if (n_blocks == 1)
+            {
+            compute_range(0, n_items, force, virial, virial_pitch);
+            return;
+            }
+
+#ifdef ENABLE_TBB
+        // one buffer for each block after the first
+        const size_t n_buffers = n_blocks - 1;
+        m_force.resize(n_buffers * n_particles);
+        m_virial.resize(n_buffers * 6 * n_particles);
+
+        exec_conf->getTaskArena()->execute(
+            [&]
+            {
+                tbb::parallel_for(
+                    0u,
+                    n_blocks,
+                    [&](unsigned int block)
+                    {
+                        Scalar4* block_force = force;
+                        Scalar* block_virial = virial;
+                        size_t block_virial_pitch = virial_pitch;
+                        if (block > 0)
+                            {
+                            block_force = m_force.data() + (block - 1) * n_particles;
+                            block_virial = m_virial.data() + (block - 1) * 6 * n_particles;
+                            block_virial_pitch = n_particles;
+                            std::fill(block_force,
+                                      block_force + n_particles,
+                                      make_scalar4(0, 0, 0, 0));
+                            std::fill(block_virial, block_virial + 6 * n_particles, Scalar(0));
+                            }
+
+                        unsigned int begin = (unsigned int)(size_t(n_items) * block / n_blocks);
+                        unsigned int end
+                            = (unsigned int)(size_t(n_items) * (block + 1) / n_blocks);
+                        compute_range(begin, end, block_force, block_virial, block_virial_pitch);
+                    });
+
+                // sum the buffers into the output
+                tbb::parallel_for(
+                    tbb::blocked_range<unsigned int>(0, n_particles),
+                    [&](const tbb::blocked_range<unsigned int>& r)
+                    {
+                        for (size_t k = 0; k < n_buffers; k++)
+                            {
+                            const Scalar4* buffer_force = m_force.data() + k * n_particles;
+                            const Scalar* buffer_virial = m_virial.data() + k * 6 * n_particles;
+                            for (unsigned int idx = r.begin(); idx != r.end(); ++idx)
+                                {
+                                force[idx].x += buffer_force[idx].x;
+                                force[idx].y += buffer_force[idx].y;
+                                force[idx].z += buffer_force[idx].z;
+                                force[idx].w += buffer_force[idx].w;
+                                for (unsigned int j = 0; j < 6; j++)
+                                    virial[j * virial_pitch + idx]
+                                        += buffer_virial[j * n_particles + idx];
+                                }
+                            }
+                    });
+            });
+#endif
+        }
+
+    private:
+    std::vector<Scalar4> m_force; //!< Force buffers for all blocks after the first
+    std::vector<Scalar> m_virial; //!< Virial buffers for all blocks after the first
+    };
+
+    } // end namespace detail
+    } // end namespace md
+    } // end namespace hoomd
+
+#endif // __BONDED_FORCE_SCATTER_H__
@@ -66,6 +66,7 @@ void ComputeThermo::compute(uint64_t timestep)
     Compute::compute(timestep);
     if (shouldCompute(timestep))
         {
+        hoomd::detail::ScopedProfile profile(m_exec_conf, m_profile);
         computeProperties();
         m_computed_flags = m_pdata->getFlags();
         }
@@ -85,9 +86,15 @@ void ComputeThermo::computeProperties()
 
     // access the particle data
     ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
-    ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                     access_location::host,
-                                     access_mode::read);
+    // all particles are free particles when the body array is not allocated
+    std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+    if (m_pdata->isAllocated(pdata_array::body))
+        {
+        h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                   access_location::host,
+                                                   access_mode::read));
+        }
+    const unsigned int* body = h_body ? h_body->data : nullptr;
     ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
 
     // access the net force, pe, and virial
@@ -115,7 +122,7 @@ void ComputeThermo::computeProperties()
             {
             unsigned int j = m_group->getMemberIndex(group_idx);
             // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+            if (!body || body[j] >= MIN_FLOPPY || body[j] == h_tag.data[j])
                 {
                 double mass = h_vel.data[j].w;
                 pressure_kinetic_xx += mass * ((double)h_vel.data[j].x * (double)h_vel.data[j].x);
@@ -137,7 +144,7 @@ void ComputeThermo::computeProperties()
             {
             unsigned int j = m_group->getMemberIndex(group_idx);
             // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+            if (!body || body[j] >= MIN_FLOPPY || body[j] == h_tag.data[j])
                 {
                 ke_trans_total += (double)h_vel.data[j].w
                                   * ((double)h_vel.data[j].x * (double)h_vel.data[j].x
@@ -169,7 +176,7 @@ void ComputeThermo::computeProperties()
             {
             unsigned int j = m_group->getMemberIndex(group_idx);
             // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+            if (!body || body[j] >= MIN_FLOPPY || body[j] == h_tag.data[j])
                 {
                 Scalar3 I = h_inertia.data[j];
                 quat<Scalar> q(h_orientation.data[j]);
@@ -203,7 +210,7 @@ void ComputeThermo::computeProperties()
         unsigned int j = m_group->getMemberIndex(group_idx);
 
         // ignore rigid body constituent particles in the sum
-        if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+        if (!body || body[j] >= MIN_FLOPPY || body[j] == h_tag.data[j])
             {
             pe_total += (double)h_net_force.data[j].w;
             }
@@ -227,7 +234,7 @@ void ComputeThermo::computeProperties()
             {
             unsigned int j = m_group->getMemberIndex(group_idx);
             // ignore rigid body constituent particles in the sum
-            if (h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j])
+            if (!body || body[j] >= MIN_FLOPPY || body[j] == h_tag.data[j])
                 {
                 virial_xx += (double)h_net_virial.data[j + 0 * virial_pitch];
                 virial_xy += (double)h_net_virial.data[j + 1 * virial_pitch];
@@ -90,6 +90,7 @@ void ComputeThermoHMA::compute(uint64_t timestep)
     if (!shouldCompute(timestep))
         return;
 
+    hoomd::detail::ScopedProfile profile(m_exec_conf, m_profile);
     computeProperties();
     }
 
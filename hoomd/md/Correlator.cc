@@ -0,0 +1,245 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#include "Correlator.h"
+
+#ifdef ENABLE_MPI
+#include "hoomd/HOOMDMPI.h"
+#endif
+
+#include <pybind11/stl.h>
+
+#include <stdexcept>
+
+/*! \file Correlator.cc
+    \brief Defines the Correlator class
+*/
+
+namespace hoomd
+    {
+namespace md
+    {
+namespace
+    {
+/// Get the number of channels sampled for a quantity
+unsigned int getQuantityChannels(const std::string& quantity)
+    {
+    if (quantity == "pressure_tensor")
+        return 6;
+    if (quantity == "heat_flux" || quantity == "com_velocity")
+        return 3;
+
+    throw std::invalid_argument("Unknown quantity: " + quantity);
+    }
+    } // end anonymous namespace
+
+Correlator::Correlator(std::shared_ptr<SystemDefinition> sysdef,
+                       std::shared_ptr<Trigger> trigger,
+                       std::shared_ptr<ParticleGroup> group,
+                       const std::string& quantity,
+                       std::shared_ptr<ComputeThermo> thermo,
+                       unsigned int block_length,
+                       unsigned int averaging,
+                       unsigned int max_levels)
+    : Analyzer(sysdef, trigger), m_group(group), m_quantity(quantity), m_thermo(thermo),
+      m_block_length(block_length), m_averaging(averaging), m_max_levels(max_levels),
+      m_correlator(getQuantityChannels(quantity), block_length, averaging, max_levels)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing Correlator" << std::endl;
+
+    if (m_quantity == "pressure_tensor" && !m_thermo)
+        throw std::invalid_argument("Correlating the pressure tensor requires a ComputeThermo.");
+    }
+
+Correlator::~Correlator()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying Correlator" << std::endl;
+    }
+
+PDataFlags Correlator::getRequestedPDataFlags()
+    {
+    PDataFlags flags(0);
+    if (m_quantity == "pressure_tensor" || m_quantity == "heat_flux")
+        flags[pdata_flag::pressure_tensor] = 1;
+    return flags;
+    }
+
+void Correlator::analyze(uint64_t timestep)
+    {
+    Analyzer::analyze(timestep);
+
+    // the correlator assumes uniformly spaced samples
+    if (m_correlator.getNumSamples() > 0)
+        {
+        uint64_t interval = timestep - m_last_timestep;
+        if (m_sample_interval == 0)
+            {
+            m_sample_interval = interval;
+            }
+        else if (interval != m_sample_interval)
+            {
+            throw std::runtime_error("Correlator samples must be uniformly spaced in time. Use a "
+                                     "periodic trigger.");
+            }
+        }
+    m_last_timestep = timestep;
+
+    m_correlator.add(sample());
+    }
+
+std::vector<uint64_t> Correlator::getLags() const
+    {
+    std::vector<uint64_t> lags = m_correlator.getLags();
+    for (auto& lag : lags)
+        lag *= m_sample_interval;
+    return lags;
+    }
+
+void Correlator::reset()
+    {
+    m_correlator.reset();
+    m_sample_interval = 0;
+    }
+
+std::vector<double> Correlator::sample()
+    {
+    if (m_quantity == "heat_flux")
+        return computeHeatFlux();
+
+    if (m_quantity == "com_velocity")
+        return computeCenterOfMassVelocity();
+
+    // pressure tensor
+    m_thermo->compute(m_last_timestep);
+    PressureTensor p = m_thermo->getPressureTensor();
+    return std::vector<double> {p.xx, p.xy, p.xz, p.yy, p.yz, p.zz};
+    }
+
+std::vector<double> Correlator::computeHeatFlux()
+    {
+    ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+    const GlobalArray<Scalar>& net_virial = m_pdata->getNetVirial();
+    ArrayHandle<Scalar4> h_net_force(m_pdata->getNetForce(),
+                                     access_location::host,
+                                     access_mode::read);
+    ArrayHandle<Scalar> h_net_virial(net_virial, access_location::host, access_mode::read);
+    const size_t virial_pitch = net_virial.getPitch();
+
+    // rigid body constituents do not carry kinetic energy
+    std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+    if (m_pdata->isAllocated(pdata_array::body))
+        {
+        h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                   access_location::host,
+                                                   access_mode::read));
+        }
+    const unsigned int* body = h_body ? h_body->data : nullptr;
+
+    double flux[3] = {0.0, 0.0, 0.0};
+    const unsigned int group_size = m_group->getNumMembers();
+    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        {
+        unsigned int j = m_group->getMemberIndex(group_idx);
+        if (body && body[j] < MIN_FLOPPY && body[j] != h_tag.data[j])
+            continue;
+
+        const double mass = h_vel.data[j].w;
+        const double v[3] = {h_vel.data[j].x, h_vel.data[j].y, h_vel.data[j].z};
+        const double energy = 0.5 * mass * (v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+                              + double(h_net_force.data[j].w);
+
+        // upper triangular per-particle virial: xx, xy, xz, yy, yz, zz
+        double W[6];
+        for (unsigned int k = 0; k < 6; k++)
+            W[k] = h_net_virial.data[j + k * virial_pitch];
+
+        flux[0] += energy * v[0] + W[0] * v[0] + W[1] * v[1] + W[2] * v[2];
+        flux[1] += energy * v[1] + W[1] * v[0] + W[3] * v[1] + W[4] * v[2];
+        flux[2] += energy * v[2] + W[2] * v[0] + W[4] * v[1] + W[5] * v[2];
+        }
+
+#ifdef ENABLE_MPI
+    if (m_sysdef->isDomainDecomposed())
+        {
+        MPI_Allreduce(MPI_IN_PLACE,
+                      flux,
+                      3,
+                      MPI_DOUBLE,
+                      MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        }
+#endif
+
+    const BoxDim global_box = m_pdata->getGlobalBox();
+    const Scalar3 L = global_box.getL();
+    double volume = L.x * L.y;
+    if (m_sysdef->getNDimensions() == 3)
+        volume *= L.z;
+
+    return std::vector<double> {flux[0] / volume, flux[1] / volume, flux[2] / volume};
+    }
+
+std::vector<double> Correlator::computeCenterOfMassVelocity()
+    {
+    ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+
+    // total momentum and total mass
+    double sums[4] = {0.0, 0.0, 0.0, 0.0};
+    const unsigned int group_size = m_group->getNumMembers();
+    for (unsigned int group_idx = 0; group_idx < group_size; group_idx++)
+        {
+        unsigned int j = m_group->getMemberIndex(group_idx);
+        const double mass = h_vel.data[j].w;
+        sums[0] += mass * h_vel.data[j].x;
+        sums[1] += mass * h_vel.data[j].y;
+        sums[2] += mass * h_vel.data[j].z;
+        sums[3] += mass;
+        }
+
+#ifdef ENABLE_MPI
+    if (m_sysdef->isDomainDecomposed())
+        {
+        MPI_Allreduce(MPI_IN_PLACE,
+                      sums,
+                      4,
+                      MPI_DOUBLE,
+                      MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        }
+#endif
+
+    if (sums[3] == 0.0)
+        return std::vector<double> {0.0, 0.0, 0.0};
+
+    return std::vector<double> {sums[0] / sums[3], sums[1] / sums[3], sums[2] / sums[3]};
+    }
+
+namespace detail
+    {
+void export_Correlator(pybind11::module& m)
+    {
+    pybind11::class_<Correlator, Analyzer, std::shared_ptr<Correlator>>(m, "Correlator")
+        .def(pybind11::init<std::shared_ptr<SystemDefinition>,
+                            std::shared_ptr<Trigger>,
+                            std::shared_ptr<ParticleGroup>,
+                            const std::string&,
+                            std::shared_ptr<ComputeThermo>,
+                            unsigned int,
+                            unsigned int,
+                            unsigned int>())
+        .def_property_readonly("quantity", &Correlator::getQuantity)
+        .def_property_readonly("block_length", &Correlator::getBlockLength)
+        .def_property_readonly("averaging", &Correlator::getAveraging)
+        .def_property_readonly("max_levels", &Correlator::getMaxLevels)
+        .def_property_readonly("num_samples", &Correlator::getNumSamples)
+        .def_property_readonly("num_channels", &Correlator::getNumChannels)
+        .def("getLags", &Correlator::getLags)
+        .def("getCorrelation", &Correlator::getCorrelation)
+        .def("reset", &Correlator::reset);
+    }
+
+    } // end namespace detail
+
+    } // end namespace md
+    } // end namespace hoomd
@@ -0,0 +1,173 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#pragma once
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "ComputeThermo.h"
+#include "MultipleTauCorrelator.h"
+
+#include "hoomd/Analyzer.h"
+#include "hoomd/ParticleGroup.h"
+
+#include <pybind11/pybind11.h>
+
+#include <memory>
+#include <string>
+#include <vector>
+
+/*! \file Correlator.h
+    \brief Declares the Correlator class
+*/
+
+namespace hoomd
+    {
+namespace md
+    {
+/// Accumulate the time autocorrelation of a transport quantity on the fly.
+/*! Correlator samples one of the following quantities every time it is triggered and adds the
+    sample to a MultipleTauCorrelator:
+
+    - pressure_tensor: the 6 components xx, xy, xz, yy, yz, zz of the pressure tensor of the group,
+      computed by the given ComputeThermo.
+    - heat_flux: the 3 components of the heat flux of the group
+      J = (sum_i e_i v_i + sum_i W_i v_i) / V, where e_i is the kinetic plus potential energy of
+      particle i and W_i its virial tensor.
+    - com_velocity: the 3 components of the center of mass velocity of the group.
+
+    Samples must be uniformly spaced in time. Correlator reports lags in time steps.
+*/
+class PYBIND11_EXPORT Correlator : public Analyzer
+    {
+    public:
+    /// Construct the correlator
+    /*! \param sysdef System definition
+        \param trigger Steps on which to sample the quantity
+        \param group Particles that contribute to the quantity
+        \param quantity Name of the quantity to correlate
+        \param thermo Compute that provides the pressure tensor (pressure_tensor only)
+        \param block_length Number of lags in each level of the correlator
+        \param averaging Number of samples averaged when passing to the next level
+        \param max_levels Maximum number of levels of the correlator
+    */
+    Correlator(std::shared_ptr<SystemDefinition> sysdef,
+               std::shared_ptr<Trigger> trigger,
+               std::shared_ptr<ParticleGroup> group,
+               const std::string& quantity,
+               std::shared_ptr<ComputeThermo> thermo,
+               unsigned int block_length,
+               unsigned int averaging,
+               unsigned int max_levels);
+
+    virtual ~Correlator();
+
+    /// Sample the quantity and add it to the correlator
+    virtual void analyze(uint64_t timestep);
+
+    /// Request the per-particle virial when needed
+    virtual PDataFlags getRequestedPDataFlags();
+
+    /// Get the name of the correlated quantity
+    std::string getQuantity() const
+        {
+        return m_quantity;
+        }
+
+    /// Get the number of lags in each level
+    unsigned int getBlockLength() const
+        {
+        return m_block_length;
+        }
+
+    /// Get the number of samples averaged when passing to the next level
+    unsigned int getAveraging() const
+        {
+        return m_averaging;
+        }
+
+    /// Get the maximum number of levels
+    unsigned int getMaxLevels() const
+        {
+        return m_max_levels;
+        }
+
+    /// Get the number of samples added to the correlator
+    uint64_t getNumSamples() const
+        {
+        return m_correlator.getNumSamples();
+        }
+
+    /// Get the number of time steps between samples
+    uint64_t getSampleInterval() const
+        {
+        return m_sample_interval;
+        }
+
+    /// Get the lags in time steps
+    std::vector<uint64_t> getLags() const;
+
+    /// Get the correlation as a flat array with one value per channel for each lag
+    std::vector<double> getCorrelation() const
+        {
+        return m_correlator.getCorrelation();
+        }
+
+    /// Get the number of channels in each sample
+    unsigned int getNumChannels() const
+        {
+        return m_correlator.getNumChannels();
+        }
+
+    /// Discard all samples
+    void reset();
+
+    protected:
+    /// Particles that contribute to the quantity
+    std::shared_ptr<ParticleGroup> m_group;
+
+    /// Name of the correlated quantity
+    std::string m_quantity;
+
+    /// Compute that provides the pressure tensor
+    std::shared_ptr<ComputeThermo> m_thermo;
+
+    /// Number of lags in each level
+    unsigned int m_block_length;
+
+    /// Number of samples averaged when passing to the next level
+    unsigned int m_averaging;
+
+    /// Maximum number of levels
+    unsigned int m_max_levels;
+
+    /// The correlator
+    MultipleTauCorrelator m_correlator;
+
+    /// Time step of the last sample
+    uint64_t m_last_timestep = 0;
+
+    /// Number of time steps between samples, 0 until the second sample
+    uint64_t m_sample_interval = 0;
+
+    /// Sample the quantity
+    std::vector<double> sample();
+
+    /// Compute the heat flux of the group
+    std::vector<double> computeHeatFlux();
+
+    /// Compute the center of mass velocity of the group
+    std::vector<double> computeCenterOfMassVelocity();
+    };
+
+namespace detail
+    {
+/// Export the Correlator class to python
+void export_Correlator(pybind11::module& m);
+
+    } // end namespace detail
+
+    } // end namespace md
+    } // end namespace hoomd
@@ -28,12 +28,34 @@ CustomForceCompute::CustomForceCompute(std::shared_ptr<SystemDefinition> sysdef,
     m_buffers_writeable = true;
     }
 
+/*! \param sysdef SystemDefinition containing the ParticleData to compute forces on
+    \param function Address of a CustomForceFunction
+    \param user_data Address to pass to \a function
+    \param aniso Set to true when the function sets torques
+
+    The function is called directly from C++ every time step without acquiring the GIL.
+*/
+CustomForceCompute::CustomForceCompute(std::shared_ptr<SystemDefinition> sysdef,
+                                       uintptr_t function,
+                                       uintptr_t user_data,
+                                       bool aniso)
+    : ForceCompute(sysdef), m_function(reinterpret_cast<CustomForceFunction>(function)),
+      m_user_data(reinterpret_cast<void*>(user_data)), m_aniso(aniso)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing CustomForceCompute" << endl;
+    if (!m_function)
+        {
+        throw std::invalid_argument("The custom force function must not be NULL.");
+        }
+    m_buffers_writeable = true;
+    }
+
 CustomForceCompute::~CustomForceCompute()
     {
     m_exec_conf->msg->notice(5) << "Destroying ConstForceCompute" << endl;
     }
 
-/*! This function calls the python set_forces method.
+/*! This function calls the C function when one is set and the python set_forces method otherwise.
     \param timestep Current timestep
 */
 void CustomForceCompute::computeForces(uint64_t timestep)
@@ -54,7 +76,50 @@ void CustomForceCompute::computeForces(uint64_t timestep)
         ArrayHandle<Scalar> h_virial(m_virial, access_location::host, access_mode::overwrite);
         memset(h_virial.data, 0, sizeof(Scalar) * m_virial.getNumElements());
         }
+
+    if (m_function)
+        {
+        const BoxDim box = m_pdata->getGlobalBox();
+        const Scalar3 L = box.getL();
+        const Scalar box_params[6] = {L.x,
+                                      L.y,
+                                      L.z,
+                                      box.getTiltFactorXY(),
+                                      box.getTiltFactorXZ(),
+                                      box.getTiltFactorYZ()};
+
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(),
+                                   access_location::host,
+                                   access_mode::read);
+        // requesting the orientations would allocate them for isotropic particles
+        std::unique_ptr<ArrayHandle<Scalar4>> h_orientation;
+        if (m_aniso || m_pdata->isAllocated(pdata_array::orientation))
+            {
+            h_orientation.reset(new ArrayHandle<Scalar4>(m_pdata->getOrientationArray(),
+                                                         access_location::host,
+                                                         access_mode::read));
+            }
+        ArrayHandle<Scalar4> h_force(m_force, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_torque(m_torque, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_virial(m_virial, access_location::host, access_mode::readwrite);
+        const bool compute_virial = m_pdata->getFlags()[pdata_flag::pressure_tensor];
+
+        m_function(timestep,
+                   m_pdata->getN(),
+                   m_pdata->getNGhosts(),
+                   box_params,
+                   h_pos.data,
+                   h_orientation ? h_orientation->data : nullptr,
+                   h_force.data,
+                   m_aniso ? h_torque.data : nullptr,
+                   compute_virial ? h_virial.data : nullptr,
+                   m_virial_pitch,
+                   m_user_data);
+        return;
+        }
+
     // execute python callback to update the forces, if present
+    pybind11::gil_scoped_acquire acquire;
     m_setForces(timestep);
     }
 
@@ -65,7 +130,8 @@ void export_CustomForceCompute(py::module& m)
     py::class_<CustomForceCompute, ForceCompute, std::shared_ptr<CustomForceCompute>>(
         m,
         "CustomForceCompute")
-        .def(py::init<std::shared_ptr<SystemDefinition>, pybind11::object, bool>());
+        .def(py::init<std::shared_ptr<SystemDefinition>, pybind11::object, bool>())
+        .def(py::init<std::shared_ptr<SystemDefinition>, uintptr_t, uintptr_t, bool>());
     }
 
     } // end namespace detail
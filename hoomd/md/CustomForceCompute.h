@@ -3,6 +3,7 @@
 
 #include "hoomd/ForceCompute.h"
 
+#include <cstdint>
 #include <map>
 #include <memory>
 
@@ -23,6 +24,36 @@ namespace hoomd
     {
 namespace md
     {
+/// Signature of C functions that compute custom forces.
+/*! \param timestep Current time step.
+    \param N Number of particles local to this rank.
+    \param N_ghost Number of ghost particles on this rank.
+    \param box Global box parameters: Lx, Ly, Lz, xy, xz, yz.
+    \param position Positions of the local and ghost particles. The w component stores the type id
+           as the bits of an int.
+    \param orientation Orientations of the local and ghost particles. nullptr when the force is
+           isotropic and the orientations are not allocated (all are (1, 0, 0, 0)).
+    \param force Force (x, y, z) and potential energy (w) of each local particle to set.
+    \param torque Torque on each local particle to set. nullptr when the force is isotropic.
+    \param virial Virial of the local particles to set, stored as 6 rows of length \a virial_pitch.
+           nullptr when the simulation does not need the virial.
+    \param virial_pitch Stride between the rows of \a virial.
+    \param user_data Pointer passed to the constructor.
+
+    CustomForceCompute zeroes \a force, \a torque, and \a virial before calling the function.
+*/
+typedef void (*CustomForceFunction)(uint64_t timestep,
+                                    unsigned int N,
+                                    unsigned int N_ghost,
+                                    const Scalar* box,
+                                    const Scalar4* position,
+                                    const Scalar4* orientation,
+                                    Scalar4* force,
+                                    Scalar4* torque,
+                                    Scalar* virial,
+                                    size_t virial_pitch,
+                                    void* user_data);
+
 //! Adds a custom force
 /*! \ingroup computes
  */
@@ -34,6 +65,12 @@ class PYBIND11_EXPORT CustomForceCompute : public ForceCompute
                        pybind11::object py_setForces,
                        bool aniso);
 
+    /// Construct the compute with a C function that sets the forces
+    CustomForceCompute(std::shared_ptr<hoomd::SystemDefinition> sysdef,
+                       uintptr_t function,
+                       uintptr_t user_data,
+                       bool aniso);
+
     //! Destructor
     ~CustomForceCompute();
 
@@ -50,6 +87,12 @@ class PYBIND11_EXPORT CustomForceCompute : public ForceCompute
     //! A python callback when the force is updated
     pybind11::object m_setForces;
 
+    /// A C function to call instead of the python callback
+    CustomForceFunction m_function = nullptr;
+
+    /// Pointer to pass to m_function
+    void* m_user_data = nullptr;
+
     //! flag for anisotropic python custom forces
     bool m_aniso;
     };
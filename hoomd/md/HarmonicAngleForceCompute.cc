@@ -109,7 +109,6 @@ void HarmonicAngleForceCompute::computeForces(uint64_t timestep)
 
     ArrayHandle<Scalar4> h_force(m_force, access_location::host, access_mode::overwrite);
     ArrayHandle<Scalar> h_virial(m_virial, access_location::host, access_mode::overwrite);
-    size_t virial_pitch = m_virial.getPitch();
 
     // there are enough other checks on the input data: but it doesn't hurt to be safe
     assert(h_force.data);
@@ -124,12 +123,21 @@ void HarmonicAngleForceCompute::computeForces(uint64_t timestep)
     // get a local copy of the simulation box too
     const BoxDim& box = m_pdata->getGlobalBox();
 
-    // for each of the angles
-    const unsigned int size = (unsigned int)m_angle_data->getN();
-    for (unsigned int i = 0; i < size; i++)
-        {
+    // access the angle data
+    ArrayHandle<AngleData::members_t> h_angles(m_angle_data->getMembersArray(),
+                                               access_location::host,
+                                               access_mode::read);
+    ArrayHandle<typeval_t> h_typeval(m_angle_data->getTypeValArray(),
+                                     access_location::host,
+                                     access_mode::read);
+
+    const unsigned int N = m_pdata->getN();
+
+    // compute the forces on the particles in angle i
+    auto compute_angle = [&](unsigned int i, Scalar4* force, Scalar* virial, size_t virial_pitch)
+    {
         // lookup the tag of each of the particles participating in the angle
-        const AngleData::members_t& angle = m_angle_data->getMembersByIndex(i);
+        const AngleData::members_t& angle = h_angles.data[i];
         assert(angle.tag[0] <= m_pdata->getMaximumTag());
         assert(angle.tag[1] <= m_pdata->getMaximumTag());
         assert(angle.tag[2] <= m_pdata->getMaximumTag());
@@ -143,11 +151,10 @@ void HarmonicAngleForceCompute::computeForces(uint64_t timestep)
         // throw an error if this angle is incomplete
         if (idx_a == NOT_LOCAL || idx_b == NOT_LOCAL || idx_c == NOT_LOCAL)
             {
-            this->m_exec_conf->msg->error()
-                << "angle.harmonic: angle " << angle.tag[0] << " " << angle.tag[1] << " "
-                << angle.tag[2] << " incomplete." << endl
-                << endl;
-            throw std::runtime_error("Error in angle calculation");
+            std::ostringstream stream;
+            stream << "Error: angle.harmonic: angle " << angle.tag[0] << " " << angle.tag[1] << " "
+                   << angle.tag[2] << " incomplete.";
+            throw std::runtime_error(stream.str());
             }
 
         assert(idx_a < m_pdata->getN() + m_pdata->getNGhosts());
@@ -198,7 +205,7 @@ void HarmonicAngleForceCompute::computeForces(uint64_t timestep)
         s_abbc = 1.0 / s_abbc;
 
         // actually calculate the force
-        unsigned int angle_type = m_angle_data->getTypeByIndex(i);
+        unsigned int angle_type = h_typeval.data[i].type;
         Scalar dth = acos(c_abbc) - m_t_0[angle_type];
         Scalar tk = m_K[angle_type] * dth;
 
@@ -232,36 +239,45 @@ void HarmonicAngleForceCompute::computeForces(uint64_t timestep)
 
         // Now, apply the force to each individual atom a,b,c, and accumulate the energy/virial
         // do not update ghost particles
-        if (idx_a < m_pdata->getN())
+        if (idx_a < N)
             {
-            h_force.data[idx_a].x += fab[0];
-            h_force.data[idx_a].y += fab[1];
-            h_force.data[idx_a].z += fab[2];
-            h_force.data[idx_a].w += angle_eng;
+            force[idx_a].x += fab[0];
+            force[idx_a].y += fab[1];
+            force[idx_a].z += fab[2];
+            force[idx_a].w += angle_eng;
             for (int j = 0; j < 6; j++)
-                h_virial.data[j * virial_pitch + idx_a] += angle_virial[j];
+                virial[j * virial_pitch + idx_a] += angle_virial[j];
             }
 
-        if (idx_b < m_pdata->getN())
+        if (idx_b < N)
             {
-            h_force.data[idx_b].x -= fab[0] + fcb[0];
-            h_force.data[idx_b].y -= fab[1] + fcb[1];
-            h_force.data[idx_b].z -= fab[2] + fcb[2];
-            h_force.data[idx_b].w += angle_eng;
+            force[idx_b].x -= fab[0] + fcb[0];
+            force[idx_b].y -= fab[1] + fcb[1];
+            force[idx_b].z -= fab[2] + fcb[2];
+            force[idx_b].w += angle_eng;
             for (int j = 0; j < 6; j++)
-                h_virial.data[j * virial_pitch + idx_b] += angle_virial[j];
+                virial[j * virial_pitch + idx_b] += angle_virial[j];
             }
 
-        if (idx_c < m_pdata->getN())
+        if (idx_c < N)
             {
-            h_force.data[idx_c].x += fcb[0];
-            h_force.data[idx_c].y += fcb[1];
-            h_force.data[idx_c].z += fcb[2];
-            h_force.data[idx_c].w += angle_eng;
+            force[idx_c].x += fcb[0];
+            force[idx_c].y += fcb[1];
+            force[idx_c].z += fcb[2];
+            force[idx_c].w += angle_eng;
             for (int j = 0; j < 6; j++)
-                h_virial.data[j * virial_pitch + idx_c] += angle_virial[j];
+                virial[j * virial_pitch + idx_c] += angle_virial[j];
             }
-        }
+    };
+
+    // for each of the angles
+    m_force_scatter.compute(m_exec_conf,
+                            (unsigned int)m_angle_data->getN(),
+                            m_pdata->getN() + m_pdata->getNGhosts(),
+                            h_force.data,
+                            h_virial.data,
+                            m_virial.getPitch(),
+                            compute_angle);
     }
 
 namespace detail
@@ -1,6 +1,7 @@
 // Copyright (c) 2009-2023 The Regents of the University of Michigan.
 // Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+#include "BondedForceScatter.h"
 #include "hoomd/BondedGroupData.h"
 #include "hoomd/ForceCompute.h"
 
@@ -93,7 +94,8 @@ class PYBIND11_EXPORT HarmonicAngleForceCompute : public ForceCompute
     Scalar* m_K;   //!< K parameter for multiple angle tyes
     Scalar* m_t_0; //!< r_0 parameter for multiple angle types
 
-    std::shared_ptr<AngleData> m_angle_data; //!< Angle data to use in computing angles
+    std::shared_ptr<AngleData> m_angle_data;    //!< Angle data to use in computing angles
+    detail::BondedForceScatter m_force_scatter; //!< Evaluates angles on multiple threads
 
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
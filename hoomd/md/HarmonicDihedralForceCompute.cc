@@ -133,17 +133,25 @@ void HarmonicDihedralForceCompute::computeForces(uint64_t timestep)
     assert(h_pos.data);
     assert(h_rtag.data);
 
-    size_t virial_pitch = m_virial.getPitch();
-
     // get a local copy of the simulation box too
     const BoxDim& box = m_pdata->getBox();
 
-    // for each of the dihedrals
-    const unsigned int size = (unsigned int)m_dihedral_data->getN();
-    for (unsigned int i = 0; i < size; i++)
-        {
+    // access the dihedral data
+    ArrayHandle<DihedralData::members_t> h_dihedrals(m_dihedral_data->getMembersArray(),
+                                                     access_location::host,
+                                                     access_mode::read);
+    ArrayHandle<typeval_t> h_typeval(m_dihedral_data->getTypeValArray(),
+                                     access_location::host,
+                                     access_mode::read);
+
+    // compute the forces on the particles in dihedral i
+    auto compute_dihedral = [&](unsigned int i,
+                                Scalar4* force,
+                                Scalar* virial,
+                                size_t virial_pitch)
+    {
         // lookup the tag of each of the particles participating in the dihedral
-        const ImproperData::members_t& dihedral = m_dihedral_data->getMembersByIndex(i);
+        const DihedralData::members_t& dihedral = h_dihedrals.data[i];
         assert(dihedral.tag[0] <= m_pdata->getMaximumTag());
         assert(dihedral.tag[1] <= m_pdata->getMaximumTag());
         assert(dihedral.tag[2] <= m_pdata->getMaximumTag());
@@ -159,11 +167,11 @@ void HarmonicDihedralForceCompute::computeForces(uint64_t timestep)
         // throw an error if this angle is incomplete
         if (idx_a == NOT_LOCAL || idx_b == NOT_LOCAL || idx_c == NOT_LOCAL || idx_d == NOT_LOCAL)
             {
-            this->m_exec_conf->msg->error()
-                << "dihedral.harmonic: dihedral " << dihedral.tag[0] << " " << dihedral.tag[1]
-                << " " << dihedral.tag[2] << " " << dihedral.tag[3] << " incomplete." << endl
-                << endl;
-            throw std::runtime_error("Error in dihedral calculation");
+            std::ostringstream stream;
+            stream << "Error: dihedral.harmonic: dihedral " << dihedral.tag[0] << " "
+                   << dihedral.tag[1] << " " << dihedral.tag[2] << " " << dihedral.tag[3]
+                   << " incomplete.";
+            throw std::runtime_error(stream.str());
             }
 
         assert(idx_a < m_pdata->getN() + m_pdata->getNGhosts());
@@ -230,7 +238,7 @@ void HarmonicDihedralForceCompute::computeForces(uint64_t timestep)
         if (c_abcd < -1.0)
             c_abcd = -1.0;
 
-        unsigned int dihedral_type = m_dihedral_data->getTypeByIndex(i);
+        unsigned int dihedral_type = h_typeval.data[i].type;
         int multi = m_multi[dihedral_type];
         Scalar p = Scalar(1.0);
         Scalar dfab = Scalar(0.0);
@@ -325,34 +333,43 @@ void HarmonicDihedralForceCompute::computeForces(uint64_t timestep)
         dihedral_virial[4] = (1. / 4.) * (dab.z * ffay + dcb.z * ffcy + (ddc.z + dcb.z) * ffdy);
         dihedral_virial[5] = (1. / 4.) * (dab.z * ffaz + dcb.z * ffcz + (ddc.z + dcb.z) * ffdz);
 
-        h_force.data[idx_a].x += ffax;
-        h_force.data[idx_a].y += ffay;
-        h_force.data[idx_a].z += ffaz;
-        h_force.data[idx_a].w += dihedral_eng;
+        force[idx_a].x += ffax;
+        force[idx_a].y += ffay;
+        force[idx_a].z += ffaz;
+        force[idx_a].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_a] += dihedral_virial[k];
+            virial[virial_pitch * k + idx_a] += dihedral_virial[k];
 
-        h_force.data[idx_b].x += ffbx;
-        h_force.data[idx_b].y += ffby;
-        h_force.data[idx_b].z += ffbz;
-        h_force.data[idx_b].w += dihedral_eng;
+        force[idx_b].x += ffbx;
+        force[idx_b].y += ffby;
+        force[idx_b].z += ffbz;
+        force[idx_b].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_b] += dihedral_virial[k];
+            virial[virial_pitch * k + idx_b] += dihedral_virial[k];
 
-        h_force.data[idx_c].x += ffcx;
-        h_force.data[idx_c].y += ffcy;
-        h_force.data[idx_c].z += ffcz;
-        h_force.data[idx_c].w += dihedral_eng;
+        force[idx_c].x += ffcx;
+        force[idx_c].y += ffcy;
+        force[idx_c].z += ffcz;
+        force[idx_c].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_c] += dihedral_virial[k];
+            virial[virial_pitch * k + idx_c] += dihedral_virial[k];
 
-        h_force.data[idx_d].x += ffdx;
-        h_force.data[idx_d].y += ffdy;
-        h_force.data[idx_d].z += ffdz;
-        h_force.data[idx_d].w += dihedral_eng;
+        force[idx_d].x += ffdx;
+        force[idx_d].y += ffdy;
+        force[idx_d].z += ffdz;
+        force[idx_d].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_d] += dihedral_virial[k];
-        }
+            virial[virial_pitch * k + idx_d] += dihedral_virial[k];
+    };
+
+    // for each of the dihedrals
+    m_force_scatter.compute(m_exec_conf,
+                            (unsigned int)m_dihedral_data->getN(),
+                            m_pdata->getN() + m_pdata->getNGhosts(),
+                            h_force.data,
+                            h_virial.data,
+                            m_virial.getPitch(),
+                            compute_dihedral);
     }
 
 namespace detail
@@ -1,6 +1,7 @@
 // Copyright (c) 2009-2023 The Regents of the University of Michigan.
 // Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+#include "BondedForceScatter.h"
 #include "hoomd/BondedGroupData.h"
 #include "hoomd/ForceCompute.h"
 
@@ -97,6 +98,7 @@ class PYBIND11_EXPORT HarmonicDihedralForceCompute : public ForceCompute
     Scalar* m_phi_0; //!< phi_0 parameter for multiple dihedral types
 
     std::shared_ptr<DihedralData> m_dihedral_data; //!< Dihedral data to use in computing dihedrals
+    detail::BondedForceScatter m_force_scatter;    //!< Evaluates dihedrals on multiple threads
 
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
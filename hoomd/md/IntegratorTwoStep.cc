@@ -249,6 +249,12 @@ void IntegratorTwoStep::prepRun(uint64_t timestep)
     for (auto& method : m_methods)
         method->setAnisotropic(m_integrate_rotational_dof);
 
+    // The methods read the net torque when integrating rotational degrees of freedom. Allocate it
+    // now so that computeNetForce() sums the torques of all forces, including those that do not
+    // report isAnisotropic() (such as active forces).
+    if (m_integrate_rotational_dof)
+        m_pdata->getNetTorqueArray();
+
 #ifdef ENABLE_MPI
     if (m_sysdef->isDomainDecomposed())
         {
@@ -0,0 +1,231 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#pragma once
+
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+/*! \file MultipleTauCorrelator.h
+    \brief Declares the MultipleTauCorrelator class
+*/
+
+namespace hoomd
+    {
+namespace md
+    {
+/// Accumulate time autocorrelation functions with the multiple-tau algorithm.
+/*! MultipleTauCorrelator implements the multiple-tau (logarithmic block) correlator of Ramírez et
+    al. 2010 (https://doi.org/10.1063/1.3491098). Samples enter level 0, which correlates lags
+    0 to p-1 in units of the sampling interval. Every m samples of level k are averaged and passed
+    to level k+1, which correlates lags j m^(k+1) for j = p/m to p-1. The memory needed is
+    O(p C log_m(T)) for C channels and T samples.
+
+    Each channel is autocorrelated independently.
+*/
+class MultipleTauCorrelator
+    {
+    public:
+    /// Construct the correlator
+    /*! \param n_channels Number of independent channels in each sample
+        \param block_length Number of lags p in each level
+        \param averaging Number of samples m averaged when passing to the next level
+        \param max_levels Maximum number of levels
+    */
+    MultipleTauCorrelator(unsigned int n_channels,
+                          unsigned int block_length,
+                          unsigned int averaging,
+                          unsigned int max_levels)
+        : m_n_channels(n_channels), m_block_length(block_length), m_averaging(averaging),
+          m_max_levels(max_levels), m_n_samples(0)
+        {
+        if (m_n_channels == 0)
+            throw std::domain_error("The correlator needs at least one channel.");
+        if (m_averaging < 2)
+            throw std::domain_error("averaging must be at least 2.");
+        if (m_block_length < m_averaging || m_block_length % m_averaging != 0)
+            throw std::domain_error("block_length must be a multiple of averaging.");
+        if (m_max_levels == 0)
+            throw std::domain_error("max_levels must be at least 1.");
+        }
+
+    /// Add a sample
+    /*! \param values Value of each channel, must have n_channels elements
+     */
+    void add(const std::vector<double>& values)
+        {
+        if (values.size() != m_n_channels)
+            throw std::invalid_argument("The sample must have one value per channel.");
+
+        m_n_samples++;
+
+        // pass the sample up the levels, averaging m samples at each level
+        std::vector<double> sample = values;
+        for (unsigned int k = 0; k < m_max_levels; k++)
+            {
+            if (k == m_levels.size())
+                m_levels.emplace_back(m_n_channels, m_block_length);
+
+            Level& level = m_levels[k];
+            correlate(level, sample, firstLag(k));
+
+            for (unsigned int c = 0; c < m_n_channels; c++)
+                level.accumulator[c] += sample[c];
+            level.n_accumulated++;
+
+            if (level.n_accumulated < m_averaging)
+                break;
+
+            for (unsigned int c = 0; c < m_n_channels; c++)
+                {
+                sample[c] = level.accumulator[c] / double(m_averaging);
+                level.accumulator[c] = 0.0;
+                }
+            level.n_accumulated = 0;
+            }
+        }
+
+    /// Discard all samples
+    void reset()
+        {
+        m_levels.clear();
+        m_n_samples = 0;
+        }
+
+    /// Get the lags with accumulated correlations in units of the sampling interval
+    std::vector<uint64_t> getLags() const
+        {
+        std::vector<uint64_t> lags;
+        uint64_t scale = 1;
+        for (unsigned int k = 0; k < m_levels.size(); k++)
+            {
+            for (unsigned int j = firstLag(k); j < m_block_length; j++)
+                {
+                if (m_levels[k].count[j] > 0)
+                    lags.push_back(j * scale);
+                }
+            scale *= m_averaging;
+            }
+        return lags;
+        }
+
+    /// Get the correlation at each lag in getLags()
+    /*! \returns A flat array with n_channels values for each lag
+     */
+    std::vector<double> getCorrelation() const
+        {
+        std::vector<double> result;
+        for (unsigned int k = 0; k < m_levels.size(); k++)
+            {
+            const Level& level = m_levels[k];
+            for (unsigned int j = firstLag(k); j < m_block_length; j++)
+                {
+                if (level.count[j] == 0)
+                    continue;
+
+                for (unsigned int c = 0; c < m_n_channels; c++)
+                    {
+                    result.push_back(level.correlation[j * m_n_channels + c]
+                                     / double(level.count[j]));
+                    }
+                }
+            }
+        return result;
+        }
+
+    /// Get the number of channels
+    unsigned int getNumChannels() const
+        {
+        return m_n_channels;
+        }
+
+    /// Get the number of samples added since construction or the last reset()
+    uint64_t getNumSamples() const
+        {
+        return m_n_samples;
+        }
+
+    private:
+    /// Shift register and accumulated correlations of one level
+    struct Level
+        {
+        Level(unsigned int n_channels, unsigned int block_length)
+            : shift(size_t(n_channels) * block_length, 0.0),
+              correlation(size_t(n_channels) * block_length, 0.0), count(block_length, 0),
+              accumulator(n_channels, 0.0)
+            {
+            }
+
+        /// Last p samples, the newest is at index head
+        std::vector<double> shift;
+
+        /// Index of the newest sample in shift
+        unsigned int head = 0;
+
+        /// Number of samples inserted into this level
+        uint64_t n_inserted = 0;
+
+        /// Sum of the products at each lag
+        std::vector<double> correlation;
+
+        /// Number of products summed at each lag
+        std::vector<uint64_t> count;
+
+        /// Sum of the samples to pass to the next level
+        std::vector<double> accumulator;
+
+        /// Number of samples in accumulator
+        unsigned int n_accumulated = 0;
+        };
+
+    /// Insert a sample into a level and accumulate its products with the previous samples
+    void correlate(Level& level, const std::vector<double>& sample, unsigned int first_lag)
+        {
+        level.head = (level.head + 1) % m_block_length;
+        for (unsigned int c = 0; c < m_n_channels; c++)
+            level.shift[size_t(level.head) * m_n_channels + c] = sample[c];
+        level.n_inserted++;
+
+        unsigned int n_lags = level.n_inserted < m_block_length
+                                  ? static_cast<unsigned int>(level.n_inserted)
+                                  : m_block_length;
+        for (unsigned int j = first_lag; j < n_lags; j++)
+            {
+            unsigned int index = (level.head + m_block_length - j) % m_block_length;
+            for (unsigned int c = 0; c < m_n_channels; c++)
+                {
+                level.correlation[size_t(j) * m_n_channels + c]
+                    += sample[c] * level.shift[size_t(index) * m_n_channels + c];
+                }
+            level.count[j]++;
+            }
+        }
+
+    /// Get the first lag reported by a level
+    unsigned int firstLag(unsigned int k) const
+        {
+        return k == 0 ? 0 : m_block_length / m_averaging;
+        }
+
+    /// Number of channels
+    unsigned int m_n_channels;
+
+    /// Number of lags p in each level
+    unsigned int m_block_length;
+
+    /// Number of samples m averaged when passing to the next level
+    unsigned int m_averaging;
+
+    /// Maximum number of levels
+    unsigned int m_max_levels;
+
+    /// Number of samples added
+    uint64_t m_n_samples;
+
+    /// The levels allocated so far
+    std::vector<Level> m_levels;
+    };
+
+    } // end namespace md
+    } // end namespace hoomd
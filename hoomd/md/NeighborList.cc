@@ -8,6 +8,7 @@
 #include "NeighborList.h"
 #include "hoomd/BondedGroupData.h"
 
+#include <climits>
 #include <iostream>
 #include <stdexcept>
 
@@ -218,8 +219,8 @@ NeighborList::NeighborList(std::shared_ptr<SystemDefinition> sysdef, Scalar r_bu
     m_ex_list_indexer = Index2D((unsigned int)m_ex_list_idx.getPitch(), 1);
     m_ex_list_indexer_tag = Index2D((unsigned int)m_ex_list_tag.getPitch(), 1);
 
-    // connect to particle sort to force rebuild
-    m_pdata->getParticleSortSignal().connect<NeighborList, &NeighborList::forceUpdate>(this);
+    // connect to particle sort to force rebuild (or remap after an in-place permutation)
+    m_pdata->getParticleSortSignal().connect<NeighborList, &NeighborList::slotParticleSort>(this);
 
     // connect to max particle change to resize neighborlist arrays
     m_pdata->getMaxParticleNumberChangeSignal().connect<NeighborList, &NeighborList::reallocate>(
@@ -281,6 +282,84 @@ NeighborList::NeighborList(std::shared_ptr<SystemDefinition> sysdef, Scalar r_bu
 #endif
     }
 
+/*! An in-place permutation of the local particles does not change any pair distances. Remap the
+    particle indices in the neighbor list, the sublists, and the last updated positions instead of
+    rebuilding. The rows of the neighbor list stay in place in memory and the head list moves with
+    the particles. Any other sort forces a full update on the next call to compute().
+*/
+void NeighborList::slotParticleSort()
+    {
+    if (!m_pdata->isSortPermutation() || m_force_update || !m_has_been_updated_once
+        || m_n_particles_changed)
+        {
+        forceUpdate();
+        return;
+        }
+
+    m_exec_conf->msg->notice(7) << "nlist: Remapping particle indices after a permutation" << endl;
+
+    const std::vector<unsigned int>& order = m_pdata->getSortOrder();
+    const unsigned int N = m_pdata->getN();
+
+        {
+        ArrayHandle<size_t> h_head_list(m_head_list, access_location::host, access_mode::readwrite);
+        std::vector<size_t> old_head_list(h_head_list.data, h_head_list.data + N);
+        for (unsigned int i = 0; i < N; i++)
+            h_head_list.data[i] = old_head_list[order[i]];
+        }
+
+    permuteNlist(m_n_neigh, m_nlist);
+    for (auto& sublist : m_sublists)
+        {
+        if (sublist->active)
+            permuteNlist(sublist->n_neigh, sublist->nlist);
+        }
+
+        {
+        ArrayHandle<Scalar4> h_last_pos(m_last_pos, access_location::host, access_mode::readwrite);
+        std::vector<Scalar4> old_last_pos(h_last_pos.data, h_last_pos.data + N);
+        for (unsigned int i = 0; i < N; i++)
+            h_last_pos.data[i] = old_last_pos[order[i]];
+        }
+
+    if (m_exclusions_set)
+        updateExListIdx();
+
+    if (hasCompressedNList())
+        compressNlists();
+    }
+
+/*! \param n_neigh Number of neighbors of each particle
+    \param nlist Neighbors of each particle, indexed by the (already permuted) head list
+*/
+void NeighborList::permuteNlist(GlobalArray<unsigned int>& n_neigh,
+                                GlobalArray<unsigned int>& nlist)
+    {
+    const std::vector<unsigned int>& order = m_pdata->getSortOrder();
+    const std::vector<unsigned int>& rorder = m_pdata->getSortReverseOrder();
+    const unsigned int N = m_pdata->getN();
+
+    ArrayHandle<unsigned int> h_n_neigh(n_neigh, access_location::host, access_mode::readwrite);
+    ArrayHandle<unsigned int> h_nlist(nlist, access_location::host, access_mode::readwrite);
+    ArrayHandle<size_t> h_head_list(m_head_list, access_location::host, access_mode::read);
+
+    std::vector<unsigned int> old_n_neigh(h_n_neigh.data, h_n_neigh.data + N);
+    for (unsigned int i = 0; i < N; i++)
+        {
+        const unsigned int n_neigh_i = old_n_neigh[order[i]];
+        const size_t head_i = h_head_list.data[i];
+        h_n_neigh.data[i] = n_neigh_i;
+
+        // ghost particles keep their indices
+        for (unsigned int k = 0; k < n_neigh_i; k++)
+            {
+            const unsigned int j = h_nlist.data[head_i + k];
+            if (j < N)
+                h_nlist.data[head_i + k] = rorder[j];
+            }
+        }
+    }
+
 void NeighborList::reallocate()
     {
     // resize the exclusions
@@ -313,7 +392,8 @@ NeighborList::~NeighborList()
     {
     m_exec_conf->msg->notice(5) << "Destroying Neighborlist" << endl;
 
-    m_pdata->getParticleSortSignal().disconnect<NeighborList, &NeighborList::forceUpdate>(this);
+    m_pdata->getParticleSortSignal().disconnect<NeighborList, &NeighborList::slotParticleSort>(
+        this);
     m_pdata->getMaxParticleNumberChangeSignal().disconnect<NeighborList, &NeighborList::reallocate>(
         this);
     m_pdata->getGlobalParticleNumberChangeSignal()
@@ -379,6 +459,8 @@ void NeighborList::compute(uint64_t timestep)
     if (!shouldCompute(timestep) && !m_force_update)
         return;
 
+    hoomd::detail::ScopedProfile profile(m_exec_conf, m_profile);
+
     // when the number of particles or bonds in the system changes, rebuild the exclusion list
     if (m_n_particles_changed || m_topology_changed)
         {
@@ -429,6 +511,12 @@ void NeighborList::compute(uint64_t timestep)
         if (m_exclusions_set)
             filterNlist();
 
+        if (m_use_sublists)
+            buildSubLists();
+
+        if (hasCompressedNList())
+            compressNlists();
+
         setLastUpdatedPos();
         m_has_been_updated_once = true;
         }
@@ -524,6 +612,29 @@ void NeighborList::updateRList()
         }
     m_rcut_min = r_cut_min;
 
+    // a consumer needs a sublist when its r_cut is smaller than r_cut for any type pair
+    for (unsigned int matrix = 0; matrix < m_consumer_r_cut.size(); matrix++)
+        {
+        ArrayHandle<Scalar> h_consumer_r_cut(*m_consumer_r_cut[matrix],
+                                             access_location::host,
+                                             access_mode::read);
+        ArrayHandle<Scalar> h_sub_r_listsq(m_sublists[matrix]->r_listsq,
+                                           access_location::host,
+                                           access_mode::overwrite);
+
+        bool shorter = false;
+        for (unsigned int cur_pair = 0; cur_pair < m_typpair_idx.getNumElements(); ++cur_pair)
+            {
+            const Scalar r_cut_ij = h_consumer_r_cut.data[cur_pair];
+            Scalar r_list = (r_cut_ij > Scalar(0.0)) ? r_cut_ij + m_r_buff : Scalar(0.0);
+            h_sub_r_listsq.data[cur_pair] = r_list * r_list;
+
+            if (r_cut_ij < h_r_cut.data[cur_pair])
+                shorter = true;
+            }
+        m_sublists[matrix]->active = m_use_sublists && shorter;
+        }
+
     // rcut has been updated to the latest values now
     m_rcut_changed = false;
     }
@@ -1238,11 +1349,26 @@ bool NeighborList::distanceCheck(uint64_t timestep)
     Scalar lambda_min = (lambda.x < lambda.y) ? lambda.x : lambda.y;
     lambda_min = (lambda_min < lambda.z) ? lambda_min : (Scalar)lambda.z;
 
+    // sublists are built with r_cut + r_buff of a smaller cutoff, which does not grow with the box
+    if (m_use_sublists)
+        lambda_min = std::min(lambda_min, Scalar(1.0));
+
     ArrayHandle<Scalar4> h_last_pos(m_last_pos, access_location::host, access_mode::read);
     ArrayHandle<Scalar> h_rcut_max(m_rcut_max, access_location::host, access_mode::read);
 
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+    // check only the particles that may move when the check group is set
+    const unsigned int n_check = m_check_group ? m_check_group->getNumMembers() : m_pdata->getN();
+    std::unique_ptr<ArrayHandle<unsigned int>> h_index;
+    if (m_check_group)
+        {
+        h_index.reset(new ArrayHandle<unsigned int>(m_check_group->getIndexArray(),
+                                                    access_location::host,
+                                                    access_mode::read));
+        }
+
+    for (unsigned int j = 0; j < n_check; j++)
         {
+        const unsigned int i = h_index ? h_index->data[j] : j;
         const unsigned int type_i = __scalar_as_int(h_pos.data[i].w);
 
         // minimum distance within which all particles should be included
@@ -1288,6 +1414,170 @@ bool NeighborList::distanceCheck(uint64_t timestep)
     return result;
     }
 
+/*! Filter the neighbor list into the sublist of every consumer that has a shorter cutoff. Each
+    sublist keeps the neighbors within the consumer's r_cut + r_buff at the current positions.
+    buildSubLists() must be called immediately after the neighbor list is built.
+*/
+void NeighborList::buildSubLists()
+    {
+    ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_n_neigh(m_n_neigh, access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_nlist(m_nlist, access_location::host, access_mode::read);
+    ArrayHandle<size_t> h_head_list(m_head_list, access_location::host, access_mode::read);
+
+    const BoxDim& box = m_pdata->getBox();
+
+    for (auto& sublist : m_sublists)
+        {
+        if (!sublist->active)
+            continue;
+
+        allocateSubList(*sublist);
+
+        ArrayHandle<Scalar> h_r_listsq(sublist->r_listsq, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_sub_n_neigh(sublist->n_neigh,
+                                                access_location::host,
+                                                access_mode::overwrite);
+        ArrayHandle<unsigned int> h_sub_nlist(sublist->nlist,
+                                              access_location::host,
+                                              access_mode::overwrite);
+
+        for (unsigned int i = 0; i < m_pdata->getN(); i++)
+            {
+            const Scalar3 pos_i = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
+            const unsigned int type_i = __scalar_as_int(h_pos.data[i].w);
+            const size_t head_i = h_head_list.data[i];
+
+            unsigned int n_sub = 0;
+            for (unsigned int k = 0; k < h_n_neigh.data[i]; k++)
+                {
+                const unsigned int j = h_nlist.data[head_i + k];
+                const unsigned int type_j = __scalar_as_int(h_pos.data[j].w);
+
+                const Scalar3 pos_j
+                    = make_scalar3(h_pos.data[j].x, h_pos.data[j].y, h_pos.data[j].z);
+                const Scalar3 dx = box.minImage(pos_i - pos_j);
+
+                if (dot(dx, dx) < h_r_listsq.data[m_typpair_idx(type_i, type_j)])
+                    {
+                    h_sub_nlist.data[head_i + n_sub] = j;
+                    n_sub++;
+                    }
+                }
+            h_sub_n_neigh.data[i] = n_sub;
+            }
+        }
+    }
+
+/*! \param sublist Sublist to allocate
+
+    The sublist arrays are the same size as the neighbor list arrays so that the sublist can share
+    the head list.
+*/
+void NeighborList::allocateSubList(SubList& sublist)
+    {
+    if (sublist.n_neigh.getNumElements() != m_n_neigh.getNumElements())
+        {
+        GlobalArray<unsigned int> n_neigh(m_n_neigh.getNumElements(), m_exec_conf);
+        sublist.n_neigh.swap(n_neigh);
+        TAG_ALLOCATION(sublist.n_neigh);
+        }
+
+    if (sublist.nlist.getNumElements() != m_nlist.getNumElements())
+        {
+        GlobalArray<unsigned int> nlist(m_nlist.getNumElements(), m_exec_conf);
+        sublist.nlist.swap(nlist);
+        TAG_ALLOCATION(sublist.nlist);
+        }
+    }
+
+void NeighborList::compressNlists()
+    {
+    compressNlist(m_n_neigh, m_nlist, m_nlist_compressed, m_nlist_base);
+
+    for (auto& sublist : m_sublists)
+        {
+        if (sublist->active)
+            {
+            compressNlist(sublist->n_neigh,
+                          sublist->nlist,
+                          sublist->nlist_compressed,
+                          sublist->nlist_base);
+            }
+        }
+    }
+
+/*! \param n_neigh Number of neighbors of each particle
+    \param nlist Neighbor list to compress
+    \param nlist_compressed Compressed neighbor list (output)
+    \param nlist_base Base index of each particle (output)
+
+    Store the neighbors of each particle as 16-bit offsets from the smallest neighbor index. Set the
+    base to UNCOMPRESSED for particles with neighbor indices that differ by more than 65535.
+*/
+void NeighborList::compressNlist(const GlobalArray<unsigned int>& n_neigh,
+                                 const GlobalArray<unsigned int>& nlist,
+                                 GlobalArray<uint16_t>& nlist_compressed,
+                                 GlobalArray<unsigned int>& nlist_base)
+    {
+    if (nlist_compressed.getNumElements() != nlist.getNumElements())
+        {
+        GlobalArray<uint16_t> new_nlist_compressed(nlist.getNumElements(), m_exec_conf);
+        nlist_compressed.swap(new_nlist_compressed);
+        TAG_ALLOCATION(nlist_compressed);
+        }
+
+    if (nlist_base.getNumElements() != n_neigh.getNumElements())
+        {
+        GlobalArray<unsigned int> new_nlist_base(n_neigh.getNumElements(), m_exec_conf);
+        nlist_base.swap(new_nlist_base);
+        TAG_ALLOCATION(nlist_base);
+        }
+
+    ArrayHandle<unsigned int> h_n_neigh(n_neigh, access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_nlist(nlist, access_location::host, access_mode::read);
+    ArrayHandle<size_t> h_head_list(m_head_list, access_location::host, access_mode::read);
+    ArrayHandle<uint16_t> h_nlist_compressed(nlist_compressed,
+                                             access_location::host,
+                                             access_mode::overwrite);
+    ArrayHandle<unsigned int> h_nlist_base(nlist_base,
+                                           access_location::host,
+                                           access_mode::overwrite);
+
+    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+        {
+        const size_t head_i = h_head_list.data[i];
+        const unsigned int n_neigh_i = h_n_neigh.data[i];
+
+        unsigned int j_min = UINT_MAX;
+        unsigned int j_max = 0;
+        for (unsigned int k = 0; k < n_neigh_i; k++)
+            {
+            const unsigned int j = h_nlist.data[head_i + k];
+            j_min = std::min(j_min, j);
+            j_max = std::max(j_max, j);
+            }
+
+        if (n_neigh_i == 0)
+            {
+            h_nlist_base.data[i] = 0;
+            }
+        else if (j_max - j_min > UINT16_MAX)
+            {
+            h_nlist_base.data[i] = UNCOMPRESSED;
+            }
+        else
+            {
+            h_nlist_base.data[i] = j_min;
+            for (unsigned int k = 0; k < n_neigh_i; k++)
+                {
+                h_nlist_compressed.data[head_i + k]
+                    = static_cast<uint16_t>(h_nlist.data[head_i + k] - j_min);
+                }
+            }
+        }
+    }
+
 /*! Copies the current positions of all particles over to m_last_x etc...
  */
 void NeighborList::setLastUpdatedPos()
@@ -1996,6 +2286,10 @@ void export_NeighborList(pybind11::module& m)
                       &NeighborList::getRebuildCheckDelay,
                       &NeighborList::setRebuildCheckDelay)
         .def_property("check_dist", &NeighborList::getDistCheck, &NeighborList::setDistCheck)
+        .def_property("sublists", &NeighborList::getSubLists, &NeighborList::setSubLists)
+        .def_property("compressed", &NeighborList::getCompressed, &NeighborList::setCompressed)
+        .def("setCheckGroup", &NeighborList::setCheckGroup)
+        .def("getCheckGroup", &NeighborList::getCheckGroup)
         .def("setStorageMode", &NeighborList::setStorageMode)
         .def_property("exclusions", &NeighborList::getExclusions, &NeighborList::setExclusions)
         .def("addMesh", &NeighborList::AddMesh)
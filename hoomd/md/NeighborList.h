@@ -7,9 +7,11 @@
 #include "hoomd/GlobalArray.h"
 #include "hoomd/Index1D.h"
 #include "hoomd/MeshDefinition.h"
+#include "hoomd/ParticleGroup.h"
 #include "hoomd/PythonLocalDataAccess.h"
 
 #include <hoomd/extern/nano-signal-slot/nano_signal_slot.hpp>
+#include <cstdint>
 #include <memory>
 #include <set>
 #include <vector>
@@ -75,6 +77,28 @@ namespace md
    Various filters can be applied to remove unwanted neighbors from the list.
      - setFilterBody() prevents two particles of the same body from being neighbors
 
+    \b Sublists:
+
+    When consumers with very different cutoffs share a neighbor list, the consumers with short
+   cutoffs iterate over many pairs that are beyond their cutoff. When setSubLists() is enabled,
+   the neighbor list also builds a sublist for each consumer whose r_cut matrix is smaller than the
+   neighbor list's r_cut for any type pair. The sublist contains only the neighbors within the
+   consumer's r_cut + r_buff at the time of the build, which are the only pairs that may come
+   within r_cut before the next build. Sublists share the head list of the full neighbor list.
+   Consumers access their sublist with getNNeighArray(r_cut_matrix) and
+   getNListArray(r_cut_matrix).
+
+    \b Compression:
+
+    After a particle sort, the neighbors of a particle have nearby indices. When setCompressed() is
+   enabled on the CPU, the neighbor list also stores each neighbor index as a 16-bit offset from a
+   per particle base index. The compressed list is indexed by the same head list as the full list,
+   and consumers read it with getCompressedNListArray() and getCompressedBaseArray(). Particles
+   whose neighbor indices span more than 16 bits have the base NeighborList::UNCOMPRESSED, and
+   consumers must read the full list for these particles:
+
+     - <code>j = base[i] + compressed_nlist[head_list[i] + n]</code>
+
     \b Algorithms:
 
     This base class supplies no build algorithm for generating this list, it must be overridden by
@@ -156,6 +180,7 @@ class PYBIND11_EXPORT NeighborList : public Compute
             }
 
         m_consumer_r_cut.push_back(r_cut_matrix);
+        m_sublists.emplace_back(new SubList(m_typpair_idx.getNumElements(), m_exec_conf));
         notifyRCutMatrixChange();
         forceUpdate();
         }
@@ -189,6 +214,7 @@ class PYBIND11_EXPORT NeighborList : public Compute
             {
             throw std::invalid_argument("r_cut_matrix not found in neighbor list");
             }
+        m_sublists.erase(m_sublists.begin() + (p - m_consumer_r_cut.begin()));
         m_consumer_r_cut.erase(p);
         }
 
@@ -221,6 +247,59 @@ class PYBIND11_EXPORT NeighborList : public Compute
         return m_dist_check;
         }
 
+    //! Enable or disable per consumer sublists
+    void setSubLists(bool sublists)
+        {
+        m_use_sublists = sublists;
+        notifyRCutMatrixChange();
+        }
+
+    //! Enable or disable compressed neighbor list storage
+    void setCompressed(bool compressed)
+        {
+        m_compressed = compressed;
+        forceUpdate();
+        }
+
+    //! Test if compressed neighbor list storage is enabled
+    bool getCompressed()
+        {
+        return m_compressed;
+        }
+
+    //! Test if consumers can read the compressed neighbor list
+    /*! The compressed list is built only on the CPU.
+     */
+    bool hasCompressedNList()
+        {
+        return m_compressed && !m_exec_conf->isCUDAEnabled();
+        }
+
+    //! Test if per consumer sublists are enabled
+    bool getSubLists()
+        {
+        return m_use_sublists;
+        }
+
+    //! Set the group of particles to check for displacement
+    /*! \param group Particles that may move between neighbor list builds. Set to nullptr to check
+        all particles.
+
+        When set, the distance check considers only the members of \a group. Use this when the
+        remaining particles do not move (e.g. they are not integrated) to avoid scanning them.
+    */
+    void setCheckGroup(std::shared_ptr<ParticleGroup> group)
+        {
+        m_check_group = group;
+        forceUpdate();
+        }
+
+    //! Get the group of particles to check for displacement
+    std::shared_ptr<ParticleGroup> getCheckGroup()
+        {
+        return m_check_group;
+        }
+
     //! Set the storage mode
     /*! \param mode Storage mode to set
         - half only stores neighbors where i < j
@@ -305,6 +384,57 @@ class PYBIND11_EXPORT NeighborList : public Compute
         return m_nlist;
         }
 
+    //! Get the number of neighbors array for a consumer
+    /*! \param r_cut_matrix r_cut matrix that the consumer passed to addRCutMatrix()
+        \returns The number of neighbors in the consumer's sublist when it has one, otherwise
+        getNNeighArray().
+    */
+    const GlobalArray<unsigned int>&
+    getNNeighArray(const std::shared_ptr<GlobalArray<Scalar>>& r_cut_matrix) const
+        {
+        const SubList* sublist = getActiveSubList(r_cut_matrix);
+        return sublist ? sublist->n_neigh : m_n_neigh;
+        }
+
+    //! Get the neighbor list for a consumer
+    /*! \param r_cut_matrix r_cut matrix that the consumer passed to addRCutMatrix()
+        \returns The consumer's sublist when it has one, otherwise getNListArray(). Index either
+        array with getHeadList().
+    */
+    const GlobalArray<unsigned int>&
+    getNListArray(const std::shared_ptr<GlobalArray<Scalar>>& r_cut_matrix) const
+        {
+        const SubList* sublist = getActiveSubList(r_cut_matrix);
+        return sublist ? sublist->nlist : m_nlist;
+        }
+
+    //! Get the compressed neighbor list for a consumer
+    /*! \param r_cut_matrix r_cut matrix that the consumer passed to addRCutMatrix()
+        \returns 16-bit neighbor offsets from the base index of each particle. Index with
+        getHeadList().
+    */
+    const GlobalArray<uint16_t>&
+    getCompressedNListArray(const std::shared_ptr<GlobalArray<Scalar>>& r_cut_matrix) const
+        {
+        const SubList* sublist = getActiveSubList(r_cut_matrix);
+        return sublist ? sublist->nlist_compressed : m_nlist_compressed;
+        }
+
+    //! Get the base index of each particle in the compressed neighbor list for a consumer
+    /*! \param r_cut_matrix r_cut matrix that the consumer passed to addRCutMatrix()
+        \returns The base index of each particle, or UNCOMPRESSED when the particle's neighbors
+        are stored only in the full list.
+    */
+    const GlobalArray<unsigned int>&
+    getCompressedBaseArray(const std::shared_ptr<GlobalArray<Scalar>>& r_cut_matrix) const
+        {
+        const SubList* sublist = getActiveSubList(r_cut_matrix);
+        return sublist ? sublist->nlist_base : m_nlist_base;
+        }
+
+    //! Base index of particles with neighbors that are not in the compressed list
+    static constexpr unsigned int UNCOMPRESSED = 0xffffffff;
+
     //! Get the head list
     const GlobalArray<size_t>& getHeadList() const
         {
@@ -479,6 +609,48 @@ class PYBIND11_EXPORT NeighborList : public Compute
     /// List of r_cut matrices from neighborlist consumers
     std::vector<std::shared_ptr<GlobalArray<Scalar>>> m_consumer_r_cut;
 
+    /// Neighbor list filtered to the cutoff of a single consumer
+    struct SubList
+        {
+        SubList(unsigned int n_typpair, std::shared_ptr<const ExecutionConfiguration> exec_conf)
+            : r_listsq(n_typpair, exec_conf)
+            {
+            }
+
+        /// The consumer's squared list radius (r_cut + r_buff) for each type pair
+        GlobalArray<Scalar> r_listsq;
+
+        /// Number of neighbors of each particle in the sublist
+        GlobalArray<unsigned int> n_neigh;
+
+        /// Neighbors of each particle, indexed by the head list of the full neighbor list
+        GlobalArray<unsigned int> nlist;
+
+        /// Compressed neighbors of each particle
+        GlobalArray<uint16_t> nlist_compressed;
+
+        /// Base index of the compressed neighbors of each particle
+        GlobalArray<unsigned int> nlist_base;
+
+        /// True when the sublist is built
+        bool active = false;
+        };
+
+    /// Sublists of the consumers, in the same order as m_consumer_r_cut
+    std::vector<std::unique_ptr<SubList>> m_sublists;
+
+    /// Set to true to build sublists for the consumers
+    bool m_use_sublists = false;
+
+    /// Compressed neighbor list (16-bit offsets from m_nlist_base)
+    GlobalArray<uint16_t> m_nlist_compressed;
+
+    /// Base index of the compressed neighbors of each particle
+    GlobalArray<unsigned int> m_nlist_base;
+
+    /// Set to true to build the compressed neighbor list
+    bool m_compressed = false;
+
     Scalar m_rcut_max_max;      //!< The maximum cutoff radius of any pair
     Scalar m_rcut_min;          //!< The smallest cutoff radius of any pair (that is > 0)
     Scalar m_r_buff;            //!< The buffer around the cutoff
@@ -491,6 +663,9 @@ class PYBIND11_EXPORT NeighborList : public Compute
     Scalar3 m_last_L;                    //!< Box lengths at last update
     Scalar3 m_last_L_local;              //!< Local Box lengths at last update
 
+    /// Particles to check in distanceCheck() (nullptr to check all particles)
+    std::shared_ptr<ParticleGroup> m_check_group;
+
     GlobalArray<size_t> m_head_list; //!< Indexes for particles to read from the neighbor list
     GlobalArray<unsigned int>
         m_Nmax; //!< Holds the maximum number of neighbors for each particle type
@@ -545,6 +720,35 @@ class PYBIND11_EXPORT NeighborList : public Compute
     //! Build the head list to allocated memory
     virtual void buildHeadList();
 
+    //! Build the active consumer sublists from the neighbor list
+    virtual void buildSubLists();
+
+    //! Allocate the sublist arrays to match the size of the neighbor list
+    void allocateSubList(SubList& sublist);
+
+    //! Build the compressed neighbor list and all active compressed sublists
+    void compressNlists();
+
+    //! Compress one neighbor list
+    void compressNlist(const GlobalArray<unsigned int>& n_neigh,
+                       const GlobalArray<unsigned int>& nlist,
+                       GlobalArray<uint16_t>& nlist_compressed,
+                       GlobalArray<unsigned int>& nlist_base);
+
+    //! Find the active sublist of a consumer
+    const SubList* getActiveSubList(const std::shared_ptr<GlobalArray<Scalar>>& r_cut_matrix) const
+        {
+        if (!m_use_sublists)
+            return nullptr;
+
+        for (size_t i = 0; i < m_consumer_r_cut.size(); i++)
+            {
+            if (m_consumer_r_cut[i] == r_cut_matrix)
+                return m_sublists[i]->active ? m_sublists[i].get() : nullptr;
+            }
+        return nullptr;
+        }
+
     //! Amortized resizing of the neighborlist
     void resizeNlist(size_t size);
 
@@ -602,6 +806,12 @@ class PYBIND11_EXPORT NeighborList : public Compute
     //! Reallocate internal neighbor list data structures
     void reallocate();
 
+    //! Remap the neighbor list after an in-place particle permutation or force a full update
+    void slotParticleSort();
+
+    //! Remap the particle indices of a neighbor list after an in-place particle permutation
+    void permuteNlist(GlobalArray<unsigned int>& n_neigh, GlobalArray<unsigned int>& nlist);
+
     //! Check the status of the conditions
     bool checkConditions();
 
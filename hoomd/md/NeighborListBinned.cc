@@ -51,9 +51,14 @@ void NeighborListBinned::buildNlist(uint64_t timestep)
 
     // acquire the particle data and box dimension
     ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
-    ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                     access_location::host,
-                                     access_mode::read);
+    std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+    if (m_pdata->isAllocated(pdata_array::body))
+        {
+        h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                   access_location::host,
+                                                   access_mode::read));
+        }
+    const unsigned int* body = h_body ? h_body->data : nullptr;
 
     const BoxDim& box = m_pdata->getBox();
 
@@ -98,7 +103,7 @@ void NeighborListBinned::buildNlist(uint64_t timestep)
 
         const Scalar3 my_pos = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
         const unsigned int type_i = __scalar_as_int(h_pos.data[i].w);
-        const unsigned int body_i = h_body.data[i];
+        const unsigned int body_i = body ? body[i] : NO_BODY;
 
         const unsigned int Nmax_i = h_Nmax.data[type_i];
         const size_t head_idx_i = h_head_list.data[i];
@@ -143,7 +148,7 @@ void NeighborListBinned::buildNlist(uint64_t timestep)
                 // (3) they are in the same body
                 bool excluded = ((i == (int)cur_neigh) || (r_cut <= Scalar(0.0)));
                 if (m_filter_body && body_i != NO_BODY)
-                    excluded = excluded | (body_i == h_body.data[cur_neigh]);
+                    excluded = excluded | (body_i == body[cur_neigh]);
                 if (excluded)
                     continue;
 
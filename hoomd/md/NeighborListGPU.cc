@@ -48,6 +48,10 @@ bool NeighborListGPU::distanceCheck(uint64_t timestep)
     Scalar lambda_min = (lambda.x < lambda.y) ? lambda.x : lambda.y;
     lambda_min = (lambda_min < lambda.z) ? lambda_min : lambda.z;
 
+    // sublists are built with r_cut + r_buff of a smaller cutoff, which does not grow with the box
+    if (m_use_sublists)
+        lambda_min = std::min(lambda_min, Scalar(1.0));
+
     ArrayHandle<Scalar> d_rcut_max(m_rcut_max, access_location::device, access_mode::read);
 
         {
@@ -55,18 +59,40 @@ bool NeighborListGPU::distanceCheck(uint64_t timestep)
 
         m_exec_conf->beginMultiGPU();
 
-        kernel::gpu_nlist_needs_update_check_new(d_flags.data,
-                                                 d_last_pos.data,
-                                                 d_pos.data,
-                                                 m_pdata->getN(),
-                                                 box,
-                                                 d_rcut_max.data,
-                                                 m_r_buff,
-                                                 m_pdata->getNTypes(),
-                                                 lambda_min,
-                                                 lambda,
-                                                 ++m_checkn,
-                                                 m_pdata->getGPUPartition());
+        auto check_particles = [&](const unsigned int* d_index,
+                                   unsigned int N,
+                                   const GPUPartition& gpu_partition)
+        {
+            kernel::gpu_nlist_needs_update_check_new(d_flags.data,
+                                                     d_last_pos.data,
+                                                     d_pos.data,
+                                                     d_index,
+                                                     N,
+                                                     box,
+                                                     d_rcut_max.data,
+                                                     m_r_buff,
+                                                     m_pdata->getNTypes(),
+                                                     lambda_min,
+                                                     lambda,
+                                                     m_checkn,
+                                                     gpu_partition);
+        };
+
+        ++m_checkn;
+        if (m_check_group)
+            {
+            // only the particles in the check group can move
+            ArrayHandle<unsigned int> d_index(m_check_group->getIndexArray(),
+                                              access_location::device,
+                                              access_mode::read);
+            check_particles(d_index.data,
+                            m_check_group->getNumMembers(),
+                            m_check_group->getGPUPartition());
+            }
+        else
+            {
+            check_particles(nullptr, m_pdata->getN(), m_pdata->getGPUPartition());
+            }
 
         if (m_exec_conf->isCUDAErrorCheckingEnabled())
             CHECK_CUDA_ERROR();
@@ -128,6 +154,47 @@ void NeighborListGPU::filterNlist()
     m_tuner_filter->end();
     }
 
+/*! Calls gpu_nlist_build_sublist() to filter the neighbor list into each active sublist
+ */
+void NeighborListGPU::buildSubLists()
+    {
+    ArrayHandle<Scalar4> d_pos(m_pdata->getPositions(), access_location::device, access_mode::read);
+    ArrayHandle<unsigned int> d_n_neigh(m_n_neigh, access_location::device, access_mode::read);
+    ArrayHandle<unsigned int> d_nlist(m_nlist, access_location::device, access_mode::read);
+    ArrayHandle<size_t> d_head_list(m_head_list, access_location::device, access_mode::read);
+
+    for (auto& sublist : m_sublists)
+        {
+        if (!sublist->active)
+            continue;
+
+        allocateSubList(*sublist);
+
+        ArrayHandle<Scalar> d_r_listsq(sublist->r_listsq,
+                                       access_location::device,
+                                       access_mode::read);
+        ArrayHandle<unsigned int> d_sub_n_neigh(sublist->n_neigh,
+                                                access_location::device,
+                                                access_mode::overwrite);
+        ArrayHandle<unsigned int> d_sub_nlist(sublist->nlist,
+                                              access_location::device,
+                                              access_mode::overwrite);
+
+        kernel::gpu_nlist_build_sublist(d_sub_n_neigh.data,
+                                        d_sub_nlist.data,
+                                        d_n_neigh.data,
+                                        d_nlist.data,
+                                        d_head_list.data,
+                                        d_pos.data,
+                                        m_pdata->getBox(),
+                                        d_r_listsq.data,
+                                        m_typpair_idx,
+                                        m_pdata->getN());
+        if (m_exec_conf->isCUDAErrorCheckingEnabled())
+            CHECK_CUDA_ERROR();
+        }
+    }
+
 //! Update the exclusion list on the GPU
 void NeighborListGPU::updateExListIdx()
     {
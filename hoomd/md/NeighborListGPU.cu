@@ -26,6 +26,7 @@ namespace kernel
 /*! \param d_result Device pointer to a single uint. Will be set to 1 if an update is needed
     \param d_last_pos Particle positions at the time the nlist was last updated
     \param d_pos Current particle positions
+    \param d_index Indices of the particles to check (NULL to check all particles)
     \param nwork Number of particles this GPU processes
     \param box Box dimensions
     \param d_rcut_max The maximum rcut(i,j) that any particle of type i participates in
@@ -37,11 +38,13 @@ namespace kernel
 
     gpu_nlist_needs_update_check_new_kernel() executes one thread per particle. Every particle's
    current position is compared to its last position. If the particle has moved a distance more than
-   the buffer width, then *d_result is set to \a checkn.
+   the buffer width, then *d_result is set to \a checkn. When \a d_index is not NULL, the kernel
+   executes one thread per element of \a d_index and checks only those particles.
 */
 __global__ void gpu_nlist_needs_update_check_new_kernel(unsigned int* d_result,
                                                         const Scalar4* d_last_pos,
                                                         const Scalar4* d_pos,
+                                                        const unsigned int* d_index,
                                                         const unsigned int nwork,
                                                         const BoxDim box,
                                                         const Scalar* d_rcut_max,
@@ -59,6 +62,8 @@ __global__ void gpu_nlist_needs_update_check_new_kernel(unsigned int* d_result,
         {
         // get particle index
         idx += offset;
+        if (d_index)
+            idx = d_index[idx];
 
         Scalar4 cur_postype = d_pos[idx];
         Scalar3 cur_pos = make_scalar3(cur_postype.x, cur_postype.y, cur_postype.z);
@@ -86,6 +91,7 @@ __global__ void gpu_nlist_needs_update_check_new_kernel(unsigned int* d_result,
 hipError_t gpu_nlist_needs_update_check_new(unsigned int* d_result,
                                             const Scalar4* d_last_pos,
                                             const Scalar4* d_pos,
+                                            const unsigned int* d_index,
                                             const unsigned int N,
                                             const BoxDim& box,
                                             const Scalar* d_rcut_max,
@@ -113,6 +119,7 @@ hipError_t gpu_nlist_needs_update_check_new(unsigned int* d_result,
                            d_result,
                            d_last_pos,
                            d_pos,
+                           d_index,
                            nwork,
                            box,
                            d_rcut_max,
@@ -266,6 +273,94 @@ hipError_t gpu_nlist_filter(unsigned int* d_n_neigh,
     return hipSuccess;
     }
 
+/*! \param d_sub_n_neigh Number of neighbors in the sublist (output)
+    \param d_sub_nlist Sublist (output)
+    \param d_n_neigh Number of neighbors of each particle
+    \param d_nlist Neighbor list
+    \param d_head_list Head list indexing both \a d_nlist and \a d_sub_nlist
+    \param d_pos Particle positions
+    \param box Box dimensions
+    \param d_r_listsq Squared list radius of the sublist for each type pair
+    \param typpair_idx Indexer for type pairs
+    \param N Number of particles
+
+    gpu_nlist_build_sublist_kernel() executes one thread per particle. Each thread copies the
+    neighbors that are closer than the sublist radius to the sublist.
+*/
+__global__ void gpu_nlist_build_sublist_kernel(unsigned int* d_sub_n_neigh,
+                                               unsigned int* d_sub_nlist,
+                                               const unsigned int* d_n_neigh,
+                                               const unsigned int* d_nlist,
+                                               const size_t* d_head_list,
+                                               const Scalar4* d_pos,
+                                               const BoxDim box,
+                                               const Scalar* d_r_listsq,
+                                               const Index2D typpair_idx,
+                                               const unsigned int N)
+    {
+    const unsigned int idx = blockIdx.x * blockDim.x + threadIdx.x;
+
+    if (idx >= N)
+        return;
+
+    const Scalar4 postype_i = d_pos[idx];
+    const Scalar3 pos_i = make_scalar3(postype_i.x, postype_i.y, postype_i.z);
+    const unsigned int type_i = __scalar_as_int(postype_i.w);
+    const size_t head_i = d_head_list[idx];
+    const unsigned int n_neigh = d_n_neigh[idx];
+
+    unsigned int n_sub = 0;
+    for (unsigned int k = 0; k < n_neigh; k++)
+        {
+        const unsigned int j = d_nlist[head_i + k];
+        const Scalar4 postype_j = d_pos[j];
+        const Scalar3 pos_j = make_scalar3(postype_j.x, postype_j.y, postype_j.z);
+        const unsigned int type_j = __scalar_as_int(postype_j.w);
+
+        const Scalar3 dx = box.minImage(pos_i - pos_j);
+        if (dot(dx, dx) < __ldg(d_r_listsq + typpair_idx(type_i, type_j)))
+            {
+            d_sub_nlist[head_i + n_sub] = j;
+            n_sub++;
+            }
+        }
+
+    d_sub_n_neigh[idx] = n_sub;
+    }
+
+hipError_t gpu_nlist_build_sublist(unsigned int* d_sub_n_neigh,
+                                   unsigned int* d_sub_nlist,
+                                   const unsigned int* d_n_neigh,
+                                   const unsigned int* d_nlist,
+                                   const size_t* d_head_list,
+                                   const Scalar4* d_pos,
+                                   const BoxDim& box,
+                                   const Scalar* d_r_listsq,
+                                   const Index2D& typpair_idx,
+                                   const unsigned int N)
+    {
+    const unsigned int block_size = 256;
+    const unsigned int n_blocks = N / block_size + 1;
+
+    hipLaunchKernelGGL((gpu_nlist_build_sublist_kernel),
+                       dim3(n_blocks),
+                       dim3(block_size),
+                       0,
+                       0,
+                       d_sub_n_neigh,
+                       d_sub_nlist,
+                       d_n_neigh,
+                       d_nlist,
+                       d_head_list,
+                       d_pos,
+                       box,
+                       d_r_listsq,
+                       typpair_idx,
+                       N);
+
+    return hipSuccess;
+    }
+
 //! GPU kernel to update the exclusions list
 __global__ void gpu_update_exclusion_list_kernel(const unsigned int* tags,
                                                  const unsigned int* rtags,
@@ -25,6 +25,7 @@ namespace kernel
 hipError_t gpu_nlist_needs_update_check_new(unsigned int* d_result,
                                             const Scalar4* d_last_pos,
                                             const Scalar4* d_pos,
+                                            const unsigned int* d_index,
                                             const unsigned int N,
                                             const BoxDim& box,
                                             const Scalar* d_rcut_max,
@@ -45,6 +46,18 @@ hipError_t gpu_nlist_filter(unsigned int* d_n_neigh,
                             const unsigned int N,
                             const unsigned int block_size);
 
+//! Kernel driver for gpu_nlist_build_sublist_kernel()
+hipError_t gpu_nlist_build_sublist(unsigned int* d_sub_n_neigh,
+                                   unsigned int* d_sub_nlist,
+                                   const unsigned int* d_n_neigh,
+                                   const unsigned int* d_nlist,
+                                   const size_t* d_head_list,
+                                   const Scalar4* d_pos,
+                                   const BoxDim& box,
+                                   const Scalar* d_r_listsq,
+                                   const Index2D& typpair_idx,
+                                   const unsigned int N);
+
 //! Kernel driver to build head list on gpu
 hipError_t gpu_nlist_build_head_list(size_t* d_head_list,
                                      size_t* d_req_size_nlist,
@@ -122,6 +122,9 @@ class PYBIND11_EXPORT NeighborListGPU : public NeighborList
     //! Build the head list for neighbor list indexing on the GPU
     virtual void buildHeadList();
 
+    //! Build the active consumer sublists on the GPU
+    virtual void buildSubLists();
+
     //! Schedule the distance check kernel
     /*! \param timestep Current time step
      */
@@ -278,9 +278,15 @@ void NeighborListTree::traverseTree()
     ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(),
                                    access_location::host,
                                    access_mode::read);
-    ArrayHandle<unsigned int> h_body(m_pdata->getBodies(),
-                                     access_location::host,
-                                     access_mode::read);
+    // no particle belongs to a body until the body array is allocated
+    std::unique_ptr<ArrayHandle<unsigned int>> h_body;
+    if (m_pdata->isAllocated(pdata_array::body))
+        {
+        h_body.reset(new ArrayHandle<unsigned int>(m_pdata->getBodies(),
+                                                   access_location::host,
+                                                   access_mode::read));
+        }
+    const unsigned int* body = h_body ? h_body->data : nullptr;
 
     ArrayHandle<Scalar> h_r_cut(m_r_cut, access_location::host, access_mode::read);
 
@@ -300,7 +306,7 @@ void NeighborListTree::traverseTree()
         const Scalar4 postype_i = h_postype.data[i];
         const vec3<Scalar> pos_i = vec3<Scalar>(postype_i);
         const unsigned int type_i = __scalar_as_int(postype_i.w);
-        const unsigned int body_i = h_body.data[i];
+        const unsigned int body_i = body ? body[i] : NO_BODY;
 
         const unsigned int Nmax_i = h_Nmax.data[type_i];
         const size_t nlist_head_i = h_head_list.data[i];
@@ -352,7 +358,7 @@ void NeighborListTree::traverseTree()
                                 bool excluded = (i == j);
 
                                 if (m_filter_body && body_i != NO_BODY)
-                                    excluded = excluded | (body_i == h_body.data[j]);
+                                    excluded = excluded | (body_i == body[j]);
 
                                 if (!excluded)
                                     {
@@ -124,32 +124,41 @@ void OPLSDihedralForceCompute::computeForces(uint64_t timestep)
     assert(h_pos.data);
     assert(h_rtag.data);
 
-    size_t virial_pitch = m_virial.getPitch();
-
-    // From LAMMPS OPLS dihedral implementation
-    unsigned int i1, i2, i3, i4, n, dihedral_type;
-    Scalar3 vb1, vb2, vb3, vb2m;
-
-    // this volatile is not strictly needed, but it works around a compiler bug on Mac arm64
-    // with Apple clang version 13.0.0 (clang-1300.0.29.30)
-    // without the volatile, the x component of f2 is always computed the same as the y component
-    volatile Scalar4 f1, f2, f3, f4;
-    Scalar ax, ay, az, bx, by, bz, rasq, rbsq, rgsq, rg, rginv, ra2inv, rb2inv, rabinv;
-    Scalar df, df1, ddf1, fg, hg, fga, hgb, gaa, gbb;
-    Scalar dtfx, dtfy, dtfz, dtgx, dtgy, dtgz, dthx, dthy, dthz;
-    Scalar c, s, p, sx2, sy2, sz2, cos_term, e_dihedral;
-    Scalar k1, k2, k3, k4;
-    Scalar dihedral_virial[6];
-
     // get a local copy of the simulation box
     const BoxDim& box = m_pdata->getBox();
 
-    // iterate through each dihedral
-    const unsigned int numDihedrals = (unsigned int)m_dihedral_data->getN();
-    for (n = 0; n < numDihedrals; n++)
-        {
+    // access the dihedral data
+    ArrayHandle<DihedralData::members_t> h_dihedrals(m_dihedral_data->getMembersArray(),
+                                                     access_location::host,
+                                                     access_mode::read);
+    ArrayHandle<typeval_t> h_typeval(m_dihedral_data->getTypeValArray(),
+                                     access_location::host,
+                                     access_mode::read);
+
+    // compute the forces on the particles in dihedral n
+    auto compute_dihedral = [&](unsigned int n,
+                                Scalar4* force,
+                                Scalar* virial,
+                                size_t virial_pitch)
+    {
+        // From LAMMPS OPLS dihedral implementation
+        unsigned int i1, i2, i3, i4, dihedral_type;
+        Scalar3 vb1, vb2, vb3, vb2m;
+
+        // this volatile is not strictly needed, but it works around a compiler bug on Mac arm64
+        // with Apple clang version 13.0.0 (clang-1300.0.29.30)
+        // without the volatile, the x component of f2 is always computed the same as the y
+        // component
+        volatile Scalar4 f1, f2, f3, f4;
+        Scalar ax, ay, az, bx, by, bz, rasq, rbsq, rgsq, rg, rginv, ra2inv, rb2inv, rabinv;
+        Scalar df, df1, ddf1, fg, hg, fga, hgb, gaa, gbb;
+        Scalar dtfx, dtfy, dtfz, dtgx, dtgy, dtgz, dthx, dthy, dthz;
+        Scalar c, s, p, sx2, sy2, sz2, cos_term, e_dihedral;
+        Scalar k1, k2, k3, k4;
+        Scalar dihedral_virial[6];
+
         // lookup the tag of each of the particles participating in the dihedral
-        const ImproperData::members_t& dihedral = m_dihedral_data->getMembersByIndex(n);
+        const DihedralData::members_t& dihedral = h_dihedrals.data[n];
         assert(dihedral.tag[0] < m_pdata->getNGlobal());
         assert(dihedral.tag[1] < m_pdata->getNGlobal());
         assert(dihedral.tag[2] < m_pdata->getNGlobal());
@@ -164,11 +173,11 @@ void OPLSDihedralForceCompute::computeForces(uint64_t timestep)
         // throw an error if this angle is incomplete
         if (i1 == NOT_LOCAL || i2 == NOT_LOCAL || i3 == NOT_LOCAL || i4 == NOT_LOCAL)
             {
-            this->m_exec_conf->msg->error()
-                << "dihedral.opls: dihedral " << dihedral.tag[0] << " " << dihedral.tag[1] << " "
-                << dihedral.tag[2] << " " << dihedral.tag[3] << " incomplete." << endl
-                << endl;
-            throw std::runtime_error("Error in dihedral calculation");
+            std::ostringstream stream;
+            stream << "Error: dihedral.opls: dihedral " << dihedral.tag[0] << " "
+                   << dihedral.tag[1] << " " << dihedral.tag[2] << " " << dihedral.tag[3]
+                   << " incomplete.";
+            throw std::runtime_error(stream.str());
             }
 
         assert(i1 < m_pdata->getN() + m_pdata->getNGhosts());
@@ -237,7 +246,7 @@ void OPLSDihedralForceCompute::computeForces(uint64_t timestep)
 
         // get values for k1/2 through k4/2
         // ----- The 1/2 factor is already stored in the parameters --------
-        dihedral_type = m_dihedral_data->getTypeByIndex(n);
+        dihedral_type = h_typeval.data[n].type;
         k1 = h_params.data[dihedral_type].x;
         k2 = h_params.data[dihedral_type].y;
         k3 = h_params.data[dihedral_type].z;
@@ -323,22 +332,22 @@ void OPLSDihedralForceCompute::computeForces(uint64_t timestep)
         f3.w = e_dihedral;
 
         // Apply force to each of the 4 atoms
-        h_force.data[i1].x = h_force.data[i1].x + f1.x;
-        h_force.data[i1].y = h_force.data[i1].y + f1.y;
-        h_force.data[i1].z = h_force.data[i1].z + f1.z;
-        h_force.data[i1].w = h_force.data[i1].w + f1.w;
-        h_force.data[i2].x = h_force.data[i2].x + f2.x;
-        h_force.data[i2].y = h_force.data[i2].y + f2.y;
-        h_force.data[i2].z = h_force.data[i2].z + f2.z;
-        h_force.data[i2].w = h_force.data[i2].w + f2.w;
-        h_force.data[i3].x = h_force.data[i3].x + f3.x;
-        h_force.data[i3].y = h_force.data[i3].y + f3.y;
-        h_force.data[i3].z = h_force.data[i3].z + f3.z;
-        h_force.data[i3].w = h_force.data[i3].w + f3.w;
-        h_force.data[i4].x = h_force.data[i4].x + f4.x;
-        h_force.data[i4].y = h_force.data[i4].y + f4.y;
-        h_force.data[i4].z = h_force.data[i4].z + f4.z;
-        h_force.data[i4].w = h_force.data[i4].w + f4.w;
+        force[i1].x = force[i1].x + f1.x;
+        force[i1].y = force[i1].y + f1.y;
+        force[i1].z = force[i1].z + f1.z;
+        force[i1].w = force[i1].w + f1.w;
+        force[i2].x = force[i2].x + f2.x;
+        force[i2].y = force[i2].y + f2.y;
+        force[i2].z = force[i2].z + f2.z;
+        force[i2].w = force[i2].w + f2.w;
+        force[i3].x = force[i3].x + f3.x;
+        force[i3].y = force[i3].y + f3.y;
+        force[i3].z = force[i3].z + f3.z;
+        force[i3].w = force[i3].w + f3.w;
+        force[i4].x = force[i4].x + f4.x;
+        force[i4].y = force[i4].y + f4.y;
+        force[i4].z = force[i4].z + f4.z;
+        force[i4].w = force[i4].w + f4.w;
 
         // Compute 1/4 of the virial, 1/4 for each atom in the dihedral
         // upper triangular version of virial tensor
@@ -351,12 +360,21 @@ void OPLSDihedralForceCompute::computeForces(uint64_t timestep)
 
         for (int k = 0; k < 6; k++)
             {
-            h_virial.data[virial_pitch * k + i1] += dihedral_virial[k];
-            h_virial.data[virial_pitch * k + i2] += dihedral_virial[k];
-            h_virial.data[virial_pitch * k + i3] += dihedral_virial[k];
-            h_virial.data[virial_pitch * k + i4] += dihedral_virial[k];
+            virial[virial_pitch * k + i1] += dihedral_virial[k];
+            virial[virial_pitch * k + i2] += dihedral_virial[k];
+            virial[virial_pitch * k + i3] += dihedral_virial[k];
+            virial[virial_pitch * k + i4] += dihedral_virial[k];
             }
-        }
+    };
+
+    // for each of the dihedrals
+    m_force_scatter.compute(m_exec_conf,
+                            (unsigned int)m_dihedral_data->getN(),
+                            m_pdata->getN() + m_pdata->getNGhosts(),
+                            h_force.data,
+                            h_virial.data,
+                            m_virial.getPitch(),
+                            compute_dihedral);
     }
 
 namespace detail
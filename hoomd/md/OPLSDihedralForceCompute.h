@@ -1,6 +1,7 @@
 // Copyright (c) 2009-2023 The Regents of the University of Michigan.
 // Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+#include "BondedForceScatter.h"
 #include "hoomd/BondedGroupData.h"
 #include "hoomd/ForceCompute.h"
 
@@ -93,6 +94,9 @@ class PYBIND11_EXPORT OPLSDihedralForceCompute : public ForceCompute
     //!< Dihedral data to use in computing dihedrals
     std::shared_ptr<DihedralData> m_dihedral_data;
 
+    //! Evaluates dihedrals on multiple threads
+    detail::BondedForceScatter m_force_scatter;
+
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
     };
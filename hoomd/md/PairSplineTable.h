@@ -0,0 +1,208 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#ifndef __PAIR_SPLINE_TABLE_H__
+#define __PAIR_SPLINE_TABLE_H__
+
+#include "hoomd/HOOMDMath.h"
+
+#include <cmath>
+#include <vector>
+
+/*! \file PairSplineTable.h
+    \brief Defines cubic spline tables of isotropic pair potentials
+*/
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+namespace hoomd
+    {
+namespace md
+    {
+namespace detail
+    {
+//! Cubic spline table of the energy and force of an isotropic pair potential
+/*! PairSplineTable tabulates the pair energy V and force_divr = F/r as functions of \a rsq on a
+    uniform grid between \a rsq_min and \a rsq_max and interpolates with cubic splines.
+    Tabulating in rsq avoids the square root in the pair loop. The table stores the coefficients of
+    the cubic polynomial in every interval, so an evaluation costs one table read and two Horner
+    sums.
+
+    build() refines the grid until the splines reproduce the analytic form at the interval
+    midpoints within a relative tolerance of the largest magnitude of V and force_divr in the
+    table. When the tolerance cannot be met with the maximum number of intervals, the table is
+    left invalid and callers should evaluate the analytic form.
+*/
+class PairSplineTable
+    {
+    public:
+    //! Default number of intervals to start the refinement with
+    static constexpr unsigned int min_intervals = 512;
+
+    //! Maximum number of intervals
+    static constexpr unsigned int max_intervals = 65536;
+
+    //! Construct an empty (invalid) table
+    PairSplineTable() : m_rsq_min(0), m_rsq_max(0), m_inv_drsq(0), m_valid(false) { }
+
+    //! Build the table from a function
+    /*! \param f Callable f(rsq, force_divr, pair_eng) that evaluates the analytic form
+        \param rsq_min Squared distance at the start of the table
+        \param rsq_max Squared distance at the end of the table
+        \param tolerance Relative error tolerance
+        \returns true when the table meets the tolerance
+    */
+    template<class F> bool build(const F& f, Scalar rsq_min, Scalar rsq_max, Scalar tolerance)
+        {
+        m_valid = false;
+        m_coeff.clear();
+        if (!(rsq_max > rsq_min))
+            return false;
+
+        m_rsq_min = rsq_min;
+        m_rsq_max = rsq_max;
+
+        for (unsigned int n = min_intervals; n <= max_intervals; n *= 2)
+            {
+            const Scalar drsq = (rsq_max - rsq_min) / Scalar(n);
+            m_inv_drsq = Scalar(1.0) / drsq;
+
+            // sample the knots, the last one just inside the end of the table
+            std::vector<Scalar> V(n + 1), Fr(n + 1);
+            for (unsigned int k = 0; k <= n; k++)
+                {
+                Scalar rsq
+                    = (k == n) ? std::nextafter(rsq_max, rsq_min) : rsq_min + Scalar(k) * drsq;
+                f(rsq, Fr[k], V[k]);
+                }
+
+            m_coeff.resize(2 * n);
+            fit(V, 0);
+            fit(Fr, 1);
+
+            // compare to the analytic form at the midpoints, where the error is largest
+            Scalar V_max(0.0), Fr_max(0.0), V_err(0.0), Fr_err(0.0);
+            for (unsigned int k = 0; k <= n; k++)
+                {
+                V_max = std::max(V_max, std::abs(V[k]));
+                Fr_max = std::max(Fr_max, std::abs(Fr[k]));
+                }
+
+            bool finite = std::isfinite(V_max) && std::isfinite(Fr_max);
+            for (unsigned int k = 0; k < n && finite; k++)
+                {
+                Scalar rsq = rsq_min + (Scalar(k) + Scalar(0.5)) * drsq;
+                Scalar V_exact(0.0), Fr_exact(0.0), V_table, Fr_table;
+                f(rsq, Fr_exact, V_exact);
+                evaluate(rsq, Fr_table, V_table);
+                V_err = std::max(V_err, std::abs(V_table - V_exact));
+                Fr_err = std::max(Fr_err, std::abs(Fr_table - Fr_exact));
+                }
+
+            if (finite && V_err <= tolerance * V_max && Fr_err <= tolerance * Fr_max)
+                {
+                m_valid = true;
+                return true;
+                }
+            }
+
+        m_coeff.clear();
+        return false;
+        }
+
+    //! Test if the table is valid
+    bool isValid() const
+        {
+        return m_valid;
+        }
+
+    //! Test if the table covers a squared distance
+    bool covers(Scalar rsq) const
+        {
+        return m_valid && rsq >= m_rsq_min && rsq < m_rsq_max;
+        }
+
+    //! Interpolate the force and energy
+    /*! \param rsq Squared distance, must be covered by the table
+        \param force_divr Output parameter to write the interpolated force divided by r.
+        \param pair_eng Output parameter to write the interpolated pair energy.
+    */
+    void evaluate(Scalar rsq, Scalar& force_divr, Scalar& pair_eng) const
+        {
+        const Scalar x = (rsq - m_rsq_min) * m_inv_drsq;
+        unsigned int k = static_cast<unsigned int>(x);
+        const unsigned int n = static_cast<unsigned int>(m_coeff.size() / 2);
+        if (k >= n)
+            k = n - 1;
+        const Scalar t = x - Scalar(k);
+
+        const Scalar4& v = m_coeff[2 * k];
+        const Scalar4& fr = m_coeff[2 * k + 1];
+        pair_eng = v.x + t * (v.y + t * (v.z + t * v.w));
+        force_divr = fr.x + t * (fr.y + t * (fr.z + t * fr.w));
+        }
+
+    private:
+    Scalar m_rsq_min;             //!< Squared distance at the start of the table
+    Scalar m_rsq_max;             //!< Squared distance at the end of the table
+    Scalar m_inv_drsq;            //!< Inverse of the interval width
+    bool m_valid;                 //!< True when the table meets the tolerance
+    std::vector<Scalar4> m_coeff; //!< Polynomial coefficients of V and force_divr per interval
+
+    //! Fit a cubic spline to uniformly spaced samples
+    /*! \param y Samples at the n+1 knots
+        \param offset 0 to store the coefficients of V, 1 for force_divr
+
+        In units of the interval width, the second derivatives M_k of the spline solve
+        M_{k-1} + 4 M_k + M_{k+1} = 6 (y_{k+1} - 2 y_k + y_{k-1}). M_0 and M_n are set to second
+        order one-sided finite differences, which keeps the error at the ends of the table of the
+        same order as in the interior.
+    */
+    void fit(const std::vector<Scalar>& y, unsigned int offset)
+        {
+        const unsigned int n = (unsigned int)y.size() - 1;
+        std::vector<Scalar> M(n + 1, Scalar(0.0));
+        std::vector<Scalar> c(n + 1, Scalar(0.0));
+        std::vector<Scalar> d(n + 1, Scalar(0.0));
+
+        M[0] = Scalar(2.0) * y[0] - Scalar(5.0) * y[1] + Scalar(4.0) * y[2] - y[3];
+        M[n] = Scalar(2.0) * y[n] - Scalar(5.0) * y[n - 1] + Scalar(4.0) * y[n - 2] - y[n - 3];
+
+        // Thomas algorithm for the tridiagonal system in M_1 ... M_{n-1}
+        for (unsigned int k = 1; k < n; k++)
+            {
+            Scalar rhs = Scalar(6.0) * (y[k + 1] - Scalar(2.0) * y[k] + y[k - 1]);
+            if (k == 1)
+                rhs -= M[0];
+            if (k == n - 1)
+                rhs -= M[n];
+
+            Scalar denom = Scalar(4.0) - c[k - 1];
+            c[k] = Scalar(1.0) / denom;
+            d[k] = (rhs - d[k - 1]) / denom;
+            }
+
+        M[n - 1] = d[n - 1];
+        for (unsigned int k = n - 2; k >= 1; k--)
+            {
+            M[k] = d[k] - c[k] * M[k + 1];
+            }
+
+        for (unsigned int k = 0; k < n; k++)
+            {
+            Scalar4& coeff = m_coeff[2 * k + offset];
+            coeff.x = y[k];
+            coeff.y = (y[k + 1] - y[k]) - (Scalar(2.0) * M[k] + M[k + 1]) / Scalar(6.0);
+            coeff.z = M[k] / Scalar(2.0);
+            coeff.w = (M[k + 1] - M[k]) / Scalar(6.0);
+            }
+        }
+    };
+
+    } // end namespace detail
+    } // end namespace md
+    } // end namespace hoomd
+
+#endif // __PAIR_SPLINE_TABLE_H__
@@ -1,6 +1,7 @@
 // Copyright (c) 2009-2023 The Regents of the University of Michigan.
 // Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+#include "BondedForceScatter.h"
 #include "hoomd/ForceCompute.h"
 #include "hoomd/GPUArray.h"
 #include "hoomd/MeshDefinition.h"
@@ -63,6 +64,7 @@ template<class evaluator, class Bonds> class PotentialBond : public ForceCompute
     protected:
     GPUArray<param_type> m_params;      //!< Bond parameters per type
     std::shared_ptr<Bonds> m_bond_data; //!< Bond data to use in computing bonds
+    detail::BondedForceScatter m_force_scatter; //!< Evaluates bonds on multiple threads
 
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
@@ -197,10 +199,6 @@ void PotentialBond<evaluator, Bonds>::computeForces(uint64_t timestep)
     PDataFlags flags = this->m_pdata->getFlags();
     bool compute_virial = flags[pdata_flag::pressure_tensor];
 
-    Scalar bond_virial[6];
-    for (unsigned int i = 0; i < 6; i++)
-        bond_virial[i] = Scalar(0.0);
-
     ArrayHandle<typename Bonds::members_t> h_bonds(m_bond_data->getMembersArray(),
                                                    access_location::host,
                                                    access_mode::read);
@@ -210,11 +208,11 @@ void PotentialBond<evaluator, Bonds>::computeForces(uint64_t timestep)
 
     unsigned int max_local = m_pdata->getN() + m_pdata->getNGhosts();
 
-    // for each of the bonds
-    const unsigned int size = (unsigned int)m_bond_data->getN();
+    const unsigned int N = m_pdata->getN();
 
-    for (unsigned int i = 0; i < size; i++)
-        {
+    // compute the force on both particles in bond i
+    auto compute_bond = [&](unsigned int i, Scalar4* force, Scalar* virial, size_t virial_pitch)
+    {
         // lookup the tag of each of the particles participating in the bond
         const typename Bonds::members_t& bond = h_bonds.data[i];
         assert(bond.tag[0] < m_pdata->getMaximumTag() + 1);
@@ -269,6 +267,8 @@ void PotentialBond<evaluator, Bonds>::computeForces(uint64_t timestep)
 
         if (evaluated)
             {
+            Scalar bond_virial[6] = {Scalar(0.0)};
+
             // calculate virial
             if (compute_virial)
                 {
@@ -282,36 +282,45 @@ void PotentialBond<evaluator, Bonds>::computeForces(uint64_t timestep)
                 }
 
             // add the force to the particles (only for non-ghost particles)
-            if (idx_b < m_pdata->getN())
+            if (idx_b < N)
                 {
-                h_force.data[idx_b].x += force_divr * dx.x;
-                h_force.data[idx_b].y += force_divr * dx.y;
-                h_force.data[idx_b].z += force_divr * dx.z;
-                h_force.data[idx_b].w += bond_eng;
+                force[idx_b].x += force_divr * dx.x;
+                force[idx_b].y += force_divr * dx.y;
+                force[idx_b].z += force_divr * dx.z;
+                force[idx_b].w += bond_eng;
                 if (compute_virial)
                     for (unsigned int i = 0; i < 6; i++)
-                        h_virial.data[i * m_virial_pitch + idx_b] += bond_virial[i];
+                        virial[i * virial_pitch + idx_b] += bond_virial[i];
                 }
 
-            if (idx_a < m_pdata->getN())
+            if (idx_a < N)
                 {
-                h_force.data[idx_a].x -= force_divr * dx.x;
-                h_force.data[idx_a].y -= force_divr * dx.y;
-                h_force.data[idx_a].z -= force_divr * dx.z;
-                h_force.data[idx_a].w += bond_eng;
+                force[idx_a].x -= force_divr * dx.x;
+                force[idx_a].y -= force_divr * dx.y;
+                force[idx_a].z -= force_divr * dx.z;
+                force[idx_a].w += bond_eng;
                 if (compute_virial)
                     for (unsigned int i = 0; i < 6; i++)
-                        h_virial.data[i * m_virial_pitch + idx_a] += bond_virial[i];
+                        virial[i * virial_pitch + idx_a] += bond_virial[i];
                 }
             }
         else
             {
-            this->m_exec_conf->msg->error()
-                << "bond." << evaluator::getName() << ": bond out of bounds" << std::endl
-                << std::endl;
-            throw std::runtime_error("Error in bond calculation");
+            std::ostringstream stream;
+            stream << "Error: bond." << evaluator::getName() << ": bond " << bond.tag[0] << " "
+                   << bond.tag[1] << " out of bounds.";
+            throw std::runtime_error(stream.str());
             }
-        }
+    };
+
+    // for each of the bonds
+    m_force_scatter.compute(m_exec_conf,
+                            (unsigned int)m_bond_data->getN(),
+                            max_local,
+                            h_force.data,
+                            h_virial.data,
+                            m_virial_pitch,
+                            compute_bond);
     }
 
 #ifdef ENABLE_MPI
@@ -11,6 +11,7 @@
 #include <stdexcept>
 
 #include "NeighborList.h"
+#include "PairSplineTable.h"
 #include "hoomd/ForceCompute.h"
 #include "hoomd/GlobalArray.h"
 #include "hoomd/HOOMDMath.h"
@@ -95,6 +96,10 @@ template<class evaluator> class PotentialPair : public ForceCompute
     //! Set and get the pair parameters for a single type pair
     virtual void setParams(unsigned int typ1, unsigned int typ2, const param_type& param);
     virtual void setParamsPython(pybind11::tuple typ, pybind11::dict params);
+    /// Set the params for all pairs of the given types from per parameter matrices
+    void setParamsMatrixPython(pybind11::list types,
+                               pybind11::dict matrices,
+                               pybind11::dict constants);
     /// Get params for a single type pair using a tuple of strings
     virtual pybind11::dict getParams(pybind11::tuple typ);
     //! Set the rcut for a single type pair
@@ -103,6 +108,8 @@ template<class evaluator> class PotentialPair : public ForceCompute
     Scalar getRCut(pybind11::tuple types);
     /// Set the rcut for a single type pair using a tuple of strings
     virtual void setRCutPython(pybind11::tuple types, Scalar r_cut);
+    /// Set the r_cut for all pairs of the given types from a matrix
+    void setRCutMatrixPython(pybind11::list types, pybind11::array_t<Scalar> r_cut);
     //! Set ron for a single type pair
     virtual void setRon(unsigned int typ1, unsigned int typ2, Scalar ron);
     /// Get the r_on for a single type pair
@@ -124,10 +131,12 @@ template<class evaluator> class PotentialPair : public ForceCompute
     void setShiftMode(energyShiftMode mode)
         {
         m_shift_mode = mode;
+        m_tables_valid = false;
         }
 
     void setShiftModePython(std::string mode)
         {
+        m_tables_valid = false;
         if (mode == "none")
             {
             m_shift_mode = no_shift;
@@ -182,6 +191,23 @@ template<class evaluator> class PotentialPair : public ForceCompute
         return m_tail_correction_enabled;
         }
 
+    //! Set whether to evaluate the potential with cubic spline tables
+    void setTabulate(bool tabulate)
+        {
+        if (tabulate && evaluator::needsCharge())
+            {
+            throw std::runtime_error("Pair potentials that depend on the particle charges cannot "
+                                     "be tabulated.");
+            }
+        m_tabulate = tabulate;
+        m_tables_valid = false;
+        }
+
+    bool getTabulate()
+        {
+        return m_tabulate;
+        }
+
 #ifdef ENABLE_MPI
     //! Get ghost particle fields requested by this pair potential
     virtual CommFlags getRequestedCommFlags(uint64_t timestep);
@@ -236,6 +262,28 @@ template<class evaluator> class PotentialPair : public ForceCompute
     bool m_attached = true;
 
     bool m_tail_correction_enabled = false;
+
+    /// Relative error tolerance of the spline tables
+    static constexpr Scalar tabulation_tolerance = 1e-6;
+
+    /// Largest pair energy magnitude to tabulate, closer pairs use the analytic form
+    static constexpr Scalar tabulation_max_energy = 100.0;
+
+    /// Number of points to sample when searching for the start of each table
+    static constexpr unsigned int tabulation_search_points = 1000;
+
+    /// Evaluate the potential with cubic spline tables when true
+    bool m_tabulate = false;
+
+    /// True when m_tables is up to date with the parameters
+    bool m_tables_valid = false;
+
+    /// Spline tables per type pair
+    std::vector<detail::PairSplineTable> m_tables;
+
+    /// Build the spline tables
+    void updateTables();
+
     /// r_cut (not squared) given to the neighbor list
     std::shared_ptr<GlobalArray<Scalar>> m_r_cut_nlist;
 
@@ -471,6 +519,7 @@ void PotentialPair<evaluator>::setParams(unsigned int typ1,
     validateTypes(typ1, typ2, "setting params");
     m_params[m_typpair_idx(typ1, typ2)] = param;
     m_params[m_typpair_idx(typ2, typ1)] = param;
+    m_tables_valid = false;
     }
 
 template<class evaluator>
@@ -481,6 +530,57 @@ void PotentialPair<evaluator>::setParamsPython(pybind11::tuple typ, pybind11::di
     setParams(typ1, typ2, param_type(params, m_exec_conf->isCUDAEnabled()));
     }
 
+/*! \param types Names of the types that index the rows and columns of the matrices
+    \param matrices Dictionary of N x N arrays, one for each scalar parameter
+    \param constants Dictionary of parameters that have the same value for all pairs
+
+    Sets the parameters for every pair (types[i], types[j]) with i <= j using element (i, j) of the
+    matrices. This replaces one Python call per type pair with a single call.
+*/
+template<class evaluator>
+void PotentialPair<evaluator>::setParamsMatrixPython(pybind11::list types,
+                                                     pybind11::dict matrices,
+                                                     pybind11::dict constants)
+    {
+    const size_t n = pybind11::len(types);
+    std::vector<unsigned int> type_ids(n);
+    for (size_t i = 0; i < n; i++)
+        {
+        type_ids[i] = m_pdata->getTypeByName(types[i].cast<std::string>());
+        }
+
+    typedef pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast>
+        matrix_type;
+    std::vector<std::pair<pybind11::str, matrix_type>> columns;
+    for (auto item : matrices)
+        {
+        auto matrix = item.second.cast<matrix_type>();
+        if (matrix.ndim() != 2 || size_t(matrix.shape(0)) != n || size_t(matrix.shape(1)) != n)
+            {
+            throw std::invalid_argument("Parameter matrices must have shape (N, N).");
+            }
+        columns.emplace_back(item.first.cast<pybind11::str>(), matrix);
+        }
+
+    pybind11::dict params;
+    for (auto item : constants)
+        {
+        params[item.first] = item.second;
+        }
+
+    for (size_t i = 0; i < n; i++)
+        {
+        for (size_t j = i; j < n; j++)
+            {
+            for (auto& column : columns)
+                {
+                params[column.first] = column.second.at(i, j);
+                }
+            setParams(type_ids[i], type_ids[j], param_type(params, m_exec_conf->isCUDAEnabled()));
+            }
+        }
+    }
+
 template<class evaluator> pybind11::dict PotentialPair<evaluator>::getParams(pybind11::tuple typ)
     {
     auto typ1 = m_pdata->getTypeByName(typ[0].cast<std::string>());
@@ -528,6 +628,7 @@ void PotentialPair<evaluator>::setRcut(unsigned int typ1, unsigned int typ2, Sca
 
     // notify the neighbor list that we have changed r_cut values
     m_nlist->notifyRCutMatrixChange();
+    m_tables_valid = false;
     }
 
 template<class evaluator>
@@ -538,6 +639,35 @@ void PotentialPair<evaluator>::setRCutPython(pybind11::tuple types, Scalar r_cut
     setRcut(typ1, typ2, r_cut);
     }
 
+/*! \param types Names of the types that index the rows and columns of \a r_cut
+    \param r_cut N x N array of cutoff radii
+*/
+template<class evaluator>
+void PotentialPair<evaluator>::setRCutMatrixPython(pybind11::list types,
+                                                   pybind11::array_t<Scalar> r_cut)
+    {
+    const size_t n = pybind11::len(types);
+    if (r_cut.ndim() != 2 || size_t(r_cut.shape(0)) != n || size_t(r_cut.shape(1)) != n)
+        {
+        throw std::invalid_argument("r_cut must have shape (N, N).");
+        }
+
+    std::vector<unsigned int> type_ids(n);
+    for (size_t i = 0; i < n; i++)
+        {
+        type_ids[i] = m_pdata->getTypeByName(types[i].cast<std::string>());
+        }
+
+    auto h_r_cut = r_cut.unchecked<2>();
+    for (size_t i = 0; i < n; i++)
+        {
+        for (size_t j = i; j < n; j++)
+            {
+            setRcut(type_ids[i], type_ids[j], h_r_cut(i, j));
+            }
+        }
+    }
+
 template<class evaluator> Scalar PotentialPair<evaluator>::getRCut(pybind11::tuple types)
     {
     auto typ1 = m_pdata->getTypeByName(types[0].cast<std::string>());
@@ -560,6 +690,7 @@ void PotentialPair<evaluator>::setRon(unsigned int typ1, unsigned int typ2, Scal
     ArrayHandle<Scalar> h_ronsq(m_ronsq, access_location::host, access_mode::readwrite);
     h_ronsq.data[m_typpair_idx(typ1, typ2)] = ron * ron;
     h_ronsq.data[m_typpair_idx(typ2, typ1)] = ron * ron;
+    m_tables_valid = false;
     }
 
 template<class evaluator> Scalar PotentialPair<evaluator>::getROn(pybind11::tuple types)
@@ -584,20 +715,91 @@ void PotentialPair<evaluator>::setROnPython(pybind11::tuple types, Scalar r_on)
 
     \param timestep specifies the current time step of the simulation
 */
+/*! Each table starts at the smallest distance above which the magnitude of the pair energy
+    stays below tabulation_max_energy and ends at r_cut. Type pairs whose table does not meet
+    tabulation_tolerance fall back to the analytic form.
+*/
+template<class evaluator> void PotentialPair<evaluator>::updateTables()
+    {
+    ArrayHandle<Scalar> h_ronsq(m_ronsq, access_location::host, access_mode::read);
+    ArrayHandle<Scalar> h_rcutsq(m_rcutsq, access_location::host, access_mode::read);
+
+    m_tables.assign(m_typpair_idx.getNumElements(), detail::PairSplineTable());
+
+    for (unsigned int typ1 = 0; typ1 < m_pdata->getNTypes(); typ1++)
+        {
+        for (unsigned int typ2 = typ1; typ2 < m_pdata->getNTypes(); typ2++)
+            {
+            unsigned int typpair_idx = m_typpair_idx(typ1, typ2);
+            const param_type& param = m_params[typpair_idx];
+            Scalar rcutsq = h_rcutsq.data[typpair_idx];
+            if (rcutsq <= Scalar(0.0))
+                continue;
+
+            // tabulate the energy with the same shift that computeForces applies
+            bool energy_shift = false;
+            if (m_shift_mode == shift)
+                energy_shift = true;
+            else if (m_shift_mode == xplor)
+                energy_shift = h_ronsq.data[typpair_idx] > rcutsq;
+
+            auto f = [&](Scalar rsq, Scalar& force_divr, Scalar& pair_eng)
+            {
+                force_divr = Scalar(0.0);
+                pair_eng = Scalar(0.0);
+                evaluator eval(rsq, rcutsq, param);
+                eval.evalForceAndEnergy(force_divr, pair_eng, energy_shift);
+            };
+
+            // search inward from r_cut for the start of the table
+            Scalar r_cut = sqrt(rcutsq);
+            Scalar rsq_min = rcutsq;
+            for (unsigned int k = 1; k < tabulation_search_points; k++)
+                {
+                Scalar r = r_cut * (Scalar(1.0) - Scalar(k) / Scalar(tabulation_search_points));
+                Scalar force_divr, pair_eng;
+                f(r * r, force_divr, pair_eng);
+                if (!(std::abs(pair_eng) <= tabulation_max_energy) || !std::isfinite(force_divr))
+                    break;
+                rsq_min = r * r;
+                }
+
+            detail::PairSplineTable table;
+            if (!table.build(f, rsq_min, rcutsq, tabulation_tolerance))
+                {
+                m_exec_conf->msg->warning()
+                    << "pair." << evaluator::getName() << ": Cannot tabulate the potential for "
+                    << m_pdata->getNameByType(typ1) << "-" << m_pdata->getNameByType(typ2)
+                    << " within the error tolerance, using the analytic form." << std::endl;
+                }
+
+            m_tables[typpair_idx] = table;
+            m_tables[m_typpair_idx(typ2, typ1)] = table;
+            }
+        }
+
+    m_tables_valid = true;
+    }
+
 template<class evaluator> void PotentialPair<evaluator>::computeForces(uint64_t timestep)
     {
     // start by updating the neighborlist
     m_nlist->compute(timestep);
 
+    if (m_tabulate && !m_tables_valid)
+        {
+        updateTables();
+        }
+
     // depending on the neighborlist settings, we can take advantage of newton's third law
     // to reduce computations at the cost of memory access complexity: set that flag now
     bool third_law = m_nlist->getStorageMode() == NeighborList::half;
 
     // access the neighbor list, particle data, and system box
-    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(),
+    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(m_r_cut_nlist),
                                         access_location::host,
                                         access_mode::read);
-    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(),
+    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(m_r_cut_nlist),
                                       access_location::host,
                                       access_mode::read);
     //     Index2D nli = m_nlist->getNListIndexer();
@@ -605,8 +807,24 @@ template<class evaluator> void PotentialPair<evaluator>::computeForces(uint64_t
                                     access_location::host,
                                     access_mode::read);
 
+    // read 16-bit neighbor indices when the neighbor list provides them
+    const bool compressed = m_nlist->hasCompressedNList();
+    ArrayHandle<uint16_t> h_nlist_compressed(m_nlist->getCompressedNListArray(m_r_cut_nlist),
+                                             access_location::host,
+                                             access_mode::read);
+    ArrayHandle<unsigned int> h_nlist_base(m_nlist->getCompressedBaseArray(m_r_cut_nlist),
+                                           access_location::host,
+                                           access_mode::read);
+
     ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
-    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+    // access the charges only when the evaluator uses them, so that they may stay unallocated
+    std::unique_ptr<ArrayHandle<Scalar>> h_charge;
+    if (evaluator::needsCharge())
+        {
+        h_charge.reset(new ArrayHandle<Scalar>(m_pdata->getCharges(),
+                                               access_location::host,
+                                               access_mode::read));
+        }
 
     // force arrays
     ArrayHandle<Scalar4> h_force(m_force, access_location::host, access_mode::overwrite);
@@ -636,7 +854,7 @@ template<class evaluator> void PotentialPair<evaluator>::computeForces(uint64_t
         // access charge (if needed)
         Scalar qi = Scalar(0.0);
         if (evaluator::needsCharge())
-            qi = h_charge.data[i];
+            qi = h_charge->data[i];
 
         // initialize current particle force, potential energy, and virial to 0
         Scalar3 fi = make_scalar3(0, 0, 0);
@@ -651,10 +869,13 @@ template<class evaluator> void PotentialPair<evaluator>::computeForces(uint64_t
         // loop over all of the neighbors of this particle
         const size_t myHead = h_head_list.data[i];
         const unsigned int size = (unsigned int)h_n_neigh.data[i];
+        const unsigned int base = compressed ? h_nlist_base.data[i] : NeighborList::UNCOMPRESSED;
         for (unsigned int k = 0; k < size; k++)
             {
             // access the index of this neighbor (MEM TRANSFER: 1 scalar)
-            unsigned int j = h_nlist.data[myHead + k];
+            unsigned int j = (base != NeighborList::UNCOMPRESSED)
+                                 ? base + h_nlist_compressed.data[myHead + k]
+                                 : h_nlist.data[myHead + k];
             assert(j < m_pdata->getN() + m_pdata->getNGhosts());
 
             // calculate dr_ji (MEM TRANSFER: 3 scalars / FLOPS: 3)
@@ -668,7 +889,7 @@ template<class evaluator> void PotentialPair<evaluator>::computeForces(uint64_t
             // access charge (if needed)
             Scalar qj = Scalar(0.0);
             if (evaluator::needsCharge())
-                qj = h_charge.data[j];
+                qj = h_charge->data[j];
 
             // apply periodic boundary conditions
             dx = box.minImage(dx);
@@ -699,11 +920,20 @@ template<class evaluator> void PotentialPair<evaluator>::computeForces(uint64_t
             // compute the force and potential energy
             Scalar force_divr = Scalar(0.0);
             Scalar pair_eng = Scalar(0.0);
-            evaluator eval(rsq, rcutsq, param);
-            if (evaluator::needsCharge())
-                eval.setCharge(qi, qj);
+            bool evaluated = false;
+            if (m_tabulate && m_tables[typpair_idx].covers(rsq))
+                {
+                m_tables[typpair_idx].evaluate(rsq, force_divr, pair_eng);
+                evaluated = true;
+                }
+            else
+                {
+                evaluator eval(rsq, rcutsq, param);
+                if (evaluator::needsCharge())
+                    eval.setCharge(qi, qj);
 
-            bool evaluated = eval.evalForceAndEnergy(force_divr, pair_eng, energy_shift);
+                evaluated = eval.evalForceAndEnergy(force_divr, pair_eng, energy_shift);
+                }
 
             if (evaluated)
                 {
@@ -863,7 +1093,14 @@ inline void PotentialPair<evaluator>::computeEnergyBetweenSets(InputIterator fir
     ArrayHandle<unsigned int> h_rtags(m_pdata->getRTags(),
                                       access_location::host,
                                       access_mode::read);
-    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+    // access the charges only when the evaluator uses them, so that they may stay unallocated
+    std::unique_ptr<ArrayHandle<Scalar>> h_charge;
+    if (evaluator::needsCharge())
+        {
+        h_charge.reset(new ArrayHandle<Scalar>(m_pdata->getCharges(),
+                                               access_location::host,
+                                               access_mode::read));
+        }
 
     const BoxDim box = m_pdata->getGlobalBox();
     ArrayHandle<Scalar> h_ronsq(m_ronsq, access_location::host, access_mode::read);
@@ -886,7 +1123,7 @@ inline void PotentialPair<evaluator>::computeEnergyBetweenSets(InputIterator fir
         // access charge (if needed)
         Scalar qi = Scalar(0.0);
         if (evaluator::needsCharge())
-            qi = h_charge.data[i];
+            qi = h_charge->data[i];
 
         // loop over all particles in tags2
         for (InputIterator iter = first2; iter != last2; ++iter)
@@ -906,7 +1143,7 @@ inline void PotentialPair<evaluator>::computeEnergyBetweenSets(InputIterator fir
             // access charge (if needed)
             Scalar qj = Scalar(0.0);
             if (evaluator::needsCharge())
-                qj = h_charge.data[j];
+                qj = h_charge->data[j];
 
             // apply periodic boundary conditions
             dx = box.minImage(dx);
@@ -1021,8 +1258,10 @@ template<class T> void export_PotentialPair(pybind11::module& m, const std::stri
     potentialpair
         .def(pybind11::init<std::shared_ptr<SystemDefinition>, std::shared_ptr<NeighborList>>())
         .def("setParams", &PotentialPair<T>::setParamsPython)
+        .def("setParamsMatrix", &PotentialPair<T>::setParamsMatrixPython)
         .def("getParams", &PotentialPair<T>::getParams)
         .def("setRCut", &PotentialPair<T>::setRCutPython)
+        .def("setRCutMatrix", &PotentialPair<T>::setRCutMatrixPython)
         .def("getRCut", &PotentialPair<T>::getRCut)
         .def("setROn", &PotentialPair<T>::setROnPython)
         .def("getROn", &PotentialPair<T>::getROn)
@@ -1032,6 +1271,7 @@ template<class T> void export_PotentialPair(pybind11::module& m, const std::stri
         .def_property("tail_correction",
                       &PotentialPair<T>::getTailCorrectionEnabled,
                       &PotentialPair<T>::setTailCorrectionEnabled)
+        .def_property("tabulate", &PotentialPair<T>::getTabulate, &PotentialPair<T>::setTabulate)
         .def("computeEnergyBetweenSets", &PotentialPair<T>::computeEnergyBetweenSetsPythonList);
     }
 
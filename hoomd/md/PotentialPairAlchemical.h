@@ -98,6 +98,7 @@ class PotentialPairAlchemical : public PotentialPair<evaluator>
     using PotentialPair<evaluator>::m_exec_conf;
     using PotentialPair<evaluator>::m_sysdef;
     using PotentialPair<evaluator>::m_nlist;
+    using PotentialPair<evaluator>::m_r_cut_nlist;
     using PotentialPair<evaluator>::m_virial;
     using PotentialPair<evaluator>::m_ronsq;
     using PotentialPair<evaluator>::m_rcutsq;
@@ -297,10 +298,10 @@ void PotentialPairAlchemical<evaluator, extra_pkg, alpha_particle_type>::compute
     bool third_law = m_nlist->getStorageMode() == NeighborList::half;
 
     // access the neighbor list, particle data, and system box
-    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(),
+    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(m_r_cut_nlist),
                                         access_location::host,
                                         access_mode::read);
-    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(),
+    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(m_r_cut_nlist),
                                       access_location::host,
                                       access_mode::read);
     //     Index2D nli = m_nlist->getNListIndexer();
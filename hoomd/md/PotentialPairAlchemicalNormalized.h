@@ -120,6 +120,8 @@ PotentialPairAlchemicalNormalized<evaluator, extra_pkg, alpha_particle_type>::pk
     // Precompute normalization if set
     if (m_normalizer)
         {
+        // System::run releases the GIL
+        pybind11::gil_scoped_acquire acquire;
         std::vector<pybind11::dict> norm_function_input(m_alchemy_index.getNumElements(),
                                                         pybind11::dict());
         for (unsigned int i = 0; i < m_alchemy_index.getW(); i++)
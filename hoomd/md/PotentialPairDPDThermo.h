@@ -109,16 +109,27 @@ template<class evaluator> void PotentialPairDPDThermo<evaluator>::computeForces(
     bool third_law = this->m_nlist->getStorageMode() == NeighborList::half;
 
     // access the neighbor list, particle data, and system box
-    ArrayHandle<unsigned int> h_n_neigh(this->m_nlist->getNNeighArray(),
+    ArrayHandle<unsigned int> h_n_neigh(this->m_nlist->getNNeighArray(this->m_r_cut_nlist),
                                         access_location::host,
                                         access_mode::read);
-    ArrayHandle<unsigned int> h_nlist(this->m_nlist->getNListArray(),
+    ArrayHandle<unsigned int> h_nlist(this->m_nlist->getNListArray(this->m_r_cut_nlist),
                                       access_location::host,
                                       access_mode::read);
     ArrayHandle<size_t> h_head_list(this->m_nlist->getHeadList(),
                                     access_location::host,
                                     access_mode::read);
 
+    // read 16-bit neighbor indices when the neighbor list provides them
+    const bool compressed = this->m_nlist->hasCompressedNList();
+    ArrayHandle<uint16_t> h_nlist_compressed(
+        this->m_nlist->getCompressedNListArray(this->m_r_cut_nlist),
+        access_location::host,
+        access_mode::read);
+    ArrayHandle<unsigned int> h_nlist_base(
+        this->m_nlist->getCompressedBaseArray(this->m_r_cut_nlist),
+        access_location::host,
+        access_mode::read);
+
     ArrayHandle<Scalar4> h_pos(this->m_pdata->getPositions(),
                                access_location::host,
                                access_mode::read);
@@ -165,10 +176,13 @@ template<class evaluator> void PotentialPairDPDThermo<evaluator>::computeForces(
 
         // loop over all of the neighbors of this particle
         const unsigned int size = (unsigned int)h_n_neigh.data[i];
+        const unsigned int base = compressed ? h_nlist_base.data[i] : NeighborList::UNCOMPRESSED;
         for (unsigned int k = 0; k < size; k++)
             {
             // access the index of this neighbor (MEM TRANSFER: 1 scalar)
-            unsigned int j = h_nlist.data[head_i + k];
+            unsigned int j = (base != NeighborList::UNCOMPRESSED)
+                                 ? base + h_nlist_compressed.data[head_i + k]
+                                 : h_nlist.data[head_i + k];
             assert(j < this->m_pdata->getN() + this->m_pdata->getNGhosts());
 
             // calculate dr_ji (MEM TRANSFER: 3 scalars / FLOPS: 3)
@@ -100,10 +100,10 @@ void PotentialPairDPDThermoGPU<evaluator>::computeForces(uint64_t timestep)
         }
 
     // access the neighbor list
-    ArrayHandle<unsigned int> d_n_neigh(this->m_nlist->getNNeighArray(),
+    ArrayHandle<unsigned int> d_n_neigh(this->m_nlist->getNNeighArray(this->m_r_cut_nlist),
                                         access_location::device,
                                         access_mode::read);
-    ArrayHandle<unsigned int> d_nlist(this->m_nlist->getNListArray(),
+    ArrayHandle<unsigned int> d_nlist(this->m_nlist->getNListArray(this->m_r_cut_nlist),
                                       access_location::device,
                                       access_mode::read);
     ArrayHandle<size_t> d_head_list(this->m_nlist->getHeadList(),
@@ -151,7 +151,7 @@ void PotentialPairDPDThermoGPU<evaluator>::computeForces(uint64_t timestep)
                                 d_nlist.data,
                                 d_head_list.data,
                                 d_rcutsq.data,
-                                this->m_nlist->getNListArray().getPitch(),
+                                this->m_nlist->getNListArray(this->m_r_cut_nlist).getPitch(),
                                 this->m_pdata->getNTypes(),
                                 block_size,
                                 this->m_sysdef->getSeed(),
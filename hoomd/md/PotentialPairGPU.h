@@ -100,10 +100,10 @@ template<class evaluator> void PotentialPairGPU<evaluator>::computeForces(uint64
         }
 
     // access the neighbor list
-    ArrayHandle<unsigned int> d_n_neigh(this->m_nlist->getNNeighArray(),
+    ArrayHandle<unsigned int> d_n_neigh(this->m_nlist->getNNeighArray(this->m_r_cut_nlist),
                                         access_location::device,
                                         access_mode::read);
-    ArrayHandle<unsigned int> d_nlist(this->m_nlist->getNListArray(),
+    ArrayHandle<unsigned int> d_nlist(this->m_nlist->getNListArray(this->m_r_cut_nlist),
                                       access_location::device,
                                       access_mode::read);
     ArrayHandle<size_t> d_head_list(this->m_nlist->getHeadList(),
@@ -150,7 +150,7 @@ template<class evaluator> void PotentialPairGPU<evaluator>::computeForces(uint64
                             d_head_list.data,
                             d_rcutsq.data,
                             d_ronsq.data,
-                            this->m_nlist->getNListArray().getPitch(),
+                            this->m_nlist->getNListArray(this->m_r_cut_nlist).getPitch(),
                             this->m_pdata->getNTypes(),
                             block_size,
                             this->m_shift_mode,
@@ -8,7 +8,9 @@
 #include <iostream>
 #include <memory>
 #include <stdexcept>
+#include <vector>
 
+#include "BondedForceScatter.h"
 #include "NeighborList.h"
 #include "hoomd/ForceCompute.h"
 #include "hoomd/GPUArray.h"
@@ -31,6 +33,21 @@ namespace hoomd
     {
 namespace md
     {
+namespace detail
+    {
+//! Separation between particle i and one of its neighbors
+/*! PotentialTersoff computes the separations to all neighbors of i once and reuses them in the
+    loops over j and k.
+*/
+struct TersoffNeighbor
+    {
+    unsigned int idx;  //!< Index of the neighbor
+    unsigned int type; //!< Type of the neighbor
+    Scalar3 dx;        //!< Minimum image of r_i - r_neighbor
+    Scalar rsq;        //!< Squared distance
+    };
+    } // end namespace detail
+
 //! Template class for computing three-body potentials
 /*! <b>Overview:</b>
     PotentialTersoff computes standard three-body potentials and forces between all particles in the
@@ -135,6 +152,9 @@ template<class evaluator> class PotentialTersoff : public ForceCompute
     // r_cut (not squared) given to the neighborlist
     std::shared_ptr<GlobalArray<Scalar>> m_r_cut_nlist;
 
+    /// Evaluates particles on multiple threads
+    detail::BondedForceScatter m_force_scatter;
+
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
     };
@@ -319,9 +339,13 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
         memset(h_force.data, 0, sizeof(Scalar4) * (m_pdata->getN() + m_pdata->getNGhosts()));
         memset(h_virial.data, 0, sizeof(Scalar) * 6 * m_virial_pitch);
 
-        // for each particle
-        for (int i = 0; i < (int)m_pdata->getN(); i++)
-            {
+        // compute the forces on particle i and its neighbors
+        auto compute_particle = [&](unsigned int i,
+                                    std::vector<detail::TersoffNeighbor>& neighbors,
+                                    Scalar4* force,
+                                    Scalar* virial,
+                                    size_t virial_pitch)
+        {
             // access the particle's position and type (MEM TRANSFER: 4 scalars)
             Scalar3 posi = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
             unsigned int typei = __scalar_as_int(h_pos.data[i].w);
@@ -340,32 +364,35 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
             Scalar virialiyz(0.0);
             Scalar virializz(0.0);
 
-            // loop over all of the neighbors of this particle
             const unsigned int size = (unsigned int)h_n_neigh.data[i];
-            for (unsigned int j = 0; j < size; j++)
+
+            // compute the separations to all neighbors once, the j and k loops reuse them
+            neighbors.resize(size);
+            for (unsigned int n = 0; n < size; n++)
                 {
-                // access the index of neighbor j (MEM TRANSFER: 1 scalar)
-                unsigned int jj = h_nlist.data[head_i + j];
-                assert(jj < m_pdata->getN() + m_pdata->getNGhosts());
+                unsigned int nn = h_nlist.data[head_i + n];
+                assert(nn < m_pdata->getN() + m_pdata->getNGhosts());
+                Scalar3 posn = make_scalar3(h_pos.data[nn].x, h_pos.data[nn].y, h_pos.data[nn].z);
+                neighbors[n].idx = nn;
+                neighbors[n].type = __scalar_as_int(h_pos.data[nn].w);
+                neighbors[n].dx = box.minImage(posi - posn);
+                neighbors[n].rsq = dot(neighbors[n].dx, neighbors[n].dx);
+                }
 
-                // access the position and type of particle j
-                Scalar3 posj = make_scalar3(h_pos.data[jj].x, h_pos.data[jj].y, h_pos.data[jj].z);
-                unsigned int typej = __scalar_as_int(h_pos.data[jj].w);
+            // loop over all of the neighbors of this particle
+            for (unsigned int j = 0; j < size; j++)
+                {
+                // access the index, type, and separation of neighbor j
+                unsigned int jj = neighbors[j].idx;
+                unsigned int typej = neighbors[j].type;
                 assert(typej < m_pdata->getNTypes());
+                Scalar3 dxij = neighbors[j].dx;
+                Scalar rij_sq = neighbors[j].rsq;
 
                 // initialize the current force and potential energy of particle j to 0
                 Scalar3 fj = make_scalar3(0.0, 0.0, 0.0);
                 Scalar pej = 0.0;
 
-                // calculate dr_ij (MEM TRANSFER: 3 scalars / FLOPS: 3)
-                Scalar3 dxij = posi - posj;
-
-                // apply periodic boundary conditions
-                dxij = box.minImage(dxij);
-
-                // compute rij_sq (FLOPS: 5)
-                Scalar rij_sq = dot(dxij, dxij);
-
                 // get parameters for this type pair
                 unsigned int typpair_idx = m_typpair_idx(typei, typej);
                 const param_type& param = h_params.data[typpair_idx];
@@ -419,14 +446,9 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
                     for (unsigned int k = j + 1; k < size;
                          k++) // I want to account only a single time for each triplets
                         {
-                        // access the index of neighbor k
-                        unsigned int kk = h_nlist.data[head_i + k];
-                        assert(kk < m_pdata->getN() + m_pdata->getNGhosts());
-
-                        // access the position and type of neighbor k
-                        Scalar3 posk
-                            = make_scalar3(h_pos.data[kk].x, h_pos.data[kk].y, h_pos.data[kk].z);
-                        unsigned int typek = __scalar_as_int(h_pos.data[kk].w);
+                        // access the index and type of neighbor k
+                        unsigned int kk = neighbors[k].idx;
+                        unsigned int typek = neighbors[k].type;
                         assert(typek < m_pdata->getNTypes());
 
                         // access the type pair parameters for i and k
@@ -435,12 +457,9 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
                             = h_params.data[typpair_idx]; // use this to control the species wich
                                                           // have to interact
 
-                        // compute dr_ik
-                        Scalar3 dxik = posi - posk;
-                        // apply periodic boundary conditions
-                        dxik = box.minImage(dxik);
-                        // compute rik_sq
-                        Scalar rik_sq = dot(dxik, dxik);
+                        // access dr_ik and rik_sq
+                        const Scalar3& dxik = neighbors[k].dx;
+                        Scalar rik_sq = neighbors[k].rsq;
 
                         // check if k interacts using a temporary evaluator to analyze i-k
                         // parameters
@@ -501,9 +520,9 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
 
                                 // increment the force for particle k
                                 unsigned int mem_idx = kk;
-                                h_force.data[mem_idx].x += fk.x;
-                                h_force.data[mem_idx].y += fk.y;
-                                h_force.data[mem_idx].z += fk.z;
+                                force[mem_idx].x += fk.x;
+                                force[mem_idx].y += fk.y;
+                                force[mem_idx].z += fk.z;
                                 }
                             }
                         }
@@ -511,30 +530,52 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
 
                 // increment the force and potential energy for particle j
                 unsigned int mem_idx = jj;
-                h_force.data[mem_idx].x += fj.x;
-                h_force.data[mem_idx].y += fj.y;
-                h_force.data[mem_idx].z += fj.z;
-                h_force.data[mem_idx].w += pej;
+                force[mem_idx].x += fj.x;
+                force[mem_idx].y += fj.y;
+                force[mem_idx].z += fj.z;
+                force[mem_idx].w += pej;
                 }
 
             // finally, increment the force and potential energy for particle i
             unsigned int mem_idx = i;
-            h_force.data[mem_idx].x += fi.x;
-            h_force.data[mem_idx].y += fi.y;
-            h_force.data[mem_idx].z += fi.z;
-            h_force.data[mem_idx].w += pei;
+            force[mem_idx].x += fi.x;
+            force[mem_idx].y += fi.y;
+            force[mem_idx].z += fi.z;
+            force[mem_idx].w += pei;
 
             // imcrement vir for i
             if (compute_virial)
                 {
-                h_virial.data[0 * m_virial_pitch + mem_idx] += virialixx;
-                h_virial.data[1 * m_virial_pitch + mem_idx] += virialixy;
-                h_virial.data[2 * m_virial_pitch + mem_idx] += virialixz;
-                h_virial.data[3 * m_virial_pitch + mem_idx] += virialiyy;
-                h_virial.data[4 * m_virial_pitch + mem_idx] += virialiyz;
-                h_virial.data[5 * m_virial_pitch + mem_idx] += virializz;
+                virial[0 * virial_pitch + mem_idx] += virialixx;
+                virial[1 * virial_pitch + mem_idx] += virialixy;
+                virial[2 * virial_pitch + mem_idx] += virialixz;
+                virial[3 * virial_pitch + mem_idx] += virialiyy;
+                virial[4 * virial_pitch + mem_idx] += virialiyz;
+                virial[5 * virial_pitch + mem_idx] += virializz;
                 }
-            }
+        };
+
+        // for each particle
+        m_force_scatter.computeRange(m_exec_conf,
+                                     m_pdata->getN(),
+                                     m_pdata->getN() + m_pdata->getNGhosts(),
+                                     h_force.data,
+                                     h_virial.data,
+                                     m_virial_pitch,
+                                     [&](unsigned int begin,
+                                         unsigned int end,
+                                         Scalar4* force,
+                                         Scalar* virial,
+                                         size_t virial_pitch)
+                                     {
+                                         std::vector<detail::TersoffNeighbor> neighbors;
+                                         for (unsigned int i = begin; i < end; i++)
+                                             compute_particle(i,
+                                                              neighbors,
+                                                              force,
+                                                              virial,
+                                                              virial_pitch);
+                                     });
         }
     else
         {
@@ -584,9 +625,13 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
 
         unsigned int ntypes = m_pdata->getNTypes();
 
-        // for each particle
-        for (int i = 0; i < (int)m_pdata->getN(); i++)
-            {
+        // compute the forces on particle i and its neighbors
+        auto compute_particle = [&](unsigned int i,
+                                    std::vector<detail::TersoffNeighbor>& neighbors,
+                                    Scalar4* force,
+                                    Scalar* virial,
+                                    size_t virial_pitch)
+        {
             // access the particle's position and type (MEM TRANSFER: 4 scalars)
             Scalar3 posi = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
             unsigned int typei = __scalar_as_int(h_pos.data[i].w);
@@ -615,28 +660,29 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
 
             // all neighbors of this particle
             const unsigned int size = (unsigned int)h_n_neigh.data[i];
+
+            // compute the separations to all neighbors once, the j and k loops reuse them
+            neighbors.resize(size);
+            for (unsigned int n = 0; n < size; n++)
+                {
+                unsigned int nn = h_nlist.data[head_i + n];
+                assert(nn < m_pdata->getN() + m_pdata->getNGhosts());
+                Scalar3 posn = make_scalar3(h_pos.data[nn].x, h_pos.data[nn].y, h_pos.data[nn].z);
+                neighbors[n].idx = nn;
+                neighbors[n].type = __scalar_as_int(h_pos.data[nn].w);
+                neighbors[n].dx = box.minImage(posi - posn);
+                neighbors[n].rsq = dot(neighbors[n].dx, neighbors[n].dx);
+                }
+
             if (evaluator::hasPerParticleEnergy())
                 {
                 for (unsigned int j = 0; j < size; j++)
                     {
-                    // access the index of neighbor j (MEM TRANSFER: 1 scalar)
-                    unsigned int jj = h_nlist.data[head_i + j];
-                    assert(jj < m_pdata->getN() + m_pdata->getNGhosts());
-
-                    // access the position and type of particle j
-                    Scalar3 posj
-                        = make_scalar3(h_pos.data[jj].x, h_pos.data[jj].y, h_pos.data[jj].z);
-                    unsigned int typej = __scalar_as_int(h_pos.data[jj].w);
+                    // access the type and separation of neighbor j
+                    unsigned int typej = neighbors[j].type;
                     assert(typej < m_pdata->getNTypes());
-
-                    // calculate dr_ij (MEM TRANSFER: 3 scalars / FLOPS: 3)
-                    Scalar3 dxij = posi - posj;
-
-                    // apply periodic boundary conditions
-                    dxij = box.minImage(dxij);
-
-                    // compute rij_sq (FLOPS: 5)
-                    Scalar rij_sq = dot(dxij, dxij);
+                    Scalar3 dxij = neighbors[j].dx;
+                    Scalar rij_sq = neighbors[j].rsq;
 
                     // get parameters for this type pair
                     unsigned int typpair_idx = m_typpair_idx(typei, typej);
@@ -664,28 +710,17 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
             // loop over all of the neighbors of this particle
             for (unsigned int j = 0; j < size; j++)
                 {
-                // access the index of neighbor j (MEM TRANSFER: 1 scalar)
-                unsigned int jj = h_nlist.data[head_i + j];
-                assert(jj < m_pdata->getN() + m_pdata->getNGhosts());
-
-                // access the position and type of particle j
-                Scalar3 posj = make_scalar3(h_pos.data[jj].x, h_pos.data[jj].y, h_pos.data[jj].z);
-                unsigned int typej = __scalar_as_int(h_pos.data[jj].w);
+                // access the index, type, and separation of neighbor j
+                unsigned int jj = neighbors[j].idx;
+                unsigned int typej = neighbors[j].type;
                 assert(typej < m_pdata->getNTypes());
+                Scalar3 dxij = neighbors[j].dx;
+                Scalar rij_sq = neighbors[j].rsq;
 
                 // initialize the current force and potential energy of particle j to 0
                 Scalar3 fj = make_scalar3(0.0, 0.0, 0.0);
                 Scalar pej = 0.0;
 
-                // calculate dr_ij (MEM TRANSFER: 3 scalars / FLOPS: 3)
-                Scalar3 dxij = posi - posj;
-
-                // apply periodic boundary conditions
-                dxij = box.minImage(dxij);
-
-                // compute rij_sq (FLOPS: 5)
-                Scalar rij_sq = dot(dxij, dxij);
-
                 // get parameters for this type pair
                 unsigned int typpair_idx = m_typpair_idx(typei, typej);
                 const param_type& param = h_params.data[typpair_idx];
@@ -712,15 +747,9 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
                         {
                         for (unsigned int k = 0; k < size; k++)
                             {
-                            // access the index of neighbor k
-                            unsigned int kk = h_nlist.data[head_i + k];
-                            assert(kk < m_pdata->getN() + m_pdata->getNGhosts());
-
-                            // access the position and type of neighbor k
-                            Scalar3 posk = make_scalar3(h_pos.data[kk].x,
-                                                        h_pos.data[kk].y,
-                                                        h_pos.data[kk].z);
-                            unsigned int typek = __scalar_as_int(h_pos.data[kk].w);
+                            // access the index and type of neighbor k
+                            unsigned int kk = neighbors[k].idx;
+                            unsigned int typek = neighbors[k].type;
                             assert(typek < m_pdata->getNTypes());
 
                             // access the type pair parameters for i and k
@@ -732,14 +761,9 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
 
                             if (kk != jj && temp_evaluated)
                                 {
-                                // compute drik
-                                Scalar3 dxik = posi - posk;
-
-                                // apply periodic boundary conditions
-                                dxik = box.minImage(dxik);
-
-                                // compute rik_sq
-                                Scalar rik_sq = dot(dxik, dxik);
+                                // access dr_ik and rik_sq
+                                const Scalar3& dxik = neighbors[k].dx;
+                                Scalar rik_sq = neighbors[k].rsq;
 
                                 // compute the bond angle (if needed)
                                 Scalar cos_th = Scalar(0.0);
@@ -799,15 +823,9 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
                         // evaluate the force from the ik interactions
                         for (unsigned int k = 0; k < size; k++)
                             {
-                            // access the index of neighbor k
-                            unsigned int kk = h_nlist.data[head_i + k];
-                            assert(kk < m_pdata->getN() + m_pdata->getNGhosts());
-
-                            // access the position and type of neighbor k
-                            Scalar3 posk = make_scalar3(h_pos.data[kk].x,
-                                                        h_pos.data[kk].y,
-                                                        h_pos.data[kk].z);
-                            unsigned int typek = __scalar_as_int(h_pos.data[kk].w);
+                            // access the index and type of neighbor k
+                            unsigned int kk = neighbors[k].idx;
+                            unsigned int typek = neighbors[k].type;
                             assert(typek < m_pdata->getNTypes());
 
                             // access the type pair parameters for i and k
@@ -822,14 +840,9 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
                                 // create variable for the force on k
                                 Scalar3 fk = make_scalar3(0.0, 0.0, 0.0);
 
-                                // compute dr_ik
-                                Scalar3 dxik = posi - posk;
-
-                                // apply periodic boundary conditions
-                                dxik = box.minImage(dxik);
-
-                                // compute rik_sq
-                                Scalar rik_sq = dot(dxik, dxik);
+                                // access dr_ik and rik_sq
+                                const Scalar3& dxik = neighbors[k].dx;
+                                Scalar rik_sq = neighbors[k].rsq;
 
                                 // compute the bond angle (if needed)
                                 Scalar cos_th = Scalar(0.0);
@@ -902,30 +915,30 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
 
                                 // increment the force for particle k
                                 unsigned int mem_idx = kk;
-                                h_force.data[mem_idx].x += fk.x;
-                                h_force.data[mem_idx].y += fk.y;
-                                h_force.data[mem_idx].z += fk.z;
+                                force[mem_idx].x += fk.x;
+                                force[mem_idx].y += fk.y;
+                                force[mem_idx].z += fk.z;
 
                                 if (compute_virial)
                                     {
                                     Scalar force_div2r_ij = Scalar(0.5) * force_divr_ij.z;
                                     Scalar force_div2r_ik = Scalar(0.5) * force_divr_ik.z;
-                                    h_virial.data[0 * m_virial_pitch + mem_idx]
+                                    virial[0 * virial_pitch + mem_idx]
                                         += force_div2r_ij * dxij.x * dxij.x
                                            + force_div2r_ik * dxik.x * dxik.x;
-                                    h_virial.data[1 * m_virial_pitch + mem_idx]
+                                    virial[1 * virial_pitch + mem_idx]
                                         += force_div2r_ij * dxij.x * dxij.y
                                            + force_div2r_ik * dxik.x * dxik.y;
-                                    h_virial.data[2 * m_virial_pitch + mem_idx]
+                                    virial[2 * virial_pitch + mem_idx]
                                         += force_div2r_ij * dxij.x * dxij.z
                                            + force_div2r_ik * dxik.x * dxik.z;
-                                    h_virial.data[3 * m_virial_pitch + mem_idx]
+                                    virial[3 * virial_pitch + mem_idx]
                                         += force_div2r_ij * dxij.y * dxij.y
                                            + force_div2r_ik * dxik.y * dxik.y;
-                                    h_virial.data[4 * m_virial_pitch + mem_idx]
+                                    virial[4 * virial_pitch + mem_idx]
                                         += force_div2r_ij * dxij.y * dxij.z
                                            + force_div2r_ik * dxik.y * dxik.z;
-                                    h_virial.data[5 * m_virial_pitch + mem_idx]
+                                    virial[5 * virial_pitch + mem_idx]
                                         += force_div2r_ij * dxij.z * dxij.z
                                            + force_div2r_ik * dxik.z * dxik.z;
                                     }
@@ -935,38 +948,60 @@ template<class evaluator> void PotentialTersoff<evaluator>::computeForces(uint64
                     }
                 // increment the force and potential energy for particle j
                 unsigned int mem_idx = jj;
-                h_force.data[mem_idx].x += fj.x;
-                h_force.data[mem_idx].y += fj.y;
-                h_force.data[mem_idx].z += fj.z;
-                h_force.data[mem_idx].w += pej;
+                force[mem_idx].x += fj.x;
+                force[mem_idx].y += fj.y;
+                force[mem_idx].z += fj.z;
+                force[mem_idx].w += pej;
 
                 if (compute_virial)
                     {
-                    h_virial.data[0 * m_virial_pitch + mem_idx] += virialj_xx;
-                    h_virial.data[1 * m_virial_pitch + mem_idx] += virialj_xy;
-                    h_virial.data[2 * m_virial_pitch + mem_idx] += virialj_xz;
-                    h_virial.data[3 * m_virial_pitch + mem_idx] += virialj_yy;
-                    h_virial.data[4 * m_virial_pitch + mem_idx] += virialj_yz;
-                    h_virial.data[5 * m_virial_pitch + mem_idx] += virialj_zz;
+                    virial[0 * virial_pitch + mem_idx] += virialj_xx;
+                    virial[1 * virial_pitch + mem_idx] += virialj_xy;
+                    virial[2 * virial_pitch + mem_idx] += virialj_xz;
+                    virial[3 * virial_pitch + mem_idx] += virialj_yy;
+                    virial[4 * virial_pitch + mem_idx] += virialj_yz;
+                    virial[5 * virial_pitch + mem_idx] += virialj_zz;
                     }
                 }
             // finally, increment the force and potential energy for particle i
             unsigned int mem_idx = i;
-            h_force.data[mem_idx].x += fi.x;
-            h_force.data[mem_idx].y += fi.y;
-            h_force.data[mem_idx].z += fi.z;
-            h_force.data[mem_idx].w += pei;
+            force[mem_idx].x += fi.x;
+            force[mem_idx].y += fi.y;
+            force[mem_idx].z += fi.z;
+            force[mem_idx].w += pei;
 
             if (compute_virial)
                 {
-                h_virial.data[0 * m_virial_pitch + mem_idx] += viriali_xx;
-                h_virial.data[1 * m_virial_pitch + mem_idx] += viriali_xy;
-                h_virial.data[2 * m_virial_pitch + mem_idx] += viriali_xz;
-                h_virial.data[3 * m_virial_pitch + mem_idx] += viriali_yy;
-                h_virial.data[4 * m_virial_pitch + mem_idx] += viriali_yz;
-                h_virial.data[5 * m_virial_pitch + mem_idx] += viriali_zz;
+                virial[0 * virial_pitch + mem_idx] += viriali_xx;
+                virial[1 * virial_pitch + mem_idx] += viriali_xy;
+                virial[2 * virial_pitch + mem_idx] += viriali_xz;
+                virial[3 * virial_pitch + mem_idx] += viriali_yy;
+                virial[4 * virial_pitch + mem_idx] += viriali_yz;
+                virial[5 * virial_pitch + mem_idx] += viriali_zz;
                 }
-            }
+        };
+
+        // for each particle
+        m_force_scatter.computeRange(m_exec_conf,
+                                     m_pdata->getN(),
+                                     m_pdata->getN() + m_pdata->getNGhosts(),
+                                     h_force.data,
+                                     h_virial.data,
+                                     m_virial_pitch,
+                                     [&](unsigned int begin,
+                                         unsigned int end,
+                                         Scalar4* force,
+                                         Scalar* virial,
+                                         size_t virial_pitch)
+                                     {
+                                         std::vector<detail::TersoffNeighbor> neighbors;
+                                         for (unsigned int i = begin; i < end; i++)
+                                             compute_particle(i,
+                                                              neighbors,
+                                                              force,
+                                                              virial,
+                                                              virial_pitch);
+                                     });
         }
     }
 
@@ -0,0 +1,205 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#include "RadialDistributionFunction.h"
+
+#ifdef ENABLE_MPI
+#include "hoomd/HOOMDMPI.h"
+#endif
+
+#include <pybind11/stl.h>
+
+#include <algorithm>
+#include <stdexcept>
+
+/*! \file RadialDistributionFunction.cc
+    \brief Defines the RadialDistributionFunction class
+*/
+
+namespace hoomd
+    {
+namespace md
+    {
+RadialDistributionFunction::RadialDistributionFunction(std::shared_ptr<SystemDefinition> sysdef,
+                                                       std::shared_ptr<Trigger> trigger,
+                                                       std::shared_ptr<NeighborList> nlist,
+                                                       Scalar r_max,
+                                                       unsigned int bins)
+    : Analyzer(sysdef, trigger), m_nlist(nlist), m_r_max(r_max), m_bins(bins)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing RadialDistributionFunction" << std::endl;
+
+    if (m_r_max <= Scalar(0.0))
+        throw std::domain_error("r_max must be positive.");
+    if (m_bins == 0)
+        throw std::domain_error("bins must be at least 1.");
+
+    const unsigned int n_types = m_pdata->getNTypes();
+    m_counts.resize(size_t(n_types) * n_types * m_bins, 0);
+
+    // request all pairs within r_max from the neighbor list
+    m_r_cut_nlist = std::make_shared<GlobalArray<Scalar>>(n_types * n_types, m_exec_conf);
+        {
+        ArrayHandle<Scalar> h_r_cut_nlist(*m_r_cut_nlist,
+                                          access_location::host,
+                                          access_mode::overwrite);
+        std::fill(h_r_cut_nlist.data, h_r_cut_nlist.data + n_types * n_types, m_r_max);
+        }
+    m_nlist->addRCutMatrix(m_r_cut_nlist);
+    }
+
+RadialDistributionFunction::~RadialDistributionFunction()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying RadialDistributionFunction" << std::endl;
+
+    if (m_attached)
+        {
+        m_nlist->removeRCutMatrix(m_r_cut_nlist);
+        }
+    }
+
+void RadialDistributionFunction::notifyDetach()
+    {
+    if (m_attached)
+        {
+        m_nlist->removeRCutMatrix(m_r_cut_nlist);
+        }
+    m_attached = false;
+    }
+
+void RadialDistributionFunction::analyze(uint64_t timestep)
+    {
+    Analyzer::analyze(timestep);
+
+    // reuse the current build when another consumer already updated the neighbor list this step
+    m_nlist->compute(timestep);
+
+    // a half neighbor list stores each pair once, count it for both particles
+    const bool third_law = m_nlist->getStorageMode() == NeighborList::half;
+
+    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(m_r_cut_nlist),
+                                        access_location::host,
+                                        access_mode::read);
+    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(m_r_cut_nlist),
+                                      access_location::host,
+                                      access_mode::read);
+    ArrayHandle<size_t> h_head_list(m_nlist->getHeadList(),
+                                    access_location::host,
+                                    access_mode::read);
+    ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+
+    const BoxDim box = m_pdata->getGlobalBox();
+    const unsigned int N = m_pdata->getN();
+    const unsigned int n_types = m_pdata->getNTypes();
+    const Scalar r_max_sq = m_r_max * m_r_max;
+    const Scalar bins_per_length = Scalar(m_bins) / m_r_max;
+
+    for (unsigned int i = 0; i < N; i++)
+        {
+        const Scalar3 pi = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
+        const unsigned int typei = __scalar_as_int(h_pos.data[i].w);
+
+        const size_t head = h_head_list.data[i];
+        const unsigned int n_neigh = h_n_neigh.data[i];
+        for (unsigned int k = 0; k < n_neigh; k++)
+            {
+            const unsigned int j = h_nlist.data[head + k];
+            assert(j < m_pdata->getN() + m_pdata->getNGhosts());
+
+            const Scalar3 pj = make_scalar3(h_pos.data[j].x, h_pos.data[j].y, h_pos.data[j].z);
+            const Scalar3 dx = box.minImage(pi - pj);
+            const Scalar rsq = dot(dx, dx);
+            if (rsq >= r_max_sq)
+                continue;
+
+            const unsigned int typej = __scalar_as_int(h_pos.data[j].w);
+            const unsigned int bin
+                = std::min(static_cast<unsigned int>(fast::sqrt(rsq) * bins_per_length),
+                           m_bins - 1);
+            m_counts[(size_t(typei) * n_types + typej) * m_bins + bin]++;
+
+            // the rank that owns j counts the pair when j is a ghost
+            if (third_law && j < N)
+                m_counts[(size_t(typej) * n_types + typei) * m_bins + bin]++;
+            }
+        }
+
+    m_num_samples++;
+    m_inverse_volume_sum += 1.0 / box.getVolume(m_sysdef->getNDimensions() == 2);
+    }
+
+std::vector<uint64_t> RadialDistributionFunction::getCounts() const
+    {
+    std::vector<uint64_t> counts(m_counts);
+
+#ifdef ENABLE_MPI
+    if (m_sysdef->isDomainDecomposed())
+        {
+        MPI_Allreduce(MPI_IN_PLACE,
+                      counts.data(),
+                      int(counts.size()),
+                      MPI_UINT64_T,
+                      MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        }
+#endif
+
+    return counts;
+    }
+
+std::vector<uint64_t> RadialDistributionFunction::getTypeCounts() const
+    {
+    std::vector<uint64_t> type_counts(m_pdata->getNTypes(), 0);
+
+    ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+        type_counts[__scalar_as_int(h_pos.data[i].w)]++;
+
+#ifdef ENABLE_MPI
+    if (m_sysdef->isDomainDecomposed())
+        {
+        MPI_Allreduce(MPI_IN_PLACE,
+                      type_counts.data(),
+                      int(type_counts.size()),
+                      MPI_UINT64_T,
+                      MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        }
+#endif
+
+    return type_counts;
+    }
+
+void RadialDistributionFunction::reset()
+    {
+    std::fill(m_counts.begin(), m_counts.end(), 0);
+    m_num_samples = 0;
+    m_inverse_volume_sum = 0.0;
+    }
+
+namespace detail
+    {
+void export_RadialDistributionFunction(pybind11::module& m)
+    {
+    pybind11::class_<RadialDistributionFunction,
+                     Analyzer,
+                     std::shared_ptr<RadialDistributionFunction>>(m, "RadialDistributionFunction")
+        .def(pybind11::init<std::shared_ptr<SystemDefinition>,
+                            std::shared_ptr<Trigger>,
+                            std::shared_ptr<NeighborList>,
+                            Scalar,
+                            unsigned int>())
+        .def_property_readonly("r_max", &RadialDistributionFunction::getRMax)
+        .def_property_readonly("bins", &RadialDistributionFunction::getBins)
+        .def_property_readonly("num_samples", &RadialDistributionFunction::getNumSamples)
+        .def_property_readonly("inverse_volume_sum",
+                               &RadialDistributionFunction::getInverseVolumeSum)
+        .def("getCounts", &RadialDistributionFunction::getCounts)
+        .def("getTypeCounts", &RadialDistributionFunction::getTypeCounts)
+        .def("reset", &RadialDistributionFunction::reset);
+    }
+
+    } // end namespace detail
+
+    } // end namespace md
+    } // end namespace hoomd
@@ -0,0 +1,130 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+#pragma once
+
+#ifdef __HIPCC__
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "NeighborList.h"
+
+#include "hoomd/Analyzer.h"
+
+#include <pybind11/pybind11.h>
+
+#include <memory>
+#include <vector>
+
+/*! \file RadialDistributionFunction.h
+    \brief Declares the RadialDistributionFunction class
+*/
+
+namespace hoomd
+    {
+namespace md
+    {
+/// Histogram pair distances from a neighbor list.
+/*! RadialDistributionFunction adds a histogram of the distances between all pairs of particles
+    within r_max to a running sum every time it is triggered. It reads the pairs from a
+    NeighborList, which includes r_max in its cutoff so that the pairs are complete. Pairs that the
+    neighbor list excludes (e.g. bonded pairs) are not counted.
+
+    The histogram is stored per ordered type pair (type_i, type_j) in a flat array indexed by
+    (type_i * n_types + type_j) * bins + bin. Each rank accumulates the pairs of its local
+    particles and getCounts() sums the ranks only when the histogram is read.
+*/
+class PYBIND11_EXPORT RadialDistributionFunction : public Analyzer
+    {
+    public:
+    /// Construct the histogram
+    /*! \param sysdef System definition
+        \param trigger Steps on which to sample the pair distances
+        \param nlist Neighbor list that provides the pairs
+        \param r_max Largest pair distance to histogram
+        \param bins Number of bins
+    */
+    RadialDistributionFunction(std::shared_ptr<SystemDefinition> sysdef,
+                               std::shared_ptr<Trigger> trigger,
+                               std::shared_ptr<NeighborList> nlist,
+                               Scalar r_max,
+                               unsigned int bins);
+
+    virtual ~RadialDistributionFunction();
+
+    /// Add the pair distances at this step to the histogram
+    virtual void analyze(uint64_t timestep);
+
+    /// Stop using the neighbor list
+    virtual void notifyDetach();
+
+    /// Get the largest pair distance in the histogram
+    Scalar getRMax() const
+        {
+        return m_r_max;
+        }
+
+    /// Get the number of bins
+    unsigned int getBins() const
+        {
+        return m_bins;
+        }
+
+    /// Get the number of samples in the histogram
+    uint64_t getNumSamples() const
+        {
+        return m_num_samples;
+        }
+
+    /// Get the sum of 1/V over all samples
+    /*! In 2D, V is the area of the box.
+     */
+    double getInverseVolumeSum() const
+        {
+        return m_inverse_volume_sum;
+        }
+
+    /// Get the histogram summed over all ranks
+    std::vector<uint64_t> getCounts() const;
+
+    /// Get the number of particles of each type summed over all ranks
+    std::vector<uint64_t> getTypeCounts() const;
+
+    /// Discard all samples
+    void reset();
+
+    protected:
+    /// Neighbor list that provides the pairs
+    std::shared_ptr<NeighborList> m_nlist;
+
+    /// r_cut matrix given to the neighbor list, r_max for every type pair
+    std::shared_ptr<GlobalArray<Scalar>> m_r_cut_nlist;
+
+    /// Largest pair distance in the histogram
+    Scalar m_r_max;
+
+    /// Number of bins
+    unsigned int m_bins;
+
+    /// Rank local histogram
+    std::vector<uint64_t> m_counts;
+
+    /// Number of samples in the histogram
+    uint64_t m_num_samples = 0;
+
+    /// Sum of 1/V over all samples
+    double m_inverse_volume_sum = 0.0;
+
+    /// True while m_r_cut_nlist is added to the neighbor list
+    bool m_attached = true;
+    };
+
+namespace detail
+    {
+/// Export the RadialDistributionFunction class to python
+void export_RadialDistributionFunction(pybind11::module& m);
+
+    } // end namespace detail
+
+    } // end namespace md
+    } // end namespace hoomd
@@ -3,6 +3,7 @@
 
 #include "TableAngleForceCompute.h"
 
+#include <sstream>
 #include <stdexcept>
 
 /*! \file TableAngleForceCompute.cc
@@ -149,8 +150,6 @@ void TableAngleForceCompute::computeForces(uint64_t timestep)
     assert(h_pos.data);
     assert(h_rtag.data);
 
-    size_t virial_pitch = m_virial.getPitch();
-
     // Zero data for force calculation.
     memset((void*)h_force.data, 0, sizeof(Scalar4) * m_force.getNumElements());
     memset((void*)h_virial.data, 0, sizeof(Scalar) * m_virial.getNumElements());
@@ -161,12 +160,21 @@ void TableAngleForceCompute::computeForces(uint64_t timestep)
     // access the table data
     ArrayHandle<Scalar2> h_tables(m_tables, access_location::host, access_mode::read);
 
-    // for each of the angles
-    const unsigned int size = (unsigned int)m_angle_data->getN();
-    for (unsigned int i = 0; i < size; i++)
-        {
+    // access the angle data
+    ArrayHandle<AngleData::members_t> h_angles(m_angle_data->getMembersArray(),
+                                               access_location::host,
+                                               access_mode::read);
+    ArrayHandle<typeval_t> h_typeval(m_angle_data->getTypeValArray(),
+                                     access_location::host,
+                                     access_mode::read);
+
+    const unsigned int N = m_pdata->getN();
+
+    // compute the forces on the particles in angle i
+    auto compute_angle = [&](unsigned int i, Scalar4* force, Scalar* virial, size_t virial_pitch)
+    {
         // lookup the tag of each of the particles participating in the angle
-        const AngleData::members_t& angle = m_angle_data->getMembersByIndex(i);
+        const AngleData::members_t& angle = h_angles.data[i];
         assert(angle.tag[0] <= m_pdata->getMaximumTag());
         assert(angle.tag[1] <= m_pdata->getMaximumTag());
         assert(angle.tag[2] <= m_pdata->getMaximumTag());
@@ -180,11 +188,10 @@ void TableAngleForceCompute::computeForces(uint64_t timestep)
         // throw an error if this angle is incomplete
         if (idx_a == NOT_LOCAL || idx_b == NOT_LOCAL || idx_c == NOT_LOCAL)
             {
-            this->m_exec_conf->msg->error()
-                << "angle.table: angle " << angle.tag[0] << " " << angle.tag[1] << " "
-                << angle.tag[2] << " incomplete." << endl
-                << endl;
-            throw std::runtime_error("Error in angle calculation");
+            std::ostringstream stream;
+            stream << "Error: angle.table: angle " << angle.tag[0] << " " << angle.tag[1] << " "
+                   << angle.tag[2] << " incomplete.";
+            throw std::runtime_error(stream.str());
             }
 
         assert(idx_a < m_pdata->getN() + m_pdata->getNGhosts());
@@ -244,7 +251,7 @@ void TableAngleForceCompute::computeForces(uint64_t timestep)
         // compute index into the table and read in values
 
         /// Here we use the table!!
-        unsigned int angle_type = m_angle_data->getTypeByIndex(i);
+        unsigned int angle_type = h_typeval.data[i].type;
         unsigned int value_i = (unsigned int)(slow::floor(value_f));
         Scalar2 VT0 = h_tables.data[m_table_value(value_i, angle_type)];
         Scalar2 VT1 = h_tables.data[m_table_value(value_i + 1, angle_type)];
@@ -290,36 +297,45 @@ void TableAngleForceCompute::computeForces(uint64_t timestep)
 
         // Now, apply the force to each individual atom a,b,c, and accumulate the energy/virial
         // only apply force to local atoms
-        if (idx_a < m_pdata->getN())
+        if (idx_a < N)
             {
-            h_force.data[idx_a].x += fab[0];
-            h_force.data[idx_a].y += fab[1];
-            h_force.data[idx_a].z += fab[2];
-            h_force.data[idx_a].w += angle_eng;
+            force[idx_a].x += fab[0];
+            force[idx_a].y += fab[1];
+            force[idx_a].z += fab[2];
+            force[idx_a].w += angle_eng;
             for (int j = 0; j < 6; j++)
-                h_virial.data[j * virial_pitch + idx_a] += angle_virial[j];
+                virial[j * virial_pitch + idx_a] += angle_virial[j];
             }
 
-        if (idx_b < m_pdata->getN())
+        if (idx_b < N)
             {
-            h_force.data[idx_b].x -= fab[0] + fcb[0];
-            h_force.data[idx_b].y -= fab[1] + fcb[1];
-            h_force.data[idx_b].z -= fab[2] + fcb[2];
-            h_force.data[idx_b].w += angle_eng;
+            force[idx_b].x -= fab[0] + fcb[0];
+            force[idx_b].y -= fab[1] + fcb[1];
+            force[idx_b].z -= fab[2] + fcb[2];
+            force[idx_b].w += angle_eng;
             for (int j = 0; j < 6; j++)
-                h_virial.data[j * virial_pitch + idx_b] += angle_virial[j];
+                virial[j * virial_pitch + idx_b] += angle_virial[j];
             }
 
-        if (idx_c < m_pdata->getN())
+        if (idx_c < N)
             {
-            h_force.data[idx_c].x += fcb[0];
-            h_force.data[idx_c].y += fcb[1];
-            h_force.data[idx_c].z += fcb[2];
-            h_force.data[idx_c].w += angle_eng;
+            force[idx_c].x += fcb[0];
+            force[idx_c].y += fcb[1];
+            force[idx_c].z += fcb[2];
+            force[idx_c].w += angle_eng;
             for (int j = 0; j < 6; j++)
-                h_virial.data[j * virial_pitch + idx_c] += angle_virial[j];
+                virial[j * virial_pitch + idx_c] += angle_virial[j];
             }
-        }
+    };
+
+    // for each of the angles
+    m_force_scatter.compute(m_exec_conf,
+                            (unsigned int)m_angle_data->getN(),
+                            m_pdata->getN() + m_pdata->getNGhosts(),
+                            h_force.data,
+                            h_virial.data,
+                            m_virial.getPitch(),
+                            compute_angle);
     }
 
 namespace detail
@@ -1,6 +1,7 @@
 // Copyright (c) 2009-2023 The Regents of the University of Michigan.
 // Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+#include "BondedForceScatter.h"
 #include "hoomd/BondedGroupData.h"
 #include "hoomd/ForceCompute.h"
 #include "hoomd/GPUArray.h"
@@ -97,6 +98,8 @@ class PYBIND11_EXPORT TableAngleForceCompute : public ForceCompute
     GPUArray<Scalar2> m_tables;              //!< Stored V and T tables
     Index2D m_table_value;                   //!< Index table helper
 
+    detail::BondedForceScatter m_force_scatter; //!< Evaluates angles on multiple threads
+
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
     };
@@ -4,6 +4,7 @@
 #include "TableDihedralForceCompute.h"
 #include "hoomd/VectorMath.h"
 
+#include <sstream>
 #include <stdexcept>
 
 /*! \file TableDihedralForceCompute.cc
@@ -144,8 +145,6 @@ void TableDihedralForceCompute::computeForces(uint64_t timestep)
     assert(h_virial.data);
     assert(h_pos.data);
 
-    size_t virial_pitch = m_virial.getPitch();
-
     // Zero data for force calculation.
     memset((void*)h_force.data, 0, sizeof(Scalar4) * m_force.getNumElements());
     memset((void*)h_virial.data, 0, sizeof(Scalar) * m_virial.getNumElements());
@@ -156,12 +155,22 @@ void TableDihedralForceCompute::computeForces(uint64_t timestep)
     // access the table data
     ArrayHandle<Scalar2> h_tables(m_tables, access_location::host, access_mode::read);
 
-    // for each of the dihedrals
-    const unsigned int size = (unsigned int)m_dihedral_data->getN();
-    for (unsigned int i = 0; i < size; i++)
-        {
+    // access the dihedral data
+    ArrayHandle<DihedralData::members_t> h_dihedrals(m_dihedral_data->getMembersArray(),
+                                                     access_location::host,
+                                                     access_mode::read);
+    ArrayHandle<typeval_t> h_typeval(m_dihedral_data->getTypeValArray(),
+                                     access_location::host,
+                                     access_mode::read);
+
+    // compute the forces on the particles in dihedral i
+    auto compute_dihedral = [&](unsigned int i,
+                                Scalar4* force,
+                                Scalar* virial,
+                                size_t virial_pitch)
+    {
         // lookup the tag of each of the particles participating in the dihedral
-        const DihedralData::members_t& dihedral = m_dihedral_data->getMembersByIndex(i);
+        const DihedralData::members_t& dihedral = h_dihedrals.data[i];
         assert(dihedral.tag[0] <= m_pdata->getMaximumTag());
         assert(dihedral.tag[1] <= m_pdata->getMaximumTag());
         assert(dihedral.tag[2] <= m_pdata->getMaximumTag());
@@ -177,11 +186,11 @@ void TableDihedralForceCompute::computeForces(uint64_t timestep)
         // throw an error if this angle is incomplete
         if (idx_a == NOT_LOCAL || idx_b == NOT_LOCAL || idx_c == NOT_LOCAL || idx_d == NOT_LOCAL)
             {
-            this->m_exec_conf->msg->error()
-                << "dihedral.harmonic: dihedral " << dihedral.tag[0] << " " << dihedral.tag[1]
-                << " " << dihedral.tag[2] << " " << dihedral.tag[3] << " incomplete." << endl
-                << endl;
-            throw std::runtime_error("Error in dihedral calculation");
+            std::ostringstream stream;
+            stream << "Error: dihedral.harmonic: dihedral " << dihedral.tag[0] << " "
+                   << dihedral.tag[1] << " " << dihedral.tag[2] << " " << dihedral.tag[3]
+                   << " incomplete.";
+            throw std::runtime_error(stream.str());
             }
 
         assert(idx_a < m_pdata->getN() + m_pdata->getNGhosts());
@@ -285,7 +294,7 @@ void TableDihedralForceCompute::computeForces(uint64_t timestep)
         // compute index into the table and read in values
 
         /// Here we use the table!!
-        unsigned int dihedral_type = m_dihedral_data->getTypeByIndex(i);
+        unsigned int dihedral_type = h_typeval.data[i].type;
         unsigned int value_i = (unsigned int)value_f;
         Scalar2 VT0 = h_tables.data[m_table_value(value_i, dihedral_type)];
         Scalar2 VT1 = h_tables.data[m_table_value(value_i + 1, dihedral_type)];
@@ -334,34 +343,43 @@ void TableDihedralForceCompute::computeForces(uint64_t timestep)
         dihedral_virial[4] = (1. / 4.) * (dab.z * f_a.y + dcb.z * f_c.y + (ddc.z + dcb.z) * f_d.y);
         dihedral_virial[5] = (1. / 4.) * (dab.z * f_a.z + dcb.z * f_c.z + (ddc.z + dcb.z) * f_d.z);
 
-        h_force.data[idx_a].x += f_a.x;
-        h_force.data[idx_a].y += f_a.y;
-        h_force.data[idx_a].z += f_a.z;
-        h_force.data[idx_a].w += dihedral_eng;
+        force[idx_a].x += f_a.x;
+        force[idx_a].y += f_a.y;
+        force[idx_a].z += f_a.z;
+        force[idx_a].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_a] += dihedral_virial[k];
+            virial[virial_pitch * k + idx_a] += dihedral_virial[k];
 
-        h_force.data[idx_b].x += f_b.x;
-        h_force.data[idx_b].y += f_b.y;
-        h_force.data[idx_b].z += f_b.z;
-        h_force.data[idx_b].w += dihedral_eng;
+        force[idx_b].x += f_b.x;
+        force[idx_b].y += f_b.y;
+        force[idx_b].z += f_b.z;
+        force[idx_b].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_b] += dihedral_virial[k];
+            virial[virial_pitch * k + idx_b] += dihedral_virial[k];
 
-        h_force.data[idx_c].x += f_c.x;
-        h_force.data[idx_c].y += f_c.y;
-        h_force.data[idx_c].z += f_c.z;
-        h_force.data[idx_c].w += dihedral_eng;
+        force[idx_c].x += f_c.x;
+        force[idx_c].y += f_c.y;
+        force[idx_c].z += f_c.z;
+        force[idx_c].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_c] += dihedral_virial[k];
+            virial[virial_pitch * k + idx_c] += dihedral_virial[k];
 
-        h_force.data[idx_d].x += f_d.x;
-        h_force.data[idx_d].y += f_d.y;
-        h_force.data[idx_d].z += f_d.z;
-        h_force.data[idx_d].w += dihedral_eng;
+        force[idx_d].x += f_d.x;
+        force[idx_d].y += f_d.y;
+        force[idx_d].z += f_d.z;
+        force[idx_d].w += dihedral_eng;
         for (int k = 0; k < 6; k++)
-            h_virial.data[virial_pitch * k + idx_d] += dihedral_virial[k];
-        }
+            virial[virial_pitch * k + idx_d] += dihedral_virial[k];
+    };
+
+    // for each of the dihedrals
+    m_force_scatter.compute(m_exec_conf,
+                            (unsigned int)m_dihedral_data->getN(),
+                            m_pdata->getN() + m_pdata->getNGhosts(),
+                            h_force.data,
+                            h_virial.data,
+                            m_virial.getPitch(),
+                            compute_dihedral);
     }
 
 namespace detail
@@ -327,6 +327,7 @@ class LJGauss(BaseLJGauss, _AlchemicalPairForce):
         ``particle_type``], `AlchemicalDOF`])
     """
     _alchemical_dofs = ['epsilon', 'sigma', 'r0']
+    _supports_tabulation = False
 
     def __init__(self,
                  nlist,
@@ -355,6 +356,7 @@ class _NLJGauss(BaseLJGauss, _AlchemicalPairForce):
 
     """
     _alchemical_dofs = ['epsilon', 'sigma', 'r0']
+    _supports_tabulation = False
     normalized = True
 
     def __init__(self,
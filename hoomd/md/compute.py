@@ -9,10 +9,13 @@ or by direct access via the Python API.
 """
 
 from hoomd.md import _md
-from hoomd.operation import Compute
+from hoomd.operation import Compute, Writer
 from hoomd.data.parameterdicts import ParameterDict
+from hoomd.data.typeconverter import OnlyFrom
+from hoomd.filter import ParticleFilter
 from hoomd.logging import log
 import hoomd
+import numpy
 
 
 class ThermodynamicQuantities(Compute):
@@ -381,3 +384,300 @@ class HarmonicAveragedThermodynamicQuantities(Compute):
         """Average pressure :math:`[\\mathrm{pressure}]`."""
         self._cpp_obj.compute(self._simulation.timestep)
         return self._cpp_obj.pressure
+
+
+class Correlator(Writer):
+    r"""Accumulate time autocorrelation functions for Green-Kubo transport.
+
+    Args:
+        trigger (hoomd.trigger.Periodic): Select the timesteps on which to
+            sample the quantity.
+        filter (hoomd.filter.filter_like): Particles that contribute to the
+            quantity.
+        quantity (str): Quantity to correlate: ``'pressure_tensor'``,
+            ``'heat_flux'``, or ``'com_velocity'``.
+        block_length (int): Number of lags :math:`p` in each level of the
+            correlator. Defaults to 16.
+        averaging (int): Number of samples :math:`m` averaged when passing to
+            the next level. Must divide *block_length*. Defaults to 2.
+        max_levels (int): Maximum number of levels of the correlator. Defaults
+            to 32.
+
+    `Correlator` samples *quantity* every time *trigger* activates and
+    accumulates the time autocorrelation :math:`\langle A(t_0) A(t_0 + t)
+    \rangle` of each component on the fly with the multiple-tau algorithm
+    (Ramírez et al. 2010 https://doi.org/10.1063/1.3491098). Level 0 holds the
+    last :math:`p` samples and correlates lags :math:`0` to :math:`p-1`. Every
+    :math:`m` samples of a level are averaged and passed to the next level, so
+    the lags grow geometrically and the memory needed grows with the logarithm
+    of the number of samples.
+
+    The components of *quantity* are:
+
+    * ``'pressure_tensor'``: :math:`P_{xx}, P_{xy}, P_{xz}, P_{yy}, P_{yz},
+      P_{zz}`, the pressure tensor of the particles in *filter*.
+    * ``'heat_flux'``: :math:`J_x, J_y, J_z` where
+
+      .. math::
+
+          \vec{J} = \frac{1}{V} \sum_i \left( e_i \vec{v}_i
+                    + \mathbf{W}_i \cdot \vec{v}_i \right),
+
+      :math:`e_i` is the kinetic plus potential energy of particle :math:`i`,
+      and :math:`\mathbf{W}_i` is its virial tensor.
+    * ``'com_velocity'``: :math:`v_x, v_y, v_z`, the center of mass velocity of
+      the particles in *filter*.
+
+    Use the integral of the correlation to compute transport coefficients with
+    the Green-Kubo relations. For example, the shear viscosity is
+    :math:`\eta = \frac{V}{kT} \int_0^\infty \langle P_{xy}(0) P_{xy}(t)
+    \rangle \, dt`.
+
+    Note:
+        `Correlator` is a `hoomd.operation.Writer` so that it samples on the
+        timesteps selected by *trigger*. Add it to the simulation's writers.
+        *trigger* must select uniformly spaced timesteps.
+
+    Examples::
+
+        correlator = hoomd.md.compute.Correlator(
+            trigger=hoomd.trigger.Periodic(10),
+            filter=hoomd.filter.All(),
+            quantity='pressure_tensor')
+        sim.operations.writers.append(correlator)
+
+    Attributes:
+        trigger (hoomd.trigger.Periodic): Select the timesteps on which to
+            sample the quantity.
+        filter (hoomd.filter.filter_like): Particles that contribute to the
+            quantity (*read only*).
+        quantity (str): Quantity to correlate (*read only*).
+        block_length (int): Number of lags in each level of the correlator
+            (*read only*).
+        averaging (int): Number of samples averaged when passing to the next
+            level (*read only*).
+        max_levels (int): Maximum number of levels of the correlator (*read
+            only*).
+    """
+
+    def __init__(self,
+                 trigger,
+                 filter,
+                 quantity,
+                 block_length=16,
+                 averaging=2,
+                 max_levels=32):
+        super().__init__(trigger)
+        self._param_dict.update(
+            ParameterDict(filter=ParticleFilter,
+                          quantity=OnlyFrom(
+                              ['pressure_tensor', 'heat_flux',
+                               'com_velocity']),
+                          block_length=int,
+                          averaging=int,
+                          max_levels=int))
+        self.filter = filter
+        self.quantity = quantity
+        self.block_length = block_length
+        self.averaging = averaging
+        self.max_levels = max_levels
+
+    def _attach_hook(self):
+        group = self._simulation.state._get_group(self.filter)
+
+        thermo = None
+        if self.quantity == 'pressure_tensor':
+            if isinstance(self._simulation.device, hoomd.device.CPU):
+                thermo_cls = _md.ComputeThermo
+            else:
+                thermo_cls = _md.ComputeThermoGPU
+            thermo = thermo_cls(self._simulation.state._cpp_sys_def, group)
+
+        self._cpp_obj = _md.Correlator(self._simulation.state._cpp_sys_def,
+                                       self.trigger, group, self.quantity,
+                                       thermo, self.block_length,
+                                       self.averaging, self.max_levels)
+
+    def reset(self):
+        """Discard all samples."""
+        if self._attached:
+            self._cpp_obj.reset()
+
+    @log(requires_run=True)
+    def num_samples(self):
+        """int: Number of samples accumulated."""
+        return self._cpp_obj.num_samples
+
+    @log(category='sequence', requires_run=True)
+    def lags(self):
+        """(*N_lags*,) `numpy.ndarray` of ``numpy.uint64``: Lags \
+        :math:`[\\mathrm{time\\ steps}]`."""
+        return numpy.array(self._cpp_obj.getLags(), dtype=numpy.uint64)
+
+    @log(category='sequence', requires_run=True)
+    def correlation(self):
+        """(*N_lags*, *N_components*) `numpy.ndarray` of ``float``: \
+        Autocorrelation of each component of the quantity at each lag."""
+        return numpy.array(self._cpp_obj.getCorrelation()).reshape(
+            (-1, self._cpp_obj.num_channels))
+
+    @log(category='sequence', requires_run=True)
+    def integral(self):
+        """(*N_lags*, *N_components*) `numpy.ndarray` of ``float``: \
+        Running integral of the correlation over time
+        :math:`[\\mathrm{time}]`.
+
+        `integral` applies the trapezoidal rule to `correlation` with the lags
+        converted to time using the integrator's step size.
+        """
+        correlation = self.correlation
+        integral = numpy.zeros_like(correlation)
+        if len(correlation) < 2:
+            return integral
+
+        times = self.lags * self._simulation.operations.integrator.dt
+        dt = numpy.diff(times)[:, numpy.newaxis]
+        integral[1:] = numpy.cumsum(0.5 * dt
+                                    * (correlation[1:] + correlation[:-1]),
+                                    axis=0)
+        return integral
+
+
+class RadialDistributionFunction(Writer):
+    r"""Accumulate radial distribution functions from a neighbor list.
+
+    Args:
+        trigger (hoomd.trigger.trigger_like): Select the timesteps on which to
+            sample the pair distances.
+        nlist (hoomd.md.nlist.NeighborList): Neighbor list that provides the
+            pairs.
+        r_max (float): Largest pair distance in the histogram
+            :math:`[\mathrm{length}]`.
+        bins (int): Number of bins. Defaults to 100.
+
+    `RadialDistributionFunction` histograms the distances between all pairs of
+    particles within *r_max* every time *trigger* activates and accumulates the
+    histogram over all samples. It reads the pairs from *nlist*, reusing the
+    current build when a force has already updated *nlist* on that timestep.
+    *nlist* includes all pairs within *r_max* while `RadialDistributionFunction`
+    is attached.
+
+    The partial radial distribution function of types :math:`a` and :math:`b`
+    is:
+
+    .. math::
+
+        g_{ab}(r) = \frac{\sum_\mathrm{samples} n_{ab}(r)}
+                         {N_a (N_b - \delta_{ab}) \, \Delta V(r)
+                          \sum_\mathrm{samples} V^{-1}}
+
+    where :math:`n_{ab}(r)` is the number of ordered pairs with a particle of
+    type :math:`a` and a particle of type :math:`b` in the bin at :math:`r`,
+    :math:`N_a` is the number of particles of type :math:`a`, :math:`\Delta
+    V(r)` is the volume of the spherical shell spanned by the bin (the area of
+    the annulus in 2D), and :math:`V` is the volume of the box (the area in
+    2D).
+
+    Each MPI rank accumulates the pairs of its local particles. The ranks sum
+    their histograms only when you read `rdf` or `partial_rdf`.
+
+    Note:
+        `RadialDistributionFunction` omits the pairs that *nlist* excludes, such
+        as bonded pairs and particles in the same rigid body. It assumes that
+        the number of particles of each type is constant.
+
+    Note:
+        `RadialDistributionFunction` is a `hoomd.operation.Writer` so that it
+        samples on the timesteps selected by *trigger*. Add it to the
+        simulation's writers.
+
+    Examples::
+
+        rdf = hoomd.md.compute.RadialDistributionFunction(
+            trigger=hoomd.trigger.Periodic(100), nlist=nlist, r_max=4.0)
+        sim.operations.writers.append(rdf)
+
+    Attributes:
+        trigger (hoomd.trigger.Trigger): Select the timesteps on which to
+            sample the pair distances.
+        nlist (hoomd.md.nlist.NeighborList): Neighbor list that provides the
+            pairs (*read only*).
+        r_max (float): Largest pair distance in the histogram
+            :math:`[\mathrm{length}]` (*read only*).
+        bins (int): Number of bins (*read only*).
+    """
+
+    def __init__(self, trigger, nlist, r_max, bins=100):
+        super().__init__(trigger)
+        self._param_dict.update(
+            ParameterDict(nlist=hoomd.md.nlist.NeighborList,
+                          r_max=float,
+                          bins=int))
+        self.nlist = nlist
+        self.r_max = r_max
+        self.bins = bins
+
+    def _attach_hook(self):
+        self.nlist._attach(self._simulation)
+        self._cpp_obj = _md.RadialDistributionFunction(
+            self._simulation.state._cpp_sys_def, self.trigger,
+            self.nlist._cpp_obj, self.r_max, self.bins)
+
+    def _detach_hook(self):
+        self.nlist._detach()
+
+    def reset(self):
+        """Discard all samples."""
+        if self._attached:
+            self._cpp_obj.reset()
+
+    @log(requires_run=True)
+    def num_samples(self):
+        """int: Number of samples accumulated."""
+        return self._cpp_obj.num_samples
+
+    @log(category='sequence')
+    def bin_centers(self):
+        """(*bins*,) `numpy.ndarray` of ``float``: Distance at the center of \
+        each bin :math:`[\\mathrm{length}]`."""
+        edges = numpy.linspace(0, self.r_max, self.bins + 1)
+        return 0.5 * (edges[1:] + edges[:-1])
+
+    def _shell_volumes(self):
+        edges = numpy.linspace(0, self.r_max, self.bins + 1)
+        if self._simulation.state.box.is2D:
+            return numpy.pi * numpy.diff(edges**2)
+        return 4 / 3 * numpy.pi * numpy.diff(edges**3)
+
+    def _normalize(self, counts, pairs):
+        ideal = pairs * self._shell_volumes() * self._cpp_obj.inverse_volume_sum
+        return numpy.divide(counts,
+                            ideal,
+                            out=numpy.zeros(ideal.shape),
+                            where=ideal > 0)
+
+    @log(category='sequence', requires_run=True)
+    def rdf(self):
+        """(*bins*,) `numpy.ndarray` of ``float``: Radial distribution \
+        function :math:`g(r)` of all particles."""
+        counts = numpy.array(self._cpp_obj.getCounts(), dtype=numpy.float64)
+        counts = counts.reshape((-1, self.bins)).sum(axis=0)
+        N = numpy.sum(self._cpp_obj.getTypeCounts())
+        return self._normalize(counts, N * (N - 1))
+
+    @log(category='sequence', requires_run=True)
+    def partial_rdf(self):
+        """(*N_types*, *N_types*, *bins*) `numpy.ndarray` of ``float``: \
+        Partial radial distribution function :math:`g_{ab}(r)` of each pair of
+        types.
+
+        Index `partial_rdf` by the type ids of :math:`a` and :math:`b` in the
+        order of `hoomd.State.types`.
+        """
+        type_counts = numpy.array(self._cpp_obj.getTypeCounts(),
+                                  dtype=numpy.float64)
+        n_types = len(type_counts)
+        counts = numpy.array(self._cpp_obj.getCounts(), dtype=numpy.float64)
+        counts = counts.reshape((n_types, n_types, self.bins))
+        pairs = numpy.outer(type_counts, type_counts) - numpy.diag(type_counts)
+        return self._normalize(counts, pairs[:, :, numpy.newaxis])
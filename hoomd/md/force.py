@@ -4,6 +4,7 @@
 """Apply forces to particles."""
 
 from abc import abstractmethod
+import ctypes
 
 import hoomd
 from hoomd.md import _md
@@ -317,6 +318,129 @@ class Custom(Force):
         pass
 
 
+class CustomCFunction(Force):
+    """Custom forces implemented in a C function.
+
+    Args:
+        function: C function that sets the forces. Pass a numba ``cfunc``, a
+            `ctypes` function pointer, or the address of the function as an
+            `int`.
+        user_data (int): Address of data to pass to ``function``. *Optional*:
+            defaults to 0 (``NULL``).
+        aniso (bool): Set to `True` when ``function`` sets torques.
+
+    `CustomCFunction` calls ``function`` directly from C++ every time step.
+    Unlike `Custom`, it does not acquire the Python global interpreter lock or
+    create local array views, so it adds no overhead per step. ``function``
+    must have the signature:
+
+    .. code-block:: c
+
+        void function(uint64_t timestep,
+                      unsigned int N,
+                      unsigned int N_ghost,
+                      const Scalar* box,
+                      const Scalar4* position,
+                      const Scalar4* orientation,
+                      Scalar4* force,
+                      Scalar4* torque,
+                      Scalar* virial,
+                      size_t virial_pitch,
+                      void* user_data);
+
+    ``Scalar`` is ``double`` (``float`` when HOOMD-blue is built with single
+    precision, see `hoomd.version.floating_point_precision`) and ``Scalar4`` is
+    four consecutive ``Scalar`` values. The arguments are:
+
+    * ``timestep``: The current time step.
+    * ``N``: The number of particles local to this MPI rank.
+    * ``N_ghost``: The number of ghost particles on this MPI rank.
+    * ``box``: The global box parameters ``Lx, Ly, Lz, xy, xz, yz``.
+    * ``position``: The ``x, y, z`` position and the type id of the ``N``
+      local particles followed by the ``N_ghost`` ghost particles. The type id
+      is an ``int`` stored in the bits of the fourth ``Scalar``.
+    * ``orientation``: The orientation quaternions of the local and ghost
+      particles. ``NULL`` when ``aniso`` is `False` and every particle has the
+      default orientation ``(1, 0, 0, 0)``.
+    * ``force``: The ``x, y, z`` force and the potential energy of each local
+      particle.
+    * ``torque``: The ``x, y, z`` torque on each local particle. ``NULL``
+      when ``aniso`` is `False`.
+    * ``virial``: The virial of each local particle, stored as 6 rows (in the
+      order ``xx, xy, xz, yy, yz, zz``) with ``virial_pitch`` elements
+      between the rows. ``NULL`` when the simulation does not need the virial.
+    * ``user_data``: The value of ``user_data`` given to the constructor.
+
+    `CustomCFunction` sets ``force``, ``torque``, and ``virial`` to zero
+    before calling ``function``.
+
+    Example::
+
+        import numba
+        from numba import types
+
+        scalar_p = types.CPointer(types.float64)
+        signature = types.void(types.uint64, types.uint32, types.uint32,
+                               scalar_p, scalar_p, scalar_p, scalar_p,
+                               scalar_p, scalar_p, types.uintp, types.voidptr)
+
+        @numba.cfunc(signature)
+        def tether(timestep, N, N_ghost, box, position, orientation, force,
+                   torque, virial, virial_pitch, user_data):
+            r = numba.carray(position, (N, 4))
+            f = numba.carray(force, (N, 4))
+            for i in range(N):
+                f[i, 0:3] = -r[i, 0:3]
+                f[i, 3] = 0.5 * (r[i, 0]**2 + r[i, 1]**2 + r[i, 2]**2)
+
+        tether_force = hoomd.md.force.CustomCFunction(tether)
+
+    Warning:
+        ``function`` executes on the host with the host copies of the arrays
+        and HOOMD-blue does not check its behavior. ``function`` must not
+        access elements outside of the given arrays or call into Python.
+
+    Note:
+        Keep ``user_data`` valid for as long as `CustomCFunction` is part of
+        a simulation.
+    """
+
+    def __init__(self, function, user_data=0, aniso=False):
+        super().__init__()
+        # Keep a reference to function so that it remains valid.
+        self._function = function
+        self._address = self._function_address(function)
+        self._user_data = int(user_data)
+        self._aniso = aniso
+
+    @staticmethod
+    def _function_address(function):
+        """Get the address of a C function."""
+        if isinstance(function, int):
+            address = function
+        elif hasattr(function, 'address'):
+            address = function.address
+        elif callable(function):
+            # ctypes function pointers cast to their address, Python callables
+            # do not.
+            try:
+                address = ctypes.cast(function, ctypes.c_void_p).value
+            except ctypes.ArgumentError as err:
+                raise TypeError(f"Cannot get the address of the C function "
+                                f"{function}.") from err
+        else:
+            raise TypeError(f"Cannot get the address of the C function "
+                            f"{function}.")
+        if not address:
+            raise ValueError("The function address must not be NULL.")
+        return int(address)
+
+    def _attach_hook(self):
+        self._cpp_obj = _md.CustomForceCompute(
+            self._simulation.state._cpp_sys_def, self._address,
+            self._user_data, self._aniso)
+
+
 class Active(Force):
     r"""Active force.
 
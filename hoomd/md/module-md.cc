@@ -22,6 +22,7 @@ void export_ActiveRotationalDiffusionUpdater(pybind11::module& m);
 void export_ComputeThermo(pybind11::module& m);
 void export_ComputeThermoHMA(pybind11::module& m);
 void export_ConstantForceCompute(pybind11::module& m);
+void export_Correlator(pybind11::module& m);
 void export_HarmonicAngleForceCompute(pybind11::module& m);
 void export_CosineSqAngleForceCompute(pybind11::module& m);
 void export_TableAngleForceCompute(pybind11::module& m);
@@ -39,6 +40,7 @@ void export_MolecularForceCompute(pybind11::module& m);
 void export_ForceDistanceConstraint(pybind11::module& m);
 void export_ForceComposite(pybind11::module& m);
 void export_PPPMForceCompute(pybind11::module& m);
+void export_RadialDistributionFunction(pybind11::module& m);
 void export_wall_data(pybind11::module& m);
 void export_wall_field(pybind11::module& m);
 void export_LocalNeighborListDataHost(pybind11::module& m);
@@ -300,6 +302,7 @@ PYBIND11_MODULE(_md, m)
     export_ComputeThermo(m);
     export_ComputeThermoHMA(m);
     export_ConstantForceCompute(m);
+    export_Correlator(m);
     export_HarmonicAngleForceCompute(m);
     export_CosineSqAngleForceCompute(m);
     export_TableAngleForceCompute(m);
@@ -367,6 +370,7 @@ PYBIND11_MODULE(_md, m)
     export_ForceDistanceConstraint(m);
     export_ForceComposite(m);
     export_PPPMForceCompute(m);
+    export_RadialDistributionFunction(m);
     export_LocalNeighborListDataHost(m);
 
     export_PotentialExternalPeriodic(m);
@@ -24,6 +24,32 @@ last build and performs a rebuild when any particle has moved a distance
 ``buffer/2``. When `NeighborList.check_dist` is `False`, `NeighborList` always
 rebuilds after `NeighborList.rebuild_check_delay` time steps.
 
+When only some of the particles in the system move (for example, when the
+integration methods apply to a subset of the particles), set
+`NeighborList.check_filter` to select the particles that move. The distance
+check then considers only the selected particles, which reduces the cost of the
+check in systems where most particles are frozen.
+
+.. rubric:: Sublists
+
+When pair forces with very different cutoffs share a neighbor list, the pair
+forces with short cutoffs loop over many particle pairs beyond their cutoff.
+Set `NeighborList.sublists` to `True` to build a separate list for each pair
+force with a shorter cutoff than the neighbor list. Each list includes only the
+pairs within :math:`r_{\mathrm{cut},i,j} + r_\mathrm{buffer}` of that pair
+force. Sublists require additional memory and time to build, and improve
+performance when the short range forces dominate the run time.
+
+.. rubric:: Compression
+
+On the CPU, set `NeighborList.compressed` to `True` to also store the neighbor
+indices of each particle as 16-bit offsets from a base index. Pair forces read
+the compressed indices, which reduces the memory bandwidth needed to loop over
+the neighbor list. Compression is effective when the particles are sorted in
+space (see `hoomd.tune.ParticleSorter`) and particles with widely separated
+neighbor indices fall back to the uncompressed list. Compression requires
+additional memory and has no effect on the GPU.
+
 Note:
     With the default settings (``check_dist=True`` and
     ``rebuild_check_delay=1``), changing `NeighborList.buffer` only impacts
@@ -79,6 +105,7 @@ import hoomd.device
 from hoomd.data.parameterdicts import ParameterDict, TypeParameterDict
 from hoomd.data.typeparam import TypeParameter
 from hoomd.data.typeconverter import OnlyFrom, OnlyTypes, nonnegative_real
+from hoomd.filter import ParticleFilter
 from hoomd.logging import log
 from hoomd.mesh import Mesh
 from hoomd.operation import Compute
@@ -100,6 +127,10 @@ class NeighborList(Compute):
         rebuild_check_delay (int): How often to attempt to rebuild the neighbor
             list.
         check_dist (bool): Flag to enable / disable distance checking.
+        sublists (bool): Build separate lists for pair forces with shorter
+            cutoffs.
+        compressed (bool): Store 16-bit neighbor indices for pair forces to
+            read on the CPU.
         mesh (Mesh): mesh data structure (optional)
         default_r_cut (float): Default cutoff distance :math:`[\mathrm{length}]`
             (optional).
@@ -114,8 +145,16 @@ class NeighborList(Compute):
         `float`])
     """
 
-    def __init__(self, buffer, exclusions, rebuild_check_delay, check_dist,
-                 mesh, default_r_cut):
+    def __init__(self,
+                 buffer,
+                 exclusions,
+                 rebuild_check_delay,
+                 check_dist,
+                 mesh,
+                 default_r_cut,
+                 check_filter=None,
+                 sublists=False,
+                 compressed=False):
 
         validate_exclusions = OnlyFrom([
             'bond', 'angle', 'constraint', 'dihedral', 'special_pair', 'body',
@@ -134,17 +173,56 @@ class NeighborList(Compute):
         params = ParameterDict(exclusions=[validate_exclusions],
                                buffer=float(buffer),
                                rebuild_check_delay=int(rebuild_check_delay),
-                               check_dist=bool(check_dist))
+                               check_dist=bool(check_dist),
+                               sublists=bool(sublists),
+                               compressed=bool(compressed))
         params["exclusions"] = exclusions
         self._param_dict.update(params)
 
         self._mesh = validate_mesh(mesh)
+        self._check_filter = self._validate_check_filter(check_filter)
 
         self._in_context_manager = False
 
     def _attach_hook(self):
         if self._mesh is not None:
             self._cpp_obj.addMesh(self._mesh._cpp_obj)
+        self._apply_check_filter()
+
+    @staticmethod
+    def _validate_check_filter(check_filter):
+        return OnlyTypes(ParticleFilter, allow_none=True)(check_filter)
+
+    def _apply_check_filter(self):
+        if self._check_filter is None:
+            self._cpp_obj.setCheckGroup(None)
+        else:
+            self._cpp_obj.setCheckGroup(
+                self._simulation.state._get_group(self._check_filter))
+
+    @property
+    def check_filter(self):
+        """hoomd.filter.ParticleFilter: Particles that may move between \
+        neighbor list builds.
+
+        When `check_filter` is not `None`, the distance check considers only
+        the particles selected by `check_filter`. Set `check_filter` to the
+        union of the filters of all integration methods (and any other
+        operation that moves particles) to skip the distance check on particles
+        that never move. When `None`, the distance check considers all
+        particles.
+
+        Warning:
+            The neighbor list will not rebuild when particles outside of
+            `check_filter` move, which leads to incorrect forces.
+        """
+        return self._check_filter
+
+    @check_filter.setter
+    def check_filter(self, value):
+        self._check_filter = self._validate_check_filter(value)
+        if self._attached:
+            self._apply_check_filter()
 
     def _detach_hook(self):
         if self._mesh is not None:
@@ -333,6 +411,12 @@ class Cell(NeighborList):
         rebuild_check_delay (int): How often to attempt to rebuild the neighbor
             list.
         check_dist (bool): Flag to enable / disable distance checking.
+        check_filter (hoomd.filter.ParticleFilter): Particles to consider in
+            the distance check. Set to `None` to consider all particles.
+        sublists (bool): Build separate lists for pair forces with shorter
+            cutoffs.
+        compressed (bool): Store 16-bit neighbor indices for pair forces to
+            read on the CPU.
         deterministic (bool): When `True`, sort neighbors to help provide
             deterministic simulation runs.
         mesh (Mesh): When a mesh object is passed, the neighbor list uses the
@@ -379,10 +463,14 @@ class Cell(NeighborList):
                  check_dist=True,
                  deterministic=False,
                  mesh=None,
-                 default_r_cut=0.0):
+                 default_r_cut=0.0,
+                 check_filter=None,
+                 sublists=False,
+                 compressed=False):
 
         super().__init__(buffer, exclusions, rebuild_check_delay, check_dist,
-                         mesh, default_r_cut)
+                         mesh, default_r_cut, check_filter, sublists,
+                         compressed)
 
         self._param_dict.update(
             ParameterDict(deterministic=bool(deterministic)))
@@ -430,6 +518,12 @@ class Stencil(NeighborList):
         rebuild_check_delay (int): How often to attempt to rebuild the neighbor
             list.
         check_dist (bool): Flag to enable / disable distance checking.
+        check_filter (hoomd.filter.ParticleFilter): Particles to consider in
+            the distance check. Set to `None` to consider all particles.
+        sublists (bool): Build separate lists for pair forces with shorter
+            cutoffs.
+        compressed (bool): Store 16-bit neighbor indices for pair forces to
+            read on the CPU.
         deterministic (bool): When `True`, sort neighbors to help provide
             deterministic simulation runs.
         mesh (Mesh): When a mesh object is passed, the neighbor list uses the
@@ -487,10 +581,14 @@ class Stencil(NeighborList):
                  check_dist=True,
                  deterministic=False,
                  mesh=None,
-                 default_r_cut=0.0):
+                 default_r_cut=0.0,
+                 check_filter=None,
+                 sublists=False,
+                 compressed=False):
 
         super().__init__(buffer, exclusions, rebuild_check_delay, check_dist,
-                         mesh, default_r_cut)
+                         mesh, default_r_cut, check_filter, sublists,
+                         compressed)
 
         params = ParameterDict(deterministic=bool(deterministic),
                                cell_width=float(cell_width))
@@ -517,6 +615,12 @@ class Tree(NeighborList):
         rebuild_check_delay (int): How often to attempt to rebuild the neighbor
             list.
         check_dist (bool): Flag to enable / disable distance checking.
+        check_filter (hoomd.filter.ParticleFilter): Particles to consider in
+            the distance check. Set to `None` to consider all particles.
+        sublists (bool): Build separate lists for pair forces with shorter
+            cutoffs.
+        compressed (bool): Store 16-bit neighbor indices for pair forces to
+            read on the CPU.
         mesh (Mesh): When a mesh object is passed, the neighbor list uses the
             mesh to determine the bond exclusions in addition to all other
             set exclusions.
@@ -560,10 +664,14 @@ class Tree(NeighborList):
                  rebuild_check_delay=1,
                  check_dist=True,
                  mesh=None,
-                 default_r_cut=0.0):
+                 default_r_cut=0.0,
+                 check_filter=None,
+                 sublists=False,
+                 compressed=False):
 
         super().__init__(buffer, exclusions, rebuild_check_delay, check_dist,
-                         mesh, default_r_cut)
+                         mesh, default_r_cut, check_filter, sublists,
+                         compressed)
 
     def _attach_hook(self):
         if isinstance(self._simulation.device, hoomd.device.CPU):
@@ -48,6 +48,7 @@ class AnisotropicPair(Pair):
     """
 
     _accepted_modes = ("none", "shift")
+    _supports_tabulation = False
 
     def __init__(self, nlist, default_r_cut=None, mode="none"):
         super().__init__(nlist, default_r_cut, 0.0, mode)
@@ -9,10 +9,26 @@ import warnings
 import hoomd
 from hoomd.md import _md
 from hoomd.md import force
+from hoomd.data.collections import _to_base
 from hoomd.data.parameterdicts import ParameterDict, TypeParameterDict
 from hoomd.data.typeparam import TypeParameter
 import numpy as np
-from hoomd.data.typeconverter import OnlyFrom, nonnegative_real
+from hoomd.data.typeconverter import OnlyFrom, RequiredArg, nonnegative_real
+
+
+def _to_pair_matrix(name, value, n_types):
+    """Convert value to a finite, symmetric (n_types, n_types) float array."""
+    try:
+        matrix = np.broadcast_to(np.asarray(value, dtype=np.float64),
+                                 (n_types, n_types))
+    except ValueError as err:
+        raise ValueError(f"{name} must be a scalar or have shape "
+                         f"({n_types}, {n_types}).") from err
+    if not np.all(np.isfinite(matrix)):
+        raise ValueError(f"{name} must be finite.")
+    if not np.array_equal(matrix, matrix.T):
+        raise ValueError(f"{name} must be symmetric.")
+    return np.ascontiguousarray(matrix)
 
 
 class Pair(force.Force):
@@ -54,12 +70,43 @@ class Pair(force.Force):
         Neighbor list used to compute the pair force.
 
         Type: `hoomd.md.nlist.NeighborList`
+
+    .. py:attribute:: tabulate
+
+        Set to `True` to evaluate the pair force with cubic spline tables
+        instead of the analytic form. *Optional*: defaults to `False`. Not
+        available for all pair forces.
+
+        Type: `bool`
+
+    .. rubric:: Tabulation
+
+    Set `tabulate` to `True` to speed up pair forces that are expensive to
+    evaluate, such as those that call ``exp``, ``pow``, or ``erfc``. Before the
+    next step, `Pair` tabulates the energy and the force for each type pair on
+    a uniform grid in :math:`r^2` and interpolates with cubic splines. Each
+    table starts at the smallest :math:`r` above which :math:`|U(r)| \le 100`
+    :math:`[\mathrm{energy}]` and ends at ``r_cut``. Pairs that are closer
+    than the start of the table use the analytic form. The tables are refined
+    until the interpolated energy and force agree with the analytic form to a
+    relative tolerance of :math:`10^{-6}` of their largest magnitude in the
+    table. Type pairs that do not meet the tolerance use the analytic form
+    and `Pair` issues a warning. `Pair` rebuilds the tables when any of the
+    parameters change.
+
+    Note:
+        Tabulation applies on the CPU. On the GPU, `Pair` always evaluates the
+        analytic form.
     """
 
     # The accepted modes for the potential. Should be reset by subclasses with
     # restricted modes.
     _accepted_modes = ("none", "shift", "xplor")
 
+    # Set to False in subclasses whose C++ implementation does not support
+    # spline tables.
+    _supports_tabulation = True
+
     # Module where the C++ class is defined. Reassign this when developing an
     # external plugin.
     _ext_module = _md
@@ -84,6 +131,8 @@ class Pair(force.Force):
         self._param_dict.update(
             ParameterDict(mode=OnlyFrom(self._accepted_modes),
                           nlist=hoomd.md.nlist.NeighborList))
+        if self._supports_tabulation:
+            self._param_dict.update(ParameterDict(tabulate=False))
         self.mode = mode
         self.nlist = nlist
 
@@ -123,6 +172,111 @@ class Pair(force.Force):
         # above and raise an error if they occur.
         return self._cpp_obj.computeEnergyBetweenSets(tags1, tags2)
 
+    def set_params_matrix(self, types, r_cut=None, **params):
+        r"""Set the parameters for all pairs of the given types at once.
+
+        Args:
+            types (list[str]): Particle types that index the rows and columns
+                of the matrices.
+            r_cut ((*N*, *N*) `numpy.ndarray` of `float`): Cutoff radius for
+                each type pair :math:`[\mathrm{length}]`. *Optional*: leave
+                ``r_cut`` unchanged when `None`.
+            **params: Matrices of parameter values keyed by parameter name.
+                Each value is a (*N*, *N*) array-like or a scalar that applies
+                to all type pairs, where *N* is ``len(types)``.
+
+        `set_params_matrix` sets ``params[(types[i], types[j])]`` to the
+        values in row ``i`` and column ``j`` of the given matrices for all
+        ``i <= j``. Parameters not given keep their current values for each
+        type pair. The matrices must be finite and symmetric.
+
+        `set_params_matrix` validates and converts every type pair like
+        ``params[(types[i], types[j])] = ...`` does. When the pair force is
+        attached, it then sets all type pairs in a single call to C++ instead
+        of one call per type pair. Use it to set the parameters of simulations
+        with many particle types. `set_params_matrix` can only set parameters
+        that are scalars.
+
+        Example::
+
+            types = simulation.state.particle_types
+            epsilon = numpy.random.uniform(0.5, 1.5, size=(len(types),) * 2)
+            lj.set_params_matrix(types,
+                                 r_cut=2.5,
+                                 epsilon=(epsilon + epsilon.T) / 2,
+                                 sigma=1.0)
+        """
+        types = list(types)
+        if len(types) == 0 or not all(isinstance(t, str) for t in types):
+            raise ValueError("types must be a non-empty list of str.")
+        if len(set(types)) != len(types):
+            raise ValueError("types must be unique.")
+        if self._attached:
+            missing = set(types) - set(self._simulation.state.particle_types)
+            if missing:
+                raise KeyError(f"Types {missing} are not in the simulation.")
+
+        n_types = len(types)
+        matrices = {
+            name: _to_pair_matrix(name, value, n_types)
+            for name, value in params.items()
+        }
+        if r_cut is not None:
+            r_cut = _to_pair_matrix("r_cut", r_cut, n_types)
+
+        # Validate and convert every type pair. Parameters not given keep the
+        # current values of each type pair.
+        param_dict = self.params.param_dict
+        r_cut_dict = self.r_cut.param_dict
+        merge_current = not set(matrices).issuperset(param_dict.default)
+        rows, columns = np.triu_indices(n_types)
+        keys = [
+            tuple(sorted((types[i], types[j]))) for i, j in zip(rows, columns)
+        ]
+        values = []
+        for i, j, key in zip(rows, columns, keys):
+            value = {}
+            if merge_current:
+                value = {
+                    name: current
+                    for name, current in _to_base(param_dict[key]).items()
+                    if current is not RequiredArg
+                }
+            value.update(
+                {name: matrix[i, j] for name, matrix in matrices.items()})
+            value = param_dict._validate_values(value)
+            for name in matrices:
+                if not isinstance(value[name], float):
+                    raise ValueError(f"{name} is not a scalar parameter. Set "
+                                     f"it with params instead.")
+            values.append(value)
+            if r_cut is not None:
+                r_cut_dict._validate_values(r_cut[i, j])
+
+        # Set all type pairs in one call to C++ when every parameter is a
+        # scalar.
+        names = values[0].keys()
+        if (self._attached and hasattr(self._cpp_obj, "setParamsMatrix")
+                and all(
+                    isinstance(value[name], float)
+                    for value in values
+                    for name in names)):
+            all_matrices = {}
+            for name in names:
+                matrix = np.empty((n_types, n_types))
+                matrix[rows, columns] = [value[name] for value in values]
+                matrix[columns, rows] = matrix[rows, columns]
+                all_matrices[name] = matrix
+            self._cpp_obj.setParamsMatrix(types, all_matrices, {})
+            if r_cut is not None:
+                self._cpp_obj.setRCutMatrix(types, r_cut)
+            return
+
+        for i, j, key, value in zip(rows, columns, keys, values):
+            param_dict._single_setitem(key, value)
+            if r_cut is not None:
+                r_cut_dict._single_setitem(key, float(r_cut[i, j]))
+
     def _attach_hook(self):
         if self.nlist._attached and self._simulation != self.nlist._simulation:
             warnings.warn(
@@ -503,6 +657,7 @@ class Ewald(Pair):
         Type: `str`
     """
     _cpp_class_name = "PotentialPairEwald"
+    _supports_tabulation = False
     _accepted_modes = ("none",)
 
     def __init__(self, nlist, default_r_cut=None):
@@ -753,6 +908,7 @@ class DPD(Pair):
         Type: `str`
     """
     _cpp_class_name = "PotentialPairDPDThermoDPD"
+    _supports_tabulation = False
     _accepted_modes = ("none",)
 
     def __init__(
@@ -908,6 +1064,7 @@ class DPDLJ(Pair):
         Type: `str`
     """
     _cpp_class_name = "PotentialPairDPDThermoLJ"
+    _supports_tabulation = False
     _accepted_modes = ("none", "shift")
 
     def __init__(self, nlist, kT, default_r_cut=None, mode='none'):
@@ -1359,6 +1516,7 @@ class ReactionField(Pair):
         Type: `str`
     """
     _cpp_class_name = "PotentialPairReactionField"
+    _supports_tabulation = False
 
     def __init__(self, nlist, default_r_cut=None, default_r_on=0., mode='none'):
         super().__init__(nlist, default_r_cut, default_r_on, mode)
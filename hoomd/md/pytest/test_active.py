@@ -2,6 +2,7 @@
 # Part of HOOMD-blue, released under the BSD 3-Clause License.
 
 import hoomd
+import numpy
 import pytest
 from hoomd.conftest import pickling_check, autotuned_kernel_parameter_check
 
@@ -58,6 +59,41 @@ def test_attach(simulation_factory, two_particle_snapshot_factory):
     assert active.active_force['A'] == (0.0, 0.0, 1.0)
 
 
+def test_active_torque_first_step(simulation_factory,
+                                  two_particle_snapshot_factory):
+    """Active torques must act from the first step of a run."""
+
+    def angular_momentum(steps):
+        snapshot = two_particle_snapshot_factory(dimensions=3, d=8)
+        if snapshot.communicator.rank == 0:
+            snapshot.particles.moment_inertia[:] = [(1, 1, 1)] * 2
+        sim = simulation_factory(snapshot)
+
+        active = hoomd.md.force.Active(filter=hoomd.filter.All())
+        active.active_torque['A'] = (0.0, 0.0, 1.0)
+        integrator = hoomd.md.Integrator(.005, integrate_rotational_dof=True)
+        integrator.methods.append(
+            hoomd.md.methods.ConstantVolume(hoomd.filter.All()))
+        integrator.forces.append(active)
+        sim.operations.integrator = integrator
+        sim.run(steps)
+
+        snapshot = sim.state.get_snapshot()
+        if snapshot.communicator.rank == 0:
+            return snapshot.particles.angmom.copy()
+        return None
+
+    # a constant torque increases the z component of the angular momentum by
+    # the same amount on every step, including the first
+    one_step = angular_momentum(1)
+    two_steps = angular_momentum(2)
+    if one_step is not None:
+        assert numpy.all(one_step[:, 3] > 0)
+        numpy.testing.assert_allclose(two_steps[:, 3],
+                                      2 * one_step[:, 3],
+                                      rtol=1e-5)
+
+
 def test_kernel_parameters(simulation_factory, two_particle_snapshot_factory):
     active = hoomd.md.force.Active(filter=hoomd.filter.All())
 
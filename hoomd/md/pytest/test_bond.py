@@ -5,7 +5,8 @@ import hoomd
 from hoomd import md
 from hoomd.conftest import expected_loggable_params
 from hoomd.conftest import (logging_check, pickling_check,
-                            autotuned_kernel_parameter_check)
+                            autotuned_kernel_parameter_check,
+                            cpu_threads_check)
 import pytest
 import numpy as np
 
@@ -197,3 +198,52 @@ def test_pickling(simulation_factory, snapshot_factory, bond_cls, bond_args,
     sim.operations.integrator = integrator
     sim.run(0)
     pickling_check(potential)
+
+
+@pytest.mark.serial
+@pytest.mark.cpu
+@pytest.mark.skipif(not hoomd.version.tbb_enabled, reason='TBB is not enabled')
+def test_cpu_threads(device):
+    """Test that bonded forces do not depend on the number of CPU threads."""
+    # A random walk polymer with enough groups to split across threads.
+    N = 2000
+    rng = np.random.default_rng(5)
+    steps = rng.normal(size=(N, 3))
+    steps *= 1.0 / np.linalg.norm(steps, axis=1)[:, np.newaxis]
+    position = np.cumsum(steps, axis=0)
+    position -= np.mean(position, axis=0)
+
+    snapshot = hoomd.Snapshot()
+    L = 2 * np.max(np.abs(position)) + 10
+    snapshot.configuration.box = [L, L, L, 0, 0, 0]
+    snapshot.particles.N = N
+    snapshot.particles.types = ['A']
+    snapshot.particles.position[:] = position
+    snapshot.bonds.N = N - 1
+    snapshot.bonds.types = ['A-A']
+    snapshot.bonds.group[:] = [(i, i + 1) for i in range(N - 1)]
+    snapshot.angles.N = N - 2
+    snapshot.angles.types = ['A-A-A']
+    snapshot.angles.group[:] = [(i, i + 1, i + 2) for i in range(N - 2)]
+    snapshot.dihedrals.N = N - 3
+    snapshot.dihedrals.types = ['A-A-A-A']
+    snapshot.dihedrals.group[:] = [
+        (i, i + 1, i + 2, i + 3) for i in range(N - 3)
+    ]
+
+    def run(sim):
+        bond = md.bond.Harmonic()
+        bond.params['A-A'] = dict(k=30.0, r0=1.2)
+        angle = md.angle.Harmonic()
+        angle.params['A-A-A'] = dict(k=10.0, t0=2.0)
+        periodic = md.dihedral.Periodic()
+        periodic.params['A-A-A-A'] = dict(k=3.0, d=-1, n=3, phi0=0.5)
+        opls = md.dihedral.OPLS()
+        opls.params['A-A-A-A'] = dict(k1=1.0, k2=1.5, k3=0.5, k4=0.75)
+        forces = [bond, angle, periodic, opls]
+
+        sim.operations.integrator = md.Integrator(dt=0.005, forces=forces)
+        sim.run(0)
+        return [f.forces for f in forces] + [f.energies for f in forces]
+
+    cpu_threads_check(snapshot, run)
@@ -0,0 +1,120 @@
+# Copyright (c) 2009-2023 The Regents of the University of Michigan.
+# Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+import hoomd
+from hoomd.conftest import logging_check
+from hoomd.error import DataAccessError
+from hoomd.logging import LoggerCategories
+import pytest
+import numpy as np
+
+_quantities = [('pressure_tensor', 6), ('heat_flux', 3), ('com_velocity', 3)]
+
+
+def _make_simulation(simulation_factory, lattice_snapshot_factory):
+    snap = lattice_snapshot_factory(n=4, a=1.5)
+    if snap.communicator.rank == 0:
+        rng = np.random.default_rng(3)
+        snap.particles.velocity[:] = rng.normal(size=(snap.particles.N, 3))
+    sim = simulation_factory(snap)
+
+    nlist = hoomd.md.nlist.Cell(buffer=0.4)
+    lj = hoomd.md.pair.LJ(nlist=nlist, default_r_cut=2.5)
+    lj.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+    sim.operations.integrator = hoomd.md.Integrator(
+        dt=0.005,
+        methods=[hoomd.md.methods.ConstantVolume(filter=hoomd.filter.All())],
+        forces=[lj])
+    return sim
+
+
+@pytest.mark.parametrize('quantity, n_channels', _quantities)
+def test_correlation(simulation_factory, lattice_snapshot_factory, quantity,
+                     n_channels):
+    correlator = hoomd.md.compute.Correlator(trigger=hoomd.trigger.Periodic(2),
+                                             filter=hoomd.filter.All(),
+                                             quantity=quantity,
+                                             block_length=8,
+                                             averaging=2)
+    with pytest.raises(DataAccessError):
+        correlator.correlation
+
+    sim = _make_simulation(simulation_factory, lattice_snapshot_factory)
+    sim.operations.writers.append(correlator)
+    sim.run(200)
+
+    assert correlator.num_samples == 100
+    lags = correlator.lags
+    correlation = correlator.correlation
+    integral = correlator.integral
+
+    # level 0 holds lags 0 to 7, higher levels hold lags 4 to 7 in their units
+    np.testing.assert_array_equal(lags[:8], np.arange(8) * 2)
+    np.testing.assert_array_equal(lags[8:12], np.arange(4, 8) * 4)
+    assert np.all(np.diff(lags) > 0)
+
+    assert correlation.shape == (len(lags), n_channels)
+    assert integral.shape == correlation.shape
+    assert np.all(correlation[0] >= 0)
+    np.testing.assert_allclose(integral[0], 0)
+    np.testing.assert_allclose(
+        integral[1], 0.5 * (correlation[0] + correlation[1]) * 2 * 0.005)
+
+    correlator.reset()
+    assert correlator.num_samples == 0
+    assert len(correlator.lags) == 0
+
+
+def test_zero_lag(simulation_factory, lattice_snapshot_factory):
+    """The zero lag correlation is the mean square of the samples."""
+    correlator = hoomd.md.compute.Correlator(trigger=hoomd.trigger.Periodic(1),
+                                             filter=hoomd.filter.All(),
+                                             quantity='com_velocity')
+    sim = _make_simulation(simulation_factory, lattice_snapshot_factory)
+    sim.operations.writers.append(correlator)
+
+    snap = sim.state.get_snapshot()
+    sim.run(1)
+
+    if snap.communicator.rank == 0:
+        velocity = np.mean(snap.particles.velocity, axis=0)
+        np.testing.assert_allclose(correlator.correlation[0], velocity**2)
+
+
+def test_invalid_parameters(simulation_factory, lattice_snapshot_factory):
+    with pytest.raises(ValueError):
+        hoomd.md.compute.Correlator(trigger=hoomd.trigger.Periodic(1),
+                                    filter=hoomd.filter.All(),
+                                    quantity='energy')
+
+    correlator = hoomd.md.compute.Correlator(trigger=hoomd.trigger.Periodic(1),
+                                             filter=hoomd.filter.All(),
+                                             quantity='com_velocity',
+                                             block_length=5,
+                                             averaging=2)
+    sim = _make_simulation(simulation_factory, lattice_snapshot_factory)
+    sim.operations.writers.append(correlator)
+    with pytest.raises(ValueError):
+        sim.run(0)
+
+
+def test_logging():
+    logging_check(
+        hoomd.md.compute.Correlator, ('md', 'compute'), {
+            'num_samples': {
+                'category': LoggerCategories.scalar,
+                'default': True
+            },
+            'lags': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            },
+            'correlation': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            },
+            'integral': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            }
+        })
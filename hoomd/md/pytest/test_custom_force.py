@@ -1,6 +1,8 @@
 # Copyright (c) 2009-2023 The Regents of the University of Michigan.
 # Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+import ctypes
+
 import pytest
 import numpy as np
 import numpy.testing as npt
@@ -427,3 +429,97 @@ def test_force_zeroing(force_simulation_factory, two_particle_snapshot_factory):
             assert np.allclose(forces, timestep)
             assert np.allclose(torques, timestep)
             assert np.allclose(virials, timestep)
+
+
+_scalar_p = ctypes.POINTER(ctypes.c_double)
+_custom_force_function = ctypes.CFUNCTYPE(None, ctypes.c_uint64,
+                                          ctypes.c_uint, ctypes.c_uint,
+                                          _scalar_p, _scalar_p, _scalar_p,
+                                          _scalar_p, _scalar_p, _scalar_p,
+                                          ctypes.c_size_t, ctypes.c_void_p)
+
+
+@_custom_force_function
+def _tether(timestep, N, N_ghost, box, position, orientation, force, torque,
+            virial, virial_pitch, user_data):
+    """Harmonic tether to the origin with the spring constant in user_data."""
+    k = ctypes.cast(user_data, _scalar_p)[0]
+    for i in range(N):
+        r_sq = 0
+        for j in range(3):
+            force[4 * i + j] = -k * position[4 * i + j]
+            r_sq += position[4 * i + j]**2
+        force[4 * i + 3] = 0.5 * k * r_sq
+        if virial:
+            virial[i] = -k * position[4 * i]**2
+        if torque:
+            torque[4 * i + 2] = timestep
+
+
+@pytest.mark.cpu
+def test_c_function(force_simulation_factory, two_particle_snapshot_factory):
+    """Test forces computed by a C function pointer."""
+    if hoomd.version.floating_point_precision[0] != 64:
+        pytest.skip("The test function uses double precision.")
+
+    k = ctypes.c_double(2.0)
+    custom_force = md.force.CustomCFunction(_tether,
+                                            user_data=ctypes.addressof(k),
+                                            aniso=True)
+    snap = two_particle_snapshot_factory(d=1.5)
+    sim = force_simulation_factory(custom_force, snap)
+    sim.always_compute_pressure = True
+    sim.run(0)
+
+    forces = custom_force.forces
+    energies = custom_force.energies
+    torques = custom_force.torques
+    virials = custom_force.virials
+    snap = sim.state.get_snapshot()
+    if sim.device.communicator.rank == 0:
+        position = snap.particles.position
+        npt.assert_allclose(forces, -2.0 * position)
+        npt.assert_allclose(energies, np.sum(position**2, axis=1))
+        npt.assert_allclose(torques, 0)
+        npt.assert_allclose(virials[:, 0], -2.0 * position[:, 0]**2)
+        npt.assert_allclose(virials[:, 1:], 0)
+
+    sim.run(2)
+    torques = custom_force.torques
+    if sim.device.communicator.rank == 0:
+        npt.assert_allclose(torques[:, 2], sim.timestep)
+
+
+def test_c_function_address():
+    """Test that CustomCFunction rejects invalid functions."""
+    with pytest.raises(TypeError):
+        md.force.CustomCFunction(lambda timestep: None)
+    with pytest.raises(ValueError):
+        md.force.CustomCFunction(0)
+
+
+@_custom_force_function
+def _check_orientation(timestep, N, N_ghost, box, position, orientation, force,
+                       torque, virial, virial_pitch, user_data):
+    """Store whether the orientation array was passed in user_data."""
+    ctypes.cast(user_data, _scalar_p)[0] = 1.0 if orientation else 0.0
+
+
+@pytest.mark.cpu
+@pytest.mark.parametrize("aniso", [False, True])
+def test_c_function_orientation(force_simulation_factory,
+                                two_particle_snapshot_factory, aniso):
+    """Test that isotropic C functions do not request the orientations."""
+    if hoomd.version.floating_point_precision[0] != 64:
+        pytest.skip("The test function uses double precision.")
+
+    has_orientation = ctypes.c_double(-1.0)
+    custom_force = md.force.CustomCFunction(
+        _check_orientation,
+        user_data=ctypes.addressof(has_orientation),
+        aniso=aniso)
+    sim = force_simulation_factory(custom_force,
+                                   two_particle_snapshot_factory())
+    sim.run(0)
+
+    assert has_orientation.value == (1.0 if aniso else 0.0)
@@ -62,6 +62,8 @@ def test_common_params(nlist_params):
         "exclusions": ('bond',),
         "rebuild_check_delay": 1,
         "check_dist": True,
+        "sublists": False,
+        "compressed": False,
     }
     _assert_nlist_params(nlist, default_params_dict)
     new_params_dict = {
@@ -76,6 +78,10 @@ def test_common_params(nlist_params):
             np.random.randint(8),
         "check_dist":
             False,
+        "sublists":
+            True,
+        "compressed":
+            True,
     }
     for param in new_params_dict.keys():
         setattr(nlist, param, new_params_dict[param])
@@ -191,6 +197,123 @@ def test_cell_properties(simulation_factory, lattice_snapshot_factory):
     assert nlist.allocated_particles_per_cell >= 1
 
 
+def test_check_filter(simulation_factory, lattice_snapshot_factory):
+    nlist = Cell(buffer=0.4)
+    assert nlist.check_filter is None
+    nlist.check_filter = hoomd.filter.Type(['A'])
+    assert nlist.check_filter == hoomd.filter.Type(['A'])
+
+    def run(check_filter):
+        nlist = Cell(buffer=0.4, check_filter=check_filter)
+        lj = hoomd.md.pair.LJ(nlist, default_r_cut=1.1)
+        lj.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+        lj.params[('A', 'B')] = dict(epsilon=1, sigma=1)
+        lj.params[('B', 'B')] = dict(epsilon=1, sigma=1)
+        integrator = hoomd.md.Integrator(0.005, forces=[lj])
+        integrator.methods.append(
+            hoomd.md.methods.Langevin(hoomd.filter.Type(['A']), kT=1))
+
+        snapshot = lattice_snapshot_factory(particle_types=['A', 'B'], n=10)
+        if snapshot.communicator.rank == 0:
+            snapshot.particles.typeid[::2] = 1
+        sim = simulation_factory(snapshot)
+        sim.seed = 1
+        sim.operations.integrator = integrator
+        sim.run(100)
+        return nlist.num_builds, lj.energy
+
+    # Only the type A particles move, so checking them alone must rebuild the
+    # neighbor list on the same steps as checking all particles.
+    builds, energy = run(None)
+    assert builds > 1
+    filtered_builds, filtered_energy = run(hoomd.filter.Type(['A']))
+    assert filtered_builds == builds
+    # The neighbor order, and with it the order of the energy sum, differs.
+    np.testing.assert_allclose(filtered_energy, energy, rtol=1e-6)
+
+    # Checking only the type B particles, which never move, misses the moving
+    # particles and skips rebuilds.
+    filtered_builds, filtered_energy = run(hoomd.filter.Type(['B']))
+    assert filtered_builds < builds
+    assert filtered_energy != pytest.approx(energy, rel=1e-6)
+
+
+@pytest.mark.parametrize("sublists", [False, True])
+def test_sublists(nlist_params, simulation_factory, lattice_snapshot_factory,
+                  sublists):
+    nlist_cls, required_args = nlist_params
+
+    def make_simulation(wca_nlist, yukawa_nlist):
+        # A short and a long range force.
+        wca = hoomd.md.pair.LJ(wca_nlist,
+                               default_r_cut=2**(1 / 6),
+                               mode='shift')
+        wca.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+        yukawa = hoomd.md.pair.Yukawa(yukawa_nlist, default_r_cut=3.0)
+        yukawa.params[('A', 'A')] = dict(epsilon=1, kappa=1)
+        integrator = hoomd.md.Integrator(0.002, forces=[wca, yukawa])
+        integrator.methods.append(
+            hoomd.md.methods.ConstantVolume(hoomd.filter.All()))
+
+        sim = simulation_factory(lattice_snapshot_factory(n=6, a=1.2))
+        sim.seed = 2
+        sim.state.thermalize_particle_momenta(hoomd.filter.All(), kT=1.0)
+        sim.operations.integrator = integrator
+        return sim, wca, yukawa
+
+    # Share one neighbor list between the forces.
+    nlist = nlist_cls(**required_args, buffer=0.4, sublists=sublists)
+    sim, wca, yukawa = make_simulation(nlist, nlist)
+
+    # Use a separate neighbor list for each force as a reference.
+    reference_sim, reference_wca, reference_yukawa = make_simulation(
+        nlist_cls(**required_args, buffer=0.4),
+        nlist_cls(**required_args, buffer=0.4))
+
+    # Moving particles must not lose interactions between neighbor list
+    # builds.
+    for steps in (0, 20):
+        sim.run(steps)
+        reference_sim.run(steps)
+        assert wca.energy == pytest.approx(reference_wca.energy, rel=1e-5)
+        assert yukawa.energy == pytest.approx(reference_yukawa.energy,
+                                              rel=1e-5)
+
+
+@pytest.mark.parametrize("sublists", [False, True])
+def test_compressed(nlist_params, simulation_factory, lattice_snapshot_factory,
+                    sublists):
+    nlist_cls, required_args = nlist_params
+
+    def make_simulation(compressed):
+        nlist = nlist_cls(**required_args,
+                          buffer=0.4,
+                          sublists=sublists,
+                          compressed=compressed)
+        lj = hoomd.md.pair.LJ(nlist, default_r_cut=2.5)
+        lj.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+        dpd = hoomd.md.pair.DPD(nlist, kT=1.0, default_r_cut=1.0)
+        dpd.params[('A', 'A')] = dict(A=10, gamma=1)
+        integrator = hoomd.md.Integrator(0.002, forces=[lj, dpd])
+        integrator.methods.append(
+            hoomd.md.methods.ConstantVolume(hoomd.filter.All()))
+
+        sim = simulation_factory(lattice_snapshot_factory(n=8, a=1.1))
+        sim.seed = 3
+        sim.operations.integrator = integrator
+        return sim, lj, dpd
+
+    sim, lj, dpd = make_simulation(compressed=True)
+    reference_sim, reference_lj, reference_dpd = make_simulation(
+        compressed=False)
+
+    for steps in (0, 20):
+        sim.run(steps)
+        reference_sim.run(steps)
+        assert lj.energy == pytest.approx(reference_lj.energy, rel=1e-5)
+        assert dpd.energy == pytest.approx(reference_dpd.energy, rel=1e-5)
+
+
 def test_logging():
     base_loggables = {
         'shortest_rebuild': {
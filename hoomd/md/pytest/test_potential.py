@@ -11,8 +11,10 @@ import hoomd
 from hoomd import md
 from hoomd.logging import LoggerCategories
 from hoomd.conftest import (logging_check, pickling_check,
-                            autotuned_kernel_parameter_check)
+                            autotuned_kernel_parameter_check,
+                            cpu_threads_check)
 from hoomd.error import TypeConversionError
+from hoomd.data.typeconverter import RequiredArg
 import pytest
 import itertools
 from copy import deepcopy
@@ -727,6 +729,78 @@ def test_attached_params(simulation_factory, lattice_snapshot_factory,
                                        pot.params.to_base())
 
 
+@pytest.mark.parametrize("attach", [False, True])
+def test_set_params_matrix(simulation_factory, lattice_snapshot_factory,
+                           attach):
+    types = ['A', 'B', 'C']
+    epsilon = np.array([[1.0, 1.5, 2.0], [1.5, 2.5, 3.0], [2.0, 3.0, 3.5]])
+    r_cut = np.full((3, 3), 2.5)
+    r_cut[0, 2] = r_cut[2, 0] = 3.0
+
+    lj = md.pair.LJ(nlist=md.nlist.Cell(buffer=0.4), default_r_cut=2.0)
+    if attach:
+        snap = lattice_snapshot_factory(particle_types=types, n=5, a=1.5)
+        sim = simulation_factory(snap)
+        lj.set_params_matrix(types, epsilon=1.0, sigma=1.0)
+        integrator = md.Integrator(dt=0.005, forces=[lj])
+        sim.operations.integrator = integrator
+        sim.run(0)
+
+    lj.set_params_matrix(types, r_cut=r_cut, epsilon=epsilon, sigma=0.5)
+    for i, j in itertools.combinations_with_replacement(range(3), 2):
+        key = (types[i], types[j])
+        assert lj.params[key]['epsilon'] == epsilon[i, j]
+        assert lj.params[key]['sigma'] == 0.5
+        assert lj.r_cut[key] == r_cut[i, j]
+
+    with pytest.raises(ValueError):
+        lj.set_params_matrix(types, epsilon=np.ones((2, 2)), sigma=1.0)
+    with pytest.raises(ValueError):
+        lj.set_params_matrix(types, epsilon=np.triu(epsilon), sigma=1.0)
+    with pytest.raises(ValueError):
+        lj.set_params_matrix(types, epsilon=np.nan, sigma=1.0)
+    with pytest.raises(KeyError):
+        lj.set_params_matrix(types, epsilon=1.0, sigma=1.0, alpha=1.0)
+
+    # parameters that are not given keep their values
+    r_cut_only = np.full((3, 3), 2.0)
+    lj.set_params_matrix(types, r_cut=r_cut_only)
+    for i, j in itertools.combinations_with_replacement(range(3), 2):
+        key = (types[i], types[j])
+        assert lj.params[key]['epsilon'] == epsilon[i, j]
+        assert lj.params[key]['sigma'] == 0.5
+        assert lj.r_cut[key] == 2.0
+
+    # invalid entries off the diagonal leave all parameters unchanged
+    bad_r_cut = np.full((3, 3), 2.5)
+    bad_r_cut[0, 1] = bad_r_cut[1, 0] = -1.0
+    with pytest.raises(ValueError):
+        lj.set_params_matrix(types, r_cut=bad_r_cut, sigma=2.0)
+    bad_epsilon = np.full((3, 3), 1.0, dtype=object)
+    bad_epsilon[1, 2] = bad_epsilon[2, 1] = 'a'
+    with pytest.raises(ValueError):
+        lj.set_params_matrix(types, epsilon=bad_epsilon)
+    for i, j in itertools.combinations_with_replacement(range(3), 2):
+        key = (types[i], types[j])
+        assert lj.params[key]['epsilon'] == epsilon[i, j]
+        assert lj.params[key]['sigma'] == 0.5
+        assert lj.r_cut[key] == 2.0
+
+
+def test_set_params_matrix_partial():
+    types = ['A', 'B']
+    lj = md.pair.LJ(nlist=md.nlist.Cell(buffer=0.4))
+    lj.set_params_matrix(types, epsilon=[[1.0, 2.0], [2.0, 3.0]])
+
+    # sigma is still required
+    assert lj.params[('A', 'B')]['epsilon'] == 2.0
+    assert lj.params[('A', 'B')]['sigma'] is RequiredArg
+
+    lj.set_params_matrix(types, sigma=1.5)
+    assert lj.params[('A', 'B')]['epsilon'] == 2.0
+    assert lj.params[('A', 'B')]['sigma'] == 1.5
+
+
 def test_run(simulation_factory, lattice_snapshot_factory, valid_params):
     pair_keys = valid_params.pair_potential_params.keys()
     particle_types = list(set(itertools.chain.from_iterable(pair_keys)))
@@ -1044,6 +1118,93 @@ def test_force_energy_accuracy(simulation_factory,
                                equal_nan=True)
 
 
+@pytest.mark.cpu
+@pytest.mark.filterwarnings("ignore:invalid value encountered in multiply")
+@pytest.mark.parametrize("forces_and_energies",
+                         _forces_and_energies(),
+                         ids=lambda x: x.pair_potential.__name__)
+def test_tabulate(simulation_factory, two_particle_snapshot_factory,
+                  forces_and_energies):
+    """Test that tabulated pair forces match the analytic form."""
+    if not forces_and_energies.pair_potential._supports_tabulation:
+        pytest.skip("Cannot tabulate "
+                    + forces_and_energies.pair_potential.__name__)
+
+    pot = forces_and_energies.pair_potential(**forces_and_energies.extra_args,
+                                             nlist=md.nlist.Cell(buffer=0.4),
+                                             default_r_cut=2.5)
+    pot.params[('A', 'A')] = forces_and_energies.pair_potential_params
+    pot.tabulate = True
+    snap = two_particle_snapshot_factory(particle_types=['A'], d=0.75)
+    _update_snap(forces_and_energies.pair_potential, snap)
+    sim = simulation_factory(snap)
+    integrator = md.Integrator(dt=0.005)
+    integrator.forces.append(pot)
+    sim.operations.integrator = integrator
+    sim.run(0)
+    assert pot.tabulate
+
+    particle_distances = [0.75, 1.5]
+    for i in range(len(particle_distances)):
+        d = particle_distances[i]
+        r = np.array([0, 0, d]) / d
+        snap = sim.state.get_snapshot()
+        if snap.communicator.rank == 0:
+            snap.particles.position[0] = [0, 0, .1]
+            snap.particles.position[1] = [0, 0, d + .1]
+        sim.state.set_snapshot(snap)
+        sim_energies = pot.energies
+        sim_forces = pot.forces
+        if sim_energies is not None:
+            np.testing.assert_allclose(sum(sim_energies),
+                                       forces_and_energies.energies[i],
+                                       rtol=1e-4,
+                                       atol=1e-4)
+            np.testing.assert_allclose(sim_forces[0],
+                                       forces_and_energies.forces[i] * r,
+                                       rtol=1e-4,
+                                       atol=1e-4)
+
+
+@pytest.mark.serial
+@pytest.mark.cpu
+@pytest.mark.parametrize('cls, params', [
+    (md.many_body.Tersoff,
+     dict(cutoff_thickness=0.2,
+          magnitudes=(5.0, 2.0),
+          exp_factors=(2.0, 2.0),
+          lambda3=0.5,
+          dimer_r=1.0,
+          n=1.0,
+          gamma=0.5,
+          c=1.0,
+          d=1.0,
+          m=0.5,
+          alpha=2.0)),
+    (md.many_body.SquareDensity, dict(A=5.0, B=2.0)),
+    (md.many_body.RevCross, dict(sigma=0.8, n=10.0, epsilon=1.0, lambda3=1.0)),
+],
+                         ids=['Tersoff', 'SquareDensity', 'RevCross'])
+@pytest.mark.skipif(not hoomd.version.tbb_enabled, reason='TBB is not enabled')
+def test_many_body_cpu_threads(device, lattice_snapshot_factory, cls, params):
+    """Test that three-body forces do not depend on the number of threads."""
+    snapshot = lattice_snapshot_factory(particle_types=['A'],
+                                        dimensions=3,
+                                        a=1.0,
+                                        n=11,
+                                        r=0.1)
+
+    def run(sim):
+        potential = cls(nlist=md.nlist.Cell(buffer=0.4), default_r_cut=1.5)
+        potential.params[('A', 'A')] = params
+        sim.operations.integrator = md.Integrator(dt=0.005,
+                                                  forces=[potential])
+        sim.run(0)
+        return [potential.forces, potential.energies]
+
+    cpu_threads_check(snapshot, run)
+
+
 def populate_sim(sim):
     """Add an integrator for the following tests."""
     sim.operations.integrator = md.Integrator(
@@ -0,0 +1,110 @@
+# Copyright (c) 2009-2023 The Regents of the University of Michigan.
+# Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+import hoomd
+from hoomd.conftest import logging_check
+from hoomd.error import DataAccessError
+from hoomd.logging import LoggerCategories
+import pytest
+import numpy as np
+
+
+def test_two_particles(simulation_factory, two_particle_snapshot_factory):
+    rdf = hoomd.md.compute.RadialDistributionFunction(
+        trigger=hoomd.trigger.Periodic(1),
+        nlist=hoomd.md.nlist.Cell(buffer=0.4),
+        r_max=2.0,
+        bins=20)
+    with pytest.raises(DataAccessError):
+        rdf.rdf
+    np.testing.assert_allclose(rdf.bin_centers, np.arange(20) * 0.1 + 0.05)
+
+    sim = simulation_factory(two_particle_snapshot_factory(d=1.25, L=10))
+    sim.operations.writers.append(rdf)
+    sim.run(5)
+
+    assert rdf.num_samples == 5
+
+    # the only pair is in bin 12, normalized by the volume of its shell
+    shell_volume = 4 / 3 * np.pi * (1.3**3 - 1.2**3)
+    expected = np.zeros(20)
+    expected[12] = 1000 / shell_volume
+    np.testing.assert_allclose(rdf.rdf, expected)
+    np.testing.assert_allclose(rdf.partial_rdf, expected[np.newaxis,
+                                                         np.newaxis, :])
+
+    rdf.reset()
+    assert rdf.num_samples == 0
+    np.testing.assert_allclose(rdf.rdf, 0)
+
+
+def test_partial_rdf(simulation_factory, two_particle_snapshot_factory):
+    snapshot = two_particle_snapshot_factory(particle_types=['A', 'B'],
+                                             d=0.55,
+                                             L=10)
+    if snapshot.communicator.rank == 0:
+        snapshot.particles.typeid[:] = [0, 1]
+    sim = simulation_factory(snapshot)
+
+    rdf = hoomd.md.compute.RadialDistributionFunction(
+        trigger=hoomd.trigger.Periodic(1),
+        nlist=hoomd.md.nlist.Cell(buffer=0.4),
+        r_max=1.0,
+        bins=10)
+    sim.operations.writers.append(rdf)
+    sim.run(1)
+
+    partial_rdf = rdf.partial_rdf
+    assert partial_rdf.shape == (2, 2, 10)
+    np.testing.assert_allclose(partial_rdf[0, 0], 0)
+    np.testing.assert_allclose(partial_rdf[1, 1], 0)
+    np.testing.assert_allclose(partial_rdf[0, 1], partial_rdf[1, 0])
+    assert np.count_nonzero(partial_rdf[0, 1]) == 1
+    assert partial_rdf[0, 1, 5] > 0
+
+
+def test_lattice_coordination(simulation_factory, lattice_snapshot_factory):
+    """Integrate g(r) over the first shell of a cubic lattice."""
+    sim = simulation_factory(lattice_snapshot_factory(n=6, a=1))
+
+    # share the neighbor list with a pair force that has a shorter cutoff
+    nlist = hoomd.md.nlist.Cell(buffer=0.2)
+    lj = hoomd.md.pair.LJ(nlist=nlist, default_r_cut=0.9)
+    lj.params[('A', 'A')] = dict(epsilon=1, sigma=0.5)
+    sim.operations.integrator = hoomd.md.Integrator(dt=0.005, forces=[lj])
+
+    rdf = hoomd.md.compute.RadialDistributionFunction(
+        trigger=hoomd.trigger.Periodic(2), nlist=nlist, r_max=1.2, bins=24)
+    sim.operations.writers.append(rdf)
+    sim.run(10)
+
+    assert rdf.num_samples == 5
+
+    N = 216
+    density = N / 6**3
+    edges = np.linspace(0, 1.2, 25)
+    shell_volumes = 4 / 3 * np.pi * np.diff(edges**3)
+    coordination = np.sum(rdf.rdf * shell_volumes) * (N - 1) / N * density
+    np.testing.assert_allclose(coordination, 6)
+
+
+def test_logging():
+    logging_check(
+        hoomd.md.compute.RadialDistributionFunction, ('md', 'compute'), {
+            'num_samples': {
+                'category': LoggerCategories.scalar,
+                'default': True
+            },
+            'bin_centers': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            },
+            'rdf': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            },
+            'partial_rdf': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            }
+        })
@@ -0,0 +1,107 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+// this include is necessary to get MPI included before anything else to support intel MPI
+#include "hoomd/ExecutionConfiguration.h"
+
+#include "hoomd/test/upp11_config.h"
+
+HOOMD_UP_MAIN();
+
+#include "hoomd/md/MultipleTauCorrelator.h"
+
+#include <cmath>
+#include <stdexcept>
+#include <vector>
+
+using namespace hoomd;
+using namespace hoomd::md;
+
+/// Compute the autocorrelation of a series at a lag by brute force
+double brute_force_correlation(const std::vector<double>& x, size_t lag)
+    {
+    double sum = 0.0;
+    for (size_t t = lag; t < x.size(); t++)
+        sum += x[t] * x[t - lag];
+    return sum / double(x.size() - lag);
+    }
+
+/// Average consecutive pairs of a series
+std::vector<double> block_average(const std::vector<double>& x)
+    {
+    std::vector<double> result;
+    for (size_t t = 0; t + 1 < x.size(); t += 2)
+        result.push_back(0.5 * (x[t] + x[t + 1]));
+    return result;
+    }
+
+//! Check that each level matches the brute force correlation of the block averaged series
+UP_TEST(correlation_test)
+    {
+    MultipleTauCorrelator correlator(2, 8, 2, 3);
+
+    std::vector<double> x, y;
+    for (unsigned int i = 0; i < 100; i++)
+        {
+        x.push_back(std::sin(0.3 * i) + 0.1 * i);
+        y.push_back(std::cos(0.7 * i));
+        correlator.add(std::vector<double> {x.back(), y.back()});
+        }
+    UP_ASSERT_EQUAL((int)correlator.getNumSamples(), 100);
+
+    // level 0 holds lags 0 to 7, levels 1 and 2 hold lags 4 to 7 in their own units
+    std::vector<uint64_t> lags = correlator.getLags();
+    std::vector<uint64_t> expected_lags = {0, 1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 14, 16, 20, 24, 28};
+    UP_ASSERT(lags == expected_lags);
+
+    std::vector<double> correlation = correlator.getCorrelation();
+    UP_ASSERT_EQUAL((int)correlation.size(), 2 * (int)lags.size());
+
+    std::vector<std::vector<double>> levels_x = {x, block_average(x)};
+    levels_x.push_back(block_average(levels_x[1]));
+    std::vector<std::vector<double>> levels_y = {y, block_average(y)};
+    levels_y.push_back(block_average(levels_y[1]));
+
+    for (unsigned int i = 0; i < lags.size(); i++)
+        {
+        unsigned int level = i < 8 ? 0 : (i < 12 ? 1 : 2);
+        size_t lag = lags[i] >> level;
+        MY_CHECK_CLOSE(correlation[2 * i],
+                       brute_force_correlation(levels_x[level], lag),
+                       tol);
+        MY_CHECK_CLOSE(correlation[2 * i + 1],
+                       brute_force_correlation(levels_y[level], lag),
+                       tol);
+        }
+
+    correlator.reset();
+    UP_ASSERT_EQUAL((int)correlator.getNumSamples(), 0);
+    UP_ASSERT(correlator.getLags().empty());
+    }
+
+/// Check whether constructing a correlator with the given parameters throws
+bool rejects(unsigned int n_channels,
+             unsigned int block_length,
+             unsigned int averaging,
+             unsigned int max_levels)
+    {
+    try
+        {
+        MultipleTauCorrelator correlator(n_channels, block_length, averaging, max_levels);
+        }
+    catch (const std::domain_error&)
+        {
+        return true;
+        }
+    return false;
+    }
+
+//! Check that invalid parameters are rejected
+UP_TEST(parameters_test)
+    {
+    UP_ASSERT(!rejects(1, 8, 2, 3));
+    UP_ASSERT(rejects(0, 8, 2, 3));
+    UP_ASSERT(rejects(1, 8, 1, 3));
+    UP_ASSERT(rejects(1, 5, 2, 3));
+    UP_ASSERT(rejects(1, 8, 2, 0));
+    }
@@ -3,8 +3,14 @@
 
 #include "EAMForceCompute.h"
 
+#include <algorithm>
 #include <vector>
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#endif
+
 using namespace std;
 
 #include <stdexcept>
@@ -24,7 +30,7 @@ namespace metal
 EAMForceCompute::EAMForceCompute(std::shared_ptr<SystemDefinition> sysdef,
                                  char* filename,
                                  int type_of_file)
-    : ForceCompute(sysdef)
+    : ForceCompute(sysdef), m_max_pair_cache_bytes(size_t(1) << 30)
     {
     m_exec_conf->msg->notice(5) << "Constructing EAMForceCompute" << endl;
 
@@ -327,13 +333,6 @@ void EAMForceCompute::computeForces(uint64_t timestep)
     ArrayHandle<Scalar4> h_rphi(m_rphi, access_location::host, access_mode::read);
     ArrayHandle<Scalar4> h_drphi(m_drphi, access_location::host, access_mode::read);
 
-    // index and remainder
-    Scalar position;           // look up position, scalar
-    unsigned int int_position; // look up index for position, integer
-    unsigned int idxs;         // look up index in F, rho, rphi array, considering shift, integer
-    Scalar remainder;          // look up remainder in array, integer
-    Scalar4 v, dv;             // value, d(value)
-
     // there are enough other checks on the input data: but it doesn't hurt to be safe
     assert(h_force.data);
     assert(h_virial.data);
@@ -356,16 +355,40 @@ void EAMForceCompute::computeForces(uint64_t timestep)
     Scalar r_cut_sq = m_r_cut * m_r_cut;
 
     // parameters for each particle
-    vector<Scalar> atomElectronDensity;
-    atomElectronDensity.resize(m_pdata->getN());
-    vector<Scalar> atomDerivativeEmbeddingFunction;
-    atomDerivativeEmbeddingFunction.resize(m_pdata->getN());
-    vector<Scalar> atomEmbeddingFunction;
-    atomEmbeddingFunction.resize(m_pdata->getN());
+    const unsigned int N = m_pdata->getN();
+    vector<Scalar> atomElectronDensity(N, Scalar(0.0));
+    vector<Scalar> atomDerivativeEmbeddingFunction(N);
     unsigned int ntypes = m_pdata->getNTypes();
 
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
+    // store drho / dr of each pair from the density pass for the force pass when the cache fits
+    const size_t n_slots = m_nlist->getNListArray().getNumElements();
+    const bool use_pair_cache = n_slots * sizeof(Scalar2) <= m_max_pair_cache_bytes;
+    if (use_pair_cache)
         {
+        m_pair_cache.resize(n_slots);
+        }
+    else if (!m_pair_cache.empty())
+        {
+        m_exec_conf->msg->notice(4) << "pair.eam: The neighbor list has too many entries to cache "
+                                       "density derivatives"
+                                    << endl;
+        m_pair_cache.clear();
+        m_pair_cache.shrink_to_fit();
+        }
+    Scalar2* pair_cache = m_pair_cache.data();
+
+    // number of blocks of particles to evaluate in parallel
+    unsigned int n_blocks = 1;
+#ifdef ENABLE_TBB
+    n_blocks = std::max(
+        1u,
+        std::min(m_exec_conf->getNumThreads(),
+                 N / md::detail::BondedForceScatter::min_groups_per_block));
+#endif
+
+    // add the electron density of the pairs of particle i to density
+    auto compute_density = [&](unsigned int i, Scalar* density)
+    {
         // access the particle's position and type
         Scalar3 pi = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
         unsigned int typei = __scalar_as_int(h_pos.data[i].w);
@@ -399,53 +422,64 @@ void EAMForceCompute::computeForces(uint64_t timestep)
             // start computing the force
             // calculate r squared
             Scalar rsq = dot(dx, dx);
-            ;
+
             // only compute the force if the particles are closer than the cut-off
             if (rsq < r_cut_sq)
                 {
                 // calculate position r for rho(r)
-                position = sqrt(rsq) * rdr;
-                int_position = (unsigned int)position;
+                Scalar position = sqrt(rsq) * rdr;
+                unsigned int int_position = (unsigned int)position;
                 int_position = min(int_position, nr - 1);
-                remainder = position - int_position;
+                Scalar remainder = position - int_position;
                 // calculate P = sum{rho}
-                idxs = int_position + nr * (typej * ntypes + typei);
-                v = h_rho.data[idxs];
-                atomElectronDensity[i] += v.w + v.z * remainder + v.y * remainder * remainder
-                                          + v.x * remainder * remainder * remainder;
+                unsigned int idxs = int_position + nr * (typej * ntypes + typei);
+                Scalar4 v = h_rho.data[idxs];
+                density[i] += v.w + v.z * remainder + v.y * remainder * remainder
+                              + v.x * remainder * remainder * remainder;
                 // if third_law, pair it
                 if (third_law)
                     {
                     idxs = int_position + nr * (typei * ntypes + typej);
                     v = h_rho.data[idxs];
-                    atomElectronDensity[k] += v.w + v.z * remainder + v.y * remainder * remainder
-                                              + v.x * remainder * remainder * remainder;
+                    density[k] += v.w + v.z * remainder + v.y * remainder * remainder
+                                  + v.x * remainder * remainder * remainder;
+                    }
+                // store drho / dr of i and of j at this position for the force pass
+                if (use_pair_cache)
+                    {
+                    Scalar4 dv_i = h_drho.data[int_position + typei * ntypes * nr + typej * nr];
+                    Scalar4 dv_j = h_drho.data[int_position + typej * ntypes * nr + typei * nr];
+                    pair_cache[head_i + j] = make_scalar2(
+                        dv_i.z + dv_i.y * remainder + dv_i.x * remainder * remainder,
+                        dv_j.z + dv_j.y * remainder + dv_j.x * remainder * remainder);
                     }
                 }
             }
-        }
+    };
 
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        {
+    // compute F(P) and dF / dP of particle i
+    auto compute_embedding = [&](unsigned int i)
+    {
         unsigned int typei = __scalar_as_int(h_pos.data[i].w);
         // calculate position rho for F(rho)
-        position = atomElectronDensity[i] * rdrho;
-        int_position = (unsigned int)position;
+        Scalar position = atomElectronDensity[i] * rdrho;
+        unsigned int int_position = (unsigned int)position;
         int_position = min(int_position, nrho - 1);
-        remainder = position - int_position;
+        Scalar remainder = position - int_position;
 
-        idxs = int_position + typei * nrho;
-        v = h_F.data[idxs];
-        dv = h_dF.data[idxs];
+        unsigned int idxs = int_position + typei * nrho;
+        Scalar4 v = h_F.data[idxs];
+        Scalar4 dv = h_dF.data[idxs];
         // compute dF / dP
         atomDerivativeEmbeddingFunction[i] = dv.z + dv.y * remainder + dv.x * remainder * remainder;
         // compute embedded energy F(P), sum up each particle
         h_force.data[i].w += v.w + v.z * remainder + v.y * remainder * remainder
                              + v.x * remainder * remainder * remainder;
-        }
+    };
 
-    for (unsigned int i = 0; i < m_pdata->getN(); i++)
-        {
+    // add the pair forces of particle i to force and virial
+    auto compute_force = [&](unsigned int i, Scalar4* force, Scalar* virial, size_t pitch)
+    {
         // access the particle's position and type
         Scalar3 pi = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
         unsigned int typei = __scalar_as_int(h_pos.data[i].w);
@@ -492,18 +526,18 @@ void EAMForceCompute::computeForces(uint64_t timestep)
                 continue;
             Scalar r = sqrt(rsq);
             Scalar inverseR = 1.0 / r;
-            position = r * rdr;
-            int_position = (unsigned int)position;
+            Scalar position = r * rdr;
+            unsigned int int_position = (unsigned int)position;
             int_position = min(int_position, nr - 1);
-            remainder = position - int_position;
+            Scalar remainder = position - int_position;
             // calculate the shift position for type ij
             int shift = (typei >= typej)
                             ? (int)(0.5 * (2 * ntypes - typej - 1) * typej + typei) * nr
                             : (int)(0.5 * (2 * ntypes - typei - 1) * typei + typej) * nr;
 
-            idxs = int_position + shift;
-            v = h_rphi.data[idxs];
-            dv = h_drphi.data[idxs];
+            unsigned int idxs = int_position + shift;
+            Scalar4 v = h_rphi.data[idxs];
+            Scalar4 dv = h_drphi.data[idxs];
             // pair_eng = phi
             Scalar pair_eng = (v.w + v.z * remainder + v.y * remainder * remainder
                                + v.x * remainder * remainder * remainder)
@@ -511,14 +545,25 @@ void EAMForceCompute::computeForces(uint64_t timestep)
             // derivativePhi = (phi + r * dphi/dr - phi) * 1/r = dphi / dr
             Scalar derivativePhi
                 = (dv.z + dv.y * remainder + dv.x * remainder * remainder - pair_eng) * inverseR;
-            // derivativeRhoI = drho / dr of i
-            idxs = int_position + typei * ntypes * nr + typej * nr;
-            dv = h_drho.data[idxs];
-            Scalar derivativeRhoI = dv.z + dv.y * remainder + dv.x * remainder * remainder;
-            // derivativeRhoJ = drho / dr of j
-            idxs = int_position + typej * ntypes * nr + typei * nr;
-            dv = h_drho.data[idxs];
-            Scalar derivativeRhoJ = dv.z + dv.y * remainder + dv.x * remainder * remainder;
+            Scalar derivativeRhoI, derivativeRhoJ;
+            if (use_pair_cache)
+                {
+                // drho / dr of i and j, interpolated by the density pass
+                const Scalar2 drho_ij = pair_cache[head_i + j];
+                derivativeRhoI = drho_ij.x;
+                derivativeRhoJ = drho_ij.y;
+                }
+            else
+                {
+                // derivativeRhoI = drho / dr of i
+                idxs = int_position + typei * ntypes * nr + typej * nr;
+                dv = h_drho.data[idxs];
+                derivativeRhoI = dv.z + dv.y * remainder + dv.x * remainder * remainder;
+                // derivativeRhoJ = drho / dr of j
+                idxs = int_position + typej * ntypes * nr + typei * nr;
+                dv = h_drho.data[idxs];
+                derivativeRhoJ = dv.z + dv.y * remainder + dv.x * remainder * remainder;
+                }
             // fullDerivativePhi = dF/dP * drho / dr for j + dF/dP * drho / dr for j + phi
             Scalar fullDerivativePhi = atomDerivativeEmbeddingFunction[i] * derivativeRhoJ
                                        + atomDerivativeEmbeddingFunction[k] * derivativeRhoI
@@ -538,19 +583,110 @@ void EAMForceCompute::computeForces(uint64_t timestep)
 
             if (third_law)
                 {
-                h_force.data[k].x -= dx.x * pairForce;
-                h_force.data[k].y -= dx.y * pairForce;
-                h_force.data[k].z -= dx.z * pairForce;
-                h_force.data[k].w += pair_eng * 0.5;
+                force[k].x -= dx.x * pairForce;
+                force[k].y -= dx.y * pairForce;
+                force[k].z -= dx.z * pairForce;
+                force[k].w += pair_eng * 0.5;
                 }
             }
-        h_force.data[i].x += fxi;
-        h_force.data[i].y += fyi;
-        h_force.data[i].z += fzi;
-        h_force.data[i].w += pei;
+        force[i].x += fxi;
+        force[i].y += fyi;
+        force[i].z += fzi;
+        force[i].w += pei;
         for (int k = 0; k < 6; k++)
-            h_virial.data[k * virial_pitch + i] += viriali[k];
+            virial[k * pitch + i] += viriali[k];
+    };
+
+    if (n_blocks == 1)
+        {
+        for (unsigned int i = 0; i < N; i++)
+            compute_density(i, atomElectronDensity.data());
+        for (unsigned int i = 0; i < N; i++)
+            compute_embedding(i);
+        for (unsigned int i = 0; i < N; i++)
+            compute_force(i, h_force.data, h_virial.data, virial_pitch);
+        return;
+        }
+
+#ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute(
+        [&]
+        {
+            if (third_law)
+                {
+                // the density of neighbor k is summed in one buffer per block after the first
+                m_density_buffer.resize(size_t(n_blocks - 1) * N);
+                tbb::parallel_for(
+                    0u,
+                    n_blocks,
+                    [&](unsigned int block)
+                    {
+                        Scalar* density = atomElectronDensity.data();
+                        if (block > 0)
+                            {
+                            density = m_density_buffer.data() + size_t(block - 1) * N;
+                            std::fill(density, density + N, Scalar(0.0));
+                            }
+
+                        unsigned int begin = (unsigned int)(size_t(N) * block / n_blocks);
+                        unsigned int end = (unsigned int)(size_t(N) * (block + 1) / n_blocks);
+                        for (unsigned int i = begin; i < end; i++)
+                            compute_density(i, density);
+                    });
+
+                tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+                                  [&](const tbb::blocked_range<unsigned int>& r)
+                                  {
+                                      for (unsigned int block = 1; block < n_blocks; block++)
+                                          {
+                                          const Scalar* density
+                                              = m_density_buffer.data() + size_t(block - 1) * N;
+                                          for (unsigned int i = r.begin(); i != r.end(); ++i)
+                                              atomElectronDensity[i] += density[i];
+                                          }
+                                  });
+                }
+            else
+                {
+                tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+                                  [&](const tbb::blocked_range<unsigned int>& r)
+                                  {
+                                      for (unsigned int i = r.begin(); i != r.end(); ++i)
+                                          compute_density(i, atomElectronDensity.data());
+                                  });
+                }
+
+            tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+                              [&](const tbb::blocked_range<unsigned int>& r)
+                              {
+                                  for (unsigned int i = r.begin(); i != r.end(); ++i)
+                                      compute_embedding(i);
+                              });
+
+            if (!third_law)
+                {
+                // each particle only writes its own force with a full neighbor list
+                tbb::parallel_for(
+                    tbb::blocked_range<unsigned int>(0, N),
+                    [&](const tbb::blocked_range<unsigned int>& r)
+                    {
+                        for (unsigned int i = r.begin(); i != r.end(); ++i)
+                            compute_force(i, h_force.data, h_virial.data, virial_pitch);
+                    });
+                }
+        });
+
+    if (third_law)
+        {
+        m_force_scatter.compute(m_exec_conf,
+                                N,
+                                N,
+                                h_force.data,
+                                h_virial.data,
+                                virial_pitch,
+                                compute_force);
         }
+#endif
     }
 
 void EAMForceCompute::set_neighbor_list(std::shared_ptr<md::NeighborList> nlist)
@@ -573,7 +709,9 @@ void export_EAMForceCompute(pybind11::module& m)
         "EAMForceCompute")
         .def(pybind11::init<std::shared_ptr<SystemDefinition>, char*, int>())
         .def("set_neighbor_list", &EAMForceCompute::set_neighbor_list)
-        .def("get_r_cut", &EAMForceCompute::get_r_cut);
+        .def("get_r_cut", &EAMForceCompute::get_r_cut)
+        .def("setMaxPairCacheBytes", &EAMForceCompute::setMaxPairCacheBytes)
+        .def("getMaxPairCacheBytes", &EAMForceCompute::getMaxPairCacheBytes);
     }
 
     } // end namespace detail
@@ -2,9 +2,11 @@
 // Part of HOOMD-blue, released under the BSD 3-Clause License.
 
 #include "hoomd/ForceCompute.h"
+#include "hoomd/md/BondedForceScatter.h"
 #include "hoomd/md/NeighborList.h"
 
 #include <memory>
+#include <vector>
 
 /*! \file EAMForceCompute.h
  \brief Declares the EAMForceCompute class
@@ -43,6 +45,14 @@ namespace metal
  h_dF.data[100].z, h_dF.data[100].y, h_dF.data[100].x, are for interpolating derivative embedded
  function.
 
+ \b Threads
+ On the CPU, computeForces() evaluates the electron density pass and the force pass on multiple
+ threads. The density pass interpolates the derivatives of the electron density of each pair at the
+ same position as the densities themselves and stores them in m_pair_cache, one entry per neighbor
+ list slot. The force pass reads them back instead of interpolating m_drho a second time. The cache
+ is skipped (and the force pass interpolates m_drho) when it would need more than
+ m_max_pair_cache_bytes.
+
  \ingroup computes
  */
 class EAMForceCompute : public ForceCompute
@@ -63,6 +73,18 @@ class EAMForceCompute : public ForceCompute
     //! Load EAM potential file
     virtual void loadFile(char* filename, int type_of_file);
 
+    //! Set the maximum size of the per-pair density derivative cache in bytes
+    void setMaxPairCacheBytes(size_t max_bytes)
+        {
+        m_max_pair_cache_bytes = max_bytes;
+        }
+
+    //! Get the maximum size of the per-pair density derivative cache in bytes
+    size_t getMaxPairCacheBytes()
+        {
+        return m_max_pair_cache_bytes;
+        }
+
     protected:
     std::shared_ptr<md::NeighborList> m_nlist; //!< the neighborlist to use for the computation
     Scalar m_r_cut;                            //!< cut-off radius
@@ -88,6 +110,11 @@ class EAMForceCompute : public ForceCompute
     GPUArray<Scalar4> m_drphi; //!< derivative pair wise function and its coefficients
     GPUArray<Scalar> m_dFdP;   //!< derivative F / derivative P
 
+    std::vector<Scalar2> m_pair_cache;    //!< drho/dr of (i, j) and (j, i) per neighbor list slot
+    size_t m_max_pair_cache_bytes;        //!< Maximum size of m_pair_cache in bytes
+    std::vector<Scalar> m_density_buffer; //!< Per-thread electron density buffers
+    md::detail::BondedForceScatter m_force_scatter; //!< Scatters half list forces on threads
+
     //! Actually compute the forces
     virtual void computeForces(uint64_t timestep);
 
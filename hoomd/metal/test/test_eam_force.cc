@@ -0,0 +1,186 @@
+// Copyright (c) 2009-2023 The Regents of the University of Michigan.
+// Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+// this include is necessary to get MPI included before anything else to support intel MPI
+#include "hoomd/ExecutionConfiguration.h"
+
+#include <cmath>
+#include <cstdio>
+#include <fstream>
+#include <iostream>
+#include <string>
+#include <vector>
+
+#include "hoomd/Initializers.h"
+#include "hoomd/SnapshotSystemData.h"
+#include "hoomd/md/NeighborListBinned.h"
+#include "hoomd/metal/EAMForceCompute.h"
+
+using namespace std;
+using namespace hoomd;
+using namespace hoomd::md;
+using namespace hoomd::metal;
+
+/*! \file test_eam_force.cc
+    \brief Implements unit tests for EAMForceCompute
+    \ingroup unit_tests
+*/
+
+#include "hoomd/test/upp11_config.h"
+HOOMD_UP_MAIN();
+
+//! Write a single type EAM file in the Alloy format with smooth tabulated functions
+void write_eam_file(const std::string& filename)
+    {
+    const unsigned int nrho = 1000;
+    const double drho = 0.01;
+    const unsigned int nr = 1000;
+    const double dr = 0.003;
+    const double r_cut = 3.0;
+
+    std::ofstream f(filename.c_str());
+    f << "test EAM potential" << endl;
+    f << "smooth functions that vanish at r_cut" << endl;
+    f << "used by test_eam_force" << endl;
+    f << "1 A" << endl;
+    f << nrho << " " << drho << " " << nr << " " << dr << " " << r_cut << endl;
+    f << "1 1.0 1.0 fcc" << endl;
+
+    // embedding function F(rho)
+    for (unsigned int i = 0; i < nrho; i++)
+        {
+        double rho = i * drho;
+        f << -sqrt(rho + 0.1) << endl;
+        }
+
+    // electron density rho(r)
+    for (unsigned int i = 0; i < nr; i++)
+        {
+        double r = i * dr;
+        f << exp(-2.0 * r) * (r_cut - r) * (r_cut - r) << endl;
+        }
+
+    // r * phi(r)
+    for (unsigned int i = 0; i < nr; i++)
+        {
+        double r = i * dr;
+        f << 0.1 * r * pow(r_cut - r, 4) << endl;
+        }
+    }
+
+//! Copy the forces and virials of an EAMForceCompute
+void get_forces(std::shared_ptr<EAMForceCompute> eam,
+                unsigned int N,
+                std::vector<Scalar4>& force,
+                std::vector<Scalar>& virial)
+    {
+    ArrayHandle<Scalar4> h_force(eam->getForceArray(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar> h_virial(eam->getVirialArray(), access_location::host, access_mode::read);
+    size_t pitch = eam->getVirialArray().getPitch();
+
+    force.assign(h_force.data, h_force.data + N);
+    virial.resize(6 * N);
+    for (unsigned int i = 0; i < N; i++)
+        for (unsigned int j = 0; j < 6; j++)
+            virial[6 * i + j] = h_virial.data[j * pitch + i];
+    }
+
+//! Check that the current forces and virials of an EAMForceCompute match the reference
+void check_forces(std::shared_ptr<EAMForceCompute> eam,
+                  unsigned int N,
+                  const std::vector<Scalar4>& ref_force,
+                  const std::vector<Scalar>& ref_virial)
+    {
+    std::vector<Scalar4> force;
+    std::vector<Scalar> virial;
+    get_forces(eam, N, force, virial);
+
+    for (unsigned int i = 0; i < N; i++)
+        {
+        MY_CHECK_SMALL(force[i].x - ref_force[i].x, tol_small);
+        MY_CHECK_SMALL(force[i].y - ref_force[i].y, tol_small);
+        MY_CHECK_SMALL(force[i].z - ref_force[i].z, tol_small);
+        MY_CHECK_SMALL(force[i].w - ref_force[i].w, tol_small);
+        for (unsigned int j = 0; j < 6; j++)
+            MY_CHECK_SMALL(virial[6 * i + j] - ref_virial[6 * i + j], tol_small);
+        }
+    }
+
+//! Check that the pair cache and the threaded passes do not change the EAM forces
+void eam_force_comparison_test(std::shared_ptr<ExecutionConfiguration> exec_conf,
+                               NeighborList::storageMode mode)
+    {
+    std::string filename = "test_eam_force.eam.alloy";
+    write_eam_file(filename);
+
+    // enough particles to split the passes into several blocks
+    const unsigned int N = 2000;
+    RandomInitializer init(N, Scalar(0.2), Scalar(0.9), "A");
+    std::shared_ptr<SnapshotSystemData<Scalar>> snap = init.getSnapshot();
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(snap, exec_conf));
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+    pdata->setFlags(~PDataFlags(0));
+
+    std::shared_ptr<NeighborList> nlist(new NeighborListBinned(sysdef, Scalar(0.4)));
+    auto r_cut
+        = std::make_shared<GlobalArray<Scalar>>(nlist->getTypePairIndexer().getNumElements(),
+                                                exec_conf);
+        {
+        ArrayHandle<Scalar> h_r_cut(*r_cut, access_location::host, access_mode::overwrite);
+        h_r_cut.data[0] = 3.0;
+        }
+    nlist->addRCutMatrix(r_cut);
+    nlist->setStorageMode(mode);
+
+    std::shared_ptr<EAMForceCompute> eam(new EAMForceCompute(sysdef, &filename[0], 0));
+    eam->set_neighbor_list(nlist);
+    MY_CHECK_CLOSE(eam->get_r_cut(), 3.0, tol);
+    UP_ASSERT_EQUAL(eam->getMaxPairCacheBytes(), size_t(1) << 30);
+
+    // reference: pair cache enabled on a single thread
+    std::vector<Scalar4> ref_force;
+    std::vector<Scalar> ref_virial;
+    eam->compute(0);
+    get_forces(eam, N, ref_force, ref_virial);
+
+    // the particles interact, so the reference is not trivially zero
+    Scalar total_energy = 0;
+    for (unsigned int i = 0; i < N; i++)
+        total_energy += ref_force[i].w;
+    UP_ASSERT(total_energy != Scalar(0.0));
+
+    // interpolate the density derivatives again in the force pass
+    eam->setMaxPairCacheBytes(0);
+    eam->compute(1);
+    check_forces(eam, N, ref_force, ref_virial);
+
+#ifdef ENABLE_TBB
+    // split the passes over several threads with and without the pair cache
+    exec_conf->setNumThreads(4);
+    eam->compute(2);
+    check_forces(eam, N, ref_force, ref_virial);
+
+    eam->setMaxPairCacheBytes(size_t(1) << 30);
+    eam->compute(3);
+    check_forces(eam, N, ref_force, ref_virial);
+    exec_conf->setNumThreads(1);
+#endif
+
+    remove(filename.c_str());
+    }
+
+//! test case for EAM forces with a half neighbor list on the CPU
+UP_TEST(EAMForceCompute_half_nlist)
+    {
+    eam_force_comparison_test(std::shared_ptr<ExecutionConfiguration>(
+                                  new ExecutionConfiguration(ExecutionConfiguration::CPU)),
+                              NeighborList::half);
+    }
+
+//! test case for EAM forces with a full neighbor list on the CPU
+UP_TEST(EAMForceCompute_full_nlist)
+    {
+    eam_force_comparison_test(std::shared_ptr<ExecutionConfiguration>(
+                                  new ExecutionConfiguration(ExecutionConfiguration::CPU)),
+                              NeighborList::full);
+    }
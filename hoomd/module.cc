@@ -20,6 +20,7 @@
 #include "Initializers.h"
 #include "Integrator.h"
 #include "LoadBalancer.h"
+#include "MemoryTracker.h"
 #include "MeshDefinition.h"
 #include "MeshGroupData.h"
 #include "Messenger.h"
@@ -341,4 +342,5 @@ PYBIND11_MODULE(_hoomd, m)
 
     // messenger
     export_Messenger(m);
+    export_MemoryTracker(m);
     }
@@ -44,10 +44,12 @@ void mpcd::ATCollisionMethod::rule(uint64_t timestep)
     m_thermo->compute(timestep);
 
     // compute the cell average of the random velocities
-    m_pdata->swapVelocities();
+    if (m_embed_group)
+        m_pdata->swapVelocities();
     m_mpcd_pdata->swapVelocities();
     m_rand_thermo->compute(timestep);
-    m_pdata->swapVelocities();
+    if (m_embed_group)
+        m_pdata->swapVelocities();
     m_mpcd_pdata->swapVelocities();
 
     // apply random velocities
@@ -59,6 +61,17 @@ void mpcd::ATCollisionMethod::rule(uint64_t timestep)
  */
 void mpcd::ATCollisionMethod::drawVelocities(uint64_t timestep)
     {
+    // the random velocities of embedded particles are stored in the alternate arrays, which
+    // rand_thermo reads after they are swapped in
+    if (m_embed_group && !m_pdata->hasAlternateArrays())
+        {
+        m_exec_conf->msg->warning()
+            << "mpcd.collide.at requires the alternate particle data arrays to embed particles, "
+               "allocating them"
+            << std::endl;
+        m_pdata->setAlternateArrays(true);
+        }
+
     // mpcd particle data
     ArrayHandle<unsigned int> h_tag(m_mpcd_pdata->getTags(),
                                     access_location::host,
@@ -8,6 +8,11 @@
 #include "hoomd/Communicator.h"
 #endif // ENABLE_MPI
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#endif // ENABLE_TBB
+
 /*!
  * \file mpcd/CellList.cc
  * \brief Definition of mpcd::CellList
@@ -89,6 +94,8 @@ void mpcd::CellList::compute(uint64_t timestep)
 
     if (peekCompute(timestep))
         {
+        hoomd::detail::ScopedProfile profile(m_exec_conf, m_profile);
+
 #ifdef ENABLE_MPI
         // exchange embedded particles if necessary
         if (m_sysdef->isDomainDecomposed() && needsEmbedMigrate(timestep))
@@ -578,8 +585,11 @@ void mpcd::CellList::buildCellList()
 
     const Scalar3 global_lo = m_pdata->getGlobalBox().getLo();
 
-    for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
-        {
+    // first, bin each particle independently. Particles with invalid positions are marked with
+    // sentinel bins so that the conditions can be set in order below.
+    m_bin_ids.resize(N_tot);
+    auto bin_particle = [&](unsigned int cur_p)
+    {
         Scalar4 postype_i;
         if (cur_p < N_mpcd)
             {
@@ -593,8 +603,8 @@ void mpcd::CellList::buildCellList()
 
         if (std::isnan(pos_i.x) || std::isnan(pos_i.y) || std::isnan(pos_i.z))
             {
-            conditions.y = cur_p + 1;
-            continue;
+            m_bin_ids[cur_p] = NAN_BIN;
+            return;
             }
 
         // bin particle assuming orthorhombic box (already validated)
@@ -636,12 +646,56 @@ void mpcd::CellList::buildCellList()
         // validate and make sure no particles blew out of the box
         if ((bin.x < 0 || bin.x >= (int)m_cell_dim.x) || (bin.y < 0 || bin.y >= (int)m_cell_dim.y)
             || (bin.z < 0 || bin.z >= (int)m_cell_dim.z))
+            {
+            m_bin_ids[cur_p] = OUT_OF_BOUNDS_BIN;
+            return;
+            }
+
+        const unsigned int bin_idx = m_cell_indexer(bin.x, bin.y, bin.z);
+        m_bin_ids[cur_p] = bin_idx;
+
+        // stash the current particle bin into the velocity array
+        if (cur_p < N_mpcd)
+            {
+            h_vel.data[cur_p].w = __int_as_scalar(bin_idx);
+            }
+        else
+            {
+            h_embed_cell_ids->data[cur_p - N_mpcd] = bin_idx;
+            }
+    };
+
+#ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute(
+        [&]
+        {
+            tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N_tot),
+                              [&](const tbb::blocked_range<unsigned int>& r)
+                              {
+                                  for (unsigned int cur_p = r.begin(); cur_p != r.end(); ++cur_p)
+                                      bin_particle(cur_p);
+                              });
+        });
+#else
+    for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
+        bin_particle(cur_p);
+#endif // ENABLE_TBB
+
+    // then, fill the cells in particle order so that the cell list is always deterministic
+    for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
+        {
+        const unsigned int bin_idx = m_bin_ids[cur_p];
+        if (bin_idx == NAN_BIN)
+            {
+            conditions.y = cur_p + 1;
+            continue;
+            }
+        else if (bin_idx == OUT_OF_BOUNDS_BIN)
             {
             conditions.z = cur_p + 1;
             continue;
             }
 
-        unsigned int bin_idx = m_cell_indexer(bin.x, bin.y, bin.z);
         unsigned int offset = h_cell_np.data[bin_idx];
         if (offset < m_cell_np_max)
             {
@@ -653,16 +707,6 @@ void mpcd::CellList::buildCellList()
             conditions.x = std::max(conditions.x, offset + 1);
             }
 
-        // stash the current particle bin into the velocity array
-        if (cur_p < N_mpcd)
-            {
-            h_vel.data[cur_p].w = __int_as_scalar(bin_idx);
-            }
-        else
-            {
-            h_embed_cell_ids->data[cur_p - N_mpcd] = bin_idx;
-            }
-
         // increment the counter always
         ++h_cell_np.data[bin_idx];
         }
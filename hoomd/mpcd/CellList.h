@@ -24,6 +24,7 @@
 #include <pybind11/pybind11.h>
 
 #include <array>
+#include <vector>
 
 namespace hoomd
     {
@@ -257,6 +258,11 @@ class PYBIND11_EXPORT CellList : public Compute
     GPUVector<unsigned int> m_cell_list;      //!< Cell list of particles
     GPUVector<unsigned int> m_embed_cell_ids; //!< Cell ids of the embedded particles
     GPUFlags<uint3> m_conditions; //!< Detect conditions that might fail building cell list
+    std::vector<unsigned int> m_bin_ids; //!< Scratch cell index of each particle during binning
+
+    static constexpr unsigned int NAN_BIN = 0xffffffff; //!< Marks a particle with a NaN position
+    static constexpr unsigned int OUT_OF_BOUNDS_BIN
+        = 0xfffffffe; //!< Marks a particle outside the cell list
 
     int3 m_origin_idx; //!< Origin as a global index
 
@@ -9,6 +9,11 @@
 #include "CellThermoCompute.h"
 #include "ReductionOperators.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#endif // ENABLE_TBB
+
 namespace hoomd
     {
 /*!
@@ -60,6 +65,8 @@ void mpcd::CellThermoCompute::compute(uint64_t timestep)
         return;
     m_last_computed = timestep;
 
+    hoomd::detail::ScopedProfile profile(m_exec_conf, m_profile);
+
     // cell list needs to be up to date first
     m_cl->compute(timestep);
 
@@ -410,45 +417,60 @@ void mpcd::CellThermoCompute::calcInnerCellProperties()
 
     // iterate over all of the inner cells and compute average velocity, energy, temperature
     const bool need_energy = m_flags[mpcd::detail::thermo_options::energy];
-    for (unsigned int k = lo.z; k < hi.z; ++k)
-        {
-        for (unsigned int j = lo.y; j < hi.y; ++j)
-            {
-            for (unsigned int i = lo.x; i < hi.x; ++i)
-                {
-                const unsigned int cur_cell = ci(i, j, k);
+    const unsigned int ndim = m_sysdef->getNDimensions();
+    const Index3D inner_ci(hi.x - lo.x, hi.y - lo.y, hi.z - lo.z);
+    auto compute_cell = [&](unsigned int inner_idx)
+    {
+        const uint3 inner_cell = inner_ci.getTriple(inner_idx);
+        const unsigned int cur_cell
+            = ci(inner_cell.x + lo.x, inner_cell.y + lo.y, inner_cell.z + lo.z);
 
-                // compute the cell properties
-                double4 momentum;
-                double ke(0.0);
-                unsigned int np(0);
-                summer.compute(momentum, ke, np, cur_cell, need_energy);
+        // compute the cell properties
+        double4 momentum;
+        double ke(0.0);
+        unsigned int np(0);
+        summer.compute(momentum, ke, np, cur_cell, need_energy);
 
-                const double mass = momentum.w;
-                double3 vel_cm = make_double3(0.0, 0.0, 0.0);
-                if (mass > 0.)
-                    {
-                    vel_cm.x = momentum.x / mass;
-                    vel_cm.y = momentum.y / mass;
-                    vel_cm.z = momentum.z / mass;
-                    }
+        const double mass = momentum.w;
+        double3 vel_cm = make_double3(0.0, 0.0, 0.0);
+        if (mass > 0.)
+            {
+            vel_cm.x = momentum.x / mass;
+            vel_cm.y = momentum.y / mass;
+            vel_cm.z = momentum.z / mass;
+            }
 
-                h_cell_vel.data[cur_cell] = make_double4(vel_cm.x, vel_cm.y, vel_cm.z, mass);
-                if (need_energy)
-                    {
-                    double temp(0.0);
-                    if (np > 1)
-                        {
-                        const double ke_cm
-                            = 0.5 * mass
-                              * (vel_cm.x * vel_cm.x + vel_cm.y * vel_cm.y + vel_cm.z * vel_cm.z);
-                        temp = 2. * (ke - ke_cm) / (m_sysdef->getNDimensions() * (np - 1));
-                        }
-                    h_cell_energy.data[cur_cell] = make_double3(ke, temp, __int_as_double(np));
-                    }
-                } // i
-            }     // j
-        }         // k
+        h_cell_vel.data[cur_cell] = make_double4(vel_cm.x, vel_cm.y, vel_cm.z, mass);
+        if (need_energy)
+            {
+            double temp(0.0);
+            if (np > 1)
+                {
+                const double ke_cm
+                    = 0.5 * mass * (vel_cm.x * vel_cm.x + vel_cm.y * vel_cm.y + vel_cm.z * vel_cm.z);
+                temp = 2. * (ke - ke_cm) / (ndim * (np - 1));
+                }
+            h_cell_energy.data[cur_cell] = make_double3(ke, temp, __int_as_double(np));
+            }
+    };
+
+    // each cell is summed by exactly one thread in a fixed order, so the result does not depend
+    // on the number of threads
+#ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute(
+        [&]
+        {
+            tbb::parallel_for(tbb::blocked_range<unsigned int>(0, inner_ci.getNumElements()),
+                              [&](const tbb::blocked_range<unsigned int>& r)
+                              {
+                                  for (unsigned int idx = r.begin(); idx != r.end(); ++idx)
+                                      compute_cell(idx);
+                              });
+        });
+#else
+    for (unsigned int idx = 0; idx < inner_ci.getNumElements(); ++idx)
+        compute_cell(idx);
+#endif // ENABLE_TBB
     }
 
 void mpcd::CellThermoCompute::computeNetProperties()
@@ -16,6 +16,11 @@
 #include "StreamingMethod.h"
 #include <pybind11/pybind11.h>
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#endif // ENABLE_TBB
+
 namespace hoomd
     {
 namespace mpcd
@@ -116,8 +121,8 @@ template<class Geometry> void ConfinedStreamingMethod<Geometry>::stream(uint64_t
     // acquire polymorphic pointer to the external field
     const mpcd::ExternalField* field = (m_field) ? m_field->get(access_location::host) : nullptr;
 
-    for (unsigned int cur_p = 0; cur_p < m_mpcd_pdata->getN(); ++cur_p)
-        {
+    auto stream_particle = [&](unsigned int cur_p)
+    {
         const Scalar4 postype = h_pos.data[cur_p];
         Scalar3 pos = make_scalar3(postype.x, postype.y, postype.z);
         const unsigned int type = __scalar_as_int(postype.w);
@@ -151,7 +156,25 @@ template<class Geometry> void ConfinedStreamingMethod<Geometry>::stream(uint64_t
         h_pos.data[cur_p] = make_scalar4(pos.x, pos.y, pos.z, __int_as_scalar(type));
         h_vel.data[cur_p]
             = make_scalar4(vel.x, vel.y, vel.z, __int_as_scalar(mpcd::detail::NO_CELL));
-        }
+    };
+
+    // every particle streams independently of the others
+    const unsigned int N = m_mpcd_pdata->getN();
+#ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute(
+        [&]
+        {
+            tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+                              [&](const tbb::blocked_range<unsigned int>& r)
+                              {
+                                  for (unsigned int cur_p = r.begin(); cur_p != r.end(); ++cur_p)
+                                      stream_particle(cur_p);
+                              });
+        });
+#else
+    for (unsigned int cur_p = 0; cur_p < N; ++cur_p)
+        stream_particle(cur_p);
+#endif // ENABLE_TBB
 
     // particles have moved, so the cell cache is no longer valid
     m_mpcd_pdata->invalidateCellCache();
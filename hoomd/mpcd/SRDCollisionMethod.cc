@@ -10,6 +10,11 @@
 #include "hoomd/RNGIdentifiers.h"
 #include "hoomd/RandomNumbers.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#endif // ENABLE_TBB
+
 namespace hoomd
     {
 mpcd::SRDCollisionMethod::SRDCollisionMethod(std::shared_ptr<mpcd::SystemData> sysdata,
@@ -174,8 +179,8 @@ void mpcd::SRDCollisionMethod::rotate(uint64_t timestep)
             new ArrayHandle<double>(m_factors, access_location::host, access_mode::read));
         }
 
-    for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
-        {
+    auto rotate_particle = [&](unsigned int cur_p)
+    {
         double3 vel;
         unsigned int cell;
         // these properties are needed for the embedded particles only
@@ -245,7 +250,24 @@ void mpcd::SRDCollisionMethod::rotate(uint64_t timestep)
             {
             h_vel_embed->data[idx] = make_scalar4(new_vel.x, new_vel.y, new_vel.z, mass);
             }
-        }
+    };
+
+    // each particle is only rotated by the precomputed properties of its own cell
+#ifdef ENABLE_TBB
+    m_exec_conf->getTaskArena()->execute(
+        [&]
+        {
+            tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N_tot),
+                              [&](const tbb::blocked_range<unsigned int>& r)
+                              {
+                                  for (unsigned int cur_p = r.begin(); cur_p != r.end(); ++cur_p)
+                                      rotate_particle(cur_p);
+                              });
+        });
+#else
+    for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
+        rotate_particle(cur_p);
+#endif // ENABLE_TBB
     }
 
 /*!
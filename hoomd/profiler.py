@@ -0,0 +1,204 @@
+# Copyright (c) 2009-2023 The Regents of the University of Michigan.
+# Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+"""Profile operations.
+
+Use `Profiler` to find out which operations take the most time in a
+simulation. `Profiler` is a low overhead alternative to external profiling
+tools that you can leave enabled in production runs and log with
+`hoomd.logging.Logger`.
+
+.. invisible-code-block: python
+
+    simulation = hoomd.util.make_example_simulation()
+"""
+
+import hoomd
+from hoomd import _hoomd
+from hoomd.logging import log, Loggable
+
+
+class Profiler(metaclass=Loggable):
+    """Time operations during a simulation run.
+
+    Args:
+        simulation (hoomd.Simulation): Simulation to profile.
+
+    `Profiler` enables the collection of timing data in the simulation's
+    device. When enabled, HOOMD-blue measures the wall clock time spent in
+    every `hoomd.operation.Tuner`, `hoomd.operation.Updater`,
+    `hoomd.operation.Writer`, the integrator, and each `hoomd.operation.Compute`
+    (including forces and neighbor lists). In MPI simulations, `Profiler` also
+    times the particle migration, ghost exchange, and ghost update
+    communication phases. `Profiler` omits operations that do no work of their
+    own, such as HPMC external fields that the HPMC integrator evaluates.
+
+    Times are cumulative since the `Profiler` was constructed or since the last
+    call to `reset`. Times are inclusive: The time reported for the integrator
+    includes the time spent computing forces, and the time reported for a force
+    includes the time spent building its neighbor list.
+
+    On the GPU, `Profiler` synchronizes the device at the end of every timed
+    region. This makes the times accurate, but adds overhead to the simulation.
+
+    Note:
+        In MPI parallel simulations, `Profiler` reports the times measured on
+        the local rank.
+
+    .. rubric:: Example:
+
+    .. code-block:: python
+
+        profiler = hoomd.profiler.Profiler(simulation)
+        simulation.run(100)
+        print(profiler.summary())
+
+    .. rubric:: Example logging:
+
+    .. code-block:: python
+
+        logger = hoomd.logging.Logger()
+        logger.add(profiler, quantities=['names', 'times'])
+    """
+
+    def __init__(self, simulation):
+        self._simulation = simulation
+        simulation.device._cpp_exec_conf.setProfiling(True)
+
+    @property
+    def enabled(self):
+        """bool: Collect timing data when `True`.
+
+        .. rubric:: Example:
+
+        .. code-block:: python
+
+            profiler.enabled = False
+        """
+        return self._simulation.device._cpp_exec_conf.profilingEnabled()
+
+    @enabled.setter
+    def enabled(self, value):
+        self._simulation.device._cpp_exec_conf.setProfiling(bool(value))
+
+    def reset(self):
+        """Reset all times to zero.
+
+        .. rubric:: Example:
+
+        .. code-block:: python
+
+            profiler.reset()
+        """
+        for _, cpp_obj in self._profiled_objects():
+            cpp_obj.resetProfile()
+
+        communicator = getattr(self._simulation, '_system_communicator', None)
+        if communicator is not None:
+            communicator.resetProfile()
+
+    def _profiled_objects(self):
+        """Yield (name, C++ object) pairs for all timed operations."""
+        seen = set()
+        counts = {}
+
+        def visit(operation):
+            if operation is None or id(operation) in seen:
+                return
+            seen.add(id(operation))
+
+            cpp_obj = getattr(operation, '_cpp_obj', None)
+            if isinstance(cpp_obj, _hoomd.Action) and cpp_obj.isProfiled():
+                cls = type(operation)
+                name = f'{cls.__module__}.{cls.__name__}'
+                counts[name] = counts.get(name, 0) + 1
+                if counts[name] > 1:
+                    name = f'{name}({counts[name] - 1})'
+                yield name, cpp_obj
+
+            children = list(operation._children)
+            nlist = getattr(operation, 'nlist', None)
+            if isinstance(nlist, hoomd.operation._HOOMDBaseObject):
+                children.append(nlist)
+
+            for child in children:
+                yield from visit(child)
+
+        for operation in self._simulation.operations:
+            yield from visit(operation)
+
+    def _communication_profile(self):
+        """Return a dict mapping phase names to (time, calls) pairs."""
+        communicator = getattr(self._simulation, '_system_communicator', None)
+        if communicator is None:
+            return {}
+        calls = communicator.getProfileCalls()
+        return {
+            f'communicator.{name}': (time, calls[name])
+            for name, time in communicator.getProfileTimes().items()
+        }
+
+    @log(category='strings')
+    def names(self):
+        """list[str]: Names of the timed operations and phases.
+
+        Names are the fully qualified class names of the operations. When a
+        simulation has more than one operation of the same type, the names of
+        the later instances end with the instance number in parenthesis.
+        """
+        names = [name for name, _ in self._profiled_objects()]
+        names.extend(self._communication_profile().keys())
+        return names
+
+    @log(category='sequence')
+    def times(self):
+        """list[float]: Time spent in each operation and phase \
+        :math:`[\\mathrm{s}]`.
+
+        The order of `times` matches `names`.
+        """
+        times = [
+            cpp_obj.getProfileTime() for _, cpp_obj in self._profiled_objects()
+        ]
+        times.extend(
+            time for time, _ in self._communication_profile().values())
+        return times
+
+    @log(category='sequence')
+    def calls(self):
+        """list[int]: Number of times each operation and phase executed.
+
+        The order of `calls` matches `names`.
+        """
+        calls = [
+            cpp_obj.getProfileCalls() for _, cpp_obj in self._profiled_objects()
+        ]
+        calls.extend(
+            phase_calls
+            for _, phase_calls in self._communication_profile().values())
+        return calls
+
+    def summary(self):
+        """Format the timing data as a table.
+
+        Returns:
+            str: A table with one row per operation and communication phase
+            sorted by time.
+
+        .. rubric:: Example:
+
+        .. code-block:: python
+
+            print(profiler.summary())
+        """
+        rows = sorted(zip(self.names, self.times),
+                      key=lambda row: row[1],
+                      reverse=True)
+        width = max([len(name) for name, _ in rows] + [len('Operation')])
+
+        lines = [
+            f'{"Operation":<{width}}  {"Time (s)":>12}', '-' * (width + 14)
+        ]
+        for name, time in rows:
+            lines.append(f'{name:<{width}}  {time:12.4f}')
+        return '\n'.join(lines)
@@ -161,3 +161,28 @@ def test_noticefile(device, tmp_path):
     if device.communicator.rank == 0:
         with open(device.message_filename) as fh:
             assert fh.read() == ""
+
+
+def test_memory_accounting(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=10))
+    device = sim.device
+
+    assert device.memory_allocated > 0
+    assert device.peak_memory_allocated >= device.memory_allocated
+
+    components = device.memory_components
+    component_bytes = device.memory_component_bytes
+    assert 'hoomd::ParticleData' in components
+    assert len(component_bytes) == len(components)
+    assert component_bytes[components.index('hoomd::ParticleData')] > 0
+
+    report = device.memory_report()
+    assert 'm_pos' in report
+    assert report.splitlines()[-1].startswith('Total')
+
+    logger = hoomd.logging.Logger(categories=['scalar', 'strings'])
+    logger.add(device, quantities=['memory_allocated', 'memory_components'])
+    log = logger.log()
+    namespace = log['hoomd']['device'][type(device).__name__]
+    assert namespace['memory_allocated'][0] == device.memory_allocated
+    assert namespace['memory_components'][0] == components
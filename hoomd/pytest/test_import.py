@@ -0,0 +1,70 @@
+# Copyright (c) 2009-2023 The Regents of the University of Michigan.
+# Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+"""Test the lazy import of hoomd subpackages and measure the import time."""
+
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import hoomd
+
+
+def _run_python(code):
+    """Execute code in a new Python interpreter and return its output."""
+    # Import the same hoomd package as the test process.
+    python_path = [str(pathlib.Path(hoomd.__file__).parent.parent)]
+    if 'PYTHONPATH' in os.environ:
+        python_path.append(os.environ['PYTHONPATH'])
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(python_path))
+    result = subprocess.run([sys.executable, '-c', code],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                            env=env)
+    return result.stdout
+
+
+@pytest.mark.serial
+def test_lazy_modules(device):
+    """Test that import hoomd does not import the lazy subpackages."""
+    output = _run_python('import sys, hoomd\n'
+                         'print(" ".join(sys.modules))')
+    modules = set(output.split())
+    assert 'hoomd' in modules
+    for name in hoomd._lazy_modules:
+        assert f'hoomd.{name}' not in modules
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize('name', sorted(hoomd._lazy_modules))
+def test_lazy_module_access(device, name):
+    """Test that accessing a lazy subpackage imports it."""
+    output = _run_python('import sys, hoomd\n'
+                         f'module = hoomd.{name}\n'
+                         f'print(module is sys.modules["hoomd.{name}"])')
+    assert output.strip() == 'True'
+    assert name in dir(hoomd)
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        hoomd.not_a_module
+
+
+@pytest.mark.serial
+def test_import_time(device):
+    """Test that the time needed to import hoomd can be measured.
+
+    The test does not check the time against a threshold, which would depend
+    on the machine and file system.
+    """
+    output = _run_python('import time\n'
+                         'start = time.perf_counter()\n'
+                         'import hoomd\n'
+                         'print(time.perf_counter() - start)')
+    import_time = float(output.strip())
+    assert import_time > 0, f'import hoomd took {import_time} s'
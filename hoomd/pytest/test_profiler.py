@@ -0,0 +1,90 @@
+# Copyright (c) 2009-2023 The Regents of the University of Michigan.
+# Part of HOOMD-blue, released under the BSD 3-Clause License.
+
+"""Test hoomd.profiler.Profiler."""
+
+import hoomd
+from hoomd.conftest import logging_check
+from hoomd.logging import LoggerCategories
+
+
+def test_logging():
+    logging_check(
+        hoomd.profiler.Profiler, ('hoomd', 'profiler'), {
+            'names': {
+                'category': LoggerCategories.strings,
+                'default': True
+            },
+            'times': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            },
+            'calls': {
+                'category': LoggerCategories.sequence,
+                'default': True
+            }
+        })
+
+
+def test_profile_operations(simulation_factory, two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory())
+    drift = hoomd.update.RemoveDrift(trigger=hoomd.trigger.Periodic(1),
+                                     reference_positions=[(0, 0, 0),
+                                                          (0, 0, 0)])
+    box_resize = hoomd.update.BoxResize(trigger=hoomd.trigger.Periodic(2),
+                                        box1=sim.state.box,
+                                        box2=sim.state.box,
+                                        variant=hoomd.variant.Constant(0))
+    sim.operations.updaters.extend([drift, box_resize])
+
+    profiler = hoomd.profiler.Profiler(sim)
+    assert profiler.enabled
+    sim.run(10)
+
+    names = profiler.names
+    assert 'hoomd.update.remove_drift.RemoveDrift' in names
+    assert 'hoomd.update.box_resize.BoxResize' in names
+    assert len(profiler.times) == len(names)
+
+    calls = dict(zip(names, profiler.calls))
+    assert calls['hoomd.update.remove_drift.RemoveDrift'] == 10
+    assert calls['hoomd.update.box_resize.BoxResize'] == 5
+    assert all(time >= 0 for time in profiler.times)
+    assert 'hoomd.update.remove_drift.RemoveDrift' in profiler.summary()
+
+    profiler.reset()
+    assert all(c == 0 for c in profiler.calls)
+
+    profiler.enabled = False
+    sim.run(10)
+    assert all(c == 0 for c in profiler.calls)
+
+
+def test_profile_computes(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, a=1.2))
+    nlist = hoomd.md.nlist.Cell(buffer=0.4)
+    lj = hoomd.md.pair.LJ(nlist, default_r_cut=2.5)
+    lj.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+    sim.operations.integrator = hoomd.md.Integrator(
+        0.005,
+        forces=[lj],
+        methods=[hoomd.md.methods.ConstantVolume(hoomd.filter.All())])
+    thermo = hoomd.md.compute.ThermodynamicQuantities(hoomd.filter.All())
+    sim.operations.computes.append(thermo)
+
+    profiler = hoomd.profiler.Profiler(sim)
+    sim.run(10)
+    thermo.kinetic_energy
+
+    names = profiler.names
+    assert len(profiler.times) == len(names)
+    assert len(profiler.calls) == len(names)
+
+    # every reported operation, including computes, records its calls
+    calls = dict(zip(names, profiler.calls))
+    assert calls['hoomd.md.compute.ThermodynamicQuantities'] >= 1
+    assert calls['hoomd.md.nlist.Cell'] >= 1
+    assert calls['hoomd.md.pair.pair.LJ'] >= 10
+    assert all(c > 0
+               for name, c in calls.items()
+               if not name.startswith('communicator.'))
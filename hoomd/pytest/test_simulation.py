@@ -1,6 +1,7 @@
 # Copyright (c) 2009-2023 The Regents of the University of Michigan.
 # Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+import threading
 import time
 
 import hoomd
@@ -127,6 +128,66 @@ def test_run(simulation_factory, lattice_snapshot_factory):
     assert sim.operations._scheduled
 
 
+def test_run_releases_gil(simulation_factory, lattice_snapshot_factory):
+    """Ensure that Python threads make progress during a run."""
+    sim = simulation_factory(lattice_snapshot_factory(n=10, a=1.2))
+    lj = hoomd.md.pair.LJ(hoomd.md.nlist.Cell(buffer=0.4), default_r_cut=2.5)
+    lj.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+    sim.operations.integrator = hoomd.md.Integrator(
+        0.001,
+        forces=[lj],
+        methods=[hoomd.md.methods.ConstantVolume(hoomd.filter.All())])
+    sim.run(0)
+
+    started = threading.Event()
+    stop = threading.Event()
+    timesteps = []
+
+    def monitor():
+        started.set()
+        while not stop.is_set():
+            timesteps.append(sim.timestep)
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=monitor)
+    thread.start()
+    started.wait()
+    try:
+        sim.run(2000)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert any(0 < timestep < 2000 for timestep in timesteps)
+
+
+def test_message_during_run(simulation_factory, lattice_snapshot_factory,
+                            capfd):
+    """Ensure that C++ messages printed during a run reach Python."""
+    sim = simulation_factory(lattice_snapshot_factory(n=4, a=1.2))
+    # an integrator with no methods warns on the first step
+    sim.operations.integrator = hoomd.md.Integrator(0.001)
+
+    stop = threading.Event()
+
+    def spin():
+        while not stop.is_set():
+            time.sleep(0.0001)
+
+    thread = threading.Thread(target=spin)
+    thread.start()
+    try:
+        sim.run(10)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert sim.timestep == 10
+    captured = capfd.readouterr()
+    if sim.device.communicator.rank == 0:
+        assert 'MD Integrator has no integration methods.' in captured.err
+
+
 def test_tps(simulation_factory, two_particle_snapshot_factory):
     sim = simulation_factory()
     assert sim.tps is None
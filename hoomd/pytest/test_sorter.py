@@ -5,6 +5,8 @@
 
 from hoomd.conftest import operation_pickling_check
 import hoomd
+import numpy
+import pytest
 
 
 def test_attributes():
@@ -14,6 +16,10 @@ def test_attributes():
 
     assert sorter.trigger is trigger
     assert sorter.grid == 32
+    assert not sorter.in_place
+
+    sorter.in_place = True
+    assert sorter.in_place
 
 
 def test_attributes_attached(simulation_factory, two_particle_snapshot_factory):
@@ -27,6 +33,10 @@ def test_attributes_attached(simulation_factory, two_particle_snapshot_factory):
 
     assert sorter.trigger is trigger
     assert sorter.grid == 32
+    assert not sorter.in_place
+
+    sorter.in_place = True
+    assert sorter.in_place
 
 
 def test_default_sorter(simulation_factory, two_particle_snapshot_factory):
@@ -44,3 +54,106 @@ def test_pickling(simulation_factory, two_particle_snapshot_factory):
     # simulation
     sorter = sim.operations.tuners.pop()
     operation_pickling_check(sorter, sim)
+
+
+@pytest.mark.serial
+@pytest.mark.cpu
+def test_bonded_group_order(simulation_factory, lattice_snapshot_factory):
+    """Test that bonds are sorted by the index of their first particle."""
+    snapshot = lattice_snapshot_factory(n=6, a=1.0)
+    if snapshot.communicator.rank == 0:
+        rng = numpy.random.default_rng(seed=5)
+        chain = rng.permutation(snapshot.particles.N)
+        snapshot.bonds.N = snapshot.particles.N - 1
+        snapshot.bonds.types = ['A']
+        snapshot.bonds.group[:] = numpy.stack((chain[:-1], chain[1:]), axis=1)
+        expected_groups = numpy.array(snapshot.bonds.group)
+
+    sim = simulation_factory(snapshot)
+    sim.operations.tuners[0].trigger = hoomd.trigger.Periodic(1)
+    sim.run(2)
+
+    with sim.state.cpu_local_snapshot as local_snapshot:
+        first_index = local_snapshot.particles.rtag[
+            local_snapshot.bonds.group[:, 0]]
+        assert numpy.all(numpy.diff(first_index) >= 0)
+        for tag, group_idx in enumerate(local_snapshot.bonds.rtag):
+            assert local_snapshot.bonds.tag[group_idx] == tag
+
+    snapshot = sim.state.get_snapshot()
+    if snapshot.communicator.rank == 0:
+        numpy.testing.assert_array_equal(snapshot.bonds.group, expected_groups)
+
+
+@pytest.mark.cpu
+def test_in_place(simulation_factory, lattice_snapshot_factory):
+    """Test that in-place sorts give the same trajectory as full sorts."""
+    positions = []
+    for in_place in (False, True):
+        snapshot = lattice_snapshot_factory(n=8, a=1.2, r=0.2)
+        sim = simulation_factory(snapshot)
+        sim.seed = 2
+        sim.operations.tuners.clear()
+        sim.operations.tuners.append(
+            hoomd.tune.ParticleSorter(trigger=hoomd.trigger.Periodic(5),
+                                      in_place=in_place))
+
+        cell = hoomd.md.nlist.Cell(buffer=0.4, exclusions=())
+        lj = hoomd.md.pair.LJ(nlist=cell, default_r_cut=2.5)
+        lj.params[('A', 'A')] = dict(epsilon=1, sigma=1)
+        nve = hoomd.md.methods.ConstantVolume(filter=hoomd.filter.All())
+        sim.operations.integrator = hoomd.md.Integrator(dt=0.005,
+                                                        methods=[nve],
+                                                        forces=[lj])
+        sim.run(50)
+
+        snapshot = sim.state.get_snapshot()
+        if snapshot.communicator.rank == 0:
+            positions.append(numpy.array(snapshot.particles.position))
+
+    if len(positions) == 2:
+        numpy.testing.assert_allclose(positions[0],
+                                      positions[1],
+                                      rtol=1e-5,
+                                      atol=1e-4)
+
+
+@pytest.mark.cpu
+def test_alternate_arrays(simulation_factory, lattice_snapshot_factory):
+    """Test that sorts without alternate arrays give the same order."""
+    tags = []
+    for alternate_arrays in (True, False):
+        snapshot = lattice_snapshot_factory(n=10, a=1.0, r=0.3)
+        sim = simulation_factory(snapshot)
+        sim.state.alternate_arrays = alternate_arrays
+        assert sim.state.alternate_arrays == alternate_arrays
+        sim.operations.tuners[0].trigger = hoomd.trigger.Periodic(1)
+        sim.run(1)
+
+        with sim.state.cpu_local_snapshot as local_snapshot:
+            tags.append(numpy.array(local_snapshot.particles.tag))
+
+        final_snapshot = sim.state.get_snapshot()
+        if final_snapshot.communicator.rank == 0:
+            numpy.testing.assert_array_equal(final_snapshot.particles.position,
+                                             snapshot.particles.position)
+
+    numpy.testing.assert_array_equal(tags[0], tags[1])
+
+
+@pytest.mark.serial
+@pytest.mark.cpu
+def test_alternate_arrays_memory(simulation_factory, lattice_snapshot_factory):
+    """Test that disabling the alternate arrays frees their memory."""
+    sim = simulation_factory(lattice_snapshot_factory(n=50, a=1.0, r=0.4))
+    sim.run(0)
+
+    memory_allocated = sim.device.memory_allocated
+    sim.state.alternate_arrays = False
+    memory_saved = memory_allocated - sim.device.memory_allocated
+
+    # alternate copies of the always allocated pos, vel, accel, image, tag,
+    # net force, and net virial arrays
+    scalar_size = hoomd.version.floating_point_precision[0] // 8
+    bytes_per_particle = 21 * scalar_size + 4 * 4
+    assert memory_saved >= bytes_per_particle * sim.state.N_particles
@@ -535,6 +535,14 @@ class Simulation(metaclass=Loggable):
             Using ``write_at_start=True`` in subsequent
             calls to `run` will result in duplicate output frames.
 
+        Note:
+            `run` releases the Python global interpreter lock while the
+            simulation advances, so other Python threads continue to execute
+            during the run. Operations implemented in Python (such as custom
+            actions, custom forces, triggers, variants, and loggers) acquire
+            the lock when they execute. Other threads should not modify the
+            simulation while `run` executes.
+
         .. rubric:: Example:
 
         .. invisible-code-block: python
@@ -799,6 +799,33 @@ class State:
         group = self._get_group(filter)
         group.thermalizeParticleMomenta(kT, self._simulation.timestep)
 
+    @property
+    def alternate_arrays(self):
+        """bool: Keep a second copy of the per-particle arrays.
+
+        By default, the particle data keeps a second copy of each allocated
+        per-particle array. The GPU particle sort and the removal of particles
+        that migrate to other ranks write the reordered particle data to the
+        second copy and then swap the copies. The CPU particle sort reorders
+        through temporary buffers instead. Set `alternate_arrays` to `False`
+        to free the second copy. The CPU particle sort then permutes the
+        particle data in place.
+
+        The second copy of the positions, velocities, accelerations, images,
+        tags, net forces, and net virials takes 184 bytes per particle in
+        double precision (100 bytes in single precision). The per-particle
+        arrays that are allocated only when used, such as orientations,
+        angular momenta, and moments of inertia, add to this.
+
+        Note:
+            Only the CPU supports ``alternate_arrays = False``.
+        """
+        return self._cpp_sys_def.getParticleData().hasAlternateArrays()
+
+    @alternate_arrays.setter
+    def alternate_arrays(self, value):
+        self._cpp_sys_def.getParticleData().setAlternateArrays(bool(value))
+
     @property
     def domain_decomposition_split_fractions(self):
         """tuple(list[float], list[float], list[float]): Box fractions of the \
@@ -286,6 +286,56 @@ UP_TEST(GlobalArray_resize_tests)
         }
     }
 
+//! Tests the accounting of allocations in the MemoryTracker
+UP_TEST(GlobalArray_memory_tracking_tests)
+    {
+    std::shared_ptr<ExecutionConfiguration> exec_conf(
+        new ExecutionConfiguration(ExecutionConfiguration::CPU));
+    auto tracker = exec_conf->getMemoryTracker();
+    UP_ASSERT_EQUAL(tracker->getTotal().current, (size_t)0);
+
+        {
+        GlobalArray<int> a(100, exec_conf);
+        UP_ASSERT_EQUAL(tracker->getTotal().current, 100 * sizeof(int));
+        UP_ASSERT_EQUAL(tracker->getComponents()["anonymous"].current, 100 * sizeof(int));
+
+        // tagging moves the bytes to the named component
+        a.setTag("a", "test");
+        UP_ASSERT_EQUAL(tracker->getComponents()["anonymous"].current, (size_t)0);
+        UP_ASSERT_EQUAL(tracker->getComponents()["test"].current, 100 * sizeof(int));
+
+        // resizing updates the current and peak values
+        a.resize(200);
+        UP_ASSERT_EQUAL(tracker->getComponents()["test"].current, 200 * sizeof(int));
+        a.resize(50);
+        UP_ASSERT_EQUAL(tracker->getComponents()["test"].current, 50 * sizeof(int));
+        UP_ASSERT_EQUAL(tracker->getComponents()["test"].peak, 200 * sizeof(int));
+
+        // swapping keeps the accounting with the allocation
+        GlobalArray<int> b(10, exec_conf);
+        b.setTag("b", "test");
+        a.swap(b);
+        UP_ASSERT_EQUAL(tracker->getTotal().current, 60 * sizeof(int));
+
+        auto allocations = tracker->getAllocations();
+        UP_ASSERT_EQUAL(allocations.size(), (size_t)3);
+        for (const auto& allocation : allocations)
+            {
+            if (std::get<1>(allocation) == "a")
+                UP_ASSERT_EQUAL(std::get<2>(allocation), 50 * sizeof(int));
+            if (std::get<1>(allocation) == "b")
+                UP_ASSERT_EQUAL(std::get<2>(allocation), 10 * sizeof(int));
+            }
+
+        tracker->resetPeak();
+        UP_ASSERT_EQUAL(tracker->getTotal().peak, 60 * sizeof(int));
+        }
+
+    // destruction frees the accounted bytes
+    UP_ASSERT_EQUAL(tracker->getTotal().current, (size_t)0);
+    UP_ASSERT_EQUAL(tracker->getTotal().peak, 60 * sizeof(int));
+    }
+
 //! Tests GPUVector
 UP_TEST(GPUVector_basic_tests)
     {
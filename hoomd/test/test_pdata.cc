@@ -615,6 +615,60 @@ UP_TEST(ParticleData_test)
         }
     }
 
+//! Test that the optional per-particle arrays are allocated on first use
+UP_TEST(ParticleData_optional_arrays_test)
+    {
+    auto box = std::make_shared<BoxDim>(10.0);
+    std::shared_ptr<ExecutionConfiguration> exec_conf(
+        new ExecutionConfiguration(ExecutionConfiguration::CPU));
+    const unsigned int N = 10;
+    ParticleData a(N, box, 1, exec_conf);
+    Scalar tol = Scalar(1e-6);
+
+    // nothing is allocated by default, but the defaults are still reported
+    UP_ASSERT(!a.isAllocated(pdata_array::charge));
+    UP_ASSERT(!a.isAllocated(pdata_array::diameter));
+    UP_ASSERT(!a.isAllocated(pdata_array::body));
+    UP_ASSERT(!a.isAllocated(pdata_array::orientation));
+    MY_CHECK_CLOSE(a.getCharge(3), 0.0, tol);
+    MY_CHECK_CLOSE(a.getDiameter(3), 1.0, tol);
+    UP_ASSERT_EQUAL(a.getBody(3), NO_BODY);
+    MY_CHECK_CLOSE(a.getOrientation(3).x, 1.0, tol);
+    UP_ASSERT(!a.isAllocated(pdata_array::charge));
+
+    // the accessor allocates the array filled with the default value
+        {
+        ArrayHandle<Scalar> h_charge(a.getCharges(), access_location::host, access_mode::read);
+        UP_ASSERT(a.isAllocated(pdata_array::charge));
+        UP_ASSERT(a.getCharges().getNumElements() == N);
+        for (unsigned int i = 0; i < N; i++)
+            MY_CHECK_CLOSE(h_charge.data[i], 0.0, tol);
+        }
+
+    // setting a value allocates the array
+    a.setDiameter(2, 2.5);
+    UP_ASSERT(a.isAllocated(pdata_array::diameter));
+    MY_CHECK_CLOSE(a.getDiameter(2), 2.5, tol);
+    MY_CHECK_CLOSE(a.getDiameter(1), 1.0, tol);
+    MY_CHECK_CLOSE(a.getMaxDiameter(), 2.5, tol);
+
+    // only non-default snapshot data is allocated
+    SnapshotParticleData<Scalar> snap(N);
+    snap.type_mapping.push_back("A");
+    snap.orientation[4] = quat<Scalar>(Scalar(0), vec3<Scalar>(1, 0, 0));
+    ParticleData b(snap, box, exec_conf);
+    UP_ASSERT(b.isAllocated(pdata_array::orientation));
+    UP_ASSERT(!b.isAllocated(pdata_array::charge));
+    UP_ASSERT(!b.isAllocated(pdata_array::angmom));
+    MY_CHECK_CLOSE(b.getOrientation(4).y, 1.0, tol);
+
+    // snapshots of unallocated arrays hold the defaults
+    SnapshotParticleData<Scalar> snap_out(N);
+    b.takeSnapshot(snap_out);
+    MY_CHECK_CLOSE(snap_out.diameter[7], 1.0, tol);
+    UP_ASSERT_EQUAL(snap_out.body[7], NO_BODY);
+    }
+
 //! Tests the RandomParticleInitializer class
 UP_TEST(Random_test)
     {
@@ -22,15 +22,27 @@ class ParticleSorter(Tuner):
             value of `None` sets ``grid=4096`` in 2D simulations and
             ``grid=256`` in 3D simulations.
 
+        in_place (bool): Set to `True` to permute the local particles without
+            removing the ghost particles. Defaults to `False`.
+
     `ParticleSorter` improves simulation performance by sorting the particles in
     memory along a space-filling curve. This takes particles that are close in
     space and places them close in memory, leading to a higher rate of
     cache hits when computing pair potentials.
 
+    By default, `ParticleSorter` migrates particles to their domains, removes
+    the ghost particles, and rebuilds the neighbor lists after each sort. When
+    `in_place` is `True`, it permutes only the local particles and keeps the
+    ghost particles. The neighbor lists and cell lists then remap the particle
+    indices they store instead of rebuilding.
+
     Note:
         New `hoomd.Operations` instances include a `ParticleSorter`
         constructed with default parameters.
 
+    Note:
+        `in_place` has no effect on the GPU.
+
     Attributes:
         trigger (hoomd.trigger.Trigger): Select the timesteps on which to sort.
 
@@ -39,15 +51,19 @@ class ParticleSorter(Tuner):
             of `grid` provide more accurate space-filling curves, but consume
             more memory (``grid**D * 4`` bytes, where *D* is the dimensionality
             of the system).
+
+        in_place (bool): When `True`, permute the local particles without
+            removing the ghost particles.
     """
 
-    def __init__(self, trigger=200, grid=None):
+    def __init__(self, trigger=200, grid=None, in_place=False):
         super().__init__(trigger)
         sorter_params = ParameterDict(
             grid=OnlyTypes(int,
                            postprocess=ParticleSorter._to_power_of_two,
                            preprocess=ParticleSorter._natural_number,
-                           allow_none=True))
+                           allow_none=True),
+            in_place=bool(in_place))
         self._param_dict.update(sorter_params)
         self.grid = grid
 